@@ -5,8 +5,12 @@ setting of the experiment configuration settings.
 """
 
 import copy
+import functools
+import io
 import multiprocessing
-from typing import Dict, List, Optional, Union
+import traceback
+from contextlib import redirect_stdout
+from typing import Dict, List, Optional, Tuple, Union
 
 import customshowme
 import networkx as nx
@@ -15,14 +19,16 @@ from snnalgorithms.get_input_graphs import (
     create_mdsa_input_graphs_from_exp_config,
 )
 from snnbackends.verify_nx_graphs import verify_results_nx_graphs
-from typeguard import typechecked
 
-from snncompare.create_configs import generate_run_configs
+from snncompare.create_configs import (
+    generate_run_configs,
+    get_stage_1_group_key,
+    group_run_configs_by_stage_1,
+)
 from snncompare.exp_config.Exp_config import (
     Exp_config,
     Supported_experiment_settings,
 )
-from snncompare.export_plots.create_dash_plot import create_svg_plot
 from snncompare.export_plots.Plot_config import (
     Plot_config,
     get_default_plot_config,
@@ -32,15 +38,9 @@ from snncompare.export_plots.temp_default_output_creation import (
     create_default_hover_info,
     create_default_output_config,
 )
-from snncompare.export_results.analysis.create_adaptation_cost_plot import (
-    plot_raw_adap_cost_datas,
-)
-from snncompare.export_results.analysis.create_performance_plots import (
-    create_performance_plots,
-    get_completed_and_missing_run_configs,
-)
 from snncompare.export_results.output_stage1_configs_and_input_graph import (
     output_stage_1_configs_and_input_graphs,
+    output_stage_1_run_config_and_radiation_data,
 )
 from snncompare.export_results.output_stage1_snn_graphs import (
     output_stage_1_snns,
@@ -55,8 +55,10 @@ from snncompare.helper import (
 from snncompare.import_results.load_stage_1_and_2 import (
     assert_has_outputted_stage_1,
     has_outputted_stage_1,
+    has_outputted_stage_1_run_config_and_radiation_data,
     load_stage1_simsnn_graphs,
 )
+from snncompare.import_results.results_index import index_completed_stage
 from snncompare.optional_config.Output_config import (
     Hover_info,
     Output_config,
@@ -65,15 +67,21 @@ from snncompare.optional_config.Output_config import (
 from snncompare.process_results.get_failure_modes import (
     add_failure_modes_to_graph,
 )
-from snncompare.process_results.show_failure_modes import show_failures
 from snncompare.progress_report.has_completed_stage2_or_4 import (
     assert_has_outputted_stage_2_or_4,
+    get_completed_and_missing_run_configs,
     has_outputted_stage_2_or_4,
 )
+from snncompare.progress_report.profiling import profile_section, profile_stage
+from snncompare.progress_report.resume_manifest import (
+    get_completed_and_missing_run_configs_from_manifest,
+)
 from snncompare.run_config.Run_config import Run_config
 from snncompare.simulation.add_radiation_graphs import (
     ensure_empty_rad_snns_exist,
 )
+from snncompare.simulation.clone_snn import clone_graphs_dict
+from snncompare.typechecking import typechecked
 
 from .graph_generation.stage_1_create_graphs import (
     get_graphs_stage_1,
@@ -82,7 +90,7 @@ from .graph_generation.stage_1_create_graphs import (
 
 # from .import_results.load_stage1_results import load_results_stage_1
 from .process_results.process_results import set_results
-from .simulation.stage2_sim import sim_graphs
+from .simulation.stage2_sim import sim_deferred_rad_snns, sim_graphs
 
 
 class Experiment_runner:
@@ -103,7 +111,33 @@ class Experiment_runner:
         reverse: bool,
         perform_run: Optional[bool] = True,
         specific_run_config: Optional[Run_config] = None,
+        workers: int = 1,
+        resume: bool = False,
+        shard: Optional[Tuple[int, int]] = None,
     ) -> None:
+        if workers < 1:
+            raise ValueError(
+                f"Error, the number of workers should be 1 or larger:{workers}"
+            )
+        self.workers: int = workers
+        if output_config.early_stop_policy is not None and any(
+            simulator != "simsnn" for simulator in exp_config.simulators
+        ):
+            raise ValueError(
+                "Error, early stopping is only supported for the simsnn "
+                + f"simulator, not for:{exp_config.simulators}."
+            )
+        # Stores the error traceback per failed run_config unique_id.
+        self.failed_run_configs: Dict[str, str] = {}
+        # Stores the results of the last performed run(s) per unique_id.
+        self.results_nx_graphs: Dict = {}
+        # Stores the stage 1 graphs of the last stage 1 group, such that the
+        # run_configs that only differ in radiation can reuse them.
+        self.stage_1_group_key: Optional[str] = None
+        self.stage_1_template: Dict = {}
+        # Stores the simulated unradiated snns of the last stage 1 group.
+        self.unradiated_sim_cache: Dict = {}
+
         # Ensure output directories are created for stages 1 to 4.
         create_root_dir_if_not_exists(root_dir_name="results")
 
@@ -118,33 +152,81 @@ class Experiment_runner:
         self.supp_exp_config = Supported_experiment_settings()
         create_mdsa_input_graphs_from_exp_config(exp_config=exp_config)
         self.run_configs = generate_run_configs(
-            exp_config=exp_config, specific_run_config=specific_run_config
+            exp_config=exp_config,
+            specific_run_config=specific_run_config,
+            shard=shard,
         )
 
         if reverse:
             self.run_configs.reverse()
 
+        # Only perform the run_configs that are not yet completed according to
+        # the results index, without loading their graphs.
+        run_configs_to_perform: List[Run_config] = self.run_configs
+        if resume:
+            (
+                _,
+                run_configs_to_perform,
+            ) = get_completed_and_missing_run_configs_from_manifest(
+                run_configs=self.run_configs
+            )
+            print(
+                f"Resuming {len(run_configs_to_perform)} of "
+                + f"{len(self.run_configs)} run_configs."
+            )
+
         if perform_run:  # Used to get quick Experiment_runner for testing.
             print("Performing run.\n\n")
             self.__perform_run(
                 exp_config=self.exp_config,
                 output_config=output_config,
-                run_configs=self.run_configs,
+                run_configs=run_configs_to_perform,
             )
 
+        # The run_configs that failed in a parallel run have no results.
+        completed_run_configs: List[Run_config] = [
+            run_config
+            for run_config in self.run_configs
+            if run_config.unique_id not in self.failed_run_configs
+        ]
+
+        # The plotting and table modules are only imported when they are
+        # used, such that runs of stages 1, 2 and 4 do not import them.
         if 5 in output_config.output_json_stages:
+            # pylint: disable=C0415
+            from .export_results.analysis.create_performance_plots import (
+                create_performance_plots,
+            )
+
             print("Generating boxplot results.\n\n")
             create_performance_plots(
-                completed_run_configs=self.run_configs,
+                completed_run_configs=completed_run_configs,
                 exp_config=exp_config,
             )
 
         if 6 in output_config.output_json_stages:
+            # pylint: disable=C0415
+            from .export_results.analysis.create_adaptation_cost_plot import (
+                plot_raw_adap_cost_datas,
+            )
+
             plot_raw_adap_cost_datas(exp_config=self.exp_config)
 
         if output_config.extra_storing_config.show_failure_modes:
+            # pylint: disable=C0415
+            from snncompare.process_results.show_failure_modes import (
+                show_failures,
+            )
+
             show_failures(
-                exp_config=self.exp_config, run_configs=self.run_configs
+                exp_config=self.exp_config, run_configs=completed_run_configs
+            )
+
+        if self.failed_run_configs:
+            raise SystemError(
+                f"Error, {len(self.failed_run_configs)} of "
+                + f"{len(run_configs_to_perform)} run_configs failed:"
+                + f"{sorted(self.failed_run_configs.keys())}"
             )
 
     # pylint: disable=W0238
@@ -161,40 +243,365 @@ class Experiment_runner:
         the run in the way the processed configuration settings specify.
         """
         plot_config = get_default_plot_config()
+        if self.workers > 1:
+            self.__perform_parallel_run(
+                exp_config=exp_config,
+                output_config=output_config,
+                plot_config=plot_config,
+                run_configs=run_configs,
+            )
+            return
+
+        if output_config.batch_radiation:
+            self.__perform_batched_run(
+                exp_config=exp_config,
+                output_config=output_config,
+                plot_config=plot_config,
+                run_configs=run_configs,
+            )
+            return
+
         results_nx_graphs: Dict
-        for i, run_config in enumerate(run_configs):
+        # Perform the run_configs that share the same stage 1 graphs after
+        # each other, such that those graphs are only created/loaded once.
+        grouped_run_configs: List[Run_config] = [
+            run_config
+            for run_config_group in group_run_configs_by_stage_1(
+                run_configs=run_configs
+            )
+            for run_config in run_config_group
+        ]
+        for i, run_config in enumerate(grouped_run_configs):
             print(f"\n{i+1}/{len(run_configs)} [runs]")
             run_config.print_run_config_dict()
-            results_nx_graphs = self.perform_run_stage_1(
+            results_nx_graphs = self.perform_single_run(
                 exp_config=exp_config,
                 output_config=output_config,
                 plot_config=plot_config,
                 run_config=run_config,
+                visualise=True,
             )
+            # Store run results in dict of Experiment_runner.
+            self.results_nx_graphs = {
+                run_config.unique_id: results_nx_graphs  # type:ignore[index]
+            }
 
-            results_nx_graphs = self.__perform_run_stage_2(
-                results_nx_graphs=results_nx_graphs,
+    # pylint: disable=W0238
+    @typechecked
+    def __perform_batched_run(
+        self,
+        exp_config: Exp_config,
+        output_config: Output_config,
+        plot_config: Plot_config,
+        run_configs: List[Run_config],
+    ) -> None:
+        """Performs the run_configs per group of run_configs that share the
+        same stage 1 graphs, and simulates the radiated snns of each group in
+        a batch."""
+        nr_of_started_runs: int = 0
+        for run_config_group in group_run_configs_by_stage_1(
+            run_configs=run_configs
+        ):
+            print(
+                f"\n{nr_of_started_runs+1}-"
+                + f"{nr_of_started_runs+len(run_config_group)}/"
+                + f"{len(run_configs)} [runs]"
+            )
+            nr_of_started_runs += len(run_config_group)
+            for run_config in run_config_group:
+                run_config.print_run_config_dict()
+            self.results_nx_graphs = {
+                run_config.unique_id: results_nx_graphs
+                for run_config, results_nx_graphs in zip(
+                    run_config_group,
+                    self.perform_run_group_in_batch(
+                        exp_config=exp_config,
+                        output_config=output_config,
+                        plot_config=plot_config,
+                        run_configs=run_config_group,
+                        visualise=True,
+                    ),
+                )
+            }
+
+    # pylint: disable=R0913
+    @typechecked
+    def perform_run_group_in_batch(
+        self,
+        exp_config: Exp_config,
+        output_config: Output_config,
+        plot_config: Plot_config,
+        run_configs: List[Run_config],
+        visualise: bool,
+    ) -> List[Dict]:
+        """Performs stages 1 to 4 for a group of run_configs that share the
+        same stage 1 graphs, and returns their results_nx_graphs.
+
+        The radiated snns of the run_configs only differ in their
+        radiation. So they are all radiated first, and then simulated
+        in a single vectorised run per snn graph type, after which
+        stages 3 and 4 are performed per run_config.
+        """
+        deferred_rad_snns: Dict[str, List[Tuple[Run_config, Simulator]]] = {}
+        results_per_run_config: List[Dict] = []
+        for run_config in run_configs:
+            with profile_stage(
+                unique_id=run_config.unique_id,
+                stage_index=1,
+                enabled=output_config.profile,
+            ):
+                results_nx_graphs: Dict = self.perform_run_stage_1(
+                    exp_config=exp_config,
+                    output_config=output_config,
+                    plot_config=plot_config,
+                    run_config=run_config,
+                )
+            with profile_stage(
+                unique_id=run_config.unique_id,
+                stage_index=2,
+                enabled=output_config.profile,
+            ):
+                results_per_run_config.append(
+                    self.__perform_run_stage_2(
+                        results_nx_graphs=results_nx_graphs,
+                        output_config=output_config,
+                        run_config=run_config,
+                        deferred_rad_snns=deferred_rad_snns,
+                    )
+                )
+
+        # The batched simulation is attributed to the first run_config.
+        with profile_stage(
+            unique_id=run_configs[0].unique_id,
+            stage_index=2,
+            enabled=output_config.profile,
+        ):
+            sim_deferred_rad_snns(
+                input_graph=results_per_run_config[0]["graphs_dict"][
+                    "input_graph"
+                ],
                 output_config=output_config,
-                run_config=run_config,
+                deferred_rad_snns=deferred_rad_snns,
             )
 
-            self.__perform_run_stage_3(
+        for run_config, results_nx_graphs in zip(
+            run_configs, results_per_run_config
+        ):
+            with profile_stage(
+                unique_id=run_config.unique_id,
+                stage_index=2,
+                enabled=output_config.profile,
+            ), profile_section(category="serialise"):
+                output_stage_2_snns(
+                    graphs_dict=results_nx_graphs["graphs_dict"],
+                    output_config=output_config,
+                    run_config=run_config,
+                )
+            if visualise:
+                with profile_stage(
+                    unique_id=run_config.unique_id,
+                    stage_index=3,
+                    enabled=output_config.profile,
+                ):
+                    self.__perform_run_stage_3(
+                        exp_config=exp_config,
+                        output_config=output_config,
+                        results_nx_graphs=results_nx_graphs,
+                        run_config=run_config,
+                    )
+            with profile_stage(
+                unique_id=run_config.unique_id,
+                stage_index=4,
+                enabled=output_config.profile,
+            ):
+                self.__perform_run_stage_4(
+                    exp_config=exp_config,
+                    output_config=output_config,
+                    results_nx_graphs=results_nx_graphs,
+                    run_config=run_config,
+                )
+        return results_per_run_config
+
+    # pylint: disable=R0913
+    @typechecked
+    def perform_single_run(
+        self,
+        exp_config: Exp_config,
+        output_config: Output_config,
+        plot_config: Plot_config,
+        run_config: Run_config,
+        visualise: bool,
+    ) -> Dict:
+        """Performs stages 1 to 4 for a single run_config.
+
+        Stage 3 is only performed if visualise is True, because it
+        waits for user input.
+        """
+        with profile_stage(
+            unique_id=run_config.unique_id,
+            stage_index=1,
+            enabled=output_config.profile,
+        ):
+            results_nx_graphs: Dict = self.perform_run_stage_1(
                 exp_config=exp_config,
                 output_config=output_config,
+                plot_config=plot_config,
+                run_config=run_config,
+            )
+
+        with profile_stage(
+            unique_id=run_config.unique_id,
+            stage_index=2,
+            enabled=output_config.profile,
+        ):
+            results_nx_graphs = self.__perform_run_stage_2(
                 results_nx_graphs=results_nx_graphs,
+                output_config=output_config,
                 run_config=run_config,
             )
 
+        if visualise:
+            with profile_stage(
+                unique_id=run_config.unique_id,
+                stage_index=3,
+                enabled=output_config.profile,
+            ):
+                self.__perform_run_stage_3(
+                    exp_config=exp_config,
+                    output_config=output_config,
+                    results_nx_graphs=results_nx_graphs,
+                    run_config=run_config,
+                )
+
+        with profile_stage(
+            unique_id=run_config.unique_id,
+            stage_index=4,
+            enabled=output_config.profile,
+        ):
             self.__perform_run_stage_4(
                 exp_config=exp_config,
                 output_config=output_config,
                 results_nx_graphs=results_nx_graphs,
                 run_config=run_config,
             )
-            # Store run results in dict of Experiment_runner.
-            self.results_nx_graphs: Dict = {
-                run_config.unique_id: results_nx_graphs  # type:ignore[index]
-            }
+        return results_nx_graphs
+
+    # pylint: disable=W0238
+    @typechecked
+    def __perform_parallel_run(
+        self,
+        exp_config: Exp_config,
+        output_config: Output_config,
+        plot_config: Plot_config,
+        run_configs: List[Run_config],
+    ) -> None:
+        """Performs stages 1, 2 and 4 of the run_configs in a process pool.
+
+        The results of a run_config only depend on that run_config, and
+        they are written to files that are named after its hashes. So
+        the order in which the workers finish does not change the
+        results. A run_config that fails is reported at the end, instead
+        of aborting the other runs. Each worker task is a group of
+        run_configs that share the same stage 1 graphs.
+
+        The graphs of the runs stay in the worker processes, so the
+        results_nx_graphs remain empty. The results are in the outputted
+        files.
+        """
+        # Do not send the (potentially long) list of run_configs to the
+        # workers with every task.
+        worker_runner: Experiment_runner = copy.copy(self)
+        worker_runner.run_configs = []
+        worker_runner.stage_1_group_key = None
+        worker_runner.stage_1_template = {}
+        worker_runner.unradiated_sim_cache = {}
+        run_in_worker = functools.partial(
+            worker_runner.perform_run_group_in_worker,
+            exp_config=exp_config,
+            output_config=output_config,
+            plot_config=plot_config,
+        )
+
+        print(f"Performing {len(run_configs)} runs on {self.workers} workers.")
+        nr_of_finished_runs: int = 0
+        with multiprocessing.Pool(processes=self.workers) as pool:
+            for run_results in pool.imap_unordered(
+                run_in_worker,
+                group_run_configs_by_stage_1(run_configs=run_configs),
+            ):
+                for unique_id, error in run_results:
+                    nr_of_finished_runs += 1
+                    progress: str = (
+                        f"{nr_of_finished_runs}/{len(run_configs)} [runs]"
+                    )
+                    if error is None:
+                        print(f"{progress} done:{unique_id}")
+                    else:
+                        print(f"{progress} failed:{unique_id}")
+                        self.failed_run_configs[unique_id] = error
+
+        if self.failed_run_configs:
+            print(f"\n{len(self.failed_run_configs)} run_configs failed:")
+            for unique_id in sorted(self.failed_run_configs.keys()):
+                print(f"\n{unique_id}:\n{self.failed_run_configs[unique_id]}")
+
+    @typechecked
+    def perform_run_group_in_worker(
+        self,
+        run_configs: List[Run_config],
+        exp_config: Exp_config,
+        output_config: Output_config,
+        plot_config: Plot_config,
+    ) -> List[Tuple[str, Optional[str]]]:
+        """Performs stages 1, 2 and 4 of a group of run_configs inside a
+        worker process.
+
+        Returns per run_config its unique_id, and the traceback if the
+        run failed (None otherwise). The printed output of a run is only
+        shown if that run failed, to keep the progress report readable.
+        """
+        run_results: List[Tuple[str, Optional[str]]] = []
+        if output_config.batch_radiation:
+            # The run_configs of the group are simulated together, so they
+            # succeed or fail together.
+            worker_output = io.StringIO()
+            try:
+                with redirect_stdout(worker_output):
+                    self.perform_run_group_in_batch(
+                        exp_config=exp_config,
+                        output_config=output_config,
+                        plot_config=plot_config,
+                        run_configs=run_configs,
+                        visualise=False,
+                    )
+                error: Optional[str] = None
+            # pylint: disable=W0718
+            except Exception:
+                error = f"{worker_output.getvalue()}{traceback.format_exc()}"
+            return [
+                (run_config.unique_id, error) for run_config in run_configs
+            ]
+        for run_config in run_configs:
+            worker_output = io.StringIO()
+            try:
+                with redirect_stdout(worker_output):
+                    self.perform_single_run(
+                        exp_config=exp_config,
+                        output_config=output_config,
+                        plot_config=plot_config,
+                        run_config=run_config,
+                        visualise=False,
+                    )
+                run_results.append((run_config.unique_id, None))
+            # pylint: disable=W0718
+            except Exception:
+                run_results.append(
+                    (
+                        run_config.unique_id,
+                        f"{worker_output.getvalue()}{traceback.format_exc()}",
+                    )
+                )
+        return run_results
 
     @customshowme.time
     @typechecked
@@ -212,6 +619,13 @@ class Experiment_runner:
         SNN algorithm. This is done by taking an input graph, and
         generating an SNN (graph) that runs the intended algorithm.
         """
+        group_key: str = get_stage_1_group_key(run_config=run_config)
+        if group_key == self.stage_1_group_key:
+            return self.reuse_stage_1_template(
+                exp_config=exp_config,
+                output_config=output_config,
+                run_config=run_config,
+            )
 
         input_graph: nx.Graph = load_input_graph_from_file_with_init_props(
             run_config=run_config
@@ -237,7 +651,9 @@ class Experiment_runner:
             stage_1_graphs: Dict[
                 str, Union[nx.Graph, nx.DiGraph, Simulator]
             ] = get_graphs_stage_1(
-                plot_config=plot_config, run_config=run_config
+                plot_config=plot_config,
+                run_config=run_config,
+                recording_policy=output_config.recording_policy,
             )
 
             # Indicate the graphs have completed stage 1.
@@ -246,24 +662,28 @@ class Experiment_runner:
 
             results_nx_graphs["graphs_dict"] = stage_1_graphs
 
-            output_stage_1_configs_and_input_graphs(
-                exp_config=exp_config,
-                run_config=run_config,
-                graphs_dict=results_nx_graphs["graphs_dict"],
-            )
-
-            for with_adaptation in [False, True]:
-                output_stage_1_snns(
+            with profile_section(category="serialise"):
+                output_stage_1_configs_and_input_graphs(
+                    exp_config=exp_config,
                     run_config=run_config,
                     graphs_dict=results_nx_graphs["graphs_dict"],
-                    with_adaptation=with_adaptation,
                 )
 
+                for with_adaptation in [False, True]:
+                    output_stage_1_snns(
+                        run_config=run_config,
+                        graphs_dict=results_nx_graphs["graphs_dict"],
+                        with_adaptation=with_adaptation,
+                        stage_1_format=output_config.stage_1_format,
+                    )
+
         else:
-            results_nx_graphs["graphs_dict"] = load_stage1_simsnn_graphs(
-                run_config=run_config,
-                stage_1_graphs_dict=results_nx_graphs["graphs_dict"],
-            )
+            with profile_section(category="serialise"):
+                results_nx_graphs["graphs_dict"] = load_stage1_simsnn_graphs(
+                    run_config=run_config,
+                    stage_1_graphs_dict=results_nx_graphs["graphs_dict"],
+                    recording_policy=output_config.recording_policy,
+                )
 
             # self.equalise_loaded_run_config(
             # loaded_from_json=results_nx_graphs["run_config"],
@@ -271,6 +691,55 @@ class Experiment_runner:
             # )
 
         assert_has_outputted_stage_1(run_config=run_config)
+        index_completed_stage(unique_id=run_config.unique_id, stage_index=1)
+
+        # Store a copy of the stage 1 graphs before they are simulated.
+        self.stage_1_group_key = group_key
+        self.stage_1_template = clone_graphs_dict(
+            graphs_dict=results_nx_graphs["graphs_dict"]
+        )
+        # The unradiated simulations of the previous group do not apply.
+        self.unradiated_sim_cache = {}
+        return results_nx_graphs
+
+    @typechecked
+    def reuse_stage_1_template(
+        self,
+        exp_config: Exp_config,
+        output_config: Output_config,
+        run_config: Run_config,
+    ) -> Dict:
+        """Returns the stage 1 graphs of a run_config that only differs in
+        radiation from the run_config whose stage 1 graphs were stored last.
+
+        Only the run_config and radiation data are outputted for this
+        run_config, because the input graph and snns are shared.
+        """
+        results_nx_graphs: Dict = {
+            "exp_config": exp_config,
+            "run_config": run_config,
+            "graphs_dict": clone_graphs_dict(
+                graphs_dict=self.stage_1_template
+            ),
+        }
+        if (
+            not has_outputted_stage_1_run_config_and_radiation_data(
+                graphs_dict=results_nx_graphs["graphs_dict"],
+                run_config=run_config,
+            )
+            or 1 in output_config.recreate_stages
+        ):
+            output_stage_1_run_config_and_radiation_data(
+                run_config=run_config,
+                graphs_dict=results_nx_graphs["graphs_dict"],
+            )
+
+        if not has_outputted_stage_1_run_config_and_radiation_data(
+            graphs_dict=results_nx_graphs["graphs_dict"],
+            run_config=run_config,
+        ):
+            raise ValueError("Error, stage 1 was not completed.")
+        index_completed_stage(unique_id=run_config.unique_id, stage_index=1)
         return results_nx_graphs
 
     @customshowme.time
@@ -280,12 +749,19 @@ class Experiment_runner:
         output_config: Output_config,
         results_nx_graphs: Dict,
         run_config: Run_config,
+        deferred_rad_snns: Optional[
+            Dict[str, List[Tuple[Run_config, Simulator]]]
+        ] = None,
     ) -> Dict:
         """Performs the run for stage 2 or loads the data from file depending
         on the run configuration.
 
         Stage two simulates the SNN graphs over time and, if desired,
         exports each timestep of those SNN graphs to a json dictionary.
+
+        If deferred_rad_snns is given, the radiated snns that need to be
+        simulated are added to it instead, and the stage 2 graphs are not
+        outputted, such that the radiated snns can be simulated in a batch.
         """
 
         # Verify incoming results dict.
@@ -304,14 +780,18 @@ class Experiment_runner:
             output_config=output_config,
             run_config=run_config,
             stage_1_graphs=results_nx_graphs["graphs_dict"],
+            unradiated_sim_cache=self.unradiated_sim_cache,
+            deferred_rad_snns=deferred_rad_snns,
         )
+        if deferred_rad_snns is not None:
+            return results_nx_graphs
 
-        # TODO: include check to se if stage 2 output is skipped.
-        output_stage_2_snns(
-            graphs_dict=results_nx_graphs["graphs_dict"],
-            output_config=output_config,
-            run_config=run_config,
-        )
+        with profile_section(category="serialise"):
+            output_stage_2_snns(
+                graphs_dict=results_nx_graphs["graphs_dict"],
+                output_config=output_config,
+                run_config=run_config,
+            )
         return results_nx_graphs
 
     @typechecked
@@ -337,6 +817,11 @@ class Experiment_runner:
         - A circular synapse: a recurrent connection of a neuron into itself.
         """
         if output_config.export_types:
+            # pylint: disable=C0415
+            from snncompare.export_plots.create_dash_plot import (
+                create_svg_plot,
+            )
+
             if "hover_info" not in output_config.__dict__.keys():
                 output_config = create_default_output_config(
                     exp_config=exp_config,
@@ -402,12 +887,13 @@ class Experiment_runner:
             )
             or 4 in output_config.recreate_stages
         ):
-            set_results(
-                exp_config=exp_config,
-                output_config=output_config,
-                run_config=run_config,
-                stage_2_graphs=results_nx_graphs["graphs_dict"],
-            )
+            with profile_section(category="verify"):
+                set_results(
+                    exp_config=exp_config,
+                    output_config=output_config,
+                    run_config=run_config,
+                    stage_2_graphs=results_nx_graphs["graphs_dict"],
+                )
 
             output_data_types = ["results"]
             if output_config.extra_storing_config.export_failure_modes:
@@ -416,28 +902,31 @@ class Experiment_runner:
                 ]
 
                 # Set failure modes.
-                add_failure_modes_to_graph(
-                    snn_graphs=results_nx_graphs["graphs_dict"],
-                    run_config=run_config,
-                )
+                with profile_section(category="verify"):
+                    add_failure_modes_to_graph(
+                        snn_graphs=results_nx_graphs["graphs_dict"],
+                        run_config=run_config,
+                    )
 
             for output_data_type in output_data_types:
                 if output_data_type == "results":
                     stage_index: int = 4
                 else:
                     stage_index = 7
-                output_snn_results(
-                    output_data_type=output_data_type,
-                    run_config=run_config,
-                    graphs_dict=results_nx_graphs["graphs_dict"],
-                    stage_index=stage_index,
-                )
+                with profile_section(category="serialise"):
+                    output_snn_results(
+                        output_data_type=output_data_type,
+                        run_config=run_config,
+                        graphs_dict=results_nx_graphs["graphs_dict"],
+                        stage_index=stage_index,
+                    )
 
             assert_has_outputted_stage_2_or_4(
                 graphs_dict=results_nx_graphs["graphs_dict"],
                 run_config=run_config,
                 stage_index=4,
             )
+        index_completed_stage(unique_id=run_config.unique_id, stage_index=4)
 
     def load_pickled_boxplot_data(
         self,
@@ -1,11 +1,20 @@
 """Entry point for this project, runs the project code based on the cli command
 that invokes this script."""
+import os
+import sys
 
+from snncompare.typechecking import FAST_MODE_ENV_VAR
 
-from snncompare.arg_parser.arg_verification import verify_args
+# The type checks are applied when the modules are imported, so the fast
+# mode is set before the rest of the package is imported.
+if {"-fast", "--fast"}.intersection(sys.argv[1:]):
+    os.environ[FAST_MODE_ENV_VAR] = "1"
 
-from .arg_parser.arg_parser import parse_cli_args
-from .arg_parser.process_args import process_args
+# pylint: disable=C0413
+from snncompare.arg_parser.arg_verification import verify_args  # noqa: E402
+
+from .arg_parser.arg_parser import parse_cli_args  # noqa: E402
+from .arg_parser.process_args import process_args  # noqa: E402
 
 custom_config_path = "src/snncompare/json_configurations/"
 
@@ -3,9 +3,8 @@ neural network (SNN)."""
 from argparse import ArgumentParser, Namespace
 from typing import Optional, Union
 
-from typeguard import typechecked
-
 from snncompare.exp_config.Exp_config import Supported_experiment_settings
+from snncompare.typechecking import typechecked
 
 
 @typechecked
@@ -20,6 +19,17 @@ def parse_cli_args(
         description="Optional description for arg" + " parser"
     )
 
+    parser.add_argument(
+        "-br",
+        "--batch-radiation",
+        action="store_true",
+        default=False,
+        help=(
+            "Simulate the radiated snns of the run_configs that only differ "
+            + "in radiation in a single vectorised run (simsnn only)."
+        ),
+    )
+
     parser.add_argument(
         "-c",
         "--create-boxplots",
@@ -90,6 +100,41 @@ def parse_cli_args(
         ),
     )
 
+    parser.add_argument(
+        "-es",
+        "--early-stop",
+        action="store",
+        type=str,
+        choices=supp_setts.early_stop_predicates,
+        default=None,
+        help=(
+            "Stop the simsnn simulation once the terminator neuron of the "
+            + "algorithm spiked, or once the network is quiescent, instead "
+            + "of simulating the maximum simulation duration."
+        ),
+    )
+
+    parser.add_argument(
+        "-esi",
+        "--early-stop-interval",
+        action="store",
+        type=int,
+        default=10,
+        help="The nr of timesteps between the early stop checks.",
+    )
+
+    parser.add_argument(
+        "-esq",
+        "--quiescent-duration",
+        action="store",
+        type=int,
+        default=10,
+        help=(
+            "The nr of timesteps without spikes after which the network is "
+            + "quiescent."
+        ),
+    )
+
     parser.add_argument(
         "-efm",
         "--export-failure-modes",
@@ -167,6 +212,41 @@ def parse_cli_args(
         ),
     )
 
+    parser.add_argument(
+        "-prof",
+        "--profile",
+        action="store_true",
+        default=False,
+        help=(
+            "Appends the wall time, cpu time, peak memory, I/O and touched "
+            + "files per stage and category of work of each run_config to "
+            + "results/profile_log.jsonl."
+        ),
+    )
+
+    parser.add_argument(
+        "-sprof",
+        "--summarise-profile",
+        action="store_true",
+        default=False,
+        help=(
+            "Prints the stages and categories of work that took the most "
+            + "wall time according to results/profile_log.jsonl, instead of "
+            + "running the experiment."
+        ),
+    )
+
+    parser.add_argument(
+        "-fast",
+        "--fast",
+        action="store_true",
+        default=False,
+        help=(
+            "Disables the runtime type checks of the package, by setting the "
+            + "SNNCOMPARE_FAST environment variable before it is imported."
+        ),
+    )
+
     # Run run on a particular run_settings json file.
     parser.add_argument(
         "-r",
@@ -250,6 +330,66 @@ def parse_cli_args(
         help=("Rereate boxplots with adaptation effectivity."),
     )
 
+    parser.add_argument(
+        "-dry",
+        "--dry-run",
+        action="store_true",
+        default=False,
+        help=(
+            "Prints how many run_configs are completed and missing according"
+            + " to the results index, without running the experiment."
+        ),
+    )
+
+    parser.add_argument(
+        "-res",
+        "--resume",
+        action="store_true",
+        default=False,
+        help=(
+            "Only runs the run_configs that are not completed according to"
+            + " the results index, without loading the completed ones."
+        ),
+    )
+
+    parser.add_argument(
+        "-ri",
+        "--reindex",
+        action="store_true",
+        default=False,
+        help=(
+            "Rebuilds the results index (results/results_index.sqlite) from"
+            + " the files in the results directory, instead of running the"
+            + " experiment. The completion checks use the results index, so"
+            + " rebuild it after deleting or copying result files."
+        ),
+    )
+
+    parser.add_argument(
+        "-rec",
+        "--recording",
+        action="store",
+        type=str,
+        choices=supp_setts.recordings,
+        default="full",
+        help=(
+            "The neuron variables that are recorded during simulation: full "
+            + "records the spikes, V and I, spikes only records the spikes."
+        ),
+    )
+
+    parser.add_argument(
+        "-recn",
+        "--recorded-neurons",
+        action="store",
+        type=str,
+        default=None,
+        help=(
+            "Comma separated neuron name patterns, e.g. selector*,counter*."
+            + " Only the matching neurons are recorded during simulation."
+        ),
+    )
+
     # Run run on a particular run_settings json file.
     parser.add_argument(
         "-rev",
@@ -259,6 +399,55 @@ def parse_cli_args(
         help=("Run experiment config from small/fast to large/slow."),
     )
 
+    parser.add_argument(
+        "-sh",
+        "--shard",
+        action="store",
+        type=str,
+        default=None,
+        help=(
+            "Only perform the run configs in shard i of n shards, as: i/n, "
+            + "with i in range 0 to n-1. The shards are disjoint, so n "
+            + "processes can each perform one shard."
+        ),
+    )
+
+    parser.add_argument(
+        "-shi",
+        "--shard-index",
+        action="store",
+        type=int,
+        default=None,
+        help=(
+            "Only perform the run configs in this shard, in range 0 to "
+            + "--shard-count - 1. The shards are balanced on the estimated "
+            + "cost: graph_size^2 * (m_val + 1) * redundancy."
+        ),
+    )
+
+    parser.add_argument(
+        "-shc",
+        "--shard-count",
+        action="store",
+        type=int,
+        default=None,
+        help="The number of shards the run configs are divided into.",
+    )
+
+    parser.add_argument(
+        "-ms",
+        "--merge-shards",
+        nargs="*",
+        type=str,
+        default=None,
+        help=(
+            "Adds the given results indices of the shards to the results "
+            + "index, and verifies all --shard-count shards have completed. "
+            + "The result files of the shards should be copied into the "
+            + "results directory."
+        ),
+    )
+
     # Run run on a particular run_settings json file.
     parser.add_argument(
         "-s2",
@@ -272,6 +461,46 @@ def parse_cli_args(
         ),
     )
 
+    parser.add_argument(
+        "-s1f",
+        "--stage-1-format",
+        action="store",
+        type=str,
+        choices=supp_setts.stage_1_formats,
+        default="json",
+        help=(
+            "File format of the stage 1 snns. npz stores the neuron "
+            + "parameters, synapses and neuron names as arrays, which are "
+            + "loaded without parsing json."
+        ),
+    )
+
+    parser.add_argument(
+        "-s2f",
+        "--stage-2-format",
+        action="store",
+        type=str,
+        choices=supp_setts.stage_2_formats,
+        default="json",
+        help=(
+            "File format of the stage 2 snn behaviour. npz stores bit-packed"
+            + " spikes and float32 V and I, which can be memory mapped."
+        ),
+    )
+
+    parser.add_argument(
+        "-sb",
+        "--simsnn-backend",
+        action="store",
+        type=str,
+        choices=supp_setts.simsnn_backends,
+        default="simsnn",
+        help=(
+            "Implementation that steps the simsnn snns. sparse steps them "
+            + "with a sparse weight matrix, with the same results as simsnn."
+        ),
+    )
+
     parser.add_argument(
         "-sfm",
         "--show-failure-modes",
@@ -318,6 +547,20 @@ def parse_cli_args(
         help=("Store which neurons died due to radiation."),
     )
 
+    parser.add_argument(
+        "-w",
+        "--workers",
+        action="store",
+        default=1,
+        type=int,
+        help=(
+            "Perform stage 1, 2 and 4 of the run configs in parallel, using "
+            + "this number of worker processes. A failing run config does "
+            + "not abort the other run configs, the failed run configs are "
+            + "reported and raise an error once the others are completed."
+        ),
+    )
+
     # Ensure SNN behaviour visualisation in stage 3 is exported to images.
     parser.add_argument(
         "-x",
@@ -4,7 +4,8 @@ import argparse
 import json
 
 import networkx as nx
-from typeguard import typechecked
+
+from snncompare.typechecking import typechecked
 
 from ..helper import file_exists
 
@@ -15,6 +16,9 @@ def verify_args(*, args: argparse.Namespace, custom_config_path: str) -> None:
     if isinstance(args.graph_filepath, str):
         verify_input_graph_path(graph_path=args.graph_filepath)
 
+    verify_workers(args=args)
+    verify_failure_modes_recording(args=args)
+
     # Verify output extension is passed correctly.
 
     verify_experiment_settings(
@@ -23,6 +27,32 @@ def verify_args(*, args: argparse.Namespace, custom_config_path: str) -> None:
     )
 
 
+@typechecked
+def verify_workers(*, args: argparse.Namespace) -> None:
+    """Verifies the parallel runs are not combined with the (interactive)
+    visualisation of stage 3. The number of workers is verified by the
+    Experiment_runner."""
+    if args.workers > 1 and (args.export_images or args.show_images):
+        raise SyntaxError(
+            "Error, stage 3 visualisation is not supported in combination "
+            + "with multiple workers."
+        )
+
+
+@typechecked
+def verify_failure_modes_recording(*, args: argparse.Namespace) -> None:
+    """Verifies the failure modes are only requested if the I of the neurons
+    is recorded, because the failure modes compare the I of the radiated and
+    unradiated snns."""
+    if args.recording != "full" and (
+        args.export_failure_modes or args.show_failure_modes
+    ):
+        raise SyntaxError(
+            "Error, the failure modes require the I of the neurons, which is"
+            + f" not recorded with --recording {args.recording}."
+        )
+
+
 @typechecked
 def verify_input_graph_path(*, graph_path: str) -> None:
     """Verifies the filepath for the input graph exists and contains a valid
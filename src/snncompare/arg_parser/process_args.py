@@ -1,23 +1,27 @@
-"""Completes the tasks specified in the arg_parser."""
+"""Completes the tasks specified in the arg_parser.
+
+The modules that are only needed for some of the tasks, such as the
+Experiment_runner, are imported in the branches of those tasks, such that
+the other tasks do not wait for their imports.
+"""
 import argparse
 import os
 import shutil
-from typing import List, Union
-
-from typeguard import typechecked
+from typing import List, Optional, Tuple, Union
 
 from snncompare.arg_parser.helper import convert_csv_list_arg_to_list
 from snncompare.exp_config.Exp_config import Exp_config
-from snncompare.Experiment_runner import Experiment_runner
-from snncompare.export_plots.plot_graphs import create_root_dir_if_not_exists
 from snncompare.helper import get_snn_graph_names
 from snncompare.optional_config.Output_config import (
+    Early_stop_policy,
     Extra_storing_config,
     Output_config,
+    Recording_policy,
     Zoom,
 )
 from snncompare.run_config.helper import get_run_config_filepath
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 from ..json_configurations.algo_test import (
     load_exp_config_from_file,
@@ -63,8 +67,66 @@ def process_args(*, args: argparse.Namespace, custom_config_path: str) -> None:
     else:
         specific_run_config = None
 
+    if args.merge_shards is not None:
+        # pylint: disable=C0415
+        from snncompare.progress_report.merge_shards import merge_shards
+
+        if args.shard_count is None:
+            raise ValueError("Error, merging shards requires --shard-count.")
+        if not merge_shards(
+            exp_config=exp_config,
+            shard_count=args.shard_count,
+            results_index_filepaths=args.merge_shards,
+        ):
+            raise ValueError("Error, not all shards have completed.")
+        print("Done")
+        return
+
+    shard: Optional[Tuple[int, int]] = parse_shard_arg(args=args)
+    if args.dry_run:
+        # pylint: disable=C0415
+        from snncompare.create_configs import generate_run_configs
+        from snncompare.progress_report.resume_manifest import (
+            get_completed_and_missing_run_configs_from_manifest,
+            print_resume_summary,
+        )
+
+        (
+            completed_run_configs,
+            missing_run_configs,
+        ) = get_completed_and_missing_run_configs_from_manifest(
+            run_configs=generate_run_configs(
+                exp_config=exp_config,
+                specific_run_config=specific_run_config,
+                shard=shard,
+            )
+        )
+        print_resume_summary(
+            completed_run_configs=completed_run_configs,
+            missing_run_configs=missing_run_configs,
+        )
+        return
+
     output_config: Output_config = manage_export_parsing(args=args)
 
+    if args.reindex:
+        # pylint: disable=C0415
+        from snncompare.progress_report.reindex_results import reindex_results
+
+        reindex_results()
+        print("Done")
+        return
+
+    if args.summarise_profile:
+        # pylint: disable=C0415
+        from snncompare.progress_report.profiling import print_profile_summary
+
+        print_profile_summary()
+        return
+
+    # pylint: disable=C0415
+    from snncompare.Experiment_runner import Experiment_runner
+
     # python -m src.snncompare -e mdsa_creation_only_size_3_4 -v
     Experiment_runner(
         exp_config=exp_config,
@@ -74,6 +136,9 @@ def process_args(*, args: argparse.Namespace, custom_config_path: str) -> None:
         ),
         reverse=args.reverse,
         specific_run_config=specific_run_config,
+        shard=shard,
+        workers=args.workers,
+        resume=args.resume,
     )
     # TODO: verify expected output results have been generated successfully.
     print("Done")
@@ -83,7 +148,7 @@ def process_args(*, args: argparse.Namespace, custom_config_path: str) -> None:
 @typechecked
 def manage_export_parsing(*, args: argparse.Namespace) -> Output_config:
     """Performs the argument parsing related to data export settings."""
-    create_root_dir_if_not_exists(root_dir_name="latex/Images/graphs")
+    os.makedirs("latex/Images/graphs", exist_ok=True)
     optional_config_args_dict = {}
     extra_storing_config_dict = {}
 
@@ -144,6 +209,25 @@ def manage_export_parsing(*, args: argparse.Namespace) -> Output_config:
             "Error, port nr should be >8000. Not necessarily over 9000."
         )
 
+    optional_config_args_dict["stage_1_format"] = args.stage_1_format
+    optional_config_args_dict["stage_2_format"] = args.stage_2_format
+    optional_config_args_dict["simsnn_backend"] = args.simsnn_backend
+    optional_config_args_dict["recording_policy"] = Recording_policy(
+        recording=args.recording,
+        neuron_name_patterns=(
+            None
+            if args.recorded_neurons is None
+            else args.recorded_neurons.split(",")
+        ),
+    )
+    optional_config_args_dict["batch_radiation"] = args.batch_radiation
+    optional_config_args_dict["profile"] = args.profile
+    if args.early_stop is not None:
+        optional_config_args_dict["early_stop_policy"] = Early_stop_policy(
+            predicate=args.early_stop,
+            check_interval=args.early_stop_interval,
+            quiescent_duration=args.quiescent_duration,
+        )
     optional_config_args_dict["zoom"] = parse_zoom_arg(args=args)
     optional_config_args_dict["recreate_stages"] = parse_recreate_stages(
         args=args
@@ -192,6 +276,39 @@ def parse_zoom_arg(
     return zoom
 
 
+@typechecked
+def parse_shard_arg(
+    *,
+    args: argparse.Namespace,
+) -> Optional[Tuple[int, int]]:
+    """Returns the shard index and shard count of the shard argument i/n, or
+    of the shard index and shard count arguments, or None if no shard is
+    specified."""
+    if args.shard is None:
+        if args.shard_index is None and args.shard_count is None:
+            return None
+        if args.shard_index is None or args.shard_count is None:
+            raise ValueError(
+                "Error, the shard index and shard count should be given "
+                + "together."
+            )
+        return args.shard_index, args.shard_count
+    if args.shard_index is not None or args.shard_count is not None:
+        raise ValueError(
+            "Error, give either --shard or --shard-index and --shard-count."
+        )
+    shard_index, separator, shard_count = args.shard.partition("/")
+    if (
+        separator != "/"
+        or not shard_index.isdigit()
+        or not shard_count.isdigit()
+    ):
+        raise ValueError(
+            f"Error, the shard should be formatted as i/n:{args.shard}"
+        )
+    return int(shard_index), int(shard_count)
+
+
 @typechecked
 def parse_recreate_stages(
     *,
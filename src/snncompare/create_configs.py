@@ -1,16 +1,18 @@
 """Contains helper functions that are used throughout this repository."""
-from typing import Dict, List, Optional, Tuple, Union
+import heapq
+import json
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple, Union
 
 import customshowme
 from snnadaptation.Adaptation import Adaptation
 from snnradiation.Rad_damage import Rad_damage
 
-# from snncompare.export_results.load_json_to_nx_graph import dicts_are_equal
-from typeguard import typechecked
-
 from snncompare.exp_config.Exp_config import Exp_config
 from snncompare.run_config.Run_config import Run_config, run_configs_are_equal
 
+# from snncompare.export_results.load_json_to_nx_graph import dicts_are_equal
+from snncompare.typechecking import typechecked
+
 # if TYPE_CHECKING:
 # from snncompare.exp_config.Exp_config import Exp_config
 
@@ -21,99 +23,323 @@ def generate_run_configs(
     *,
     exp_config: "Exp_config",
     specific_run_config: Optional[Run_config] = None,
+    shard: Optional[Tuple[int, int]] = None,
 ) -> List[Run_config]:
     """Generates the run configs belonging to an experiment config, and then
-    removes all run configs except for the desired run config.
+    removes all run configs except for the desired run config, or except for
+    the run configs in the desired (shard index, shard count) shard.
 
     Throws an error if the desired run config is not within the expected
     run configs.
     """
-    found_run_config = False
-    # Generate run configurations.
-    run_configs: List[Run_config] = exp_config_to_run_configs(
+    run_config_space: Run_config_space = Run_config_space(
         exp_config=exp_config
     )
-    # run_configs = run_configs[:3]  # TODO: comment out.
     if specific_run_config is not None:
-        for gen_run_config in run_configs:
-            if run_configs_are_equal(
-                left=specific_run_config, right=gen_run_config
-            ):
-                found_run_config = True
-                if gen_run_config.unique_id != specific_run_config.unique_id:
-                    raise ValueError(
-                        "Error, equal dict but unequal unique_ids."
-                    )
-                break
+        # Raises an error if the run config is not in the run space.
+        index: int = run_config_space.get_index(run_config=specific_run_config)
+        if run_config_space[index].unique_id != specific_run_config.unique_id:
+            raise ValueError("Error, equal dict but unequal unique_ids.")
+        return [specific_run_config]
+    if shard is not None:
+        return [
+            run_config_space[index]
+            for index in run_config_space.get_shard_indices(
+                shard_index=shard[0], shard_count=shard[1]
+            )
+        ]
+    return list(run_config_space)
 
-        if not found_run_config:
-            print("specific_run_config=")
-            specific_run_config.print_run_config_dict()
-            print("FOUND run configs:")
-            for run_config in run_configs:
-                if run_config.seed == specific_run_config.seed:
-                    run_config.print_run_config_dict()
-            raise ValueError("The expected run config was not found.")
-        run_configs = [specific_run_config]
 
-    return run_configs
+class Run_config_space:
+    """Lazily generates the run configs of an experiment configuration.
 
+    Run configs are only created when they are accessed, by index, by
+    unique_id or per shard, such that workers can get their part of the
+    experiment without creating all run configs. The index order is the
+    reversed order of the loops over: algorithm, adaptation, radiation,
+    seed, graph size, simulator and graph nr.
+    """
 
-@typechecked
-def exp_config_to_run_configs(
-    *,
-    exp_config: "Exp_config",
-) -> List[Run_config]:
-    """Generates all the run_config dictionaries of a single experiment
-    configuration. Then verifies whether each run_config is valid.
+    @typechecked
+    def __init__(self, exp_config: "Exp_config") -> None:
+        self.exp_config: Exp_config = exp_config
+        self.algorithms: List[Dict[str, Dict[str, int]]] = [
+            {algorithm_name: algo_config}
+            for algorithm_name, algo_specs in exp_config.algorithms.items()
+            for algo_config in algo_specs
+        ]
+        self.graph_settings: List[Tuple[Tuple[int, int], str, int]] = [
+            (size_and_max_graph, simulator, graph_nr)
+            for size_and_max_graph in exp_config.size_and_max_graphs
+            for simulator in exp_config.simulators
+            for graph_nr in range(0, size_and_max_graph[1])
+        ]
+        self.settings: List[List] = [
+            self.algorithms,
+            exp_config.adaptations,
+            exp_config.radiations,
+            exp_config.seeds,
+            self.graph_settings,
+        ]
+        # The position of each setting value in its setting list, per
+        # setting. They are created on the first index lookup.
+        self.setting_positions: Optional[List[Dict[Hashable, int]]] = None
+        # The shard of each run config, per shard count.
+        self.shard_assignments: Dict[int, List[int]] = {}
+        # The index of each run config, per unique_id. It is created on the
+        # first unique_id lookup.
+        self.unique_id_indices: Optional[Dict[str, int]] = None
 
-    TODO: Ensure this can be done modular, and lower the depth of the loop.
-    """
-    # pylint: disable=R0914
-
-    run_configs: List[Run_config] = []
-    # pylint: disable=R1702
-    # TODO: make it loop through a list of keys.
-    # for algorithm in exp_config.algorithms:
-    for algorithm_name, algo_specs in exp_config.algorithms.items():
-        for algo_config in algo_specs:
-            algorithm = {algorithm_name: algo_config}
-            for run_config_adaptation in exp_config.adaptations:
-                for run_config_radiation in exp_config.radiations:
-                    fill_remaining_run_config_settings(
-                        adaptation=run_config_adaptation,
-                        algorithm=algorithm,
-                        exp_config=exp_config,
-                        radiation=run_config_radiation,
-                        run_configs=run_configs,
+    @typechecked
+    def __len__(self) -> int:
+        nr_of_run_configs: int = 1
+        for setting_values in self.settings:
+            nr_of_run_configs *= len(setting_values)
+        return nr_of_run_configs
+
+    @typechecked
+    def __getitem__(self, index: int) -> Run_config:
+        """Returns the run config at the index of the run space."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(
+                f"Error, index:{index} not in run space of:{len(self)}."
+            )
+
+        positions: List[int] = self.get_positions(index=index)
+        size_and_max_graph, simulator, graph_nr = self.graph_settings[
+            positions[4]
+        ]
+        return run_parameters_to_dict(
+            adaptation=self.exp_config.adaptations[positions[1]],
+            algorithm=self.algorithms[positions[0]],
+            seed=self.exp_config.seeds[positions[3]],
+            size_and_max_graph=size_and_max_graph,
+            graph_nr=graph_nr,
+            radiation=self.exp_config.radiations[positions[2]],
+            simulator=simulator,
+        )
+
+    @typechecked
+    def get_positions(self, *, index: int) -> List[int]:
+        """Returns the position of the run config at the index in each setting
+        list, the last setting changes fastest."""
+        remainder: int = len(self) - 1 - index
+        positions: List[int] = []
+        for setting_values in reversed(self.settings):
+            remainder, position = divmod(remainder, len(setting_values))
+            positions.insert(0, position)
+        return positions
+
+    @typechecked
+    def get_cost_estimate(self, *, index: int) -> int:
+        """Returns an estimate of the duration of the run config at the index,
+        as: graph_size^2 * (m_val + 1) * redundancy."""
+        positions: List[int] = self.get_positions(index=index)
+        graph_size: int = self.graph_settings[positions[4]][0][0]
+        m_val: int = sum(
+            algo_config.get("m_val", 0)
+            for algo_config in self.algorithms[positions[0]].values()
+        )
+        adaptation: Union[None, Adaptation] = self.exp_config.adaptations[
+            positions[1]
+        ]
+        redundancy: int = 1
+        if adaptation is not None:
+            redundancy = max(1, adaptation.redundancy)
+        return graph_size**2 * (m_val + 1) * redundancy
+
+    @typechecked
+    def __iter__(self) -> Iterator[Run_config]:
+        for index in range(len(self)):
+            yield self[index]
+
+    @typechecked
+    def get_setting_keys(self, *, run_config: Run_config) -> List[Hashable]:
+        """Returns the key of the value of each setting of the run config,
+        in the order of the settings."""
+        return [
+            json.dumps(run_config.algorithm, sort_keys=True),
+            get_setting_hash(setting=run_config.adaptation),
+            get_setting_hash(setting=run_config.radiation),
+            run_config.seed,
+            (
+                run_config.graph_size,
+                run_config.simulator,
+                run_config.graph_nr,
+            ),
+        ]
+
+    @typechecked
+    def get_setting_positions(self) -> List[Dict[Hashable, int]]:
+        """Returns the position of each setting value in its setting list, per
+        setting, with the keys of get_setting_keys."""
+        if self.setting_positions is None:
+            self.setting_positions = [
+                {
+                    json.dumps(algorithm, sort_keys=True): position
+                    for position, algorithm in enumerate(self.algorithms)
+                },
+                {
+                    get_setting_hash(setting=adaptation): position
+                    for position, adaptation in enumerate(
+                        self.exp_config.adaptations
                     )
-    return list(reversed(run_configs))
+                },
+                {
+                    get_setting_hash(setting=radiation): position
+                    for position, radiation in enumerate(
+                        self.exp_config.radiations
+                    )
+                },
+                {
+                    seed: position
+                    for position, seed in enumerate(self.exp_config.seeds)
+                },
+                {
+                    (size_and_max_graph[0], simulator, graph_nr): position
+                    for position, (
+                        size_and_max_graph,
+                        simulator,
+                        graph_nr,
+                    ) in enumerate(self.graph_settings)
+                },
+            ]
+        return self.setting_positions
+
+    @typechecked
+    def get_index(self, *, run_config: Run_config) -> int:
+        """Returns the index of the run config in the run space, based on its
+        settings, without creating the other run configs.
+
+        The position of each setting value is multiplied with the nr of
+        run configs per step of that setting, which is the product of the
+        lengths of the settings that change faster, as in get_positions.
+        """
+        position_in_loops: int = 0
+        stride: int = 1
+        for setting_key, positions, setting_values in reversed(
+            list(
+                zip(
+                    self.get_setting_keys(run_config=run_config),
+                    self.get_setting_positions(),
+                    self.settings,
+                )
+            )
+        ):
+            if setting_key not in positions:
+                raise ValueError(
+                    "Error, the expected run config was not found:"
+                    + f"{run_config.__dict__}"
+                )
+            position_in_loops += positions[setting_key] * stride
+            stride *= len(setting_values)
+        index: int = len(self) - 1 - position_in_loops
+        if not run_configs_are_equal(left=run_config, right=self[index]):
+            raise ValueError(
+                "Error, the expected run config was not found:"
+                + f"{run_config.__dict__}"
+            )
+        return index
+
+    @typechecked
+    def get_unique_id_indices(self) -> Dict[str, int]:
+        """Returns the index of each run config in the run space, per
+        unique_id. The unique_ids are only computed once by this run space,
+        on the first unique_id lookup."""
+        if self.unique_id_indices is None:
+            self.unique_id_indices = {
+                run_config.unique_id: index
+                for index, run_config in enumerate(self)
+            }
+        return self.unique_id_indices
+
+    @typechecked
+    def get_index_of_unique_id(self, *, unique_id: str) -> int:
+        """Returns the index of the run config with the unique_id in the run
+        space."""
+        if unique_id not in self.get_unique_id_indices():
+            raise ValueError(
+                f"Error, unique_id:{unique_id} not in the run space."
+            )
+        return self.get_unique_id_indices()[unique_id]
+
+    @typechecked
+    def get_shard_assignment(self, *, shard_count: int) -> List[int]:
+        """Returns the shard index of each run config. The assignment is only
+        computed once per shard count by this run space.
+
+        The run configs are distributed over the shards based on their cost
+        estimate: from expensive to cheap, each run config is assigned to
+        the shard with the lowest total cost so far. This is deterministic,
+        so each node computes the same shards without communicating.
+        """
+        if shard_count < 1:
+            raise ValueError(
+                f"Error, the shard count should be 1 or larger:{shard_count}"
+            )
+        if shard_count not in self.shard_assignments:
+            costs: List[int] = [
+                self.get_cost_estimate(index=index)
+                for index in range(len(self))
+            ]
+            shard_assignment: List[int] = [0] * len(self)
+            # Store the (total cost, shard index) of each shard in a heap.
+            shard_costs: List[Tuple[int, int]] = [
+                (0, shard_index) for shard_index in range(shard_count)
+            ]
+            for index in sorted(
+                range(len(self)), key=lambda index: (-costs[index], index)
+            ):
+                total_cost, shard_index = heapq.heappop(shard_costs)
+                shard_assignment[index] = shard_index
+                heapq.heappush(
+                    shard_costs, (total_cost + costs[index], shard_index)
+                )
+            self.shard_assignments[shard_count] = shard_assignment
+        return self.shard_assignments[shard_count]
+
+    @typechecked
+    def get_shard_indices(
+        self, *, shard_index: int, shard_count: int
+    ) -> List[int]:
+        """Returns the indices of the run configs in a shard, in increasing
+        order. The shards are disjoint, and together they contain all run
+        configs."""
+        if not 0 <= shard_index < shard_count:
+            raise ValueError(
+                f"Error, the shard index:{shard_index} should be in range 0 "
+                + f"to the shard count:{shard_count}."
+            )
+        return [
+            index
+            for index, some_shard_index in enumerate(
+                self.get_shard_assignment(shard_count=shard_count)
+            )
+            if some_shard_index == shard_index
+        ]
 
 
 @typechecked
-def fill_remaining_run_config_settings(
+def get_setting_hash(
+    *, setting: Union[None, Adaptation, Rad_damage]
+) -> Union[None, str]:
+    """Returns the hash of an adaptation or radiation setting."""
+    if setting is None:
+        return None
+    return setting.get_hash()
+
+
+@typechecked
+def exp_config_to_run_configs(
     *,
-    adaptation: Union[None, Adaptation],
-    algorithm: Dict,
     exp_config: "Exp_config",
-    radiation: Rad_damage,
-    run_configs: List[Run_config],
-) -> None:
-    """Generate basic settings for a run config."""
-    for seed in exp_config.seeds:
-        for size_and_max_graph in exp_config.size_and_max_graphs:
-            for simulator in exp_config.simulators:
-                for graph_nr in range(0, size_and_max_graph[1]):
-                    run_config: Run_config = run_parameters_to_dict(
-                        adaptation=adaptation,
-                        algorithm=algorithm,
-                        seed=seed,
-                        size_and_max_graph=size_and_max_graph,
-                        graph_nr=graph_nr,
-                        radiation=radiation,
-                        simulator=simulator,
-                    )
-                    run_configs.append(run_config)
+) -> List[Run_config]:
+    """Generates all the run_config dictionaries of a single experiment
+    configuration."""
+    return list(Run_config_space(exp_config=exp_config))
 
 
 # pylint: disable=R0913
@@ -144,3 +370,46 @@ def run_parameters_to_dict(
     )
 
     return run_config
+
+
+@typechecked
+def get_stage_1_group_key(*, run_config: Run_config) -> str:
+    """Returns the key of the run_configs that share the same stage 1 snns.
+
+    The stage 1 snns do not depend on the radiation, so run_configs
+    that only differ in radiation get the same key.
+    """
+    if run_config.adaptation is None:
+        adaptation_hash: Union[None, str] = None
+    else:
+        adaptation_hash = run_config.adaptation.get_hash()
+    return json.dumps(
+        [
+            run_config.algorithm,
+            run_config.graph_size,
+            run_config.graph_nr,
+            run_config.seed,
+            adaptation_hash,
+            run_config.simulator,
+        ],
+        sort_keys=True,
+    )
+
+
+@typechecked
+def group_run_configs_by_stage_1(
+    *,
+    run_configs: List[Run_config],
+) -> List[List[Run_config]]:
+    """Groups the run_configs that share the same stage 1 snns.
+
+    The groups are returned in the order in which they first occur in
+    the incoming run_configs, and the run_configs within a group keep
+    their original order.
+    """
+    groups: Dict[str, List[Run_config]] = {}
+    for run_config in run_configs:
+        groups.setdefault(
+            get_stage_1_group_key(run_config=run_config), []
+        ).append(run_config)
+    return list(groups.values())
@@ -11,7 +11,6 @@ from snnalgorithms.get_alg_configs import get_algo_configs
 from snnalgorithms.sparse.MDSA.alg_params import MDSA
 from snnalgorithms.verify_algos import verify_algos_in_exp_config
 from snnradiation.Rad_damage import Rad_damage
-from typeguard import typechecked
 
 from snncompare.exp_config.adap_dict2obj import (
     get_adaptations_from_exp_config_dict,
@@ -19,6 +18,7 @@ from snncompare.exp_config.adap_dict2obj import (
 from snncompare.exp_config.rad_dict2obj import (
     get_radiations_from_exp_config_dict,
 )
+from snncompare.typechecking import typechecked
 
 
 # pylint: disable=R0902
@@ -178,6 +178,11 @@ class Supported_experiment_settings:
         # The backend/type of simulator that is used.
         self.simulators = ["nx", "lava", "simsnn"]
 
+        # The implementations that step the simsnn snns. sparse steps the
+        # snns with a sparse weight matrix, and gives the same results as
+        # simsnn.
+        self.simsnn_backends = ["simsnn", "sparse"]
+
         # Generate the supported adaptation settings.
         self.specify_supported_adaptation_settings()
 
@@ -187,6 +192,23 @@ class Supported_experiment_settings:
         # Specify the supported image export file extensions.
         self.export_types = ["gif", "pdf", "png", "svg"]
 
+        # The file formats in which the stage 1 snns are stored. npz stores
+        # the neuron parameters and synapses as arrays.
+        self.stage_1_formats = ["json", "npz"]
+
+        # The file formats in which the stage 2 snn behaviour is stored.
+        self.stage_2_formats = ["json", "npz"]
+
+        # The neuron variables that are recorded during simulation. full
+        # records the spikes, V and I, spikes only records the spikes.
+        self.recordings = ["full", "spikes"]
+
+        # The conditions on which a simsnn simulation is stopped before its
+        # maximum duration. terminator stops once the terminator neuron of the
+        # algorithm has spiked, quiescent stops once no neuron has spiked for
+        # a number of timesteps.
+        self.early_stop_predicates = ["terminator", "quiescent"]
+
     @typechecked
     def specify_supported_radiations_settings(self) -> None:
         """Specifies types of supported radiations settings. Some settings
@@ -5,7 +5,7 @@ from typing import Dict, List, Union
 from snnadaptation.Adaptation import Adaptation
 
 # from snncompare.export_results.load_json_to_nx_graph import dicts_are_equal
-from typeguard import typechecked
+from snncompare.typechecking import typechecked
 
 
 @typechecked
@@ -5,7 +5,7 @@ from typing import Dict, List, Union
 from snnradiation.Rad_damage import Rad_damage
 
 # from snncompare.export_results.load_json_to_nx_graph import dicts_are_equal
-from typeguard import typechecked
+from snncompare.typechecking import typechecked
 
 
 @typechecked
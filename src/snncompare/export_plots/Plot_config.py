@@ -1,7 +1,7 @@
 """Generates interactive view of graph."""
 
 
-from typeguard import typechecked
+from snncompare.typechecking import typechecked
 
 
 # pylint: disable=R0902
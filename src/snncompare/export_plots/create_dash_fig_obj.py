@@ -7,9 +7,9 @@ import networkx as nx
 import numpy as np
 import plotly.graph_objs as go
 from plotly.graph_objs.layout import Annotation
-from typeguard import typechecked
 
 from snncompare.export_plots.Plot_config import Plot_config
+from snncompare.typechecking import typechecked
 
 
 # pylint: disable=R0903
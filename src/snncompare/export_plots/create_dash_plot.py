@@ -10,7 +10,6 @@ from snnbackends.simsnn.simsnn_to_nx_lif import (
     add_simsnn_simulation_data_to_reconstructed_nx_lif,
     simsnn_graph_to_nx_lif_graph,
 )
-from typeguard import typechecked
 
 from snncompare.export_plots.create_dash_fig_obj import create_svg_with_dash
 from snncompare.export_plots.Plot_config import (
@@ -28,6 +27,7 @@ from snncompare.export_plots.store_plot_data_in_graph import (
 from snncompare.helper import get_some_duration
 from snncompare.optional_config.Output_config import Output_config
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 
 # Determine which graph(s) the user would like to see.
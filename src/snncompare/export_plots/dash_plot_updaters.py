@@ -7,10 +7,10 @@ import networkx as nx
 import plotly.graph_objs as go
 from dash import dcc, html
 from dash.dependencies import Input, Output
-from typeguard import typechecked
 
 from snncompare.export_plots.create_dash_fig_obj import NamedAnnotation
 from snncompare.export_plots.Plot_config import Plot_config
+from snncompare.typechecking import typechecked
 
 
 @typechecked
@@ -4,10 +4,10 @@ from __future__ import annotations
 import os
 from typing import TYPE_CHECKING, Any
 
-import matplotlib.pyplot as plt
 import networkx as nx
 from simplt.export_plot import create_target_dir_if_not_exists
-from typeguard import typechecked
+
+from snncompare.typechecking import typechecked
 
 if TYPE_CHECKING:
     from snncompare.tests.test_scope import Long_scope_of_tests
@@ -31,6 +31,11 @@ def plot_circular_graph(
     :param recurrent_edge_density:
     :param test_scope:
     """
+    # Matplotlib is only imported when a plot is made, as this module is also
+    # imported by runs that do not create plots.
+    # pylint: disable=C0415
+    import matplotlib.pyplot as plt
+
     # the_labels = get_alipour_labels(G, configuration=configuration)
     the_labels = get_labels(G=G, configuration="du")
     # nx.draw_networkx_labels(G, pos=None, labels=the_labels)
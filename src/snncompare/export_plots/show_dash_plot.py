@@ -7,7 +7,6 @@ import dash
 import networkx as nx
 import plotly.graph_objs as go
 from dash import dcc, html
-from typeguard import typechecked
 
 from snncompare.export_plots.create_dash_fig_obj import create_svg_with_dash
 from snncompare.export_plots.dash_plot_updaters import (
@@ -15,6 +14,7 @@ from snncompare.export_plots.dash_plot_updaters import (
     support_updates,
 )
 from snncompare.export_plots.Plot_config import Plot_config
+from snncompare.typechecking import typechecked
 
 
 @typechecked
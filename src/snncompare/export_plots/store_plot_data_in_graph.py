@@ -3,10 +3,10 @@ from typing import Dict, List
 
 import networkx as nx
 from snnbackends.networkx.LIF_neuron import LIF_neuron
-from typeguard import typechecked
 
 from snncompare.export_plots.get_graph_colours import get_nx_node_colours
 from snncompare.optional_config.Output_config import Hover_info
+from snncompare.typechecking import typechecked
 
 
 @typechecked
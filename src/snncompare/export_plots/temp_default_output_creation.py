@@ -3,8 +3,6 @@ package.
 
 TODO: move the duplicate code out of tests and rename this file.
 """
-from typeguard import typechecked
-
 from snncompare.exp_config.Exp_config import Exp_config
 from snncompare.optional_config.Output_config import (
     Extra_storing_config,
@@ -12,6 +10,7 @@ from snncompare.optional_config.Output_config import (
     Output_config,
     Zoom,
 )
+from snncompare.typechecking import typechecked
 
 
 @typechecked
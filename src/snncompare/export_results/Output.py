@@ -10,10 +10,9 @@ SubInput: Run configuration within an experiment.
 """
 from typing import Dict
 
-from typeguard import typechecked
-
 from snncompare.exp_config.Exp_config import Exp_config
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 from .verify_stage_1_graphs import verify_stage_1_graphs
 from .verify_stage_2_graphs import verify_stage_2_graphs
@@ -8,12 +8,12 @@ Then plots this data (in 3 plots) for a given Experiment setting.
 from typing import Dict, List, Set, Union
 
 from simplt.dotted_plot.dotted_plot import plot_multiple_dotted_groups
-from typeguard import typechecked
 
 from snncompare.export_results.analysis.get_adaptation_cost_settings import (
     Cost_plot_group,
 )
 from snncompare.import_results.helper import create_relative_path
+from snncompare.typechecking import typechecked
 
 
 # pylint: disable = R0903
@@ -1,7 +1,7 @@
 """Creates the different plot data objects."""
 from typing import Dict, List
 
-from typeguard import typechecked
+import pandas as pd
 
 from snncompare.exp_config.Exp_config import Exp_config
 from snncompare.export_results.analysis.adaptation_cost import (
@@ -12,6 +12,7 @@ from snncompare.export_results.analysis.get_adaptation_cost_settings import (
     Raw_adap_cost_data,
     get_raw_adap_cost_datas,
 )
+from snncompare.typechecking import typechecked
 
 
 @typechecked
@@ -121,35 +122,29 @@ def per_adaptation_value() -> None:
 
 
 @typechecked
-def get_adaptation_types(
+def get_adaptation_cost_table(
     raw_adap_cost_datas: List[Raw_adap_cost_data],
-) -> List[str]:
-    """Returns the adaptation types in a list of Raw_adap_cost_data."""
-    adaptation_types: List[str] = []
+    cost_type: str,
+) -> pd.DataFrame:
+    """Returns a table with the adaptation name, input graph size and cost of
+    each Raw_adap_cost_data."""
+    rows: List[Dict] = []
     for raw_adap_cost_data in raw_adap_cost_datas:
         if raw_adap_cost_data.adaptation is None:
-            adaptation_group: str = "no_adaptation"
-
+            adaptation_name: str = "no_adaptation"
         else:
-            adaptation_group = (
+            adaptation_name = (
                 f"{raw_adap_cost_data.adaptation.adaptation_type}"
                 + f"_{raw_adap_cost_data.adaptation.redundancy}"
             )
-        if adaptation_group not in adaptation_types:
-            adaptation_types.append(adaptation_group)
-    return adaptation_types
-
-
-@typechecked
-def get_graph_sizes(
-    raw_adap_cost_datas: List[Raw_adap_cost_data],
-) -> List[int]:
-    """Returns the adaptation types in a list of Raw_adap_cost_data."""
-    graph_sizes: List[int] = []
-    for raw_adap_cost_data in raw_adap_cost_datas:
-        if raw_adap_cost_data.graph_size not in graph_sizes:
-            graph_sizes.append(raw_adap_cost_data.graph_size)
-    return graph_sizes
+        rows.append(
+            {
+                "adaptation_name": adaptation_name,
+                "graph_size": raw_adap_cost_data.graph_size,
+                "cost": raw_adap_cost_data.costs[cost_type],
+            }
+        )
+    return pd.DataFrame(rows)
 
 
 @typechecked
@@ -162,29 +157,20 @@ def get_adaptation_cost_groups_from_incoming_adaptation_cost_datas(
 
     cost_plot_groups: Dict[str, Cost_plot_group] = {}
     print(f"cost_type={cost_type}")
-    for adaptation_type in get_adaptation_types(
-        raw_adap_cost_datas=raw_adap_cost_datas
-    ):  # both type and value
-        # Create a list of input_graph sizes, and per input_graph size, a list
-        # of y-coordinates that represent the cost in [neurons/synapses/spikes]
-        xy_coords_per_adaptation_type: Dict[float, List[float]] = {}
-        for graph_size in get_graph_sizes(raw_adap_cost_datas):
-            y_values: List[float] = []
-            for raw_adap_cost_data in raw_adap_cost_datas:
-                if raw_adap_cost_data.adaptation is None:
-                    adaptation_name: str = "no_adaptation"
-                else:
-                    adaptation_name = (
-                        f"{raw_adap_cost_data.adaptation.adaptation_type}"
-                        + f"_{raw_adap_cost_data.adaptation.redundancy}"
-                    )
-                if (
-                    adaptation_name == adaptation_type
-                    and raw_adap_cost_data.graph_size == graph_size
-                ):
-                    y_values.append(raw_adap_cost_data.costs[cost_type])
-            xy_coords_per_adaptation_type[graph_size] = y_values
-
+    adap_cost_table: pd.DataFrame = get_adaptation_cost_table(
+        raw_adap_cost_datas=raw_adap_cost_datas, cost_type=cost_type
+    )
+    # Create a list of y-coordinates that represent the cost in
+    # [neurons/synapses/spikes], per adaptation type and input_graph size.
+    costs_per_group: pd.Series = adap_cost_table.groupby(
+        ["adaptation_name", "graph_size"], sort=False
+    )["cost"].agg(lambda costs: costs.tolist())
+    graph_sizes: List[int] = adap_cost_table["graph_size"].unique().tolist()
+    for adaptation_type in adap_cost_table["adaptation_name"].unique():
+        xy_coords_per_adaptation_type: Dict[float, List[float]] = {
+            graph_size: costs_per_group.get((adaptation_type, graph_size), [])
+            for graph_size in graph_sizes
+        }
         cost_plot_groups[adaptation_type] = Cost_plot_group(
             adaptation_type=adaptation_type,
             xy_coords_per_adaptation_type=xy_coords_per_adaptation_type,
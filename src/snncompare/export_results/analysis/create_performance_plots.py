@@ -5,33 +5,23 @@ import copy
 
 # Take in exp_config or run_configs
 # If exp_config, get run_configs
-from typing import Dict, List, Tuple
+from typing import Dict, List
 
 import matplotlib.pyplot as plt
-import networkx as nx
 import numpy as np
 import pandas as pd
 import seaborn as sns
-from rich.progress import track
 from snnadaptation.Adaptation import Adaptation
 from snnradiation.Rad_damage import Rad_damage
-from typeguard import typechecked
 
 from snncompare.exp_config.Exp_config import Exp_config
 from snncompare.export_plots.plot_graphs import export_plot
-from snncompare.graph_generation.stage_1_create_graphs import (
-    load_input_graph_from_file_with_init_props,
+from snncompare.export_results.analysis.results_table import (
+    output_stage_4_results_table,
 )
 from snncompare.helper import get_snn_graph_names
-from snncompare.import_results.load_stage4 import load_stage4_results
-from snncompare.import_results.load_stage_1_and_2 import (
-    has_outputted_stage_1,
-    load_stage1_simsnn_graphs,
-)
-from snncompare.progress_report.has_completed_stage2_or_4 import (
-    has_outputted_stage_2_or_4,
-)
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 
 # pylint: disable = R0903
@@ -94,6 +84,11 @@ def create_performance_plots(
             Get the result of a run config and store it in the boxplot data.
     """
 
+    # Collect the stage 4 results of all run configs into a single table.
+    results_table: pd.DataFrame = output_stage_4_results_table(
+        run_configs=completed_run_configs
+    )
+
     robustness_plot_data: Dict[str, Dict[str, List[float]]] = {}
     for rad_setting in reversed(exp_config.radiations):
         # TODO: separate per radiation_name (type).
@@ -101,23 +96,20 @@ def create_performance_plots(
         # for radiation_value in radiation_values:
 
         print(
-            "Loading stage 4 results to create boxplot with:"
+            "Creating boxplot from stage 4 results with:"
             # + f"{radiation_name}:{radiation_value}, adaptation type"
             + f":{exp_config.adaptations:}"
         )
 
-        # Get run configs belonging to this radiation type/level.
-        wanted_run_configs: List[Run_config] = []
-        for run_config in completed_run_configs:
-            if run_config.radiation == rad_setting:
-                wanted_run_configs.append(run_config)
-
-        # Get results per line.
+        # Get results per line, of the run configs belonging to this
+        # radiation type/level.
         boxplot_data: Dict[
             str, Dict[int, Boxplot_x_val]
         ] = get_boxplot_datapoints(
             adaptations=exp_config.adaptations,
-            wanted_run_configs=wanted_run_configs,
+            results_table=results_table[
+                results_table["radiation"] == rad_setting.get_filename()
+            ],
             seeds=exp_config.seeds,
         )
 
@@ -161,50 +153,15 @@ def get_image_name(*, count: int, rad_setts: Rad_damage) -> str:
     )
 
 
-@typechecked
-def get_completed_and_missing_run_configs(
-    *,
-    run_configs: List[Run_config],
-) -> Tuple[List[Run_config], List[Run_config]]:
-    """Returns the run configs that still need to be ran."""
-    missing_run_configs: List[Run_config] = []
-    completed_run_configs: List[Run_config] = []
-
-    for run_config in run_configs:
-        input_graph: nx.Graph = load_input_graph_from_file_with_init_props(
-            run_config=run_config
-        )
-        if has_outputted_stage_1(
-            input_graph=input_graph,
-            run_config=run_config,
-        ):
-            graphs_dict: Dict = load_stage1_simsnn_graphs(
-                run_config=run_config,
-            )
-            if has_outputted_stage_2_or_4(
-                graphs_dict=graphs_dict,
-                run_config=run_config,
-                stage_index=4,
-            ):
-                completed_run_configs.append(run_config)
-            else:
-                missing_run_configs.append(run_config)
-        else:
-            missing_run_configs.append(run_config)
-    if len(missing_run_configs) > 0:
-        print(f"Want:{len(run_configs)}, missing:{len(missing_run_configs)}")
-    return completed_run_configs, missing_run_configs
-
-
 @typechecked
 def get_boxplot_datapoints(
     *,
     adaptations: list[Adaptation],
-    wanted_run_configs: List[Run_config],
-    # run_config_nx_graphs: Dict,
+    results_table: pd.DataFrame,
     seeds: List[int],
 ) -> Dict[str, Dict[int, Boxplot_x_val]]:
-    """Returns the run configs that still need to be ran."""
+    """Returns the nr of correct and wrong results per boxplot column, per
+    seed, of the run configs in the stage 4 results table."""
     # Creates a boxplot storage object, with the name of the column as string,
     # and in the value a dict with seed as key, and boxplot score (nr_of_wrongs
     # vs nr of right) in the value.
@@ -214,97 +171,49 @@ def get_boxplot_datapoints(
         graph_names=get_snn_graph_names(),
         seeds=seeds,
     )
+    for algo_name in results_table["algorithm_name"].unique():
+        if algo_name != "MDSA":
+            raise NotImplementedError(
+                f"Error, {algo_name} is not yet supported."
+            )
 
-    for wanted_run_config in track(
-        wanted_run_configs, total=len(wanted_run_configs)
-    ):
-        # TODO: load the boxplot data pickle if it exists, otherwise
-        # load it from json data.
-
-        # Get the results per x-axis category per graph type.
-        for algo_name in wanted_run_config.algorithm.keys():
-            if algo_name == "MDSA":
-                stage_4_results_dict = load_stage4_results(
-                    run_config=wanted_run_config,
-                    stage_4_results_dict=None,
-                )
-
-                # Get the graphs names that were used in the run.
-                graph_names: List[str] = get_snn_graph_names()
-
-                # Specify the x-axis labels and get snn result dicts.
-                x_labels, results = get_x_labels(
-                    run_config_adaptation=wanted_run_config.adaptation,
-                    adaptations=adaptations,
-                    graphs_dict=stage_4_results_dict,
-                    graph_names=graph_names,
-                    simulator=wanted_run_config.simulator,
-                )
-
-                # Per column, compute the graph scores, and store them into the
-                # boxplot_data.
-                for x_label in x_labels:
-                    # TODO: verify this check is correct.
-                    # pylint: disable=C0201
-                    if x_label in results.keys():
-                        add_graph_scores(
-                            boxplot_data=boxplot_data,
-                            x_label=x_label,
-                            result=results[x_label],
-                            seed=wanted_run_config.seed,
-                        )
-                # TODO: export boxplot data as pickle per run config.
-            else:
-                raise NotImplementedError(
-                    f"Error, {algo_name} is not yet supported."
-                )
+    # Count the correct and wrong results per column and seed.
+    pass_counts: pd.DataFrame = (
+        results_table.assign(x_label=get_x_labels(results_table=results_table))
+        .groupby(["x_label", "seed"])["passed"]
+        .agg(["sum", "count"])
+    )
+    for (x_label, seed), counts in pass_counts.iterrows():
+        # The rad_adapted_snn_graph results of adaptations that are not in
+        # the boxplot, do not get a column.
+        if x_label in boxplot_data and seed in boxplot_data[x_label]:
+            add_graph_scores(
+                boxplot_data=boxplot_data,
+                x_label=x_label,
+                nr_of_correct_results=int(counts["sum"]),
+                nr_of_results=int(counts["count"]),
+                seed=int(seed),
+            )
     return boxplot_data
 
 
 @typechecked
-def get_x_labels(
-    *,
-    run_config_adaptation: Adaptation,
-    adaptations: List[Adaptation],
-    graphs_dict: Dict,
-    graph_names: List[str],
-    simulator: str,
-) -> Tuple[List[str], Dict]:
-    """Returns a tuple of the x-axis labels per column, and the accompanying
-    snn graph results."""
-    x_labels: List[str] = []
-    results = {}
-    for graph_name in graph_names:
-        if graph_name == "rad_adapted_snn_graph":
-            # TODO: fix.
-            for adaptation in adaptations:
-                # Create a new column and xlabel in the results dict, and
-                # store the snn graph results in there.
-                x_labels.append(adaptation.get_name())
-                # Only add the results of the run_config adaptation graph if
-                # the (generic) adaptation name is the same as that of the
-                # run_config adaptation type and redundancy value.
-                if run_config_adaptation.get_name() == adaptation.get_name():
-                    if simulator == "simsnn":
-                        results[adaptation.get_name()] = graphs_dict[
-                            graph_name
-                        ].network.graph.graph["results"]
-                    elif simulator == "nx":
-                        results[adaptation.get_name()] = graphs_dict[
-                            graph_name
-                        ]["graph"]["results"]
-        elif graph_name != "input_graph":
-            # This are:
-            # - snn_algo_graphs: 100% score
-            # - snn_adapted_graphs: 100% score
-            # - rad_snn_algo_graphs: xx% score, but it all graphs of this
-            # category are put into 1 column, because there aren't any
-            # different types of adaptation.
-            x_labels.append(graph_name)
-            results[x_labels[-1]] = graphs_dict[
-                graph_name
-            ].network.graph.graph["results"]
-    return x_labels, results
+def get_x_labels(*, results_table: pd.DataFrame) -> pd.Series:
+    """Returns the x-axis label of the boxplot column of each row in the
+    stage 4 results table.
+
+    The rad_adapted_snn_graph results get a column per adaptation name,
+    the other snn graphs are put into a column per graph name:
+    - snn_algo_graphs: 100% score
+    - snn_adapted_graphs: 100% score
+    - rad_snn_algo_graphs: xx% score, but it all graphs of this
+    category are put into 1 column, because there aren't any
+    different types of adaptation.
+    """
+    return results_table["graph_name"].where(
+        results_table["graph_name"] != "rad_adapted_snn_graph",
+        results_table["adaptation_name"],
+    )
 
 
 @typechecked
@@ -312,7 +221,8 @@ def add_graph_scores(
     *,
     boxplot_data: Dict[str, Dict[int, Boxplot_x_val]],
     x_label: str,
-    result: Dict,
+    nr_of_correct_results: int,
+    nr_of_results: int,
     seed: int,
 ) -> None:
     """Per column, per seed it creates a score, which can become a
@@ -321,10 +231,10 @@ def add_graph_scores(
     Then the e.g. 20 seeds, yield 20 scores in range [0,1] which can
     result in an avg score in range [0,1] per column.
     """
-    if result["passed"]:
-        boxplot_data[x_label][seed].correct_results += 1
-    else:
-        boxplot_data[x_label][seed].wrong_results += 1
+    boxplot_data[x_label][seed].correct_results += nr_of_correct_results
+    boxplot_data[x_label][seed].wrong_results += (
+        nr_of_results - nr_of_correct_results
+    )
 
 
 @typechecked
@@ -3,13 +3,13 @@ import json
 from typing import Dict, List, Set, Union
 
 import networkx as nx
+import numpy as np
 from simsnn.core.simulators import Simulator
 from snnadaptation.Adaptation import Adaptation
 from snnalgorithms.get_input_graphs import (
     add_mdsa_initialisation_properties_to_input_graph,
 )
 from snnradiation.Rad_damage import Rad_damage
-from typeguard import typechecked
 
 from snncompare.exp_config.Exp_config import Exp_config
 from snncompare.export_plots.Plot_config import get_default_plot_config
@@ -24,7 +24,11 @@ from snncompare.graph_generation.stage_1_create_graphs import (
 )
 from snncompare.helper import get_snn_graph_from_graphs_dict
 from snncompare.import_results.helper import simsnn_files_exists_and_get_path
+from snncompare.import_results.load_stage_1_and_2 import (
+    load_binary_snn_graph_stage_2,
+)
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 
 # pylint: disable = R0903
@@ -342,6 +346,12 @@ def get_nr_of_spikes_in_snn(
     if not simsnn_exists:
         raise FileNotFoundError(f"Error, {simsnn_filepath} not found.")
 
+    if simsnn_filepath.endswith(".npz"):
+        _, traces = load_binary_snn_graph_stage_2(
+            output_filepath=simsnn_filepath
+        )
+        return int(np.unpackbits(traces["spikes"][0]).sum())
+
     # Read snn graph propagation JSON file into dict.
     with open(simsnn_filepath, encoding="utf-8") as json_file:
         snn_propagation = json.load(json_file)
@@ -0,0 +1,120 @@
+"""Collects the stage 4 results of the run_configs of an experiment into a
+single table, with a row per snn graph per run_config, and the run_config
+settings as columns.
+
+The analysis plots can then be created with group-bys on this table,
+instead of reading the stage 4 results of each run_config separately.
+"""
+import json
+import os
+from typing import Any, Dict, List, Union
+
+import pandas as pd
+
+from snncompare.import_results.load_stage4 import load_stage4_results_only
+from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
+
+RESULTS_TABLE_FILEPATH: str = "results/stage4_results_table.parquet"
+
+
+@typechecked
+def get_run_config_columns(
+    *, run_config: Run_config
+) -> Dict[str, Union[int, str]]:
+    """Returns the settings of a run_config as columns of the results
+    table."""
+    if len(run_config.algorithm.keys()) != 1:
+        raise NotImplementedError(
+            "Error, only 1 algorithm per run_config is supported."
+        )
+    algorithm_name: str = list(run_config.algorithm.keys())[0]
+    columns: Dict[str, Union[int, str]] = {
+        "unique_id": run_config.unique_id,
+        "algorithm_name": algorithm_name,
+    }
+    columns.update(run_config.algorithm[algorithm_name])
+    if run_config.adaptation is None:
+        columns["adaptation_name"] = "no_adaptation"
+    else:
+        columns["adaptation_name"] = run_config.adaptation.get_name()
+    columns.update(
+        {
+            "graph_size": run_config.graph_size,
+            "graph_nr": run_config.graph_nr,
+            "seed": run_config.seed,
+            "simulator": run_config.simulator,
+            "radiation": run_config.radiation.get_filename(),
+        }
+    )
+    return columns
+
+
+@typechecked
+def get_stage_4_results_table(
+    *,
+    run_configs: List[Run_config],
+) -> pd.DataFrame:
+    """Returns the stage 4 results of the run_configs as a table with a row
+    per snn graph per run_config.
+
+    The columns are the run_config settings, the snn graph_name, and the
+    values in the stage 4 results dict of that graph.
+    """
+    results_per_run_config: Dict[
+        str, Dict[str, Dict]
+    ] = load_stage4_results_only(run_configs=run_configs)
+
+    rows: List[Dict] = []
+    for run_config in run_configs:
+        run_config_columns: Dict[
+            str, Union[int, str]
+        ] = get_run_config_columns(run_config=run_config)
+        for graph_name, results in results_per_run_config[
+            run_config.unique_id
+        ].items():
+            rows.append(
+                {**run_config_columns, "graph_name": graph_name, **results}
+            )
+    return pd.DataFrame(rows)
+
+
+@typechecked
+def output_stage_4_results_table(
+    *,
+    run_configs: List[Run_config],
+    filepath: str = RESULTS_TABLE_FILEPATH,
+) -> pd.DataFrame:
+    """Exports the stage 4 results table of the run_configs to a Parquet
+    file, and returns the table.
+
+    Parquet columns have a single type, so the nested (dict or list)
+    values of the stage 4 results are stored as json strings.
+    """
+    results_table: pd.DataFrame = get_stage_4_results_table(
+        run_configs=run_configs
+    )
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    results_table.map(nested_value_to_json).to_parquet(filepath, index=False)
+    return results_table
+
+
+@typechecked
+def nested_value_to_json(value: Any) -> Any:
+    """Returns dicts and lists as json strings, and other values as is."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True)
+    return value
+
+
+@typechecked
+def load_stage_4_results_table(
+    *,
+    filepath: str = RESULTS_TABLE_FILEPATH,
+) -> pd.DataFrame:
+    """Returns the exported stage 4 results table."""
+    if not os.path.isfile(filepath):
+        raise FileNotFoundError(
+            f"Error, stage 4 results table not found at:{filepath}"
+        )
+    return pd.read_parquet(filepath)
@@ -0,0 +1,95 @@
+"""Writes result files such that multiple snncompare processes can share a
+results directory.
+
+Files are written to a temporary file in the same directory, which then
+replaces the target file, such that other processes never read a partially
+written file. Lines are appended to the shared seed hash files under an
+advisory file lock, such that each line is only added once. The same lock
+serialises other read-modify-write updates of shared files.
+"""
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import IO, Iterator, Optional
+
+from snncompare.typechecking import typechecked
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Advisory file locks are not available on Windows.
+    fcntl = None  # type: ignore[assignment]
+
+# The temporary files are created with owner-only permissions, so the output
+# files get the permissions of regular files instead.
+_UMASK: int = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextmanager
+@typechecked
+def atomic_open(
+    *,
+    output_filepath: str,
+    mode: str = "w",
+) -> Iterator[IO]:
+    """Yields a temporary file in the directory of the output file, and
+    replaces the output file with the temporary file once it is written.
+
+    If writing fails, the temporary file is removed and the output file is
+    left unchanged.
+    """
+    if mode not in ["w", "wb"]:
+        raise ValueError(f"Error, mode:{mode} is not supported.")
+    encoding: Optional[str] = "utf-8" if mode == "w" else None
+    tmp_fd, tmp_filepath = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(output_filepath)),
+        prefix=f".{os.path.basename(output_filepath)}.",
+        suffix=".tmp",
+    )
+    try:
+        with os.fdopen(tmp_fd, mode, encoding=encoding) as tmp_file:
+            yield tmp_file
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+    except BaseException:
+        os.remove(tmp_filepath)
+        raise
+    os.chmod(tmp_filepath, 0o666 & ~_UMASK)
+    os.replace(tmp_filepath, output_filepath)
+
+
+@contextmanager
+@typechecked
+def exclusive_lock(*, some_file: IO) -> Iterator[None]:
+    """Holds an advisory lock on the open file, such that concurrent
+    processes that lock the same file wait for each other."""
+    if fcntl is not None:
+        fcntl.flock(some_file.fileno(), fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        if fcntl is not None:
+            fcntl.flock(some_file.fileno(), fcntl.LOCK_UN)
+
+
+@typechecked
+def append_line_if_missing(*, filepath: str, line: str) -> bool:
+    """Appends the line to the file if the file does not yet contain it, and
+    returns True if the line was appended.
+
+    The file is locked while it is read and appended, such that concurrent
+    processes do not add the same line twice.
+    """
+    with open(filepath, "a+", encoding="utf-8") as txt_file, exclusive_lock(
+        some_file=txt_file
+    ):
+        txt_file.seek(0)
+        if any(
+            existing_line.rstrip("\n") == line for existing_line in txt_file
+        ):
+            return False
+        txt_file.write(f"{line}\n")
+        txt_file.flush()
+        os.fsync(txt_file.fileno())
+        return True
@@ -5,7 +5,9 @@ from typing import Any, Dict, List, Union
 
 import networkx as nx
 from networkx.readwrite import json_graph
-from typeguard import typechecked
+
+from snncompare.export_results.atomic_storage import atomic_open
+from snncompare.typechecking import typechecked
 
 
 @typechecked
@@ -17,12 +19,11 @@ def write_to_json(
     TODO: Rename some_dict to some_text.
     """
 
-    with open(output_filepath, "w", encoding="utf-8") as fp:
+    with atomic_open(output_filepath=output_filepath) as fp:
         if isinstance(some_dict, Dict):
             json.dump(some_dict, fp, indent=4, sort_keys=True)
         elif isinstance(some_dict, List):
             json.dump(some_dict, fp, indent=4, sort_keys=True)
-        fp.close()
 
     # Verify the file exists.
     if not Path(output_filepath).is_file():
@@ -3,7 +3,8 @@ from typing import Dict
 
 import networkx as nx
 from networkx.readwrite import json_graph
-from typeguard import typechecked
+
+from snncompare.typechecking import typechecked
 
 
 @typechecked
@@ -8,9 +8,9 @@ from typing import Any, Dict, List, Union
 import networkx as nx
 from simsnn.core.simulators import Simulator
 from snnradiation.Rad_damage import list_of_hashes_to_hash
-from typeguard import typechecked
 
 from snncompare.exp_config.Exp_config import Exp_config
+from snncompare.typechecking import typechecked
 
 from ..helper import get_some_duration
 
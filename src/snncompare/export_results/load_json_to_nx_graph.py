@@ -7,10 +7,10 @@ from networkx.readwrite import json_graph
 from snnbackends.verify_nx_graphs import (
     verify_results_nx_graphs_contain_expected_stages,
 )
-from typeguard import typechecked
 
 from snncompare.helper import dicts_are_equal, file_exists
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 from .verify_json_graphs import (
     verify_results_safely_check_json_graphs_contain_expected_stages,
@@ -19,10 +19,11 @@ import jsons
 import networkx as nx
 from simsnn.core.nodes import LIF
 from simsnn.core.simulators import Simulator
-from typeguard import typechecked
 
-# if TYPE_CHECKING:
 from snncompare.exp_config.Exp_config import Exp_config
+
+# if TYPE_CHECKING:
+from snncompare.export_results.atomic_storage import append_line_if_missing
 from snncompare.export_results.export_json_results import (
     verify_loaded_json_content_is_nx_graph,
     write_to_json,
@@ -39,7 +40,10 @@ from snncompare.import_results.helper import (
     seed_rand_nrs_hash_file_exists,
     simsnn_files_exists_and_get_path,
 )
+from snncompare.import_results.results_index import index_artifact
+from snncompare.progress_report.profiling import profile_section
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 
 # pylint: disable=R0902
@@ -103,7 +107,6 @@ def output_stage_1_configs_and_input_graphs(
 ) -> None:
     """Exports results dict to a json file."""
     output_simsnn_stage1_exp_config(exp_config=exp_config, stage_index=1)
-    output_simsnn_stage1_run_config(run_config=run_config, stage_index=1)
     output_input_graph_if_not_exist(
         input_graph=graphs_dict["input_graph"],
     )
@@ -112,6 +115,25 @@ def output_stage_1_configs_and_input_graphs(
         run_config=run_config,
         stage_index=1,
     )
+    output_stage_1_run_config_and_radiation_data(
+        run_config=run_config,
+        graphs_dict=graphs_dict,
+    )
+
+
+@typechecked
+def output_stage_1_run_config_and_radiation_data(
+    *,
+    run_config: Run_config,
+    graphs_dict: Dict[str, Union[nx.Graph, nx.DiGraph, Simulator]],
+) -> None:
+    """Exports the stage 1 data that depends on the radiation of the
+    run_config.
+
+    The other stage 1 data is shared by all run_configs that only
+    differ in radiation.
+    """
+    output_simsnn_stage1_run_config(run_config=run_config, stage_index=1)
 
     # Output radiation affected neurons.
     for with_adaptation in [False, True]:
@@ -174,6 +196,10 @@ def output_simsnn_stage1_run_config(
         output_filepath=f"{relative_dir}{run_config.unique_id}.json",
         some_dict=jsons.dump(run_config.__dict__),
     )
+    index_artifact(
+        filepath=f"{relative_dir}{run_config.unique_id}.json",
+        unique_id=run_config.unique_id,
+    )
 
 
 @typechecked
@@ -260,11 +286,10 @@ def output_mdsa_rand_nrs(
         filepath=rand_nrs_data.seed_hash_filepath,
         expected_line=rand_nrs_data.rand_nrs_hash,
     ):
-        with open(
-            rand_nrs_data.seed_hash_filepath, "a", encoding="utf-8"
-        ) as txt_file:
-            txt_file.write(f"{rand_nrs_data.rand_nrs_hash}\n")
-            txt_file.close()
+        append_line_if_missing(
+            filepath=rand_nrs_data.seed_hash_filepath,
+            line=rand_nrs_data.rand_nrs_hash,
+        )
 
     if not rand_nrs_data.rand_nrs_file_exists:
         output_unique_list_int_or_dict(
@@ -281,9 +306,10 @@ def get_rand_nrs_and_hash(
 ) -> Tuple[List[int], str]:
     """Returns the rand nrs and accompanying hash."""
     rand_nrs: List[int] = input_graph.graph["alg_props"]["rand_edge_weights"]
-    rand_nrs_hash: str = str(
-        hashlib.sha256(json.dumps(rand_nrs).encode("utf-8")).hexdigest()
-    )
+    with profile_section(category="hash"):
+        rand_nrs_hash: str = str(
+            hashlib.sha256(json.dumps(rand_nrs).encode("utf-8")).hexdigest()
+        )
     return rand_nrs, rand_nrs_hash
 
 
@@ -373,6 +399,7 @@ def output_unique_list_int_or_dict(
             output_filepath=output_filepath,
             some_dict=output_data,
         )
+        index_artifact(filepath=output_filepath, unique_id=None)
     else:
         raise NotImplementedError("Error, target already exists. Write check.")
 
@@ -409,8 +436,7 @@ def output_radiation_data(
         filepath=radiation_data.seed_hash_filepath,
         expected_line=radiation_data.rad_affected_neurons_hash,
     ):
-        with open(
-            radiation_data.seed_hash_filepath, "a", encoding="utf-8"
-        ) as txt_file:
-            txt_file.write(f"{radiation_data.rad_affected_neurons_hash}\n")
-            txt_file.close()
+        append_line_if_missing(
+            filepath=radiation_data.seed_hash_filepath,
+            line=radiation_data.rad_affected_neurons_hash,
+        )
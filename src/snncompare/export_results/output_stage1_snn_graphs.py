@@ -7,21 +7,30 @@
     radiation type, Died neurons list with adaptation.
 """
 import copy
-from typing import Dict, List, Union
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
 
 import networkx as nx
 import numpy as np
 from simsnn.core.connections import Synapse
 from simsnn.core.nodes import LIF
 from simsnn.core.simulators import Simulator
-from typeguard import typechecked
 
+from snncompare.export_results.atomic_storage import atomic_open
 from snncompare.export_results.export_json_results import write_to_json
 from snncompare.export_results.output_stage1_configs_and_input_graph import (
     get_rand_nrs_and_hash,
 )
-from snncompare.import_results.helper import simsnn_files_exists_and_get_path
+from snncompare.import_results.helper import (
+    get_binary_filepath,
+    simsnn_files_exists_and_get_path,
+)
+from snncompare.import_results.results_index import index_artifact
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
+
+STAGE_1_FORMAT_VERSION: int = 2
 
 
 @typechecked
@@ -30,8 +39,10 @@ def output_stage_1_snns(
     run_config: Run_config,
     graphs_dict: Dict[str, Union[nx.Graph, nx.DiGraph, Simulator]],
     with_adaptation: bool,
+    stage_1_format: str = "json",
 ) -> None:
-    """Exports results dict to a json file."""
+    """Exports results dict to a json file, or to a binary .npz file if the
+    stage 1 format is npz."""
     _, rand_nrs_hash = get_rand_nrs_and_hash(
         input_graph=graphs_dict["input_graph"]
     )
@@ -47,16 +58,21 @@ def output_stage_1_snns(
     if not simsnn_exists:
         if with_adaptation:
             # Export default snn.
-            output_snn_graph_stage_1(
+            output_filepath: str = output_snn_graph_stage_1(
                 output_filepath=simsnn_filepath,
                 snn_graph=graphs_dict["adapted_snn_graph"],
+                stage_1_format=stage_1_format,
             )
         else:
             # Export adapted snn.
-            output_snn_graph_stage_1(
+            output_filepath = output_snn_graph_stage_1(
                 output_filepath=simsnn_filepath,
                 snn_graph=graphs_dict["snn_algo_graph"],
+                stage_1_format=stage_1_format,
             )
+        index_artifact(
+            filepath=output_filepath, unique_id=run_config.unique_id
+        )
 
 
 @typechecked
@@ -64,8 +80,10 @@ def output_snn_graph_stage_1(
     *,
     output_filepath: str,
     snn_graph: Union[nx.DiGraph, Simulator],
-) -> None:
-    """Outputs the simsnn neuron properties, synapse properties. Explicit graph
+    stage_1_format: str = "json",
+) -> str:
+    """Outputs the simsnn neuron properties, synapse properties, and returns
+    the filepath they were written to. Explicit graph
     attributes are not stored, as they should be a function of the run config
     with which they are called, not a part of the snn graph. The graphs are
     stored in the folder:
@@ -75,6 +93,16 @@ def output_snn_graph_stage_1(
     # TODO: change this into an object with: name and a list of parameters
     # instead.
 
+    if isinstance(snn_graph, Simulator) and stage_1_format == "npz":
+        binary_filepath: str = get_binary_filepath(
+            json_filepath=output_filepath,
+            stage_index=1,
+        )
+        output_binary_snn_graph_stage_1(
+            output_filepath=binary_filepath,
+            snn_graph=snn_graph,
+        )
+        return binary_filepath
     if isinstance(snn_graph, Simulator):
         json_simsns_neurons: List[Dict] = simsnn_nodes_to_json(
             simsnn_neurons=copy.deepcopy(snn_graph.network.nodes)
@@ -91,9 +119,98 @@ def output_snn_graph_stage_1(
                 "synapses": json_simsnn_synapses,
             },
         )
+        return output_filepath
+    raise NotImplementedError("TODO: convert into simsnn and export.")
+
+
+@typechecked
+def output_binary_snn_graph_stage_1(
+    *,
+    output_filepath: str,
+    snn_graph: Simulator,
+) -> None:
+    """Outputs the simsnn neuron and synapse properties as a single .npz
+    file."""
+    with atomic_open(output_filepath=output_filepath, mode="wb") as fp:
+        np.savez(fp, **get_stage_1_arrays(snn_graph=snn_graph))
+
+    # Verify the file exists.
+    if not Path(output_filepath).is_file():
+        raise FileExistsError(
+            f"Error, filepath:{output_filepath} was not created."
+        )
 
-    else:
-        raise NotImplementedError("TODO: convert into simsnn and export.")
+
+@typechecked
+def get_stage_1_arrays(*, snn_graph: Simulator) -> Dict[str, np.ndarray]:
+    """Returns the simsnn neuron and synapse properties as a struct of arrays:
+
+    - neuron_keys: the LIF properties, in createLIF argument names.
+    - neuron_<key>: one column per LIF property, with a value per neuron.
+      The neuron_name column is the name table of the snn.
+    - json_neuron_keys: the LIF properties of which the column contains
+      json strings, because their values are not all numbers or strings.
+    - synapse_pre, synapse_post: the neuron indices of the synapses.
+    - synapse_w: the synapse weights.
+    - synapse_d: the synapse delays, the length of their output buffers.
+    """
+    neuron_dicts: List[Dict] = simsnn_nodes_to_json(
+        simsnn_neurons=copy.deepcopy(snn_graph.network.nodes)
+    )
+    neuron_keys: List[str] = list(neuron_dicts[0]) if neuron_dicts else []
+    if neuron_dicts and "name" not in neuron_keys:
+        raise KeyError("Error, the stage 1 snn neurons have no name.")
+
+    stage_1_arrays: Dict[str, np.ndarray] = {
+        "format_version": np.array(STAGE_1_FORMAT_VERSION),
+        "neuron_keys": np.array(neuron_keys, dtype=str),
+    }
+    json_neuron_keys: List[str] = []
+    for key in neuron_keys:
+        column, is_json = get_neuron_column(
+            values=[neuron_dict[key] for neuron_dict in neuron_dicts]
+        )
+        stage_1_arrays[f"neuron_{key}"] = column
+        if is_json:
+            json_neuron_keys.append(key)
+    stage_1_arrays["json_neuron_keys"] = np.array(json_neuron_keys, dtype=str)
+
+    neuron_indices: Dict[int, int] = {
+        id(neuron): neuron_index
+        for neuron_index, neuron in enumerate(snn_graph.network.nodes)
+    }
+    synapses: List[Synapse] = snn_graph.network.synapses
+    stage_1_arrays["synapse_pre"] = np.array(
+        [neuron_indices[id(synapse.pre)] for synapse in synapses],
+        dtype=np.int32,
+    )
+    stage_1_arrays["synapse_post"] = np.array(
+        [neuron_indices[id(synapse.post)] for synapse in synapses],
+        dtype=np.int32,
+    )
+    stage_1_arrays["synapse_w"] = np.array(
+        [synapse.w for synapse in synapses], dtype=float
+    )
+    stage_1_arrays["synapse_d"] = np.array(
+        [len(synapse.out_pre) for synapse in synapses], dtype=np.int32
+    )
+    return stage_1_arrays
+
+
+@typechecked
+def get_neuron_column(*, values: List[Any]) -> Tuple[np.ndarray, bool]:
+    """Returns the column of a LIF property, and True if the values are stored
+    as json strings. Columns of only numbers or only strings are stored as
+    such, other values (e.g. None, tuples) are stored as json strings such
+    that the .npz file can be loaded without pickle."""
+    if all(isinstance(value, str) for value in values):
+        return np.array(values, dtype=str), False
+    if all(
+        isinstance(value, (bool, int, float, np.number, np.bool_))
+        for value in values
+    ):
+        return np.array(values), False
+    return np.array([json.dumps(value) for value in values], dtype=str), True
 
 
 @typechecked
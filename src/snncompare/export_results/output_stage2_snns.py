@@ -8,22 +8,31 @@
 """
 import json
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import networkx as nx
+import numpy as np
 from simsnn.core.simulators import Simulator
-from typeguard import typechecked
 
+from snncompare.export_results.atomic_storage import atomic_open
 from snncompare.export_results.output_stage1_configs_and_input_graph import (
     get_rand_nrs_and_hash,
 )
-from snncompare.import_results.helper import simsnn_files_exists_and_get_path
+from snncompare.import_results.helper import (
+    STAGE_2_FLOAT_DTYPE,
+    STAGE_2_NEURON_KEYS,
+    get_binary_filepath,
+    get_recorded_neuron_names,
+    simsnn_files_exists_and_get_path,
+)
+from snncompare.import_results.results_index import index_artifact
 from snncompare.optional_config.Output_config import Output_config
 from snncompare.run_config.Run_config import Run_config
 from snncompare.simulation.stage2_sim import (
     get_output_category_and_rad_affected_neuron_hash,
     simulate_load_or_skip,
 )
+from snncompare.typechecking import typechecked
 
 
 @typechecked
@@ -33,13 +42,14 @@ def output_stage_2_snns(
     output_config: Output_config,
     run_config: Run_config,
 ) -> None:
-    """Exports results dict to a json file."""
+    """Exports results dict to a json file, unless the stage 2 output is
+    skipped."""
+    if output_config.extra_storing_config.skip_stage_2_output:
+        return
     stage_index: int = 2
 
     for with_adaptation in [False, True]:
         for with_radiation in [False, True]:
-            # if not output_config.extra_storing_config.skip_stage_2_output:
-            # TODO: check whether the output file exists or not.
             next_action: str = simulate_load_or_skip(
                 output_config=output_config,
                 run_config=run_config,
@@ -77,13 +87,18 @@ def output_stage_2_snns(
                     rand_nrs_hash=rand_nrs_hash,
                 )
                 if not simsnn_exists:
-                    output_snn_graph_stage_2(
+                    written_filepath: str = output_snn_graph_stage_2(
                         output_filepath=simsnn_filepath,
                         snn_graph=get_desired_snn_graph(
                             graphs_dict=graphs_dict,
                             with_adaptation=with_adaptation,
                             with_radiation=with_radiation,
                         ),
+                        stage_2_format=output_config.stage_2_format,
+                    )
+                    index_artifact(
+                        filepath=written_filepath,
+                        unique_id=run_config.unique_id,
                     )
 
 
@@ -114,29 +129,149 @@ def output_snn_graph_stage_2(
     *,
     output_filepath: str,
     snn_graph: Union[nx.DiGraph, Simulator],
-) -> None:
-    """Outputs the simsnn neuron behaviour over time."""
+    stage_2_format: str = "json",
+) -> str:
+    """Outputs the simsnn neuron behaviour over time, and returns the filepath
+    it was written to."""
     # TODO: change this into an object with: name and a list of parameters
     # instead.
 
+    if isinstance(snn_graph, Simulator) and stage_2_format == "npz":
+        binary_filepath: str = get_binary_filepath(
+            json_filepath=output_filepath,
+            stage_index=2,
+        )
+        output_binary_snn_graph_stage_2(
+            output_filepath=binary_filepath,
+            snn_graph=snn_graph,
+        )
+        return binary_filepath
     if isinstance(snn_graph, Simulator):
-        v: List = snn_graph.multimeter.V.tolist()
-        i: List = snn_graph.multimeter.I.tolist()
+        recorded_v, recorded_i = get_recorded_v_and_i(snn_graph=snn_graph)
+        v: List = recorded_v.tolist()
+        i: List = recorded_i.tolist()
         spikes: List = snn_graph.raster.spikes.tolist()
         neuron_dict: Dict = {"V": v, "I": i, "spikes": spikes}
-        with open(output_filepath, "w", encoding="utf-8") as fp:
+        neuron_dict.update(
+            get_stage_2_recorded_neuron_names(snn_graph=snn_graph)
+        )
+        with atomic_open(output_filepath=output_filepath) as fp:
             json.dump(
                 neuron_dict,
                 fp,
                 indent=4,
                 sort_keys=True,
             )
-            fp.close()
 
         # Verify the file exists.
         if not Path(output_filepath).is_file():
             raise FileExistsError(
                 f"Error, filepath:{output_filepath} was not created."
             )
-    else:
-        raise NotImplementedError(f"Error, {type(snn_graph)} not supported.")
+        return output_filepath
+    raise NotImplementedError(f"Error, {type(snn_graph)} not supported.")
+
+
+@typechecked
+def get_recorded_v_and_i(
+    *, snn_graph: Simulator
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the recorded V and I of the multimeter neurons, with a row per
+    timestep. If V and I are not recorded, the rows have no columns."""
+    nr_of_timesteps: int = len(snn_graph.raster.spikes)
+    v: Optional[np.ndarray] = getattr(snn_graph.multimeter, "V", None)
+    i: Optional[np.ndarray] = getattr(snn_graph.multimeter, "I", None)
+    if v is None or len(snn_graph.multimeter.targets) == 0:
+        v = np.zeros((nr_of_timesteps, 0))
+    if i is None or len(snn_graph.multimeter.targets) == 0:
+        i = np.zeros((nr_of_timesteps, 0))
+    return v, i
+
+
+@typechecked
+def get_stage_2_recorded_neuron_names(
+    *, snn_graph: Simulator
+) -> Dict[str, List[str]]:
+    """Returns the names of the neurons whose spikes, and whose V and I are
+    outputted, such that the recorded columns can be verified when they are
+    loaded into a simulator with another recording policy."""
+    recorded_v, _ = get_recorded_v_and_i(snn_graph=snn_graph)
+    raster_neurons_key, multimeter_neurons_key = STAGE_2_NEURON_KEYS
+    return {
+        raster_neurons_key: get_recorded_neuron_names(
+            detector=snn_graph.raster
+        ),
+        multimeter_neurons_key: (
+            get_recorded_neuron_names(detector=snn_graph.multimeter)
+            if recorded_v.shape[1] > 0
+            else []
+        ),
+    }
+
+
+@typechecked
+def get_stage_2_traces_dtype(
+    *,
+    nr_of_spike_columns: int,
+    nr_of_v_columns: int,
+    nr_of_i_columns: int,
+) -> np.dtype:
+    """Returns the dtype of a single timestep of the binary stage 2 snn
+    behaviour. The spikes are bit-packed, V and I are stored as float32."""
+    return np.dtype(
+        [
+            ("spikes", np.uint8, (int(np.ceil(nr_of_spike_columns / 8)),)),
+            ("V", STAGE_2_FLOAT_DTYPE, (nr_of_v_columns,)),
+            ("I", STAGE_2_FLOAT_DTYPE, (nr_of_i_columns,)),
+        ]
+    )
+
+
+@typechecked
+def output_binary_snn_graph_stage_2(
+    *,
+    output_filepath: str,
+    snn_graph: Simulator,
+) -> None:
+    """Outputs the simsnn neuron behaviour over time as an uncompressed .npz
+    file. The traces member has one record per timestep, such that it can be
+    memory mapped, and the raster_neurons and multimeter_neurons members
+    contain the names of the recorded neurons."""
+    spikes: np.ndarray = np.asarray(snn_graph.raster.spikes, dtype=bool)
+    recorded_v, recorded_i = get_recorded_v_and_i(snn_graph=snn_graph)
+    v: np.ndarray = np.asarray(recorded_v, dtype=STAGE_2_FLOAT_DTYPE)
+    i: np.ndarray = np.asarray(recorded_i, dtype=STAGE_2_FLOAT_DTYPE)
+    if not spikes.shape[0] == v.shape[0] == i.shape[0]:
+        raise ValueError(
+            "Error, the number of timesteps of the spikes, V and I differ:"
+            + f"{spikes.shape[0]},{v.shape[0]},{i.shape[0]}."
+        )
+
+    traces: np.ndarray = np.empty(
+        spikes.shape[0],
+        dtype=get_stage_2_traces_dtype(
+            nr_of_spike_columns=spikes.shape[1],
+            nr_of_v_columns=v.shape[1],
+            nr_of_i_columns=i.shape[1],
+        ),
+    )
+    traces["spikes"] = np.packbits(spikes, axis=1)
+    traces["V"] = v
+    traces["I"] = i
+    with atomic_open(output_filepath=output_filepath, mode="wb") as fp:
+        np.savez(
+            fp,
+            traces=traces,
+            **{
+                key: np.array(neuron_names, dtype=str)
+                for key, neuron_names in get_stage_2_recorded_neuron_names(
+                    snn_graph=snn_graph
+                ).items()
+            },
+        )
+
+    # Verify the file exists.
+    if not Path(output_filepath).is_file():
+        raise FileExistsError(
+            f"Error, filepath:{output_filepath} was not created."
+        )
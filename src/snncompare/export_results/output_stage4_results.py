@@ -12,17 +12,25 @@ from typing import Dict, Union
 
 import networkx as nx
 from simsnn.core.simulators import Simulator
-from typeguard import typechecked
 
+from snncompare.export_results.atomic_storage import atomic_open
 from snncompare.export_results.output_stage1_configs_and_input_graph import (
     Radiation_data,
     get_rad_name_filepath_and_exists,
     get_rand_nrs_and_hash,
 )
 from snncompare.export_results.output_stage2_snns import get_desired_snn_graph
-from snncompare.helper import get_snn_graph_from_graphs_dict
+from snncompare.helper import (
+    get_snn_graph_from_graphs_dict,
+    get_snn_graph_names,
+)
 from snncompare.import_results.helper import simsnn_files_exists_and_get_path
+from snncompare.import_results.results_index import (
+    index_artifact,
+    index_stage_4_results,
+)
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 
 @typechecked
@@ -90,6 +98,26 @@ def output_snn_results(
                     ),
                     simulator=run_config.simulator,
                 )
+                index_artifact(
+                    filepath=simsnn_filepath, unique_id=run_config.unique_id
+                )
+
+    if output_data_type == "results":
+        # Also store the results in the results index, such that they can be
+        # loaded for many run_configs at once.
+        results_per_graph: Dict[str, Dict] = {}
+        for graph_name in get_snn_graph_names():
+            snn_graph = graphs_dict[graph_name]
+            if run_config.simulator == "simsnn":
+                results_per_graph[graph_name] = snn_graph.network.graph.graph[
+                    "results"
+                ]
+            else:
+                results_per_graph[graph_name] = snn_graph.graph["results"]
+        index_stage_4_results(
+            unique_id=run_config.unique_id,
+            results_per_graph=results_per_graph,
+        )
 
 
 @typechecked
@@ -118,14 +146,13 @@ def output_some_graph_property_dict(
             f"Error, simulator:{simulator} not implemented."
         )
 
-    with open(output_filepath, "w", encoding="utf-8") as fp:
+    with atomic_open(output_filepath=output_filepath) as fp:
         json.dump(
             dict_content,
             fp,
             indent=4,
             sort_keys=True,
         )
-        fp.close()
 
     # Verify the file exists.
     if not Path(output_filepath).is_file():
@@ -2,9 +2,8 @@
 import pprint
 from typing import Dict, List
 
-from typeguard import typechecked
-
 from snncompare.run_config.Run_config import dict_to_run_config
+from snncompare.typechecking import typechecked
 
 
 @typechecked
@@ -12,10 +12,9 @@ Input: Experiment configuration.
 # pylint: disable=W0613
 from typing import Dict, List
 
-from typeguard import typechecked
-
 from snncompare.exp_config.Exp_config import Exp_config
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 from ..graph_generation.stage_1_create_graphs import has_adaptation
 
@@ -55,7 +54,7 @@ def get_expected_stage_1_graph_names(
     if has_adaptation(run_config=run_config):
         expected_graph_names.append("adapted_snn_graph")
 
-    if not run_config.simulator == "simsnn":
+    if run_config.simulator != "simsnn":
         if run_config.radiation:
             expected_graph_names.append("rad_snn_algo_graph")
             if has_adaptation(run_config=run_config):
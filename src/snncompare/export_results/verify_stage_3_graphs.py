@@ -11,10 +11,9 @@ Input: Experiment configuration.
 """
 from typing import Dict
 
-from typeguard import typechecked
-
 from snncompare.exp_config.Exp_config import Exp_config
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 
 # pylint: disable=W0613
@@ -1,6 +1,5 @@
 """Helps with exporting input graphs."""
 import json
-import os
 import pickle  # nosec
 from pathlib import Path
 from pprint import pprint
@@ -8,38 +7,35 @@ from typing import Dict, List
 
 import networkx as nx
 from networkx.readwrite import json_graph
-from typeguard import typechecked
 
 # if TYPE_CHECKING:
+from snncompare.export_results.atomic_storage import atomic_open
+from snncompare.graph_generation.input_graph_catalogue import (
+    has_input_graph,
+    load_input_graph,
+    register_input_graph,
+)
 from snncompare.import_results.helper import (
     create_relative_path,
     get_isomorphic_graph_hash,
 )
+from snncompare.import_results.results_index import (
+    has_artifact,
+    index_artifact,
+)
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 
 @typechecked
 def load_input_graph_based_on_nr(graph_size: int, graph_nr: int) -> nx.Graph:
     """Loads an input graph based on the graph_size and graph_nr.
 
-    Sorts the input graph filenames(=input graph hashes), loads the nth
-    input  graph, converts it into an nx object and returns it.
+    The input graph hashes are numbered in the order of the input graph
+    catalogue, which only lists the input graph directory once, and the
+    parsed input graphs are cached.
     """
-
-    output_dir: str = f"results/stage1/input_graphs/{graph_size}/"
-    input_graph_hashes: List[str] = [
-        name
-        for name in os.listdir(output_dir)
-        if os.path.isfile(os.path.join(output_dir, name))
-    ]
-    output_filepath: str = f"{output_dir}{input_graph_hashes[graph_nr]}"
-
-    # Load graph from file and verify it results in the same graph.
-    with open(output_filepath, encoding="utf-8") as json_file:
-        some_json_graph = json.load(json_file)
-        json_file.close()
-    loaded_input_graph = nx.node_link_graph(some_json_graph)
-    return loaded_input_graph
+    return load_input_graph(graph_size=graph_size, graph_nr=graph_nr)
 
 
 @typechecked
@@ -47,18 +43,7 @@ def has_outputted_input_graph_for_graph_size_and_nr(
     *, graph_size: int, graph_nr: int
 ) -> bool:
     """Returns True if this input graph already exists."""
-    output_dir: str = f"results/stage1/input_graphs/{graph_size}/"
-    if not os.path.isdir(output_dir):
-        return False
-    nr_of_input_graphs: int = len(
-        [
-            name
-            for name in os.listdir(output_dir)
-            if os.path.isfile(os.path.join(output_dir, name))
-        ]
-    )
-
-    return nr_of_input_graphs > graph_nr
+    return has_input_graph(graph_size=graph_size, graph_nr=graph_nr)
 
 
 @typechecked
@@ -87,13 +72,18 @@ def output_input_graph_if_not_exist(
     output_filepath: str = get_input_graph_output_filepath(
         input_graph=input_graph
     )
-    if not Path(output_filepath).is_file():
+    if not has_artifact(filepath=output_filepath):
         create_relative_path(some_path=output_dir)
 
         # Write undirected graph to json file.
         write_undirected_graph_to_json(
             output_filepath=output_filepath, the_graph=input_graph
         )
+        index_artifact(filepath=output_filepath, unique_id=None)
+        register_input_graph(
+            graph_size=len(input_graph),
+            isomorphic_hash=Path(output_filepath).stem,
+        )
 
 
 @typechecked
@@ -102,11 +92,10 @@ def write_undirected_graph_to_json(
 ) -> None:
     """Writes an undirected graph to json and verifies it can be loaded back
     into the graph."""
-    with open(output_filepath, "w", encoding="utf-8") as fp:
+    with atomic_open(output_filepath=output_filepath) as fp:
         # json.dump(the_graph.__dict__, fp, indent=4, sort_keys=True)
         some_json_graph: Dict = json_graph.node_link_data(the_graph)
         json.dump(some_json_graph, fp, indent=4, sort_keys=True)
-        fp.close()
 
     # Verify the file exists.
     if not Path(output_filepath).is_file():
@@ -134,7 +123,7 @@ def write_undirected_graph_to_json(
 @typechecked
 def store_pickle(*, run_configs: List[Run_config], filepath: str) -> None:
     """Stores run_config list into pickle file."""
-    with open(filepath, "wb") as handle:
+    with atomic_open(output_filepath=filepath, mode="wb") as handle:
         pickle.dump(run_configs, handle, protocol=pickle.HIGHEST_PROTOCOL)
 
 
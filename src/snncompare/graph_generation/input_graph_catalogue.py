@@ -0,0 +1,233 @@
+"""Catalogues the input graphs in results/stage1/input_graphs/<graph size>/,
+such that input graphs are found by (graph size, graph nr) or by isomorphic
+hash without listing and parsing the input graph files on every lookup.
+
+Per graph size, a manifest stores the isomorphic hashes of the input graphs
+in graph nr order. The manifest is created from the filenames in the input
+graph directory in the order of os.listdir, which is how earlier versions
+numbered the input graphs, such that the existing results keep their input
+graphs. Input graphs that are added later get the next graph nrs, so the
+graph nr of an input graph does not change. The manifests are stored in
+results/stage1/input_graph_manifests/ and kept in memory, and the parsed
+input graphs are kept in a least recently used cache. A manifest is only
+updated under a file lock, such that concurrent processes number the input
+graphs the same.
+"""
+import copy
+import functools
+import json
+import os
+from typing import Dict, List, Optional
+
+import networkx as nx
+
+from snncompare.export_results.atomic_storage import (
+    atomic_open,
+    exclusive_lock,
+)
+from snncompare.typechecking import typechecked
+
+INPUT_GRAPHS_DIR: str = "results/stage1/input_graphs/"
+INPUT_GRAPH_MANIFESTS_DIR: str = "results/stage1/input_graph_manifests/"
+INPUT_GRAPH_CACHE_SIZE: int = 256
+
+# The manifests and the graph nr per isomorphic hash, per absolute manifest
+# filepath, such that changing the working directory changes the catalogue.
+_manifests: Dict[str, List[str]] = {}
+_graph_nrs: Dict[str, Dict[str, int]] = {}
+
+
+@typechecked
+def get_input_graph_dir(*, graph_size: int) -> str:
+    """Returns the directory with the input graphs of a graph size."""
+    return f"{INPUT_GRAPHS_DIR}{graph_size}/"
+
+
+@typechecked
+def get_manifest_filepath(*, graph_size: int) -> str:
+    """Returns the absolute filepath of the manifest of a graph size."""
+    return os.path.abspath(f"{INPUT_GRAPH_MANIFESTS_DIR}{graph_size}.json")
+
+
+@typechecked
+def list_input_graph_hashes(*, graph_size: int) -> List[str]:
+    """Returns the isomorphic hashes of the input graph files of a graph size,
+    in the order of os.listdir."""
+    input_graph_dir: str = get_input_graph_dir(graph_size=graph_size)
+    if not os.path.isdir(input_graph_dir):
+        return []
+    return [
+        filename[: -len(".json")]
+        for filename in os.listdir(input_graph_dir)
+        if filename.endswith(".json")
+        and os.path.isfile(os.path.join(input_graph_dir, filename))
+    ]
+
+
+@typechecked
+def get_input_graph_hashes(
+    *, graph_size: int, refresh: bool = False
+) -> List[str]:
+    """Returns the isomorphic hashes of the input graphs of a graph size, in
+    graph nr order.
+
+    The input graph directory is only listed if the manifest does not
+    yet exist, or if refresh is True.
+    """
+    manifest_filepath: str = get_manifest_filepath(graph_size=graph_size)
+    if manifest_filepath in _manifests and not refresh:
+        return _manifests[manifest_filepath]
+
+    hashes: List[str]
+    if os.path.isfile(manifest_filepath) and not refresh:
+        hashes = load_manifest(graph_size=graph_size)
+    else:
+        hashes = update_manifest(graph_size=graph_size)
+
+    _manifests[manifest_filepath] = hashes
+    _graph_nrs[manifest_filepath] = {
+        isomorphic_hash: graph_nr
+        for graph_nr, isomorphic_hash in enumerate(hashes)
+    }
+    return hashes
+
+
+@typechecked
+def update_manifest(*, graph_size: int) -> List[str]:
+    """Appends the input graphs that were added to the input graph directory
+    to the manifest, drops the input graphs that were removed, and returns
+    the updated manifest.
+
+    The manifest is read, updated and written under a file lock, such
+    that concurrent processes do not overwrite each others graph nrs.
+    """
+    manifest_filepath: str = get_manifest_filepath(graph_size=graph_size)
+    os.makedirs(os.path.dirname(manifest_filepath), exist_ok=True)
+    with open(
+        f"{manifest_filepath}.lock", "a", encoding="utf-8"
+    ) as lock_file, exclusive_lock(some_file=lock_file):
+        manifest_exists: bool = os.path.isfile(manifest_filepath)
+        hashes: List[str] = []
+        if manifest_exists:
+            hashes = load_manifest(graph_size=graph_size)
+
+        listed_hashes: List[str] = list_input_graph_hashes(
+            graph_size=graph_size
+        )
+        listed_hash_set = set(listed_hashes)
+        known_hashes = set(hashes)
+        updated_hashes: List[str] = [
+            isomorphic_hash
+            for isomorphic_hash in hashes
+            if isomorphic_hash in listed_hash_set
+        ] + [
+            isomorphic_hash
+            for isomorphic_hash in listed_hashes
+            if isomorphic_hash not in known_hashes
+        ]
+        if updated_hashes != hashes or (listed_hashes and not manifest_exists):
+            output_manifest(graph_size=graph_size, hashes=updated_hashes)
+    return updated_hashes
+
+
+@typechecked
+def load_manifest(*, graph_size: int) -> List[str]:
+    """Returns the isomorphic hashes in the manifest of a graph size."""
+    with open(
+        get_manifest_filepath(graph_size=graph_size), encoding="utf-8"
+    ) as manifest_file:
+        hashes: List[str] = json.load(manifest_file)
+    return hashes
+
+
+@typechecked
+def output_manifest(*, graph_size: int, hashes: List[str]) -> None:
+    """Writes the manifest of a graph size."""
+    manifest_filepath: str = get_manifest_filepath(graph_size=graph_size)
+    os.makedirs(os.path.dirname(manifest_filepath), exist_ok=True)
+    with atomic_open(output_filepath=manifest_filepath) as manifest_file:
+        json.dump(hashes, manifest_file, indent=4)
+
+
+@typechecked
+def register_input_graph(*, graph_size: int, isomorphic_hash: str) -> None:
+    """Adds an input graph that was outputted to the input graph directory to
+    the manifest of its graph size, if it is not yet in it."""
+    if (
+        get_input_graph_nr(
+            graph_size=graph_size, isomorphic_hash=isomorphic_hash
+        )
+        is None
+    ):
+        get_input_graph_hashes(graph_size=graph_size, refresh=True)
+
+
+@typechecked
+def has_input_graph(*, graph_size: int, graph_nr: int) -> bool:
+    """Returns True if the input graph with this graph nr exists. The input
+    graph directory is only listed if the graph nr is not in the manifest."""
+    if graph_nr < len(get_input_graph_hashes(graph_size=graph_size)):
+        return True
+    return graph_nr < len(
+        get_input_graph_hashes(graph_size=graph_size, refresh=True)
+    )
+
+
+@typechecked
+def get_input_graph_nr(
+    *, graph_size: int, isomorphic_hash: str
+) -> Optional[int]:
+    """Returns the graph nr of the input graph with the isomorphic hash, or
+    None if it is not in the manifest of the graph size."""
+    get_input_graph_hashes(graph_size=graph_size)
+    return _graph_nrs[get_manifest_filepath(graph_size=graph_size)].get(
+        isomorphic_hash
+    )
+
+
+@typechecked
+def load_input_graph(*, graph_size: int, graph_nr: int) -> nx.Graph:
+    """Returns a copy of the input graph with the graph nr, such that the
+    cached input graph is not modified."""
+    if not has_input_graph(graph_size=graph_size, graph_nr=graph_nr):
+        raise FileNotFoundError(
+            f"Error, input graph nr:{graph_nr} of size:{graph_size} not "
+            + f"found in:{get_input_graph_dir(graph_size=graph_size)}"
+        )
+    isomorphic_hash: str = get_input_graph_hashes(graph_size=graph_size)[
+        graph_nr
+    ]
+    return load_input_graph_by_hash(
+        graph_size=graph_size, isomorphic_hash=isomorphic_hash
+    )
+
+
+@typechecked
+def load_input_graph_by_hash(
+    *, graph_size: int, isomorphic_hash: str
+) -> nx.Graph:
+    """Returns a copy of the input graph with the isomorphic hash."""
+    input_graph_filepath: str = os.path.abspath(
+        f"{get_input_graph_dir(graph_size=graph_size)}{isomorphic_hash}.json"
+    )
+    return copy.deepcopy(
+        get_parsed_input_graph(input_graph_filepath=input_graph_filepath)
+    )
+
+
+@functools.lru_cache(maxsize=INPUT_GRAPH_CACHE_SIZE)
+@typechecked
+def get_parsed_input_graph(*, input_graph_filepath: str) -> nx.Graph:
+    """Returns the input graph in the json file. The input graph is memoised
+    on its absolute filepath, so it should not be modified."""
+    with open(input_graph_filepath, encoding="utf-8") as json_file:
+        some_json_graph = json.load(json_file)
+    return nx.node_link_graph(some_json_graph)
+
+
+@typechecked
+def clear_input_graph_catalogue() -> None:
+    """Forgets the manifests and parsed input graphs of this process."""
+    _manifests.clear()
+    _graph_nrs.clear()
+    get_parsed_input_graph.cache_clear()
@@ -3,9 +3,8 @@
 Takes run config of an experiment config as input, and returns a
 networkx Graph.
 """
-import copy
 from math import inf
-from typing import Dict, Union
+from typing import Dict, List, Optional, Union
 
 import networkx as nx
 from simsnn.core.networks import Network
@@ -32,13 +31,16 @@ from snnalgorithms.sparse.MDSA.SNN_initialisation_properties import (
 from snnbackends.networkx.LIF_neuron import LIF_neuron
 from snnbackends.simsnn.simsnn_to_nx_lif import simsnn_graph_to_nx_lif_graph
 from snnradiation.apply_rad_to_simsnn import apply_rad_to_simsnn
-from typeguard import typechecked
 
 from snncompare.export_plots.Plot_config import Plot_config
 from snncompare.graph_generation.export_input_graphs import (
     load_input_graph_based_on_nr,
 )
+from snncompare.optional_config.Output_config import Recording_policy
+from snncompare.progress_report.profiling import profile_section
 from snncompare.run_config.Run_config import Run_config
+from snncompare.simulation.clone_snn import clone_simsnn, clone_snn
+from snncompare.typechecking import typechecked
 
 
 @typechecked
@@ -46,24 +48,28 @@ def get_graphs_stage_1(
     *,
     plot_config: Plot_config,
     run_config: Run_config,
+    recording_policy: Optional[Recording_policy] = None,
 ) -> Dict[str, Union[nx.Graph, nx.DiGraph, Simulator]]:
     """Returns the initialised graphs for stage 1 for the different
     simulators."""
-    stage_1_graphs: Dict[
-        str, Union[nx.Graph, nx.DiGraph, Simulator]
-    ] = get_nx_lif_graphs(
-        plot_config=plot_config,
-        run_config=run_config,
-    )
+    with profile_section(category="generate"):
+        stage_1_graphs: Dict[
+            str, Union[nx.Graph, nx.DiGraph, Simulator]
+        ] = get_nx_lif_graphs(
+            plot_config=plot_config,
+            run_config=run_config,
+        )
 
     if run_config.simulator == "nx":
         return stage_1_graphs
     if run_config.simulator == "simsnn":
-        return nx_lif_graphs_to_simsnn_graphs(
-            stage_1_graphs=stage_1_graphs,
-            reverse_conversion=False,
-            run_config=run_config,
-        )
+        with profile_section(category="convert"):
+            return nx_lif_graphs_to_simsnn_graphs(
+                stage_1_graphs=stage_1_graphs,
+                reverse_conversion=False,
+                run_config=run_config,
+                recording_policy=recording_policy,
+            )
     raise NotImplementedError(
         "Error, did not yet implement simsnn to nx_lif converter."
     )
@@ -75,6 +81,7 @@ def nx_lif_graphs_to_simsnn_graphs(
     stage_1_graphs: Dict,
     reverse_conversion: bool,
     run_config: Run_config,
+    recording_policy: Optional[Recording_policy] = None,
 ) -> Dict[str, Union[nx.Graph, nx.DiGraph, Simulator]]:
     """Converts nx_lif graphs to sim snn graphs."""
     new_graphs: Dict = {}
@@ -102,6 +109,7 @@ def nx_lif_graphs_to_simsnn_graphs(
                     snn_graph=stage_1_graphs[graph_name],
                     add_to_multimeter=True,
                     add_to_raster=True,
+                    recording_policy=recording_policy,
                 )
 
     return new_graphs
@@ -113,10 +121,10 @@ def nx_lif_graph_to_simsnn_graph(
     snn_graph: nx.DiGraph,
     add_to_multimeter: bool,
     add_to_raster: bool,
+    recording_policy: Optional[Recording_policy] = None,
 ) -> Simulator:
     """Converts an snn graph of type nx_LIF to sim snn graph."""
     net = Network()
-    sim = Simulator(net, monitor_I=True)
 
     simsnn: Dict[str, LIF] = {}
     for node_name in snn_graph.nodes:
@@ -155,18 +163,46 @@ def nx_lif_graph_to_simsnn_graph(
             d=1,
         )
 
-    if add_to_raster:
-        # Add all neurons to the raster.
-        sim.raster.addTarget(net.nodes)
-    if add_to_multimeter:
-        # Add all neurons to the multimeter.
-        sim.multimeter.addTarget(net.nodes)
+    sim: Simulator = get_simulator_with_recorded_neurons(
+        net=net,
+        add_to_multimeter=add_to_multimeter,
+        add_to_raster=add_to_raster,
+        recording_policy=recording_policy,
+    )
 
     # Add (redundant) graph properties.
     sim.network.graph.graph = snn_graph.graph
     return sim
 
 
+@typechecked
+def get_simulator_with_recorded_neurons(
+    *,
+    net: Network,
+    add_to_multimeter: bool,
+    add_to_raster: bool,
+    recording_policy: Optional[Recording_policy] = None,
+) -> Simulator:
+    """Returns a simsnn Simulator of the network, with the neurons of the
+    recording policy in its raster and multimeter. By default, the spikes, V
+    and I of all neurons are recorded."""
+    if recording_policy is None:
+        recording_policy = Recording_policy()
+    monitor_v_and_i: bool = (
+        add_to_multimeter and recording_policy.records_v_and_i()
+    )
+    sim = Simulator(net, monitor_I=monitor_v_and_i)
+
+    recorded_neurons: List[LIF] = recording_policy.get_recorded_neurons(
+        neurons=net.nodes
+    )
+    if add_to_raster:
+        sim.raster.addTarget(recorded_neurons)
+    if monitor_v_and_i:
+        sim.multimeter.addTarget(recorded_neurons)
+    return sim
+
+
 @typechecked
 def get_nx_lif_graphs(
     *,
@@ -236,7 +272,12 @@ def get_adapted_graph(
     run_config: Run_config,
 ) -> nx.DiGraph:
     """Converts an input graph of stage 1 and applies a form of brain-inspired
-    adaptation to it."""
+    adaptation to it.
+
+    The adaptation is applied to a clone of the snn_algo_graph. For a
+    networkx snn, that clone is a deep copy, because its neurons are
+    mutable objects in its node attributes.
+    """
 
     if run_config.adaptation is None:
         raise ValueError(
@@ -248,14 +289,14 @@ def get_adapted_graph(
             adaptation=run_config.adaptation
         )
         adaptation_graph: nx.DiGraph = apply_sparse_redundancy(
-            adaptation_graph=copy.deepcopy(snn_algo_graph),
+            adaptation_graph=clone_snn(snn=snn_algo_graph),
             plot_config=plot_config,
             redundancy=run_config.adaptation.redundancy,
         )
 
     elif run_config.adaptation.adaptation_type == "population":
         adaptation_graph = apply_population_coding(
-            adaptation_graph=copy.deepcopy(snn_algo_graph),
+            adaptation_graph=clone_snn(snn=snn_algo_graph),
             plot_config=plot_config,
             redundancy=run_config.adaptation.redundancy,
         )
@@ -289,7 +330,7 @@ def get_redundant_graph(
     *, snn_algo_graph: nx.DiGraph, plot_config: Plot_config, red_lev: int
 ) -> nx.DiGraph:
     """Returns a networkx graph that has a form of adaptation added."""
-    adaptation_graph = copy.deepcopy(snn_algo_graph)
+    adaptation_graph = clone_snn(snn=snn_algo_graph)
     apply_sparse_redundancy(
         adaptation_graph=adaptation_graph,
         plot_config=plot_config,
@@ -304,12 +345,12 @@ def get_new_radiation_graph(
     snn_graph: Simulator,
     run_config: Run_config,
 ) -> Simulator:
-    """Makes a deep copy of the incoming graph and applies radiation to it.
+    """Makes a clone of the incoming graph and applies radiation to it.
 
     Then returns the graph with the radiation, as well as a list of
     neurons that are dead.
     """
-    radiation_graph: Simulator = copy.deepcopy(snn_graph)
+    radiation_graph: Simulator = clone_simsnn(snn=snn_graph)
     # TODO: include ignored neuron names per algorithm.
     apply_rad_to_simsnn(
         rad=run_config.radiation,
@@ -8,7 +8,8 @@ import networkx as nx
 from networkx.classes.graph import Graph
 from simsnn.core.connections import Synapse
 from simsnn.core.simulators import Simulator
-from typeguard import typechecked
+
+from snncompare.typechecking import typechecked
 
 if TYPE_CHECKING:
     pass
@@ -2,9 +2,9 @@
 from typing import Dict, List
 
 from snnbackends.verify_nx_graphs import verify_completed_stages_list
-from typeguard import typechecked
 
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 from ..export_results.verify_stage_1_graphs import (
     get_expected_stage_1_graph_names,
@@ -1,14 +1,36 @@
 """Helps importing and exporting."""
 
+import functools
+import hashlib
+import json
 import os
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import Any, FrozenSet, Hashable, List, Optional, Tuple, Union
 
 import networkx as nx
-from typeguard import typechecked
+import numpy as np
+
+from snncompare.import_results.results_index import (
+    get_indexed_hash,
+    has_artifact,
+    index_hash,
+)
+from snncompare.progress_report.profiling import profile_section
 
 # if TYPE_CHECKING:
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
+
+# The keys of the names of the neurons whose behaviour is recorded in a stage
+# 2 file, in the order of the recorded columns.
+STAGE_2_NEURON_KEYS: List[str] = ["raster_neurons", "multimeter_neurons"]
+
+# The dtype of the V and I in a binary stage 2 file.
+STAGE_2_FLOAT_DTYPE: type = np.float32
+
+# The name of the isomorphic hashes in the results index. It contains the
+# networkx version, because another version may compute another hash.
+ISOMORPHIC_HASH_NAME: str = f"weisfeiler_lehman_networkx_{nx.__version__}"
 
 
 @typechecked
@@ -37,9 +59,10 @@ def prepare_target_file_output(
         f"{output_dir}{isomorphic_hash}{additional_hashes}.json"
     )
 
-    if not Path(output_filepath).is_file():
+    output_file_exists: bool = has_artifact(filepath=output_filepath)
+    if not output_file_exists:
         create_relative_path(some_path=output_dir)
-    return Path(output_filepath).is_file(), output_filepath
+    return output_file_exists, output_filepath
 
 
 @typechecked
@@ -49,13 +72,88 @@ def get_isomorphic_graph_hash(*, some_graph: nx.Graph) -> str:
 
     An isomorphic graph is one that looks the same as another/has the
     same shape as another, (if you are blind to the node numbers).
+
+    The hash is memoised on the nodes and edges of the graph, so a graph
+    that is mutated afterwards, is hashed again. The hash is also stored in
+    the results index, such that other processes do not recompute it.
     """
+    with profile_section(category="hash"):
+        return get_cached_isomorphic_graph_hash(
+            graph_structure=get_graph_structure(some_graph=some_graph)
+        )
+
+
+@typechecked
+def get_graph_structure(
+    *, some_graph: nx.Graph
+) -> Tuple[bool, FrozenSet[Hashable], FrozenSet[Tuple[Hashable, Hashable]]]:
+    """Returns the (hashable) nodes and edges that determine the isomorphic
+    hash of a graph."""
+    return (
+        some_graph.is_directed(),
+        frozenset(some_graph.nodes),
+        frozenset(some_graph.edges),
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+@typechecked
+def get_cached_isomorphic_graph_hash(
+    *,
+    graph_structure: Tuple[
+        bool, FrozenSet[Hashable], FrozenSet[Tuple[Hashable, Hashable]]
+    ],
+) -> str:
+    """Computes the Weisfeiler-Lehman hash of a graph structure once, and
+    returns the stored hash on subsequent calls, also if it was stored in the
+    results index by another process."""
+    input_digest: str = get_graph_structure_digest(
+        graph_structure=graph_structure
+    )
+    indexed_hash: Optional[str] = get_indexed_hash(
+        hash_name=ISOMORPHIC_HASH_NAME, input_digest=input_digest
+    )
+    if indexed_hash is not None:
+        return indexed_hash
+
+    is_directed, nodes, edges = graph_structure
+    some_graph: nx.Graph = nx.DiGraph() if is_directed else nx.Graph()
+    some_graph.add_nodes_from(nodes)
+    some_graph.add_edges_from(edges)
     isomorphic_hash: str = (
         nx.algorithms.graph_hashing.weisfeiler_lehman_graph_hash(some_graph)
     )
+    index_hash(
+        hash_name=ISOMORPHIC_HASH_NAME,
+        input_digest=input_digest,
+        hash_value=isomorphic_hash,
+    )
     return isomorphic_hash
 
 
+@typechecked
+def get_graph_structure_digest(
+    *,
+    graph_structure: Tuple[
+        bool, FrozenSet[Hashable], FrozenSet[Tuple[Hashable, Hashable]]
+    ],
+) -> str:
+    """Returns the sha256 digest of a graph structure, which is the same in
+    each process. The edges of undirected graphs are stored in both
+    directions, so they are sorted."""
+    is_directed, nodes, edges = graph_structure
+    edge_reprs: List[List[str]] = [
+        [repr(left), repr(right)] for left, right in edges
+    ]
+    if not is_directed:
+        edge_reprs = [sorted(edge_repr) for edge_repr in edge_reprs]
+    return hashlib.sha256(
+        json.dumps(
+            [is_directed, sorted(map(repr, nodes)), sorted(edge_reprs)]
+        ).encode("utf-8")
+    ).hexdigest()
+
+
 @typechecked
 def create_relative_path(*, some_path: str) -> None:
     """Exports Run_config to a json file."""
@@ -147,6 +245,7 @@ def simsnn_files_exists_and_get_path(
         run_config=run_config
     )
 
+    binary_filepath: str
     if algorithm_name == "MDSA":
         if with_adaptation:
             # Import adapted snn.
@@ -186,11 +285,42 @@ def simsnn_files_exists_and_get_path(
             # print("With adaptation=False")
             # print(snn_algo_graph_filepath)
             # print("Does the snn filepath include the rand_nrs hash?")
+        if not snn_algo_graph_exists and (
+            stage_index == 2
+            or (stage_index == 1 and output_category == "snns")
+        ):
+            # The stage 1 snns and stage 2 behaviour may be stored in the
+            # binary format.
+            binary_filepath = get_binary_filepath(
+                json_filepath=snn_algo_graph_filepath, stage_index=stage_index
+            )
+            if has_artifact(filepath=binary_filepath):
+                return (True, binary_filepath)
         return (snn_algo_graph_exists, snn_algo_graph_filepath)
 
     raise NotImplementedError(f"Error:{algorithm_name} is not yet supported.")
 
 
+@typechecked
+def get_binary_filepath(*, json_filepath: str, stage_index: int) -> str:
+    """Returns the filepath of the binary stage 1 snn or stage 2 snn
+    behaviour that belongs to the json filepath of that stage."""
+    if stage_index not in [1, 2]:
+        raise ValueError(
+            f"Error, stage:{stage_index} has no binary output format."
+        )
+    if not json_filepath.endswith(".json"):
+        raise ValueError(f"Error, {json_filepath} is not a json filepath.")
+    return f"{json_filepath[:-len('.json')]}.npz"
+
+
+@typechecked
+def get_recorded_neuron_names(*, detector: Any) -> List[str]:
+    """Returns the names of the neurons in a simsnn raster or multimeter, in
+    the order of their recorded columns."""
+    return [neuron.name for neuron in detector.targets]
+
+
 @typechecked
 def get_algorithm_description(*, run_config: Run_config) -> Tuple[str, int]:
     """Returns the algorithm name and value as a single string."""
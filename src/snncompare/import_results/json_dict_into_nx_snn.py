@@ -6,9 +6,9 @@ from networkx.readwrite import json_graph
 from snnbackends.networkx.LIF_neuron import Synapse, manually_create_lif_neuron
 from snnbackends.simsnn.export import json_to_simsnn
 from snnbackends.verify_nx_graphs import verify_results_nx_graphs
-from typeguard import typechecked
 
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 
 @typechecked
@@ -1,8 +1,7 @@
 """Parses the graph json files to recreate the graphs."""
 
-from typeguard import typechecked
-
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 
 @typechecked
@@ -3,16 +3,30 @@
 no adaptation no radiation, adaptation no radiation, no adaptation with
 radiation, adaptation with radiation,
 """
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
-from typeguard import typechecked
+import networkx as nx
 
+from snncompare.export_results.output_stage1_configs_and_input_graph import (
+    get_rad_name_filepath_and_exists,
+    get_rand_nrs_and_hash,
+)
 from snncompare.graph_generation.stage_1_create_graphs import (
     load_input_graph_from_file_with_init_props,
 )
 from snncompare.helper import get_snn_graph_name
-from snncompare.import_results.load_stage_1_and_2 import load_simsnn_graphs
+from snncompare.import_results.helper import simsnn_files_exists_and_get_path
+from snncompare.import_results.load_stage_1_and_2 import (
+    load_simsnn_graphs,
+    load_stage_1_neuron_names,
+)
+from snncompare.import_results.read_json import load_json_file_into_dict
+from snncompare.import_results.results_index import (
+    get_indexed_stage_4_results,
+    index_stage_4_results,
+)
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 
 @typechecked
@@ -42,3 +56,102 @@ def load_stage4_results(
             )
 
     return stage_4_results_dict
+
+
+@typechecked
+def load_stage4_results_only(
+    *,
+    run_configs: List[Run_config],
+) -> Dict[str, Dict[str, Dict]]:
+    """Returns the stage 4 results dict per snn graph name, per run_config
+    unique_id, without creating simsnn Simulators.
+
+    The results are read from the results index in bulk. The results of
+    run_configs that are not in the results index are read from their
+    stage 4 json files, and then added to the results index.
+    """
+    results: Dict[str, Dict[str, Dict]] = get_indexed_stage_4_results(
+        unique_ids=[run_config.unique_id for run_config in run_configs]
+    )
+    for run_config in run_configs:
+        if run_config.unique_id not in results:
+            results[run_config.unique_id] = load_stage4_results_from_files(
+                run_config=run_config
+            )
+            index_stage_4_results(
+                unique_id=run_config.unique_id,
+                results_per_graph=results[run_config.unique_id],
+            )
+    return results
+
+
+@typechecked
+def load_stage4_results_from_files(
+    *,
+    run_config: Run_config,
+) -> Dict[str, Dict]:
+    """Returns the stage 4 results dict per snn graph name of a run_config.
+
+    Only the neuron names are read from the stage 1 snns, as they
+    determine which neurons are affected by radiation.
+    """
+    input_graph: nx.Graph = load_input_graph_from_file_with_init_props(
+        run_config=run_config
+    )
+    _, rand_nrs_hash = get_rand_nrs_and_hash(input_graph=input_graph)
+
+    results_per_graph: Dict[str, Dict] = {}
+    for with_adaptation in [False, True]:
+        _, stage_1_simsnn_filepath = simsnn_files_exists_and_get_path(
+            output_category="snns",
+            input_graph=input_graph,
+            run_config=run_config,
+            with_adaptation=with_adaptation,
+            stage_index=1,
+            rand_nrs_hash=rand_nrs_hash,
+            rad_affected_neurons_hash=None,
+        )
+        neuron_graph: nx.DiGraph = nx.DiGraph()
+        neuron_graph.add_nodes_from(
+            load_stage_1_neuron_names(
+                stage_1_simsnn_filepath=stage_1_simsnn_filepath
+            )
+        )
+
+        for with_radiation in [False, True]:
+            if with_radiation:
+                radiation_data = get_rad_name_filepath_and_exists(
+                    input_graph=input_graph,
+                    snn_graph=neuron_graph,
+                    run_config=run_config,
+                    stage_index=4,
+                    with_adaptation=with_adaptation,
+                )
+                output_category: str = radiation_data.radiation_name
+                rad_affected_neurons_hash: Optional[
+                    str
+                ] = radiation_data.rad_affected_neurons_hash
+            else:
+                output_category = "snns"
+                rad_affected_neurons_hash = None
+
+            results_exist, results_filepath = simsnn_files_exists_and_get_path(
+                output_category=output_category,
+                input_graph=input_graph,
+                run_config=run_config,
+                with_adaptation=with_adaptation,
+                stage_index=4,
+                rand_nrs_hash=rand_nrs_hash,
+                rad_affected_neurons_hash=rad_affected_neurons_hash,
+            )
+            if not results_exist:
+                raise FileNotFoundError(
+                    f"Error, stage 4 results not found at:{results_filepath}"
+                )
+            results_per_graph[
+                get_snn_graph_name(
+                    with_adaptation=with_adaptation,
+                    with_radiation=with_radiation,
+                )
+            ] = load_json_file_into_dict(json_filepath=results_filepath)
+    return results_per_graph
@@ -8,15 +8,15 @@
     radiation type, Died neurons list with adaptation.
 """
 import json
+import zipfile
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import networkx as nx
 import numpy as np
 from simsnn.core.networks import Network
 from simsnn.core.nodes import LIF
 from simsnn.core.simulators import Simulator
-from typeguard import typechecked
 
 from snncompare.export_results.output_stage1_configs_and_input_graph import (
     Radiation_data,
@@ -25,23 +25,54 @@ from snncompare.export_results.output_stage1_configs_and_input_graph import (
     get_rand_nrs_and_hash,
     get_rand_nrs_data,
 )
+from snncompare.export_results.output_stage1_snn_graphs import (
+    STAGE_1_FORMAT_VERSION,
+)
 from snncompare.graph_generation.export_input_graphs import (
     get_input_graph_output_filepath,
 )
 from snncompare.graph_generation.stage_1_create_graphs import (
+    get_simulator_with_recorded_neurons,
     load_input_graph_from_file,
     load_input_graph_from_file_with_init_props,
 )
-from snncompare.helper import add_stage_completion_to_graph
-from snncompare.import_results.helper import simsnn_files_exists_and_get_path
+from snncompare.helper import (
+    add_stage_completion_to_graph,
+    get_snn_graph_from_graphs_dict,
+)
+from snncompare.import_results.helper import (
+    STAGE_2_NEURON_KEYS,
+    get_recorded_neuron_names,
+    simsnn_files_exists_and_get_path,
+)
 from snncompare.import_results.load_stage1_results import (
     get_run_config_filepath,
 )
+from snncompare.import_results.results_index import (
+    has_artifact,
+    has_confirmed_completed_stage,
+)
+from snncompare.optional_config.Output_config import Recording_policy
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 from .read_json import load_json_file_into_dict
 
 
+class Stage_2_recording_mismatch(ValueError):
+    """Raised if a stage 2 file contains the behaviour of other neurons than
+    the ones that are recorded by the simulator it is loaded into."""
+
+    @typechecked
+    def __init__(self, *, output_filepath: str, detector_key: str) -> None:
+        super().__init__(
+            f"Error, the snn behaviour in:{output_filepath} is not "
+            + f"recorded for the {detector_key} of the simulator. It was "
+            + "probably outputted with another recording policy."
+        )
+        self.output_filepath: str = output_filepath
+
+
 @typechecked
 def has_outputted_stage_1(
     *,
@@ -56,6 +87,10 @@ def has_outputted_stage_1(
     - (optional) adapted snn graphs
     have been outputted for the isomorphic hash belonging to this run_config.
     """
+    if has_confirmed_completed_stage(
+        unique_id=run_config.unique_id, stage_index=1
+    ):
+        return True
     for with_adaptation in [False, True]:
         if not has_outputted_snn_graph(
             input_graph=input_graph,
@@ -70,7 +105,7 @@ def has_outputted_stage_1(
             return False
 
         json_filepath: str = get_run_config_filepath(run_config=run_config)
-        if not Path(json_filepath).is_file():
+        if not has_artifact(filepath=json_filepath):
             return False
     return True
 
@@ -83,7 +118,7 @@ def has_outputted_input_graph(
     output_filepath: str = get_input_graph_output_filepath(
         input_graph=input_graph
     )
-    return Path(output_filepath).is_file()
+    return has_artifact(filepath=output_filepath)
 
 
 def has_outputted_snn_graph(
@@ -159,6 +194,42 @@ def has_outputted_rand_nrs(
     raise FileNotFoundError(f"{rand_nrs_filepath} does not exist.")
 
 
+@typechecked
+def has_outputted_stage_1_run_config_and_radiation_data(
+    *,
+    graphs_dict: Dict,
+    run_config: Run_config,
+) -> bool:
+    """Returns True if the run_config and the radiation data of this
+    run_config have been outputted.
+
+    Uses the stage 1 snns that are already in memory to compute the
+    radiation affected neurons, instead of loading them from file.
+    """
+    json_filepath: str = get_run_config_filepath(run_config=run_config)
+    if not has_artifact(filepath=json_filepath):
+        return False
+    for with_adaptation in [False, True]:
+        radiation_data: Radiation_data = get_rad_name_filepath_and_exists(
+            input_graph=graphs_dict["input_graph"],
+            snn_graph=get_snn_graph_from_graphs_dict(
+                with_adaptation=with_adaptation,
+                with_radiation=False,
+                graphs_dict=graphs_dict,
+            ),
+            run_config=run_config,
+            stage_index=1,
+            with_adaptation=with_adaptation,
+            rand_nrs_hash=None,
+        )
+        if (
+            not radiation_data.radiation_file_exists
+            or not radiation_data.seed_in_seed_hash_file
+        ):
+            return False
+    return True
+
+
 @typechecked
 def assert_has_outputted_stage_1(run_config: Run_config) -> None:
     """Throws error if stage 1 is not outputted."""
@@ -176,6 +247,7 @@ def load_stage1_simsnn_graphs(
     *,
     run_config: Run_config,
     stage_1_graphs_dict: Optional[Dict] = None,
+    recording_policy: Optional[Recording_policy] = None,
 ) -> Dict:
     """Loads stage1 simsnn graphs and input graph."""
     if stage_1_graphs_dict is None:
@@ -195,6 +267,7 @@ def load_stage1_simsnn_graphs(
             with_adaptation=with_adaptation,
             with_radiation=False,
             stage_index=1,
+            recording_policy=recording_policy,
         )
     return stage_1_graphs_dict
 
@@ -207,6 +280,7 @@ def load_simsnn_graphs(
     with_adaptation: bool,
     with_radiation: bool,
     stage_index: int,
+    recording_policy: Optional[Recording_policy] = None,
 ) -> Simulator:
     """Loads the input_graph."""
     _, rand_nrs_hash = get_rand_nrs_and_hash(input_graph=input_graph)
@@ -227,6 +301,7 @@ def load_simsnn_graphs(
         with_adaptation=with_adaptation,
         with_radiation=with_radiation,
         stage_index=stage_index,
+        recording_policy=recording_policy,
     )
 
 
@@ -240,18 +315,30 @@ def load_simsnn_graph_from_file(
     with_radiation: bool,
     rand_nrs_hash: str,
     stage_index: int,
+    recording_policy: Optional[Recording_policy] = None,
 ) -> Simulator:
     """Loads the simsnn filepath and converts it into a simsnn graph file."""
-    # Read output JSON file into dict.
-    with open(stage_1_simsnn_filepath, encoding="utf-8") as json_file:
-        some_dict: Dict[str, List] = json.load(json_file)
-        json_file.close()
-
-    stage1_simsnn: Simulator = stage1_simsnn_graph_from_file_to_simulator(
-        add_to_raster=True,
-        add_to_multimeter=True,
-        simsnn_dict=some_dict,
-    )
+    if stage_1_simsnn_filepath.endswith(".npz"):
+        stage1_simsnn: Simulator = stage1_simsnn_arrays_to_simulator(
+            add_to_raster=True,
+            add_to_multimeter=True,
+            stage_1_arrays=load_binary_snn_graph_stage_1(
+                output_filepath=stage_1_simsnn_filepath
+            ),
+            recording_policy=recording_policy,
+        )
+    else:
+        # Read output JSON file into dict.
+        with open(stage_1_simsnn_filepath, encoding="utf-8") as json_file:
+            some_dict: Dict[str, List] = json.load(json_file)
+            json_file.close()
+
+        stage1_simsnn = stage1_simsnn_graph_from_file_to_simulator(
+            add_to_raster=True,
+            add_to_multimeter=True,
+            simsnn_dict=some_dict,
+            recording_policy=recording_policy,
+        )
     add_stage_completion_to_graph(snn=stage1_simsnn, stage_index=1)
 
     if with_radiation:
@@ -317,10 +404,10 @@ def stage1_simsnn_graph_from_file_to_simulator(
     add_to_raster: bool,
     add_to_multimeter: bool,
     simsnn_dict: Dict,
+    recording_policy: Optional[Recording_policy] = None,
 ) -> Simulator:
     """Loads the simsnn filepath and converts it into a simsnn graph file."""
     net = Network()
-    sim = Simulator(net, monitor_I=True)
 
     simsnn: Dict[str, LIF] = {}
     for neuron_dict in simsnn_dict["neurons"]:
@@ -335,41 +422,275 @@ def stage1_simsnn_graph_from_file_to_simulator(
             w=synapse["w"],
             d=1,  # TODO: make explicit/load from file.
         )
-    if add_to_raster:
-        # Add all neurons to the raster.
-        sim.raster.addTarget(net.nodes)
-    if add_to_multimeter:
-        # Add all neurons to the multimeter.
-        sim.multimeter.addTarget(net.nodes)
+    sim: Simulator = get_simulator_with_recorded_neurons(
+        net=net,
+        add_to_multimeter=add_to_multimeter,
+        add_to_raster=add_to_raster,
+        recording_policy=recording_policy,
+    )
 
     # TODO: Add (redundant) graph properties.
     return sim
 
 
+@typechecked
+def load_binary_snn_graph_stage_1(
+    *, output_filepath: str
+) -> Dict[str, np.ndarray]:
+    """Returns the arrays of the binary stage 1 snn, see get_stage_1_arrays."""
+    with np.load(output_filepath) as npz_file:
+        stage_1_arrays: Dict[str, np.ndarray] = dict(npz_file)
+    if int(stage_1_arrays["format_version"]) != STAGE_1_FORMAT_VERSION:
+        raise ValueError(
+            "Error, stage 1 format version:"
+            + f"{stage_1_arrays['format_version']} is not supported."
+        )
+    return stage_1_arrays
+
+
+@typechecked
+def load_stage_1_neuron_names(*, stage_1_simsnn_filepath: str) -> List[str]:
+    """Returns the names of the neurons of a json or binary stage 1 snn,
+    without creating its simsnn Simulator."""
+    if stage_1_simsnn_filepath.endswith(".npz"):
+        with np.load(stage_1_simsnn_filepath) as npz_file:
+            if int(npz_file["format_version"]) != STAGE_1_FORMAT_VERSION:
+                raise ValueError(
+                    "Error, stage 1 format version:"
+                    + f"{npz_file['format_version']} is not supported."
+                )
+            neuron_names: List[str] = npz_file["neuron_name"].tolist()
+        return neuron_names
+    return [
+        neuron_dict["name"]
+        for neuron_dict in load_json_file_into_dict(
+            json_filepath=stage_1_simsnn_filepath
+        )["neurons"]
+    ]
+
+
+@typechecked
+def stage1_simsnn_arrays_to_simulator(
+    *,
+    add_to_raster: bool,
+    add_to_multimeter: bool,
+    stage_1_arrays: Dict[str, np.ndarray],
+    recording_policy: Optional[Recording_policy] = None,
+) -> Simulator:
+    """Creates the simsnn Simulator of the binary stage 1 snn from its
+    columns. Each column is converted into Python values at once, instead of
+    parsing a json dict per neuron and synapse.
+
+    The neurons and synapses are created with createLIF and createSynapse,
+    which also add them to the networkx graph of the network. Copying a
+    constructed neuron and synapse instead was not faster, as simsnn
+    needs a Python object per neuron and synapse either way.
+    """
+    neuron_keys: List[str] = stage_1_arrays["neuron_keys"].tolist()
+    json_neuron_keys = set(stage_1_arrays["json_neuron_keys"].tolist())
+    columns: List[List] = []
+    for key in neuron_keys:
+        column: List = stage_1_arrays[f"neuron_{key}"].tolist()
+        if key in json_neuron_keys:
+            column = [json.loads(value) for value in column]
+        columns.append(column)
+
+    net = Network()
+    neurons: List[LIF] = [
+        net.createLIF(**dict(zip(neuron_keys, neuron_values)))
+        for neuron_values in zip(*columns)
+    ]
+    names: List[str] = [neuron.name for neuron in neurons]
+    for pre, post, weight, delay in zip(
+        stage_1_arrays["synapse_pre"].tolist(),
+        stage_1_arrays["synapse_post"].tolist(),
+        stage_1_arrays["synapse_w"].tolist(),
+        stage_1_arrays["synapse_d"].tolist(),
+    ):
+        net.createSynapse(
+            pre=neurons[pre],
+            post=neurons[post],
+            ID=(names[pre], names[post]),
+            w=weight,
+            d=delay,
+        )
+    sim: Simulator = get_simulator_with_recorded_neurons(
+        net=net,
+        add_to_multimeter=add_to_multimeter,
+        add_to_raster=add_to_raster,
+        recording_policy=recording_policy,
+    )
+    return sim
+
+
 @typechecked
 def load_snn_graph_stage_2(
     *,
     output_filepath: str,
     stage_1_simsnn_simulator: Simulator,
 ) -> None:
-    """Adds the spikes, I and V of an snn into a simsnn Simulator object."""
+    """Adds the spikes, I and V of an snn into a simsnn Simulator object.
+
+    Raises a Stage_2_recording_mismatch if the file contains the behaviour
+    of other neurons than the raster and multimeter neurons of the
+    simulator.
+    """
     # Verify the file exists.
     if not Path(output_filepath).is_file():
         raise FileExistsError(
             f"Error, filepath:{output_filepath} was not created."
         )
 
+    raster_neurons_key, multimeter_neurons_key = STAGE_2_NEURON_KEYS
+    if output_filepath.endswith(".npz"):
+        recorded_neuron_names, traces = load_binary_snn_graph_stage_2(
+            output_filepath=output_filepath
+        )
+        verify_stage_2_recorded_neurons(
+            output_filepath=output_filepath,
+            stage_1_simsnn_simulator=stage_1_simsnn_simulator,
+            recorded_neuron_names=recorded_neuron_names,
+            nr_of_columns={
+                raster_neurons_key: traces["spikes"].shape[1],
+                multimeter_neurons_key: traces["V"].shape[1],
+            },
+            spikes_are_packed=True,
+        )
+        stage_1_simsnn_simulator.raster.spikes = np.unpackbits(
+            traces["spikes"],
+            axis=1,
+            count=len(stage_1_simsnn_simulator.raster.targets),
+        ).astype(bool)
+        stage_1_simsnn_simulator.multimeter.V = traces["V"]
+        stage_1_simsnn_simulator.multimeter.I = traces["I"]
+        return
+
     loaded_snn: Dict = load_json_file_into_dict(json_filepath=output_filepath)
+    # Stage 2 files of older versions do not contain the neuron names.
+    recorded_neuron_names = {
+        key: loaded_snn.pop(key)
+        for key in STAGE_2_NEURON_KEYS
+        if key in loaded_snn
+    }
     for key, value in loaded_snn.items():
+        if key not in ["spikes", "V", "I"]:
+            raise KeyError(f"Error:{key} not supported in stage 2 snn dict.")
         loaded_snn[key] = np.array(value)
-        if key == "spikes":
-            stage_1_simsnn_simulator.raster.spikes = loaded_snn[key]
-        elif key == "V":
-            stage_1_simsnn_simulator.multimeter.V = loaded_snn[key]
-        elif key == "I":
-            stage_1_simsnn_simulator.multimeter.I = loaded_snn[key]
+    verify_stage_2_recorded_neurons(
+        output_filepath=output_filepath,
+        stage_1_simsnn_simulator=stage_1_simsnn_simulator,
+        recorded_neuron_names=recorded_neuron_names,
+        nr_of_columns={
+            raster_neurons_key: loaded_snn["spikes"].shape[1],
+            multimeter_neurons_key: loaded_snn["V"].shape[1],
+        },
+        spikes_are_packed=False,
+    )
+    stage_1_simsnn_simulator.raster.spikes = loaded_snn["spikes"]
+    stage_1_simsnn_simulator.multimeter.V = loaded_snn["V"]
+    stage_1_simsnn_simulator.multimeter.I = loaded_snn["I"]
+
+
+# pylint: disable=R0913
+@typechecked
+def verify_stage_2_recorded_neurons(
+    *,
+    output_filepath: str,
+    stage_1_simsnn_simulator: Simulator,
+    recorded_neuron_names: Dict[str, List[str]],
+    nr_of_columns: Dict[str, int],
+    spikes_are_packed: bool,
+) -> None:
+    """Raises a Stage_2_recording_mismatch if the stage 2 snn behaviour is
+    recorded for other neurons than the raster and multimeter neurons of the
+    simulator, e.g. because it was outputted with another recording policy.
+
+    The neuron names are only verified if they are stored in the file,
+    the number of recorded columns is always verified.
+    """
+    raster_neurons_key, multimeter_neurons_key = STAGE_2_NEURON_KEYS
+    for key, detector in [
+        (raster_neurons_key, stage_1_simsnn_simulator.raster),
+        (multimeter_neurons_key, stage_1_simsnn_simulator.multimeter),
+    ]:
+        neuron_names: List[str] = get_recorded_neuron_names(detector=detector)
+        expected_nr_of_columns: int = len(neuron_names)
+        if key == raster_neurons_key and spikes_are_packed:
+            # The spikes of 8 neurons are packed into a single byte.
+            expected_nr_of_columns = int(np.ceil(len(neuron_names) / 8))
+        if (
+            key in recorded_neuron_names
+            and recorded_neuron_names[key] != neuron_names
+        ) or nr_of_columns[key] != expected_nr_of_columns:
+            raise Stage_2_recording_mismatch(
+                output_filepath=output_filepath, detector_key=key
+            )
+
+
+@typechecked
+def load_binary_snn_graph_stage_2(
+    *, output_filepath: str
+) -> Tuple[Dict[str, List[str]], np.ndarray]:
+    """Returns the names of the recorded neurons, and a read-only memory map
+    of the binary stage 2 snn behaviour, with one record (spikes, V, I) per
+    timestep. The V and I columns are only read from disk once they are
+    accessed."""
+    with np.load(output_filepath) as npz_file:
+        recorded_neuron_names: Dict[str, List[str]] = {
+            key: npz_file[key].tolist() for key in STAGE_2_NEURON_KEYS
+        }
+    return recorded_neuron_names, memmap_npz_member(
+        npz_filepath=output_filepath, member_name="traces"
+    )
+
+
+@typechecked
+def memmap_npz_member(*, npz_filepath: str, member_name: str) -> np.ndarray:
+    """Returns a read-only memory map of an array in an uncompressed .npz
+    file.
+
+    np.load does not memory map the arrays of a .npz file, so the array
+    is mapped at the offset of its .npy member in the zip file.
+    """
+    with zipfile.ZipFile(npz_filepath) as zip_file:
+        member: zipfile.ZipInfo = zip_file.getinfo(f"{member_name}.npy")
+    if member.compress_type != zipfile.ZIP_STORED:
+        raise ValueError(
+            f"Error, {member_name} in:{npz_filepath} is compressed, so it "
+            + "can not be memory mapped."
+        )
+    with open(npz_filepath, "rb") as npz_file:
+        # The local file header has a fixed size of 30 bytes, followed by
+        # the filename and the extra field, of which the lengths are stored
+        # in its last 4 bytes.
+        npz_file.seek(member.header_offset + 26)
+        filename_length, extra_field_length = np.frombuffer(
+            npz_file.read(4), dtype="<u2"
+        )
+        npz_file.seek(
+            member.header_offset
+            + 30
+            + int(filename_length)
+            + int(extra_field_length)
+        )
+        version = np.lib.format.read_magic(npz_file)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(
+                npz_file
+            )
         else:
-            raise KeyError(f"Error:{key} not supported in stage 2 snn dict.")
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(
+                npz_file
+            )
+        offset: int = npz_file.tell()
+    return np.memmap(
+        npz_filepath,
+        dtype=dtype,
+        mode="r",
+        shape=shape,
+        offset=offset,
+        order="F" if fortran_order else "C",
+    )
 
 
 @typechecked
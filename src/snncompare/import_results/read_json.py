@@ -8,12 +8,11 @@ import json
 from pathlib import Path
 from typing import Dict
 
-from typeguard import typechecked
-
 from snncompare.import_results.json_dict_into_nx_snn import (
     load_json_graph_to_snn,
 )
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 
 @typechecked
@@ -0,0 +1,491 @@
+"""Maintains an sqlite index of the outputted results, such that completion
+checks are indexed lookups instead of probing the results/stageN/.. tree.
+
+Per outputted file, the index stores the stage, the unique_id of the
+run_config that outputted it, and the hashes in its filename. Per run_config
+unique_id, it stores which stages have been completed, and the stage 4
+results dict of each snn graph. It also stores the hashes that are costly to
+compute, such as the isomorphic hash of a graph, per digest of their input,
+such that other processes and later runs do not recompute them.
+
+Once the index exists, a file that is not in the index has not been
+outputted. A file that is in the index is confirmed on the filesystem, as it
+can be deleted after it was indexed, or a shard index can be merged before
+the files of that shard are copied. Likewise, a completed stage is only
+reported if the files that its run_config outputted in that stage exist. The files that exist when the index is
+created are indexed. After files are copied into the results directory, the
+index is rebuilt with --reindex.
+"""
+import json
+import os
+import re
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from snncompare.typechecking import typechecked
+
+RESULTS_INDEX_FILEPATH: str = "results/results_index.sqlite"
+
+# Sqlite connections can not be shared with forked processes, so each process
+# gets its own connection.
+_connections: Dict[Tuple[int, str], sqlite3.Connection] = {}
+
+
+@typechecked
+def get_connection_key() -> Tuple[int, str]:
+    """Returns the key of the results index connection of this process."""
+    return (os.getpid(), os.path.abspath(RESULTS_INDEX_FILEPATH))
+
+
+@typechecked
+def results_index_exists() -> bool:
+    """Returns True if the results index exists. Only probes the filesystem
+    if this process has not yet connected to the results index."""
+    return (
+        get_connection_key() in _connections
+        or Path(RESULTS_INDEX_FILEPATH).is_file()
+    )
+
+
+@typechecked
+def get_results_index_connection() -> sqlite3.Connection:
+    """Returns the connection to the results index of this process, and
+    creates the index if it does not yet exist.
+
+    A new index contains the files that are already in the results
+    directory, such that results of before the index remain completed.
+    """
+    key: Tuple[int, str] = get_connection_key()
+    absolute_filepath: str = key[1]
+    if key not in _connections:
+        os.makedirs(os.path.dirname(absolute_filepath), exist_ok=True)
+        is_new_index: bool = not os.path.isfile(absolute_filepath)
+        connection: sqlite3.Connection = sqlite3.connect(
+            absolute_filepath, timeout=60
+        )
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS artifacts ("
+                + "filepath TEXT PRIMARY KEY, "
+                + "stage_index INTEGER NOT NULL, "
+                + "unique_id TEXT, "
+                + "isomorphic_hash TEXT, "
+                + "rand_nrs_hash TEXT, "
+                + "rad_affected_neurons_hash TEXT)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS artifacts_stage_unique_id ON "
+                + "artifacts (stage_index, unique_id)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS completed_stages ("
+                + "unique_id TEXT NOT NULL, "
+                + "stage_index INTEGER NOT NULL, "
+                + "PRIMARY KEY (unique_id, stage_index))"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS stage_4_results ("
+                + "unique_id TEXT NOT NULL, "
+                + "graph_name TEXT NOT NULL, "
+                + "results TEXT NOT NULL, "
+                + "PRIMARY KEY (unique_id, graph_name))"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS hashes ("
+                + "hash_name TEXT NOT NULL, "
+                + "input_digest TEXT NOT NULL, "
+                + "hash TEXT NOT NULL, "
+                + "PRIMARY KEY (hash_name, input_digest))"
+            )
+            if is_new_index:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO artifacts VALUES "
+                    + "(?, ?, ?, ?, ?, ?)",
+                    get_artifact_rows_in_results_dir(
+                        results_dir=os.path.dirname(RESULTS_INDEX_FILEPATH)
+                    ),
+                )
+        _connections[key] = connection
+    return _connections[key]
+
+
+@typechecked
+def get_stage_index_and_hashes(
+    *, filepath: str
+) -> Tuple[int, Optional[str], Optional[str], Optional[str]]:
+    """Returns the stage index, isomorphic hash, rand_nrs hash and radiation
+    hash that are encoded in the filepath of an outputted result:
+
+    results/stage<stage_index>/../<isomorphic hash>_rand_<rand nrs hash>
+    _rad_<rad affected neurons hash>.<extension>
+    """
+    stage_match = re.search(r"(?:^|/)stage(\d+)/", filepath)
+    if stage_match is None:
+        raise ValueError(f"Error, no stage found in:{filepath}")
+    stem: str = Path(filepath).stem
+    hashes_match = re.fullmatch(
+        r"(?P<isomorphic>[^_]+)(?:_rand_(?P<rand>[^_]+))?"
+        + r"(?:_rad_(?P<rad>[^_]+))?",
+        stem,
+    )
+    if hashes_match is None:
+        return int(stage_match.group(1)), None, None, None
+    return (
+        int(stage_match.group(1)),
+        hashes_match.group("isomorphic"),
+        hashes_match.group("rand"),
+        hashes_match.group("rad"),
+    )
+
+
+@typechecked
+def get_artifact_row(
+    *, filepath: str, unique_id: Optional[str]
+) -> Tuple[
+    str, int, Optional[str], Optional[str], Optional[str], Optional[str]
+]:
+    """Returns the row of the artifacts table for an outputted file."""
+    (
+        stage_index,
+        isomorphic_hash,
+        rand_nrs_hash,
+        rad_affected_neurons_hash,
+    ) = get_stage_index_and_hashes(filepath=filepath)
+    return (
+        os.path.normpath(filepath),
+        stage_index,
+        unique_id,
+        isomorphic_hash,
+        rand_nrs_hash,
+        rad_affected_neurons_hash,
+    )
+
+
+@typechecked
+def index_artifact(*, filepath: str, unique_id: Optional[str]) -> None:
+    """Stores that the file at filepath has been outputted by the run_config
+    with the given unique_id."""
+    connection: sqlite3.Connection = get_results_index_connection()
+    with connection:
+        connection.execute(
+            "INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?, ?, ?, ?)",
+            get_artifact_row(filepath=filepath, unique_id=unique_id),
+        )
+
+
+@typechecked
+def is_indexed_artifact(*, filepath: str) -> bool:
+    """Returns True if the file at filepath is in the results index."""
+    if not results_index_exists():
+        return False
+    row = (
+        get_results_index_connection()
+        .execute(
+            "SELECT 1 FROM artifacts WHERE filepath = ?",
+            (os.path.normpath(filepath),),
+        )
+        .fetchone()
+    )
+    return row is not None
+
+
+@typechecked
+def remove_indexed_artifact(*, filepath: str) -> None:
+    """Removes the file at filepath from the results index."""
+    connection: sqlite3.Connection = get_results_index_connection()
+    with connection:
+        connection.execute(
+            "DELETE FROM artifacts WHERE filepath = ?",
+            (os.path.normpath(filepath),),
+        )
+
+
+@typechecked
+def has_artifact(*, filepath: str) -> bool:
+    """Returns True if the file at filepath has been outputted.
+
+    If there is no results index yet, the filesystem decides. Otherwise,
+    a file that is not in the results index has not been outputted, and
+    an indexed file is confirmed on the filesystem. An indexed file that
+    does not exist is removed from the results index.
+    """
+    if not results_index_exists():
+        return Path(filepath).is_file()
+    if not is_indexed_artifact(filepath=filepath):
+        return False
+    if Path(filepath).is_file():
+        return True
+    remove_indexed_artifact(filepath=filepath)
+    return False
+
+
+@typechecked
+def index_completed_stage(*, unique_id: str, stage_index: int) -> None:
+    """Stores that the run_config with the given unique_id has completed the
+    stage."""
+    connection: sqlite3.Connection = get_results_index_connection()
+    with connection:
+        connection.execute(
+            "INSERT OR IGNORE INTO completed_stages VALUES (?, ?)",
+            (unique_id, stage_index),
+        )
+
+
+@typechecked
+def has_indexed_completed_stage(*, unique_id: str, stage_index: int) -> bool:
+    """Returns True if the results index contains that the run_config with
+    the given unique_id has completed the stage."""
+    if not results_index_exists():
+        return False
+    row = (
+        get_results_index_connection()
+        .execute(
+            "SELECT 1 FROM completed_stages WHERE unique_id = ? "
+            + "AND stage_index = ?",
+            (unique_id, stage_index),
+        )
+        .fetchone()
+    )
+    return row is not None
+
+
+@typechecked
+def remove_indexed_completed_stage(
+    *, unique_id: str, stage_index: int
+) -> None:
+    """Removes that the run_config with the given unique_id has completed the
+    stage from the results index."""
+    connection: sqlite3.Connection = get_results_index_connection()
+    with connection:
+        connection.execute(
+            "DELETE FROM completed_stages WHERE unique_id = ? "
+            + "AND stage_index = ?",
+            (unique_id, stage_index),
+        )
+
+
+@typechecked
+def has_confirmed_completed_stage(*, unique_id: str, stage_index: int) -> bool:
+    """Returns True if the results index contains that the run_config with
+    the given unique_id has completed the stage, and the files it outputted
+    in that stage are confirmed with has_artifact.
+
+    If one of those files is missing, the completed stage is removed from
+    the results index, such that the stage is checked on its files again.
+    """
+    if not has_indexed_completed_stage(
+        unique_id=unique_id, stage_index=stage_index
+    ):
+        return False
+    rows = (
+        get_results_index_connection()
+        .execute(
+            "SELECT filepath FROM artifacts WHERE stage_index = ? "
+            + "AND unique_id = ?",
+            (stage_index, unique_id),
+        )
+        .fetchall()
+    )
+    if all(has_artifact(filepath=row[0]) for row in rows):
+        return True
+    remove_indexed_completed_stage(
+        unique_id=unique_id, stage_index=stage_index
+    )
+    return False
+
+
+@typechecked
+def get_indexed_completed_unique_ids(*, stage_index: int) -> Set[str]:
+    """Returns the unique_ids of all run_configs that have completed the
+    stage according to the results index."""
+    if not results_index_exists():
+        return set()
+    rows = (
+        get_results_index_connection()
+        .execute(
+            "SELECT unique_id FROM completed_stages WHERE stage_index = ?",
+            (stage_index,),
+        )
+        .fetchall()
+    )
+    return {row[0] for row in rows}
+
+
+@typechecked
+def clear_results_index() -> None:
+    """Removes all entries from the results index."""
+    connection: sqlite3.Connection = get_results_index_connection()
+    with connection:
+        connection.execute("DELETE FROM artifacts")
+        connection.execute("DELETE FROM completed_stages")
+        connection.execute("DELETE FROM stage_4_results")
+        connection.execute("DELETE FROM hashes")
+
+
+@typechecked
+def get_indexed_hash(*, hash_name: str, input_digest: str) -> Optional[str]:
+    """Returns the stored hash of the input with the given digest, or None if
+    it is not in the results index, or if there is no results index."""
+    if not results_index_exists():
+        return None
+    row = (
+        get_results_index_connection()
+        .execute(
+            "SELECT hash FROM hashes WHERE hash_name = ? "
+            + "AND input_digest = ?",
+            (hash_name, input_digest),
+        )
+        .fetchone()
+    )
+    return None if row is None else row[0]
+
+
+@typechecked
+def index_hash(*, hash_name: str, input_digest: str, hash_value: str) -> None:
+    """Stores the hash of the input with the given digest, if there is a
+    results index."""
+    if not results_index_exists():
+        return
+    connection: sqlite3.Connection = get_results_index_connection()
+    with connection:
+        connection.execute(
+            "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?)",
+            (hash_name, input_digest, hash_value),
+        )
+
+
+@typechecked
+def get_artifact_rows_in_results_dir(
+    *, results_dir: str
+) -> List[
+    Tuple[str, int, Optional[str], Optional[str], Optional[str], Optional[str]]
+]:
+    """Returns the rows of the artifacts table for all outputted files in the
+    results/stageN/.. directories.
+
+    The run_configs in results/stage1/run_configs are indexed under their
+    own unique_id, the other files are shared between run_configs.
+    """
+    rows: List[
+        Tuple[
+            str,
+            int,
+            Optional[str],
+            Optional[str],
+            Optional[str],
+            Optional[str],
+        ]
+    ] = []
+    for root, _, filenames in os.walk(results_dir):
+        if re.search(r"(?:^|/)stage\d+(?:/|$)", root) is None:
+            continue
+        for filename in filenames:
+            unique_id: Optional[str] = None
+            if os.path.basename(root) == "run_configs":
+                unique_id = Path(filename).stem
+            rows.append(
+                get_artifact_row(
+                    filepath=os.path.join(root, filename), unique_id=unique_id
+                )
+            )
+    return rows
+
+
+@typechecked
+def index_artifacts_in_results_dir(*, results_dir: str = "results") -> int:
+    """Adds all outputted files in the results/stageN/.. directories to the
+    results index, and returns the number of indexed files."""
+    connection: sqlite3.Connection = get_results_index_connection()
+    rows: List[
+        Tuple[
+            str,
+            int,
+            Optional[str],
+            Optional[str],
+            Optional[str],
+            Optional[str],
+        ]
+    ] = get_artifact_rows_in_results_dir(results_dir=results_dir)
+    with connection:
+        connection.executemany(
+            "INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?, ?, ?, ?)", rows
+        )
+    return len(rows)
+
+
+@typechecked
+def index_stage_4_results(
+    *, unique_id: str, results_per_graph: Dict[str, Dict]
+) -> None:
+    """Stores the stage 4 results dict of each snn graph of a run_config."""
+    connection: sqlite3.Connection = get_results_index_connection()
+    with connection:
+        connection.executemany(
+            "INSERT OR REPLACE INTO stage_4_results VALUES (?, ?, ?)",
+            [
+                (unique_id, graph_name, json.dumps(results, sort_keys=True))
+                for graph_name, results in results_per_graph.items()
+            ],
+        )
+
+
+@typechecked
+def get_indexed_stage_4_results(
+    *, unique_ids: List[str]
+) -> Dict[str, Dict[str, Dict]]:
+    """Returns the stage 4 results dict per snn graph name, per run_config
+    unique_id, for the unique_ids that are in the results index."""
+    results: Dict[str, Dict[str, Dict]] = {}
+    if not results_index_exists():
+        return results
+    connection: sqlite3.Connection = get_results_index_connection()
+    # Stay below the maximum number of parameters of an sqlite query.
+    chunk_size: int = 500
+    for start in range(0, len(unique_ids), chunk_size):
+        end: int = start + chunk_size
+        chunk: List[str] = unique_ids[start:end]
+        rows = connection.execute(
+            "SELECT unique_id, graph_name, results FROM stage_4_results "
+            + f"WHERE unique_id IN ({','.join('?' * len(chunk))})",
+            chunk,
+        ).fetchall()
+        for unique_id, graph_name, results_json in rows:
+            results.setdefault(unique_id, {})[graph_name] = json.loads(
+                results_json
+            )
+    return results
+
+
+@typechecked
+def merge_results_index(*, filepath: str) -> None:
+    """Adds the entries of another results index, e.g. of a shard that ran on
+    another node, to the results index.
+
+    The files of the shard may not have been copied into the results
+    directory yet. The merged files are confirmed on the filesystem when
+    they are looked up, and only the completed stage 4 of the shard is
+    merged, because its results are stored in the results index itself.
+    The completed stages 1 and 2 are derived from the files again.
+    """
+    if not os.path.isfile(filepath):
+        raise FileNotFoundError(f"Error, results index not found:{filepath}")
+    connection: sqlite3.Connection = get_results_index_connection()
+    connection.execute("ATTACH DATABASE ? AS shard", (filepath,))
+    try:
+        with connection:
+            for table_name in [
+                "artifacts",
+                "stage_4_results",
+                "hashes",
+            ]:
+                connection.execute(
+                    f"INSERT OR IGNORE INTO {table_name} "
+                    + f"SELECT * FROM shard.{table_name}"
+                )
+            connection.execute(
+                "INSERT OR IGNORE INTO completed_stages "
+                + "SELECT * FROM shard.completed_stages WHERE stage_index = 4"
+            )
+    finally:
+        connection.execute("DETACH DATABASE shard")
@@ -6,12 +6,12 @@ from snnadaptation.Adaptation import Adaptation
 from snnalgorithms.get_alg_configs import get_algo_configs
 from snnalgorithms.sparse.MDSA.alg_params import MDSA
 from snnradiation.Rad_damage import Rad_damage
-from typeguard import typechecked
 
 from snncompare.exp_config.Exp_config import Exp_config
 from snncompare.export_results.export_json_results import encode_tuples
 from snncompare.helper import file_exists
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 
 @typechecked
@@ -1,10 +1,13 @@
 """"Stores the run config Dict type."""
 from __future__ import annotations
 
+from fnmatch import fnmatchcase
+from typing import Any
+
 from snnbackends.networkx.LIF_neuron import LIF_neuron, Synapse
-from typeguard import typechecked
 
 from snncompare.exp_config.Exp_config import Supported_experiment_settings
+from snncompare.typechecking import typechecked
 
 
 # pylint: disable=R0902
@@ -25,6 +28,13 @@ class Output_config:
         hover_info: Hover_info | None = None,
         graph_types: list[str] | None = None,
         dash_port: int | None = None,
+        stage_2_format: str = "json",
+        recording_policy: Recording_policy | None = None,
+        early_stop_policy: Early_stop_policy | None = None,
+        batch_radiation: bool = False,
+        profile: bool = False,
+        stage_1_format: str = "json",
+        simsnn_backend: str = "simsnn",
     ):
         """Stores run configuration settings for the exp_configriment."""
         self.verify_int_list_values(
@@ -59,6 +69,30 @@ class Output_config:
         self.graph_types: None | list[str] = graph_types
         self.dash_port: None | int = dash_port
 
+        self.verify_stage_1_format(stage_1_format)
+        self.stage_1_format: str = stage_1_format
+
+        self.verify_stage_2_format(stage_2_format)
+        self.stage_2_format: str = stage_2_format
+
+        if recording_policy is None:
+            recording_policy = Recording_policy()
+        self.recording_policy: Recording_policy = recording_policy
+        if not recording_policy.records_v_and_i() and (
+            extra_storing_config.export_failure_modes
+            or extra_storing_config.show_failure_modes
+        ):
+            raise ValueError(
+                "Error, the failure modes require the I of the neurons, which"
+                + f" is not recorded with:{recording_policy.recording}."
+            )
+        self.early_stop_policy: Early_stop_policy | None = early_stop_policy
+        self.batch_radiation: bool = batch_radiation
+        self.profile: bool = profile
+
+        self.verify_simsnn_backend(simsnn_backend)
+        self.simsnn_backend: str = simsnn_backend
+
     @typechecked
     def verify_int_list_values(
         self,
@@ -88,6 +122,121 @@ class Output_config:
                     + f" export types:{supp_setts.export_types}."
                 )
 
+    @typechecked
+    def verify_stage_1_format(
+        self,
+        stage_1_format: str,
+    ) -> None:
+        """Verifies the stage 1 output format is supported."""
+        supp_setts = Supported_experiment_settings()
+        if stage_1_format not in supp_setts.stage_1_formats:
+            raise ValueError(
+                f"Error, stage_1_format:{stage_1_format} not in supported"
+                + f" stage 1 formats:{supp_setts.stage_1_formats}."
+            )
+
+    @typechecked
+    def verify_stage_2_format(
+        self,
+        stage_2_format: str,
+    ) -> None:
+        """Verifies the stage 2 output format is supported."""
+        supp_setts = Supported_experiment_settings()
+        if stage_2_format not in supp_setts.stage_2_formats:
+            raise ValueError(
+                f"Error, stage_2_format:{stage_2_format} not in supported"
+                + f" stage 2 formats:{supp_setts.stage_2_formats}."
+            )
+
+    @typechecked
+    def verify_simsnn_backend(
+        self,
+        simsnn_backend: str,
+    ) -> None:
+        """Verifies the simsnn backend is supported."""
+        supp_setts = Supported_experiment_settings()
+        if simsnn_backend not in supp_setts.simsnn_backends:
+            raise ValueError(
+                f"Error, simsnn_backend:{simsnn_backend} not in supported"
+                + f" simsnn backends:{supp_setts.simsnn_backends}."
+            )
+
+
+class Recording_policy:
+    """Specifies which neurons are added to the raster and multimeter of the
+    simsnn Simulators, and whether their V and I are recorded."""
+
+    @typechecked
+    def __init__(
+        self,
+        recording: str = "full",
+        neuron_name_patterns: list[str] | None = None,
+    ):
+        """Stores the recorded variables, and the (fnmatch) name patterns of
+        the recorded neurons. If no patterns are given, all neurons are
+        recorded."""
+        supp_setts = Supported_experiment_settings()
+        if recording not in supp_setts.recordings:
+            raise ValueError(
+                f"Error, recording:{recording} not in supported"
+                + f" recordings:{supp_setts.recordings}."
+            )
+        self.recording: str = recording
+        self.neuron_name_patterns: list[str] | None = neuron_name_patterns
+
+    @typechecked
+    def records_v_and_i(self) -> bool:
+        """Returns True if the V and I of the neurons are recorded."""
+        return self.recording == "full"
+
+    @typechecked
+    def get_recorded_neurons(self, neurons: list[Any]) -> list[Any]:
+        """Returns the simsnn neurons whose name matches a recorded neuron
+        name pattern."""
+        if self.neuron_name_patterns is None:
+            return list(neurons)
+        return [
+            neuron
+            for neuron in neurons
+            if any(
+                fnmatchcase(neuron.name, pattern)
+                for pattern in self.neuron_name_patterns
+            )
+        ]
+
+
+class Early_stop_policy:
+    """Specifies when the simsnn simulation of an snn is stopped before the
+    maximum simulation duration is reached."""
+
+    @typechecked
+    def __init__(
+        self,
+        predicate: str,
+        check_interval: int = 10,
+        quiescent_duration: int = 10,
+    ):
+        """Stores the predicate that is checked every check_interval
+        timesteps, and the nr of timesteps without spikes after which the
+        network is considered quiescent."""
+        supp_setts = Supported_experiment_settings()
+        if predicate not in supp_setts.early_stop_predicates:
+            raise ValueError(
+                f"Error, predicate:{predicate} not in supported"
+                + f" predicates:{supp_setts.early_stop_predicates}."
+            )
+        if check_interval < 1:
+            raise ValueError(
+                f"Error, check_interval:{check_interval} should be >0."
+            )
+        if quiescent_duration < 1:
+            raise ValueError(
+                f"Error, quiescent_duration:{quiescent_duration} should be >0."
+            )
+        self.predicate: str = predicate
+        self.check_interval: int = check_interval
+        self.quiescent_duration: int = quiescent_duration
+
 
 class Zoom:
     """Stores whether zoomed in images of png files will be created or not."""
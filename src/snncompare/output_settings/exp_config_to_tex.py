@@ -1,9 +1,8 @@
 """Outputs data on the experiment config to files importable by latex."""
 from typing import List
 
-from typeguard import typechecked
-
 from snncompare.exp_config.Exp_config import Exp_config
+from snncompare.typechecking import typechecked
 
 
 @typechecked
@@ -3,17 +3,20 @@ graphs."""
 from typing import Dict, List, Tuple
 
 import networkx as nx
+import pandas as pd
 from snnalgorithms.sparse.MDSA.alg_params import get_algorithm_setting_name
-from typeguard import typechecked
 
 from snncompare.exp_config import Exp_config
+from snncompare.export_results.analysis.results_table import (
+    get_stage_4_results_table,
+)
 from snncompare.graph_generation.stage_1_create_graphs import (
     load_input_graph_from_file_with_init_props,
 )
 from snncompare.helper import get_snn_graph_name
 from snncompare.import_results.load_stage_1_and_2 import load_simsnn_graphs
-from snncompare.process_results.helper import graph_of_run_config_passed
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 # from dash.dependencies import Input, Output
 
@@ -33,6 +36,7 @@ class Failure_mode_entry:
         incorrect_u_increase: bool,
         incorrect_u_decrease: bool,
         neuron_names: List[str],
+        passed: bool,
         run_config: Run_config,
         timestep: int,
     ) -> None:
@@ -43,6 +47,7 @@ class Failure_mode_entry:
             incorrectly_spikes (bool): Indicates if the neurons spiked
             incorrectly.
             neuron_names (List[str]): List of neuron names.
+            passed (bool): Indicates if the radiated adapted snn passed.
             run_config (Run_config): The run configuration.
             timestep (int): The timestep at which the failure mode occurred.
         """
@@ -52,6 +57,7 @@ class Failure_mode_entry:
         self.incorrect_u_increase: bool = incorrect_u_increase
         self.incorrect_u_decrease: bool = incorrect_u_decrease
         self.neuron_names: List = neuron_names
+        self.passed: bool = passed
         self.run_config: Run_config = run_config
         self.timestep: int = timestep
 
@@ -106,6 +112,19 @@ class Table_settings:
             Tuple[Run_config, Dict]
         ] = self.create_failure_mode_tables()
 
+        # Get whether the rad_adapted_snn_graph passed, per run_config, from
+        # the stage 4 results table.
+        results_table: pd.DataFrame = get_stage_4_results_table(
+            run_configs=run_configs
+        )
+        self.rad_adapted_passed: Dict[str, bool] = {
+            unique_id: bool(passed)
+            for unique_id, passed in results_table.loc[
+                results_table["graph_name"] == "rad_adapted_snn_graph",
+                ["unique_id", "passed"],
+            ].itertuples(index=False)
+        }
+
     @typechecked
     def create_failure_mode_tables(
         self,
@@ -195,16 +214,14 @@ class Table_settings:
                 run_config.seed == seed
                 and run_config.graph_size == graph_size
                 and run_config_algorithm_name == algorithm_setting
-                and not graph_of_run_config_passed(
-                    graph_name="rad_adapted_snn_graph",
-                    run_config=run_config,
-                )
+                and not self.rad_adapted_passed[run_config.unique_id]
             ):
                 get_failure_mode_obj(
                     adaptation_name=adaptation_name,
                     failure_mode=failure_mode,
                     failure_mode_entries=failure_mode_entries,
                     first_timestep_only=first_timestep_only,
+                    passed=self.rad_adapted_passed[run_config.unique_id],
                     run_config=run_config,
                     show_spike_failures=show_spike_failures,
                 )
@@ -219,6 +236,7 @@ def get_failure_mode_obj(
     failure_mode: Dict,
     failure_mode_entries: List[Failure_mode_entry],
     first_timestep_only: bool,
+    passed: bool,
     run_config: Run_config,
     show_spike_failures: bool,
 ) -> None:
@@ -242,6 +260,7 @@ def get_failure_mode_obj(
             incorrect_u_increase=incorrect_u_increase,
             incorrect_u_decrease=incorrect_u_decrease,
             neuron_names=neuron_list,
+            passed=passed,
             run_config=run_config,
             timestep=int(timestep),
         )
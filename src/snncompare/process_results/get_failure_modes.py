@@ -3,15 +3,19 @@ graphs."""
 from typing import Dict, List, Tuple, Union
 
 import networkx as nx
+import numpy as np
 from simsnn.core.simulators import Simulator
-from typeguard import typechecked
 
 from snncompare.export_results.output_stage1_configs_and_input_graph import (
     get_rand_nrs_and_hash,
 )
-from snncompare.import_results.helper import simsnn_files_exists_and_get_path
+from snncompare.import_results.helper import (
+    get_recorded_neuron_names,
+    simsnn_files_exists_and_get_path,
+)
 from snncompare.import_results.load_stage_1_and_2 import load_snn_graph_stage_2
 from snncompare.run_config import Run_config
+from snncompare.typechecking import typechecked
 
 
 # pylint: disable=R0912
@@ -66,30 +70,14 @@ def add_failure_modes_to_graph(
                 ] = {}
 
 
-@typechecked
-def store_incorrect_spike(
-    *,
-    failures: Dict[int, List[str]],
-    neuron_name: str,
-    t: int,
-) -> None:
-    """Stores the time and adds the neuron name to the list.
-
-    TODO: rename for its dual use case.
-    """
-    if t not in failures.keys():
-        failures[t] = []
-    failures[t].append(neuron_name)
-
-
 @typechecked
 def get_unradiated_spike_list(
     *,
     adapted_unradiated_snn: Simulator,
     run_config: Run_config,
     snn_graphs: Dict[str, Union[nx.Graph, nx.DiGraph, Simulator]],
-) -> Tuple[List[List[bool]], List[List[float]], List[List[float]]]:
-    """Get the boolean list of spikes for the unradiated snn.
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get the boolean array of spikes for the unradiated snn.
 
     This function may be called directly after simulating the SNNs, or
     after their behaviour has been stored to a file. That is why it
@@ -98,15 +86,9 @@ def get_unradiated_spike_list(
     """
     if "spikes" in adapted_unradiated_snn.raster.__dict__.keys():
         # If spikes are (still) stored in incoming object, load them directly.
-        unradiated_spikes: List[
-            List[bool]
-        ] = adapted_unradiated_snn.raster.spikes.tolist()
-        unradiated_I: List[
-            List[float]
-        ] = adapted_unradiated_snn.multimeter.I.tolist()
-        unradiated_V: List[
-            List[float]
-        ] = adapted_unradiated_snn.multimeter.V.tolist()
+        unradiated_spikes: np.ndarray = adapted_unradiated_snn.raster.spikes
+        unradiated_I: np.ndarray = adapted_unradiated_snn.multimeter.I
+        unradiated_V: np.ndarray = adapted_unradiated_snn.multimeter.V
     else:  # Load the data from the snn behaviour file.
         # Get boilerplate data to receive the snn behaviour.
         _, rand_nrs_hash = get_rand_nrs_and_hash(
@@ -132,10 +114,10 @@ def get_unradiated_spike_list(
                 "Error, was not able to find the SNN propagation results"
                 + f" at:{simsnn_filepath}."
             )
-        # Store the boolean spike list for the unradiated snn.
-        unradiated_spikes = adapted_unradiated_snn.raster.spikes.tolist()
-        unradiated_I = adapted_unradiated_snn.multimeter.I.tolist()
-        unradiated_V = adapted_unradiated_snn.multimeter.V.tolist()
+        # Store the boolean spike array for the unradiated snn.
+        unradiated_spikes = adapted_unradiated_snn.raster.spikes
+        unradiated_I = adapted_unradiated_snn.multimeter.I
+        unradiated_V = adapted_unradiated_snn.multimeter.V
     return unradiated_spikes, unradiated_I, unradiated_V
 
 
@@ -144,8 +126,8 @@ def get_incorrect_spikes(
     *,
     adapted_unradiated_snn: Simulator,
     snn_graphs: Dict[str, Union[nx.Graph, nx.DiGraph, Simulator]],
-    unradiated_I: List[List[float]],
-    unradiated_spikes: List[List[bool]],
+    unradiated_I: np.ndarray,
+    unradiated_spikes: np.ndarray,
 ) -> Tuple[
     Dict[int, List[str]],
     Dict[int, List[str]],
@@ -154,139 +136,129 @@ def get_incorrect_spikes(
 ]:
     """Creates dictionaries with the times at which neuron(s) of the radiated
     adapted SNN shows a different spike behaviour than the unradiated adapted
-    SNN."""
-
-    # Create the dictionaries with timestep and neuron names for the neurons
-    # in the radiated SNN that behave different from those in the unadapted
-    # snn.
-    incorrectly_spikes: Dict[int, List[str]] = {}
-    incorrectly_silent: Dict[int, List[str]] = {}
-
-    excitatory_delta_u: Dict[int, List[str]] = {}
-    inhibitory_delta_u: Dict[int, List[str]] = {}
+    SNN.
 
+    The columns of the spikes and currents belong to the neurons in the
+    raster and multimeter, which may be a subset of the neurons of the SNN.
+    """
     # Get adapted radiated SNN.
     adapted_radiated_snn: Simulator = snn_graphs["rad_adapted_snn_graph"]
-    radiated_spikes: List[
-        List[bool]
-    ] = adapted_radiated_snn.raster.spikes.tolist()
-    radiated_I: List[List[float]] = adapted_radiated_snn.multimeter.I.tolist()
 
-    # Loop over timesteps
-    # Loop over neurons
-    for neuron_index, neuron_name in enumerate(
-        list(
-            map(
-                lambda neuron: neuron.name,
-                adapted_unradiated_snn.network.nodes,
-            )
-        )
-    ):
-        for t, unradiated_spikes_at_t in enumerate(unradiated_spikes):
-            add_neurons_with_spike_difference(
-                incorrectly_spikes=incorrectly_spikes,
-                incorrectly_silent=incorrectly_silent,
-                neuron_index=neuron_index,
-                neuron_name=neuron_name,
-                radiated_spikes=radiated_spikes,
-                t=t,
-                unradiated_spikes=unradiated_spikes,
-                unradiated_spikes_at_t=unradiated_spikes_at_t,
+    neuron_names: List[str] = get_recorded_neuron_names(
+        detector=adapted_unradiated_snn.raster
+    )
+    for snn, detector_name in [
+        (adapted_unradiated_snn, "multimeter"),
+        (adapted_radiated_snn, "raster"),
+        (adapted_radiated_snn, "multimeter"),
+    ]:
+        if (
+            get_recorded_neuron_names(detector=getattr(snn, detector_name))
+            != neuron_names
+        ):
+            raise ValueError(
+                "Error, the failure modes require the spikes and I of the "
+                + "same neurons in the unradiated and radiated SNN, yet the "
+                + f"{detector_name} records other neurons than the raster "
+                + "of the unradiated SNN."
             )
 
-        for t, unradiated_I_at_t in enumerate(unradiated_I):
-            add_neurons_with_u_difference(
-                excitatory_delta_u=excitatory_delta_u,
-                inhibitory_delta_u=inhibitory_delta_u,
-                neuron_index=neuron_index,
-                neuron_name=neuron_name,
-                radiated_I=radiated_I,
-                t=t,
-                unradiated_I_at_t=unradiated_I_at_t,
-            )
-    return (
-        incorrectly_spikes,
-        incorrectly_silent,
-        excitatory_delta_u,
-        inhibitory_delta_u,
+    return get_failure_modes_from_arrays(
+        neuron_names=neuron_names,
+        unradiated_spikes=unradiated_spikes,
+        radiated_spikes=adapted_radiated_snn.raster.spikes,
+        unradiated_I=unradiated_I,
+        radiated_I=adapted_radiated_snn.multimeter.I,
     )
 
 
+# pylint: disable=R0913
 @typechecked
-def add_neurons_with_spike_difference(
+def get_failure_modes_from_arrays(
     *,
-    incorrectly_spikes: Dict[int, List[str]],
-    incorrectly_silent: Dict[int, List[str]],
-    neuron_index: int,
-    neuron_name: str,
-    radiated_spikes: List[List[bool]],
-    t: int,
-    unradiated_spikes: List[List[bool]],
-    unradiated_spikes_at_t: List[bool],
-) -> None:
-    """Stores the neurons that show alternative spike behaviour."""
-    # Check if a spike boolean is stored for each timestep.
-    if t < len(radiated_spikes):
-        # Check if the unradiated neuron behaves different than the
-        # radiated neuron.
-        if (
-            unradiated_spikes_at_t[neuron_index]
-            != radiated_spikes[t][neuron_index]
-        ):
-            # pylint: disable=R1736
-            if unradiated_spikes[t][neuron_index]:
-                store_incorrect_spike(
-                    failures=incorrectly_silent,
-                    neuron_name=neuron_name,
-                    t=t,
-                )
-            else:
-                store_incorrect_spike(
-                    failures=incorrectly_spikes,
-                    neuron_name=neuron_name,
-                    t=t,
-                )
-    sort_lists_in_dict_values(some_dict=incorrectly_silent)
-    sort_lists_in_dict_values(some_dict=incorrectly_spikes)
-
+    neuron_names: List[str],
+    unradiated_spikes: np.ndarray,
+    radiated_spikes: np.ndarray,
+    unradiated_I: np.ndarray,
+    radiated_I: np.ndarray,
+) -> Tuple[
+    Dict[int, List[str]],
+    Dict[int, List[str]],
+    Dict[int, List[str]],
+    Dict[int, List[str]],
+]:
+    """Returns the neurons that are incorrectly spiking, incorrectly silent,
+    and that receive a larger (excitatory) or smaller (inhibitory) current
+    in the radiated SNN than in the unradiated SNN, per timestep.
 
-@typechecked
-def add_neurons_with_u_difference(
-    *,
-    excitatory_delta_u: Dict[int, List[str]],
-    inhibitory_delta_u: Dict[int, List[str]],
-    neuron_index: int,
-    neuron_name: str,
-    radiated_I: List[List[float]],
-    t: int,
-    unradiated_I_at_t: List[float],
-) -> None:
-    """Stores the neurons that show alternative spike behaviour."""
-    # Check if a spike boolean is stored for each timestep.
-    if t < len(radiated_I):
-        # Check if the unradiated neuron behaves different than the
-        # radiated neuron.
-        if unradiated_I_at_t[neuron_index] < radiated_I[t][neuron_index]:
-            store_incorrect_spike(
-                failures=excitatory_delta_u,
-                neuron_name=neuron_name,
-                t=t,
-            )
-        elif unradiated_I_at_t[neuron_index] > radiated_I[t][neuron_index]:
-            store_incorrect_spike(
-                failures=inhibitory_delta_u,
-                neuron_name=neuron_name,
-                t=t,
+    The spike and current arrays have a row per timestep and a column per
+    neuron. Only the timesteps that exist in both SNNs are compared. The
+    currents are compared in the least precise dtype of the two, such that
+    a current that is loaded from a binary stage 2 file equals the same
+    current that is simulated.
+    """
+    nr_of_neurons: int = len(neuron_names)
+    for array_name, some_array in [
+        ("unradiated_spikes", unradiated_spikes),
+        ("radiated_spikes", radiated_spikes),
+        ("unradiated_I", unradiated_I),
+        ("radiated_I", radiated_I),
+    ]:
+        if np.shape(some_array)[1:] != (nr_of_neurons,):
+            raise ValueError(
+                f"Error, {array_name} has shape:{np.shape(some_array)}, "
+                + f"instead of a column for each of the:{nr_of_neurons} "
+                + "neurons."
             )
-    sort_lists_in_dict_values(some_dict=excitatory_delta_u)
-    sort_lists_in_dict_values(some_dict=inhibitory_delta_u)
+
+    nr_of_timesteps: int = min(len(unradiated_spikes), len(radiated_spikes))
+    unradiated_s: np.ndarray = np.asarray(unradiated_spikes, dtype=bool)[
+        :nr_of_timesteps
+    ]
+    radiated_s: np.ndarray = np.asarray(radiated_spikes, dtype=bool)[
+        :nr_of_timesteps
+    ]
+    spike_differences: np.ndarray = np.logical_xor(unradiated_s, radiated_s)
+
+    nr_of_timesteps = min(len(unradiated_I), len(radiated_I))
+    compared_dtype: np.dtype = min(
+        np.result_type(unradiated_I, np.float16),
+        np.result_type(radiated_I, np.float16),
+        key=lambda dtype: dtype.itemsize,
+    )
+    delta_u_signs: np.ndarray = np.sign(
+        np.asarray(radiated_I, dtype=compared_dtype)[:nr_of_timesteps]
+        - np.asarray(unradiated_I, dtype=compared_dtype)[:nr_of_timesteps]
+    )
+
+    return (
+        get_neuron_names_per_timestep(
+            mask=spike_differences & ~unradiated_s, neuron_names=neuron_names
+        ),
+        get_neuron_names_per_timestep(
+            mask=spike_differences & unradiated_s, neuron_names=neuron_names
+        ),
+        get_neuron_names_per_timestep(
+            mask=delta_u_signs > 0, neuron_names=neuron_names
+        ),
+        get_neuron_names_per_timestep(
+            mask=delta_u_signs < 0, neuron_names=neuron_names
+        ),
+    )
 
 
 @typechecked
-def sort_lists_in_dict_values(
+def get_neuron_names_per_timestep(
     *,
-    some_dict: Dict[int, List[str]],
-) -> None:
-    """Sorts each list in this dictionary."""
-    for key, some_list in some_dict.items():
-        some_dict[key] = sorted(some_list)
+    mask: np.ndarray,
+    neuron_names: List[str],
+) -> Dict[int, List[str]]:
+    """Returns the sorted names of the neurons for which the mask is True, per
+    timestep at which the mask is True for at least one neuron."""
+    failures: Dict[int, List[str]] = {}
+    timesteps, neuron_indices = np.nonzero(mask)
+    for t, neuron_index in zip(timesteps.tolist(), neuron_indices.tolist()):
+        failures.setdefault(t, []).append(neuron_names[neuron_index])
+    for neuron_names_at_t in failures.values():
+        neuron_names_at_t.sort()
+    return failures
@@ -15,12 +15,12 @@ from snnalgorithms.sparse.MDSA.apply_results_to_graphs import (
     set_mdsa_snn_results,
 )
 from snnbackends.verify_nx_graphs import verify_snn_contains_correct_stages
-from typeguard import typechecked
 
 from snncompare.exp_config.Exp_config import Exp_config
 from snncompare.optional_config.Output_config import Output_config
 from snncompare.run_config.Run_config import Run_config
 from snncompare.simulation.stage2_sim import stage_2_or_4_graph_exists_already
+from snncompare.typechecking import typechecked
 
 from ..helper import (
     add_stage_completion_to_graph,
@@ -120,7 +120,6 @@ def perform_mdsa_results_computation_if_needed(
                         verbose=True,
                     )
 
-
         # Indicate the graphs have completed stage 1.
         add_stage_completion_to_graph(snn=graph, stage_index=4)
     return set_new_results
@@ -9,7 +9,6 @@ from dash import Input, Output, dcc, html
 from dash.dcc.Markdown import Markdown
 from pandas import DataFrame
 from snnalgorithms.sparse.MDSA.alg_params import get_algorithm_setting_name
-from typeguard import typechecked
 
 from snncompare.exp_config import Exp_config
 from snncompare.process_results.helper import (
@@ -22,6 +21,7 @@ from snncompare.process_results.Table_settings import (
     Table_settings,
 )
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 
 # pylint: disable=R0914
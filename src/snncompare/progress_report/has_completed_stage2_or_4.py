@@ -1,19 +1,31 @@
 """Checks whether stage 2 has been outputted."""
 
-from typing import Dict, Union
+from typing import Dict, List, Set, Tuple, Union
 
 import networkx as nx
 from simsnn.core.simulators import Simulator
-from typeguard import typechecked
 
 from snncompare.export_results.output_stage1_configs_and_input_graph import (
     Radiation_data,
     get_rad_name_filepath_and_exists,
     get_rand_nrs_and_hash,
 )
+from snncompare.graph_generation.stage_1_create_graphs import (
+    load_input_graph_from_file_with_init_props,
+)
 from snncompare.helper import get_snn_graph_from_graphs_dict
 from snncompare.import_results.helper import simsnn_files_exists_and_get_path
+from snncompare.import_results.load_stage_1_and_2 import (
+    has_outputted_stage_1,
+    load_stage1_simsnn_graphs,
+)
+from snncompare.import_results.results_index import (
+    get_indexed_completed_unique_ids,
+    has_confirmed_completed_stage,
+    index_completed_stage,
+)
 from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
 
 
 @typechecked
@@ -51,6 +63,10 @@ def has_outputted_stage_2_or_4(
     stage2/algorithm_name+setting/adaptation_type/isomorphichash+rand_hash+rad_affected_neurons_hash
     under filenames:
     """
+    if has_confirmed_completed_stage(
+        unique_id=run_config.unique_id, stage_index=stage_index
+    ):
+        return True
     _, rand_nrs_hash = get_rand_nrs_and_hash(
         input_graph=graphs_dict["input_graph"]
     )
@@ -120,3 +136,55 @@ def has_outputted_radiation_json(
         if not radiation_data.radiation_file_exists:
             return False
     return True
+
+
+@typechecked
+def get_completed_and_missing_run_configs(
+    *,
+    run_configs: List[Run_config],
+) -> Tuple[List[Run_config], List[Run_config]]:
+    """Returns the run configs that still need to be ran.
+
+    The run configs that are completed according to the results index are
+    not loaded. The completed stages of the other run configs are added to
+    the results index.
+    """
+    missing_run_configs: List[Run_config] = []
+    completed_run_configs: List[Run_config] = []
+    indexed_unique_ids: Set[str] = get_indexed_completed_unique_ids(
+        stage_index=4
+    )
+
+    for run_config in run_configs:
+        if run_config.unique_id in indexed_unique_ids:
+            completed_run_configs.append(run_config)
+            continue
+        input_graph: nx.Graph = load_input_graph_from_file_with_init_props(
+            run_config=run_config
+        )
+        if has_outputted_stage_1(
+            input_graph=input_graph,
+            run_config=run_config,
+        ):
+            index_completed_stage(
+                unique_id=run_config.unique_id, stage_index=1
+            )
+            graphs_dict: Dict = load_stage1_simsnn_graphs(
+                run_config=run_config,
+            )
+            if has_outputted_stage_2_or_4(
+                graphs_dict=graphs_dict,
+                run_config=run_config,
+                stage_index=4,
+            ):
+                index_completed_stage(
+                    unique_id=run_config.unique_id, stage_index=4
+                )
+                completed_run_configs.append(run_config)
+            else:
+                missing_run_configs.append(run_config)
+        else:
+            missing_run_configs.append(run_config)
+    if len(missing_run_configs) > 0:
+        print(f"Want:{len(run_configs)}, missing:{len(missing_run_configs)}")
+    return completed_run_configs, missing_run_configs
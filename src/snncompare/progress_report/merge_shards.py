@@ -0,0 +1,60 @@
+"""Merges the results indices of the shards of an experiment, and verifies
+that all shards have completed."""
+from typing import Dict, List, Set
+
+from snncompare.create_configs import Run_config_space
+from snncompare.exp_config.Exp_config import Exp_config
+from snncompare.import_results.results_index import (
+    get_indexed_completed_unique_ids,
+    merge_results_index,
+)
+from snncompare.typechecking import typechecked
+
+
+@typechecked
+def merge_shards(
+    *,
+    exp_config: Exp_config,
+    shard_count: int,
+    results_index_filepaths: List[str],
+) -> bool:
+    """Adds the results indices of the shards to the results index, and
+    returns True if all run_configs of all shards completed stage 4.
+
+    The outputted result files of the shards are expected to be copied into
+    the results directory separately.
+    """
+    for results_index_filepath in results_index_filepaths:
+        merge_results_index(filepath=results_index_filepath)
+
+    run_config_space: Run_config_space = Run_config_space(
+        exp_config=exp_config
+    )
+    completed_unique_ids: Set[str] = get_indexed_completed_unique_ids(
+        stage_index=4
+    )
+    shard_assignment: List[int] = run_config_space.get_shard_assignment(
+        shard_count=shard_count
+    )
+    nr_of_run_configs: List[int] = [0] * shard_count
+    for shard_index in shard_assignment:
+        nr_of_run_configs[shard_index] += 1
+    nr_of_completed: List[int] = [0] * shard_count
+    # The completed unique_ids are looked up in the unique_id map of the run
+    # space, such that each run config is created once.
+    unique_id_indices: Dict[
+        str, int
+    ] = run_config_space.get_unique_id_indices()
+    for unique_id in completed_unique_ids:
+        if unique_id in unique_id_indices:
+            nr_of_completed[
+                shard_assignment[unique_id_indices[unique_id]]
+            ] += 1
+
+    for shard_index in range(shard_count):
+        print(
+            f"Shard {shard_index}/{shard_count}: "
+            + f"{nr_of_completed[shard_index]} of "
+            + f"{nr_of_run_configs[shard_index]} run_configs completed."
+        )
+    return nr_of_completed == nr_of_run_configs
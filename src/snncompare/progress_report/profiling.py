@@ -0,0 +1,401 @@
+"""Records the wall time, CPU time, peak memory, I/O and touched files per
+stage of each run_config, split into the categories of work that are done
+in that stage, and appends them to a JSONL log.
+
+A stage is profiled with profile_stage, and the work within the stage is
+attributed to a category with profile_section. Sections can be nested; the
+time of a section is only attributed to its own category, not to the
+categories of the sections around it. The work within a profiled stage that
+is not in a section is attributed to the other category. Outside a
+profiled stage, profile_section does nothing.
+
+The operating system only reports the peak memory of a process over its
+whole lifetime, its high-water mark. So peak_rss_kb is the high-water mark
+of the process at the end of a category, which includes the stages that
+were performed before it. The peak_rss_growth_kb is how much the sections
+of a category raised that high-water mark, which is the memory that the
+category needs on top of the memory the process already used.
+"""
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from snncompare.typechecking import is_fast_mode, typechecked
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # The peak memory usage is not available on Windows.
+    resource = None  # type: ignore[assignment]
+
+PROFILE_LOG_FILEPATH: str = "results/profile_log.jsonl"
+PROFILE_CATEGORIES: List[str] = [
+    "generate",
+    "convert",
+    "simulate",
+    "serialise",
+    "hash",
+    "verify",
+    "other",
+]
+# The metrics that are summed over the sections of a category.
+SUMMED_METRICS: List[str] = [
+    "wall_time",
+    "cpu_time",
+    "bytes_read",
+    "bytes_written",
+    "peak_rss_growth_kb",
+]
+
+
+@typechecked
+def get_io_bytes() -> Tuple[int, int]:
+    """Returns the nr of bytes this process has read and written, or zeros if
+    the operating system does not report them."""
+    try:
+        with open("/proc/self/io", encoding="utf-8") as io_file:
+            io_counters: Dict[str, int] = {
+                key: int(value)
+                for key, value in (
+                    line.split(": ") for line in io_file.read().splitlines()
+                )
+            }
+        return io_counters["rchar"], io_counters["wchar"]
+    except OSError:
+        return 0, 0
+
+
+@typechecked
+def get_peak_rss_kb() -> int:
+    """Returns the peak resident memory (high-water mark) of this process
+    over its lifetime in kB, or 0 if the operating system does not report
+    it."""
+    if resource is None:
+        return 0
+    peak_rss: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kB, macOS reports bytes.
+    if sys.platform == "darwin":
+        return peak_rss // 1024
+    return peak_rss
+
+
+class Profile_section:
+    """Stores the counters at the start of a section, and the totals of its
+    child sections."""
+
+    @typechecked
+    def __init__(self, category: str):
+        """Reads the counters at the start of the section."""
+        if category not in PROFILE_CATEGORIES:
+            raise ValueError(
+                f"Error, category:{category} not in supported"
+                + f" categories:{PROFILE_CATEGORIES}."
+            )
+        self.category: str = category
+        self.files: Set[str] = set()
+        self.start: Dict[str, float] = self.get_counters()
+        self.children: Dict[str, float] = dict.fromkeys(SUMMED_METRICS, 0.0)
+
+    @typechecked
+    def get_counters(self) -> Dict[str, float]:
+        """Returns the current value of the summed metrics. The difference
+        between two values of the peak RSS is the growth of the peak."""
+        bytes_read, bytes_written = get_io_bytes()
+        return {
+            "wall_time": time.perf_counter(),
+            "cpu_time": time.process_time(),
+            "bytes_read": float(bytes_read),
+            "bytes_written": float(bytes_written),
+            "peak_rss_growth_kb": float(get_peak_rss_kb()),
+        }
+
+
+class Stage_profile:
+    """Stores the open sections and the metrics per category of a stage of a
+    run_config."""
+
+    @typechecked
+    def __init__(self, unique_id: str, stage_index: int):
+        """Opens the section that contains the whole stage."""
+        self.unique_id: str = unique_id
+        self.stage_index: int = stage_index
+        self.sections: List[Profile_section] = [Profile_section("other")]
+        self.metrics: Dict[str, Dict[str, Any]] = {}
+
+    @typechecked
+    def close_section(self) -> None:
+        """Adds the metrics of the innermost section, without those of its
+        child sections, to its category."""
+        section: Profile_section = self.sections.pop()
+        end: Dict[str, float] = section.get_counters()
+        totals: Dict[str, float] = {
+            metric: end[metric] - section.start[metric]
+            for metric in SUMMED_METRICS
+        }
+        if self.sections:
+            for metric in SUMMED_METRICS:
+                self.sections[-1].children[metric] += totals[metric]
+
+        category_metrics: Dict[str, Any] = self.metrics.setdefault(
+            section.category,
+            {**dict.fromkeys(SUMMED_METRICS, 0.0), "files": set(), "calls": 0},
+        )
+        for metric in SUMMED_METRICS:
+            category_metrics[metric] += (
+                totals[metric] - section.children[metric]
+            )
+        category_metrics["files"].update(section.files)
+        category_metrics["calls"] += 1
+        category_metrics["peak_rss_kb"] = get_peak_rss_kb()
+
+    @typechecked
+    def get_records(self) -> List[Dict[str, Any]]:
+        """Returns a log record per category of the stage."""
+        return [
+            {
+                "unique_id": self.unique_id,
+                "stage_index": self.stage_index,
+                "category": category,
+                "wall_time": category_metrics["wall_time"],
+                "cpu_time": category_metrics["cpu_time"],
+                "peak_rss_kb": category_metrics["peak_rss_kb"],
+                "peak_rss_growth_kb": int(
+                    category_metrics["peak_rss_growth_kb"]
+                ),
+                "bytes_read": int(category_metrics["bytes_read"]),
+                "bytes_written": int(category_metrics["bytes_written"]),
+                "files_touched": len(category_metrics["files"]),
+                "calls": category_metrics["calls"],
+                "fast_mode": is_fast_mode(),
+                "pid": os.getpid(),
+            }
+            for category, category_metrics in self.metrics.items()
+        ]
+
+
+# The stage that is currently profiled in this process.
+_stage_profile: Optional[Stage_profile] = None
+_audit_hook_added: bool = False
+
+
+def _record_opened_file(event: str, args: Tuple) -> None:
+    """Stores the files that are opened in the innermost open section."""
+    if event == "open" and _stage_profile is not None:
+        if isinstance(args[0], (str, bytes, os.PathLike)):
+            filepath: str = os.fsdecode(args[0])
+            # The I/O counters of the profiler itself are not counted.
+            if filepath != "/proc/self/io":
+                _stage_profile.sections[-1].files.add(filepath)
+
+
+@contextmanager
+@typechecked
+def profile_stage(
+    *,
+    unique_id: str,
+    stage_index: int,
+    enabled: bool,
+    log_filepath: str = PROFILE_LOG_FILEPATH,
+) -> Iterator[None]:
+    """Profiles a stage of a run_config, and appends a record per category to
+    the profile log once the stage is completed."""
+    # pylint: disable=W0603
+    global _stage_profile, _audit_hook_added
+    if not enabled or _stage_profile is not None:
+        yield
+        return
+    if not _audit_hook_added:
+        # Audit hooks can not be removed, so it is only added once.
+        sys.addaudithook(_record_opened_file)
+        _audit_hook_added = True
+
+    _stage_profile = Stage_profile(unique_id, stage_index)
+    try:
+        yield
+    finally:
+        stage_profile: Stage_profile = _stage_profile
+        while stage_profile.sections:
+            stage_profile.close_section()
+        _stage_profile = None
+    append_profile_records(
+        log_filepath=log_filepath, records=stage_profile.get_records()
+    )
+
+
+@contextmanager
+@typechecked
+def profile_section(*, category: str) -> Iterator[None]:
+    """Attributes the work within the section to the category, if a stage is
+    being profiled."""
+    if _stage_profile is None:
+        yield
+        return
+    stage_profile: Stage_profile = _stage_profile
+    stage_profile.sections.append(Profile_section(category))
+    try:
+        yield
+    finally:
+        stage_profile.close_section()
+
+
+@typechecked
+def append_profile_records(
+    *, log_filepath: str, records: List[Dict[str, Any]]
+) -> None:
+    """Appends the records to the JSONL profile log.
+
+    Each record is appended with a single write, such that the records
+    of parallel workers do not get interleaved.
+    """
+    log_dir: str = os.path.dirname(log_filepath)
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+    with open(log_filepath, "a", encoding="utf-8") as log_file:
+        for record in records:
+            log_file.write(f"{json.dumps(record)}\n")
+            log_file.flush()
+
+
+@typechecked
+def load_profile_records(
+    *, log_filepath: str = PROFILE_LOG_FILEPATH
+) -> List[Dict[str, Any]]:
+    """Returns the records of the profile log."""
+    if not os.path.isfile(log_filepath):
+        raise FileNotFoundError(
+            f"Error, profile log not found at:{log_filepath}"
+        )
+    with open(log_filepath, encoding="utf-8") as log_file:
+        return [json.loads(line) for line in log_file if line.strip()]
+
+
+@typechecked
+def summarise_profile_records(
+    *, records: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Returns the totals per stage and category over all run_configs, sorted
+    from the most to the least wall time. The peak RSS and its growth are
+    the maxima over the run_configs, not totals."""
+    summary: Dict[Tuple[int, str], Dict[str, Any]] = {}
+    for record in records:
+        totals: Dict[str, Any] = summary.setdefault(
+            (record["stage_index"], record["category"]),
+            {
+                "stage_index": record["stage_index"],
+                "category": record["category"],
+                "wall_time": 0.0,
+                "cpu_time": 0.0,
+                "peak_rss_kb": 0,
+                "peak_rss_growth_kb": 0,
+                "bytes_read": 0,
+                "bytes_written": 0,
+                "files_touched": 0,
+                "run_configs": set(),
+            },
+        )
+        for metric in [
+            "wall_time",
+            "cpu_time",
+            "bytes_read",
+            "bytes_written",
+            "files_touched",
+        ]:
+            totals[metric] += record[metric]
+        for metric in ["peak_rss_kb", "peak_rss_growth_kb"]:
+            # Records of older logs do not contain the growth.
+            totals[metric] = max(totals[metric], record.get(metric, 0))
+        totals["run_configs"].add(record["unique_id"])
+
+    for totals in summary.values():
+        totals["run_configs"] = len(totals["run_configs"])
+    return sorted(
+        summary.values(), key=lambda totals: totals["wall_time"], reverse=True
+    )
+
+
+@typechecked
+def get_fast_mode_speedups(
+    *, records: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Returns per stage the mean wall time per run_config with and without
+    runtime type checks, and the speedup of the fast mode. Only the stages
+    that are profiled in both modes are returned."""
+    # The wall time and run_configs per stage, per fast mode.
+    stage_totals: Dict[int, Dict[bool, Tuple[float, Set[str]]]] = {}
+    for record in records:
+        fast_mode: bool = record.get("fast_mode", False)
+        mode_totals = stage_totals.setdefault(record["stage_index"], {})
+        wall_time, run_configs = mode_totals.get(fast_mode, (0.0, set()))
+        run_configs.add(record["unique_id"])
+        mode_totals[fast_mode] = (wall_time + record["wall_time"], run_configs)
+
+    speedups: List[Dict[str, Any]] = []
+    for stage_index, mode_totals in sorted(stage_totals.items()):
+        if len(mode_totals) < 2:
+            continue
+        checked_wall_time: float = mode_totals[False][0] / len(
+            mode_totals[False][1]
+        )
+        fast_wall_time: float = mode_totals[True][0] / len(
+            mode_totals[True][1]
+        )
+        speedups.append(
+            {
+                "stage_index": stage_index,
+                "checked_wall_time": checked_wall_time,
+                "fast_wall_time": fast_wall_time,
+                "speedup": checked_wall_time / max(fast_wall_time, 1e-9),
+            }
+        )
+    return speedups
+
+
+@typechecked
+def print_profile_summary(
+    *,
+    log_filepath: str = PROFILE_LOG_FILEPATH,
+    nr_of_rows: int = 10,
+) -> None:
+    """Prints the stages and categories with the most wall time in the
+    profile log, and the speedup of the fast mode per stage if the log
+    contains runs with and without runtime type checks."""
+    records: List[Dict[str, Any]] = load_profile_records(
+        log_filepath=log_filepath
+    )
+    summary: List[Dict[str, Any]] = summarise_profile_records(records=records)
+    total_wall_time: float = sum(totals["wall_time"] for totals in summary)
+    print(
+        f"{'stage':>5} {'category':<9} {'wall [s]':>10} {'share':>6} "
+        + f"{'cpu [s]':>10} {'peak rss [MB]':>13} {'growth [MB]':>11} "
+        + f"{'read [MB]':>10} "
+        + f"{'written [MB]':>12} {'files':>7} {'runs':>6}"
+    )
+    for totals in summary[:nr_of_rows]:
+        share: float = (
+            totals["wall_time"] / total_wall_time if total_wall_time else 0.0
+        )
+        print(
+            f"{totals['stage_index']:>5} {totals['category']:<9} "
+            + f"{totals['wall_time']:>10.2f} {share:>6.1%} "
+            + f"{totals['cpu_time']:>10.2f} "
+            + f"{totals['peak_rss_kb']/1024:>13.1f} "
+            + f"{totals['peak_rss_growth_kb']/1024:>11.1f} "
+            + f"{totals['bytes_read']/1e6:>10.1f} "
+            + f"{totals['bytes_written']/1e6:>12.1f} "
+            + f"{totals['files_touched']:>7} {totals['run_configs']:>6}"
+        )
+
+    speedups: List[Dict[str, Any]] = get_fast_mode_speedups(records=records)
+    if speedups:
+        print("\nMean wall time per run_config with and without type checks:")
+        print(f"{'stage':>5} {'checked [s]':>12} {'fast [s]':>10} {'x':>6}")
+        for speedup in speedups:
+            print(
+                f"{speedup['stage_index']:>5} "
+                + f"{speedup['checked_wall_time']:>12.3f} "
+                + f"{speedup['fast_wall_time']:>10.3f} "
+                + f"{speedup['speedup']:>6.2f}"
+            )
@@ -0,0 +1,48 @@
+"""Rebuilds the results index from the files in the results directory."""
+import os
+from typing import List
+
+from snncompare.import_results.results_index import (
+    clear_results_index,
+    index_artifacts_in_results_dir,
+)
+from snncompare.json_configurations.algo_test import load_run_config_from_file
+from snncompare.progress_report.has_completed_stage2_or_4 import (
+    get_completed_and_missing_run_configs,
+)
+from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
+
+
+@typechecked
+def reindex_results(*, results_dir: str = "results") -> None:
+    """Replaces the results index with the outputted files that exist in the
+    results directory, and the completed stages of the run_configs that are
+    stored in results/stage1/run_configs."""
+    clear_results_index()
+    nr_of_artifacts: int = index_artifacts_in_results_dir(
+        results_dir=results_dir
+    )
+
+    run_configs_dir: str = f"{results_dir}/stage1/run_configs"
+    run_configs: List[Run_config] = []
+    if os.path.isdir(run_configs_dir):
+        for filename in sorted(os.listdir(run_configs_dir)):
+            if filename.endswith(".json"):
+                run_configs.append(
+                    load_run_config_from_file(
+                        custom_config_path="",
+                        filename=f"{run_configs_dir}/{filename[:-5]}",
+                        from_unique_id=True,
+                    )
+                )
+
+    # Probes the stage 1 and 4 files of each run_config, and stores its
+    # completed stages in the results index.
+    completed_run_configs, _ = get_completed_and_missing_run_configs(
+        run_configs=run_configs
+    )
+    print(
+        f"Indexed {nr_of_artifacts} files and {len(run_configs)} run_configs,"
+        + f" of which {len(completed_run_configs)} completed stage 4."
+    )
@@ -0,0 +1,86 @@
+"""Determines which run_configs still need to be ran, based on the completed
+stages that the results index stores per Run_config.unique_id.
+
+Unlike get_completed_and_missing_run_configs, this does not load any input
+graph or snn, so its duration does not depend on the size of the results.
+"""
+from collections import Counter
+from typing import List, Set, Tuple
+
+from snncompare.import_results.results_index import (
+    get_indexed_completed_unique_ids,
+    results_index_exists,
+)
+from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
+
+
+@typechecked
+def get_completed_and_missing_run_configs_from_manifest(
+    *,
+    run_configs: List[Run_config],
+    stage_index: int = 4,
+) -> Tuple[List[Run_config], List[Run_config]]:
+    """Returns the run_configs that have completed the stage according to the
+    results index, and the run_configs that have not."""
+    completed_unique_ids: Set[str] = get_indexed_completed_unique_ids(
+        stage_index=stage_index
+    )
+    completed_run_configs: List[Run_config] = []
+    missing_run_configs: List[Run_config] = []
+    for run_config in run_configs:
+        if run_config.unique_id in completed_unique_ids:
+            completed_run_configs.append(run_config)
+        else:
+            missing_run_configs.append(run_config)
+    return completed_run_configs, missing_run_configs
+
+
+@typechecked
+def get_run_config_summary_key(*, run_config: Run_config) -> str:
+    """Returns the algorithm, graph size and adaptation of a run_config as a
+    human readable string."""
+    algorithm: str = ",".join(
+        f"{algo_name}_{'_'.join(str(v) for v in algo_setts.values())}"
+        for algo_name, algo_setts in run_config.algorithm.items()
+    )
+    if run_config.adaptation is None:
+        adaptation: str = "no_adaptation"
+    else:
+        adaptation = (
+            f"{run_config.adaptation.adaptation_type}_"
+            + f"{run_config.adaptation.redundancy}"
+        )
+    return (
+        f"{algorithm}, graph_size={run_config.graph_size}, "
+        + f"adaptation={adaptation}"
+    )
+
+
+@typechecked
+def print_resume_summary(
+    *,
+    completed_run_configs: List[Run_config],
+    missing_run_configs: List[Run_config],
+) -> None:
+    """Prints how many run_configs are completed and missing, and how the
+    missing run_configs are distributed over the experiment settings."""
+    nr_of_run_configs: int = len(completed_run_configs) + len(
+        missing_run_configs
+    )
+    if not results_index_exists():
+        print(
+            "No results index found, run with --reindex to index existing"
+            + " results."
+        )
+    print(
+        f"Run_configs: {nr_of_run_configs}, completed: "
+        + f"{len(completed_run_configs)}, missing: "
+        + f"{len(missing_run_configs)}"
+    )
+    missing_per_setting: Counter = Counter(
+        get_run_config_summary_key(run_config=run_config)
+        for run_config in missing_run_configs
+    )
+    for setting, nr_of_missing in sorted(missing_per_setting.items()):
+        print(f"  missing {nr_of_missing}: {setting}")
@@ -3,9 +3,9 @@ from typing import TYPE_CHECKING, Dict, List
 
 import networkx as nx
 import pylab as plt
-from typeguard import typechecked
 
 from snncompare.export_plots.plot_graphs import export_plot
+from snncompare.typechecking import typechecked
 
 if TYPE_CHECKING:
     pass
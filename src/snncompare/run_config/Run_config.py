@@ -6,9 +6,9 @@ from typing import Dict, Optional, Union
 
 from snnadaptation.Adaptation import Adaptation
 from snnradiation.Rad_damage import Rad_damage
-from typeguard import typechecked
 
 from snncompare.export_results.helper import get_unique_run_config_id
+from snncompare.typechecking import typechecked
 
 if sys.version_info < (3, 11):
     from typing_extensions import TypedDict
@@ -9,7 +9,7 @@ Supported_experiment_settings.py.
 """
 from typing import Dict, Union
 
-from typeguard import typechecked
+from snncompare.typechecking import typechecked
 
 
 # pylint: disable=R0902
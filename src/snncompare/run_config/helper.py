@@ -3,9 +3,8 @@
 import os
 from typing import List
 
-from typeguard import typechecked
-
 from snncompare.import_results.helper import file_contains_line
+from snncompare.typechecking import typechecked
 
 
 @typechecked
@@ -1,15 +1,15 @@
 """Checks whether the radiation graphs already exist in graph_dict, and adds
 them if they don't."""
-import copy
 from typing import Dict
 
 from simsnn.core.simulators import Simulator
-from typeguard import typechecked
 
 from snncompare.graph_generation.stage_1_create_graphs import (
     get_new_radiation_graph,
 )
 from snncompare.run_config.Run_config import Run_config
+from snncompare.simulation.clone_snn import clone_snn
+from snncompare.typechecking import typechecked
 
 
 @typechecked
@@ -21,14 +21,14 @@ def ensure_empty_rad_snns_exist(
     """Copies the un-radiated snn graph into the radiated snn graph, for
     simulation."""
 
-    if "rad_snn_algo_graph" not in stage_1_graphs.keys():
-        stage_1_graphs["rad_snn_algo_graph"] = copy.deepcopy(
-            stage_1_graphs["snn_algo_graph"]
-        )
-    if "rad_adapted_snn_graph" not in stage_1_graphs.keys():
-        stage_1_graphs["rad_adapted_snn_graph"] = copy.deepcopy(
-            stage_1_graphs["adapted_snn_graph"]
-        )
+    # With radiation, the radiated snns are (re)created from the un-radiated
+    # snns below, so they do not need to be copied here.
+    if not run_config.radiation:
+        for graph_name in ["snn_algo_graph", "adapted_snn_graph"]:
+            if f"rad_{graph_name}" not in stage_1_graphs.keys():
+                stage_1_graphs[f"rad_{graph_name}"] = clone_snn(
+                    snn=stage_1_graphs[graph_name]
+                )
 
     apply_radiation_to_empty_simsnn_graphs(
         run_config=run_config,
@@ -0,0 +1,325 @@
+"""Simulates a batch of simsnn snns that share the same topology, e.g. the
+radiated copies of a single stage 1 snn, in a single vectorised run.
+
+The V, I and spike states of the neurons are stored in arrays with a
+leading batch dimension, such that each timestep is a few array operations
+over all snns in the batch, instead of a Python loop over the neurons and
+synapses of each snn. The snns may differ in their neuron parameters and
+synapse weights, which is how radiation perturbs them.
+
+Per timestep, the neurons are updated like the simsnn LIF neurons:
+    V = max(V_min, V*m + I + bias)
+    I = I_e + (I - I_e)*(1 - du)
+after which a neuron spikes (and V is reset) if V reaches the threshold,
+and the synapses add w*out of their presynaptic neuron to the I of their
+postsynaptic neuron, in the same order as simsnn (see Csr_synapses).
+Neurons without a du (or bias) attribute reset I to I_e (or have no bias),
+as in the original simsnn LIF neurons.
+"""
+from typing import Dict, List, Optional
+
+import numpy as np
+from simsnn.core.simulators import Simulator
+
+from snncompare.optional_config.Output_config import Early_stop_policy
+from snncompare.run_config.Run_config import Run_config
+from snncompare.simulation.early_stop import (
+    early_stop_holds,
+    get_watched_neurons,
+)
+from snncompare.simulation.sparse_sim import Csr_synapses
+from snncompare.typechecking import typechecked
+
+# The simsnn LIF attributes that are stored per neuron, with the value that
+# is used if a neuron does not have the attribute.
+NEURON_PARAMETERS: Dict[str, float] = {
+    "m": 1.0,
+    "bias": 0.0,
+    "V_min": 0.0,
+    "V_reset": 0.0,
+    "thr": 1.0,
+    "I_e": 0.0,
+    "du": 1.0,
+    "amplitude": 1.0,
+}
+
+
+# pylint: disable=R0902
+class Batched_snns:
+    """Stores the neuron and synapse arrays of a batch of snns that share the
+    same topology."""
+
+    @typechecked
+    def __init__(self, snns: List[Simulator]):
+        """Converts the neurons and synapses of the snns into arrays with a
+        row per snn."""
+        if not snns:
+            raise ValueError("Error, no snns to simulate in batch.")
+        self.snns: List[Simulator] = snns
+        self.nr_of_neurons: int = len(snns[0].network.nodes)
+
+        # The index of each neuron object, per snn.
+        self.neuron_indices: List[Dict[int, int]] = [
+            {
+                id(neuron): index
+                for index, neuron in enumerate(snn.network.nodes)
+            }
+            for snn in snns
+        ]
+        pre_indices, post_indices = self.get_synapse_indices()
+        self.synapses: Csr_synapses = Csr_synapses(
+            pre_indices=pre_indices,
+            post_indices=post_indices,
+            nr_of_neurons=self.nr_of_neurons,
+        )
+
+        self.parameters: Dict[str, np.ndarray] = {
+            parameter_name: np.array(
+                [
+                    [
+                        getattr(neuron, parameter_name, default)
+                        for neuron in snn.network.nodes
+                    ]
+                    for snn in snns
+                ],
+                dtype=float,
+            )
+            for parameter_name, default in NEURON_PARAMETERS.items()
+        }
+        self.strict_thr: np.ndarray = np.array(
+            [
+                [
+                    getattr(neuron, "spike_only_if_thr_exceeded", False)
+                    for neuron in snn.network.nodes
+                ]
+                for snn in snns
+            ],
+            dtype=bool,
+        )
+        self.csr_weights: np.ndarray = self.synapses.get_csr_weights(
+            weights=np.array(
+                [
+                    [synapse.w for synapse in snn.network.synapses]
+                    for snn in snns
+                ],
+                dtype=float,
+            ).reshape(len(snns), len(pre_indices))
+        )
+
+        self.v: np.ndarray = self.get_neuron_states(state_name="V")
+        self.i: np.ndarray = self.get_neuron_states(state_name="I")
+        self.out: np.ndarray = self.get_neuron_states(state_name="out")
+
+    @typechecked
+    def get_synapse_indices(self) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the pre- and postsynaptic neuron index of each synapse, and
+        verifies all snns have the same topology."""
+        synapse_indices: List[List[tuple[int, int]]] = []
+        for snn, neuron_indices in zip(self.snns, self.neuron_indices):
+            if len(snn.network.nodes) != self.nr_of_neurons:
+                raise ValueError(
+                    "Error, the snns in a batch should have the same neurons."
+                )
+            if any(
+                getattr(neuron, "noise", 0) > 0 for neuron in snn.network.nodes
+            ):
+                raise NotImplementedError(
+                    "Error, neurons with noise are not supported."
+                )
+            if any(
+                len(synapse.out_pre) != 1 for synapse in snn.network.synapses
+            ):
+                raise NotImplementedError(
+                    "Error, only synapses with delay 1 are supported."
+                )
+            synapse_indices.append(
+                [
+                    (
+                        neuron_indices[id(synapse.pre)],
+                        neuron_indices[id(synapse.post)],
+                    )
+                    for synapse in snn.network.synapses
+                ]
+            )
+        if any(indices != synapse_indices[0] for indices in synapse_indices):
+            raise ValueError(
+                "Error, the snns in a batch should have the same synapses."
+            )
+        pre_post: np.ndarray = np.array(synapse_indices[0], dtype=int).reshape(
+            -1, 2
+        )
+        return pre_post[:, 0], pre_post[:, 1]
+
+    @typechecked
+    def get_neuron_states(self, *, state_name: str) -> np.ndarray:
+        """Returns the current value of a state of the neurons, per snn."""
+        return np.array(
+            [
+                [getattr(neuron, state_name) for neuron in snn.network.nodes]
+                for snn in self.snns
+            ],
+            dtype=float,
+        )
+
+    @typechecked
+    def step(self) -> None:
+        """Simulates a single timestep of all snns."""
+        params: Dict[str, np.ndarray] = self.parameters
+        self.v = np.maximum(
+            params["V_min"], self.v * params["m"] + self.i + params["bias"]
+        )
+        self.i = params["I_e"] + (self.i - params["I_e"]) * (1 - params["du"])
+        spikes: np.ndarray = np.where(
+            self.strict_thr, self.v > params["thr"], self.v >= params["thr"]
+        )
+        self.v = np.where(spikes, params["V_reset"], self.v)
+        self.out = np.where(spikes, params["amplitude"], 0.0)
+
+        self.synapses.add_synaptic_input(
+            i=self.i, out=self.out, csr_weights=self.csr_weights
+        )
+
+    @typechecked
+    def get_recorded_indices(self) -> List[int]:
+        """Returns the indices of the neurons that are in the raster or
+        multimeter of any snn in the batch."""
+        recorded_indices: set[int] = set()
+        for snn, neuron_indices in zip(self.snns, self.neuron_indices):
+            for target in snn.raster.targets + snn.multimeter.targets:
+                recorded_indices.add(neuron_indices[id(target)])
+        return sorted(recorded_indices)
+
+
+# pylint: disable=R0914
+@typechecked
+def run_snns_in_batch(
+    *,
+    snns: List[Simulator],
+    sim_duration: int,
+    early_stop_policy: Optional[Early_stop_policy] = None,
+    run_config: Optional[Run_config] = None,
+    sim_durations: Optional[List[int]] = None,
+) -> None:
+    """Simulates the snns for sim_duration timesteps in a single vectorised
+    run, and stores the raster and multimeter recordings in each snn as if it
+    was simulated separately.
+
+    If sim_durations are given, each snn is only simulated for its own
+    duration, which is at most sim_duration. If an early_stop_policy is
+    given, each snn stops once its predicate holds, like
+    run_snn_on_simsnn_with_early_stop. The recordings, neuron states and
+    actual_duration of a snn are those at its own stop timestep. The batch
+    is stepped until all snns have stopped.
+    """
+    if sim_durations is None:
+        sim_durations = [sim_duration] * len(snns)
+    if len(sim_durations) != len(snns) or max(sim_durations) > sim_duration:
+        raise ValueError(
+            "Error, expected a sim_duration of at most:"
+            + f"{sim_duration} per snn, got:{sim_durations}."
+        )
+    batch: Batched_snns = Batched_snns(snns)
+    # Only the states of the recorded neurons are stored per timestep.
+    recorded_indices: List[int] = batch.get_recorded_indices()
+    columns: Dict[int, int] = {
+        neuron_index: column
+        for column, neuron_index in enumerate(recorded_indices)
+    }
+    spikes: np.ndarray = np.zeros(
+        (sim_duration, len(snns), len(recorded_indices)), dtype=bool
+    )
+    v: np.ndarray = np.zeros((sim_duration, len(snns), len(recorded_indices)))
+    i: np.ndarray = np.zeros((sim_duration, len(snns), len(recorded_indices)))
+
+    watched: Optional[np.ndarray] = None
+    if early_stop_policy is not None:
+        if run_config is None:
+            raise ValueError(
+                "Error, the early stop predicate requires the run_config."
+            )
+        watched = get_watched_neuron_mask(
+            batch=batch,
+            early_stop_policy=early_stop_policy,
+            run_config=run_config,
+        )
+    # The nr of simulated timesteps, and the final neuron states, per snn.
+    durations: np.ndarray = np.array(sim_durations, dtype=int)
+    stopped: np.ndarray = durations == 0
+    last_spike_t: np.ndarray = np.zeros(len(snns), dtype=int)
+    final_states: Dict[str, np.ndarray] = {
+        "V": batch.v.copy(),
+        "I": batch.i.copy(),
+        "out": batch.out.copy(),
+    }
+
+    t: int = 0
+    while t < sim_duration and not stopped.all():
+        batch.step()
+        spikes[t] = batch.out[:, recorded_indices] > 0
+        v[t] = batch.v[:, recorded_indices]
+        i[t] = batch.i[:, recorded_indices]
+        t += 1
+        stopping: np.ndarray = ~stopped & (durations == t)
+        if early_stop_policy is not None and watched is not None:
+            last_spike_t[((batch.out > 0) & watched).any(axis=1)] = t
+            if t % early_stop_policy.check_interval == 0:
+                for snn_index in np.flatnonzero(~stopped).tolist():
+                    stopping[snn_index] |= early_stop_holds(
+                        early_stop_policy=early_stop_policy,
+                        last_spike_t=int(last_spike_t[snn_index]),
+                        t=t,
+                    )
+        if stopping.any():
+            stopped |= stopping
+            durations[stopping] = t
+            final_states["V"][stopping] = batch.v[stopping]
+            final_states["I"][stopping] = batch.i[stopping]
+            final_states["out"][stopping] = batch.out[stopping]
+    final_states["V"][~stopped] = batch.v[~stopped]
+    final_states["I"][~stopped] = batch.i[~stopped]
+    final_states["out"][~stopped] = batch.out[~stopped]
+
+    for snn_index, snn in enumerate(snns):
+        duration: int = int(durations[snn_index])
+        raster_columns: List[int] = [
+            columns[batch.neuron_indices[snn_index][id(target)]]
+            for target in snn.raster.targets
+        ]
+        multimeter_columns: List[int] = [
+            columns[batch.neuron_indices[snn_index][id(target)]]
+            for target in snn.multimeter.targets
+        ]
+        snn.raster.spikes = spikes[:duration, snn_index, raster_columns]
+        snn.multimeter.V = v[:duration, snn_index, multimeter_columns]
+        if multimeter_columns:
+            snn.multimeter.I = i[:duration, snn_index, multimeter_columns]
+        snn.raster.index = duration
+        snn.multimeter.index = duration
+
+        for neuron_index, neuron in enumerate(snn.network.nodes):
+            neuron.V = final_states["V"][snn_index, neuron_index]
+            neuron.I = final_states["I"][snn_index, neuron_index]
+            neuron.out = final_states["out"][snn_index, neuron_index]
+        snn.network.graph.graph["actual_duration"] = duration
+
+
+@typechecked
+def get_watched_neuron_mask(
+    *,
+    batch: Batched_snns,
+    early_stop_policy: Early_stop_policy,
+    run_config: Run_config,
+) -> np.ndarray:
+    """Returns a boolean array with a row per snn, that is True for the
+    neurons whose spikes determine whether the early stop predicate holds."""
+    watched: np.ndarray = np.zeros(
+        (len(batch.snns), batch.nr_of_neurons), bool
+    )
+    for snn_index, snn in enumerate(batch.snns):
+        for neuron in get_watched_neurons(
+            early_stop_policy=early_stop_policy, run_config=run_config, snn=snn
+        ):
+            watched[
+                snn_index, batch.neuron_indices[snn_index][id(neuron)]
+            ] = True
+    return watched
@@ -0,0 +1,94 @@
+"""Clones simsnn snns without deep copying them.
+
+The radiated snns, and the snns of run_configs that only differ in
+radiation, start as copies of the same stage 1 snn. A deep copy of a
+Simulator copies every object it refers to. A clone only copies the objects
+that radiation and simulation modify: the neurons and synapses (whose
+parameters and states are scalars), the synapse buffers, the recordings,
+and the graph attributes. The networkx graph structure is copied without
+copying its node and edge attribute values, and the other neuron attributes
+(like names and positions) are shared with the original.
+"""
+import copy
+from typing import Any, Dict, Union
+
+import networkx as nx
+from simsnn.core.simulators import Simulator
+
+from snncompare.typechecking import typechecked
+
+
+@typechecked
+def clone_snn(
+    *, snn: Union[nx.Graph, nx.DiGraph, Simulator]
+) -> Union[nx.Graph, nx.DiGraph, Simulator]:
+    """Returns a clone of a simsnn snn, or a deep copy of a networkx snn,
+    whose neurons are objects in the node attributes that are modified
+    during simulation."""
+    if isinstance(snn, Simulator):
+        return clone_simsnn(snn=snn)
+    return copy.deepcopy(snn)
+
+
+@typechecked
+def clone_graphs_dict(*, graphs_dict: Dict) -> Dict:
+    """Returns a dict with a clone of each graph in the graphs_dict."""
+    return {
+        graph_name: clone_snn(snn=snn)
+        for graph_name, snn in graphs_dict.items()
+    }
+
+
+@typechecked
+def clone_simsnn(*, snn: Simulator) -> Simulator:
+    """Returns a copy of the simsnn snn that can be radiated and simulated
+    without modifying the original snn."""
+    neuron_clones: Dict[int, Any] = {}
+    for neuron in snn.network.nodes:
+        neuron_clone = copy.copy(neuron)
+        # Noisy neurons should draw the same noise as the original would.
+        if getattr(neuron, "noise", 0) > 0:
+            neuron_clone.rng = copy.deepcopy(neuron.rng)
+        neuron_clones[id(neuron)] = neuron_clone
+
+    synapse_clones = []
+    for synapse in snn.network.synapses:
+        synapse_clone = copy.copy(synapse)
+        synapse_clone.pre = neuron_clones[id(synapse.pre)]
+        synapse_clone.post = neuron_clones[id(synapse.post)]
+        synapse_clone.out_pre = synapse.out_pre.copy()
+        synapse_clones.append(synapse_clone)
+
+    network_clone = copy.copy(snn.network)
+    network_clone.nodes = list(neuron_clones.values())
+    network_clone.synapses = synapse_clones
+    network_clone.graph = snn.network.graph.copy()
+    network_clone.graph.graph = copy.deepcopy(snn.network.graph.graph)
+
+    snn_clone: Simulator = copy.copy(snn)
+    snn_clone.network = network_clone
+    snn_clone.raster = clone_detector(
+        detector=snn.raster, neuron_clones=neuron_clones
+    )
+    snn_clone.multimeter = clone_detector(
+        detector=snn.multimeter, neuron_clones=neuron_clones
+    )
+    return snn_clone
+
+
+@typechecked
+def clone_detector(*, detector: Any, neuron_clones: Dict[int, Any]) -> Any:
+    """Returns a copy of a raster or multimeter that records the cloned
+    neurons, with a copy of the recordings."""
+    detector_clone = copy.copy(detector)
+    detector_clone.targets = [
+        neuron_clones[id(target)] for target in detector.targets
+    ]
+    for recording_name in ["spikes", "V", "I"]:
+        if hasattr(detector, recording_name):
+            setattr(
+                detector_clone,
+                recording_name,
+                getattr(detector, recording_name).copy(),
+            )
+    return detector_clone
@@ -0,0 +1,129 @@
+"""Simulates a simsnn snn until an early stop predicate holds, instead of
+simulating the maximum simulation duration.
+
+The predicate is checked every check_interval timesteps. Once it holds, the
+raster and multimeter recordings are truncated to the simulated timesteps,
+and the nr of simulated timesteps is stored as the actual_duration of the
+snn.
+"""
+from fnmatch import fnmatchcase
+from typing import Dict, List
+
+from simsnn.core.nodes import LIF
+from simsnn.core.simulators import Simulator
+
+from snncompare.optional_config.Output_config import Early_stop_policy
+from snncompare.run_config.Run_config import Run_config
+from snncompare.typechecking import typechecked
+
+# The (fnmatch) name patterns of the neurons that spike once the algorithm
+# has computed its result, per algorithm.
+TERMINATOR_NEURON_PATTERNS: Dict[str, str] = {"MDSA": "*terminator_node*"}
+
+
+@typechecked
+def get_terminator_neurons(
+    *,
+    run_config: Run_config,
+    snn: Simulator,
+) -> List[LIF]:
+    """Returns the neurons of the snn that spike once the algorithm of the
+    run_config has computed its result."""
+    terminator_neurons: List[LIF] = []
+    for algo_name in run_config.algorithm.keys():
+        if algo_name not in TERMINATOR_NEURON_PATTERNS:
+            raise NotImplementedError(
+                f"Error, algo_name:{algo_name} has no terminator neuron."
+            )
+        terminator_neurons.extend(
+            neuron
+            for neuron in snn.network.nodes
+            if fnmatchcase(neuron.name, TERMINATOR_NEURON_PATTERNS[algo_name])
+        )
+    if not terminator_neurons:
+        raise ValueError("Error, no terminator neuron found in the snn.")
+    return terminator_neurons
+
+
+@typechecked
+def get_watched_neurons(
+    *,
+    early_stop_policy: Early_stop_policy,
+    run_config: Run_config,
+    snn: Simulator,
+) -> List[LIF]:
+    """Returns the neurons whose spikes determine whether the early stop
+    predicate holds. Only the terminator neurons need to be checked for the
+    terminator predicate, quiescence is checked on all neurons."""
+    if early_stop_policy.predicate == "terminator":
+        return get_terminator_neurons(run_config=run_config, snn=snn)
+    return list(snn.network.nodes)
+
+
+@typechecked
+def run_snn_on_simsnn_with_early_stop(
+    *,
+    early_stop_policy: Early_stop_policy,
+    run_config: Run_config,
+    snn: Simulator,
+    sim_duration: int,
+) -> int:
+    """Simulates the snn for at most sim_duration timesteps, stops once the
+    early stop predicate holds, and returns the simulated nr of timesteps."""
+    watched_neurons: List[LIF] = get_watched_neurons(
+        early_stop_policy=early_stop_policy, run_config=run_config, snn=snn
+    )
+
+    snn.raster.initialize(sim_duration)
+    snn.multimeter.initialize(sim_duration)
+    last_spike_t: int = 0
+    t: int = 0
+    while t < sim_duration:
+        snn.network.step()
+        snn.raster.step()
+        snn.multimeter.step()
+        t += 1
+        if any(neuron.out > 0 for neuron in watched_neurons):
+            last_spike_t = t
+        if t % early_stop_policy.check_interval == 0 and early_stop_holds(
+            early_stop_policy=early_stop_policy,
+            last_spike_t=last_spike_t,
+            t=t,
+        ):
+            break
+
+    truncate_recordings(snn=snn, duration=t)
+    snn.network.graph.graph["actual_duration"] = t
+    return t
+
+
+@typechecked
+def early_stop_holds(
+    *,
+    early_stop_policy: Early_stop_policy,
+    last_spike_t: int,
+    t: int,
+) -> bool:
+    """Returns True if the simulation can be stopped at timestep t, given the
+    last timestep at which a watched neuron spiked."""
+    if early_stop_policy.predicate == "terminator":
+        return last_spike_t > 0
+    if early_stop_policy.predicate == "quiescent":
+        return t - last_spike_t >= early_stop_policy.quiescent_duration
+    raise NotImplementedError(
+        f"Error, predicate:{early_stop_policy.predicate} not implemented."
+    )
+
+
+@typechecked
+def truncate_recordings(*, snn: Simulator, duration: int) -> None:
+    """Removes the unsimulated timesteps from the raster and multimeter
+    recordings."""
+    snn.raster.spikes = snn.raster.spikes[:duration]
+    for recording_name in ["V", "I"]:
+        if hasattr(snn.multimeter, recording_name):
+            setattr(
+                snn.multimeter,
+                recording_name,
+                getattr(snn.multimeter, recording_name)[:duration],
+            )
@@ -0,0 +1,154 @@
+"""Reuses the simulation of an unradiated simsnn snn for its radiated snn, if
+the radiation did not change the radiated snn.
+
+With a low probability per timestep, most radiation draws do not affect
+any neuron or synapse. The radiated snn then behaves exactly like the
+unradiated snn, so its simulation results are copied from the simulated
+unradiated snn instead of simulating it again.
+
+Radiation can only change the behaviour of an snn by changing its neurons
+or synapses, so the radiated snn is unaffected if it has the same neurons
+and synapses with the same static properties as the unradiated snn. The
+dynamic states (V, I, out and the synapse buffers) are not compared, as
+the unradiated snn has already been simulated.
+"""
+from typing import Any, Dict, List
+
+import numpy as np
+from simsnn.core.simulators import Simulator
+
+from snncompare.typechecking import typechecked
+
+# The neuron and synapse attributes that change during simulation.
+DYNAMIC_NEURON_PROPERTIES: List[str] = ["I", "V", "out"]
+DYNAMIC_SYNAPSE_PROPERTIES: List[str] = ["pre", "post", "out_pre", "index"]
+
+
+@typechecked
+def get_static_properties(
+    *, some_object: Any, dynamic_properties: List[str]
+) -> Dict[str, Any]:
+    """Returns the attributes of a neuron or synapse that do not change
+    during simulation."""
+    return {
+        key: value
+        for key, value in vars(some_object).items()
+        if key not in dynamic_properties
+    }
+
+
+@typechecked
+def have_equal_properties(
+    *, properties: Dict[str, Any], other_properties: Dict[str, Any]
+) -> bool:
+    """Returns True if both neurons or synapses have the same attributes, with
+    the same values."""
+    if properties.keys() != other_properties.keys():
+        return False
+    for key, value in properties.items():
+        other_value: Any = other_properties[key]
+        if isinstance(value, np.ndarray) or isinstance(
+            other_value, np.ndarray
+        ):
+            if not np.array_equal(value, other_value):
+                return False
+        elif value != other_value:
+            return False
+    return True
+
+
+@typechecked
+def get_neuron_indices(*, snn: Simulator) -> Dict[int, int]:
+    """Returns the index of each neuron in the network, per neuron id."""
+    return {
+        id(neuron): neuron_index
+        for neuron_index, neuron in enumerate(snn.network.nodes)
+    }
+
+
+@typechecked
+def is_unaffected_by_radiation(
+    *, rad_snn: Simulator, unradiated_snn: Simulator
+) -> bool:
+    """Returns True if the radiated snn has the same neurons, synapses and
+    recorded neurons as the unradiated snn, such that its simulation
+    results are those of the unradiated snn."""
+    if len(rad_snn.network.nodes) != len(unradiated_snn.network.nodes) or len(
+        rad_snn.network.synapses
+    ) != len(unradiated_snn.network.synapses):
+        return False
+    rad_indices: Dict[int, int] = get_neuron_indices(snn=rad_snn)
+    indices: Dict[int, int] = get_neuron_indices(snn=unradiated_snn)
+    for detector_name in ["raster", "multimeter"]:
+        if [
+            rad_indices[id(neuron)]
+            for neuron in getattr(rad_snn, detector_name).targets
+        ] != [
+            indices[id(neuron)]
+            for neuron in getattr(unradiated_snn, detector_name).targets
+        ]:
+            return False
+
+    for rad_neuron, neuron in zip(
+        rad_snn.network.nodes, unradiated_snn.network.nodes
+    ):
+        if not have_equal_properties(
+            properties=get_static_properties(
+                some_object=rad_neuron,
+                dynamic_properties=DYNAMIC_NEURON_PROPERTIES,
+            ),
+            other_properties=get_static_properties(
+                some_object=neuron,
+                dynamic_properties=DYNAMIC_NEURON_PROPERTIES,
+            ),
+        ):
+            return False
+
+    for rad_synapse, synapse in zip(
+        rad_snn.network.synapses, unradiated_snn.network.synapses
+    ):
+        if (
+            rad_indices[id(rad_synapse.pre)] != indices[id(synapse.pre)]
+            or rad_indices[id(rad_synapse.post)] != indices[id(synapse.post)]
+            or not have_equal_properties(
+                properties=get_static_properties(
+                    some_object=rad_synapse,
+                    dynamic_properties=DYNAMIC_SYNAPSE_PROPERTIES,
+                ),
+                other_properties=get_static_properties(
+                    some_object=synapse,
+                    dynamic_properties=DYNAMIC_SYNAPSE_PROPERTIES,
+                ),
+            )
+        ):
+            return False
+    return True
+
+
+@typechecked
+def copy_sim_results(*, rad_snn: Simulator, unradiated_snn: Simulator) -> None:
+    """Stores a copy of the recordings, final neuron states and actual
+    duration of the simulated unradiated snn in the radiated snn, as if the
+    radiated snn was simulated."""
+    for detector_name in ["raster", "multimeter"]:
+        detector: Any = getattr(unradiated_snn, detector_name)
+        rad_detector: Any = getattr(rad_snn, detector_name)
+        for recording_name in ["spikes", "V", "I"]:
+            if hasattr(detector, recording_name):
+                setattr(
+                    rad_detector,
+                    recording_name,
+                    np.array(getattr(detector, recording_name)),
+                )
+        if hasattr(detector, "index"):
+            rad_detector.index = detector.index
+
+    for rad_neuron, neuron in zip(
+        rad_snn.network.nodes, unradiated_snn.network.nodes
+    ):
+        for key in DYNAMIC_NEURON_PROPERTIES:
+            setattr(rad_neuron, key, getattr(neuron, key))
+    if "actual_duration" in unradiated_snn.network.graph.graph:
+        rad_snn.network.graph.graph[
+            "actual_duration"
+        ] = unradiated_snn.network.graph.graph["actual_duration"]
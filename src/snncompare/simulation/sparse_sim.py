@@ -0,0 +1,71 @@
+"""Stores the synapses of an snn as a compressed sparse row (CSR) weight
+matrix, with a row per postsynaptic neuron, and computes the synaptic input
+of all neurons with vectorised NumPy operations.
+
+simsnn adds the input of each synapse to the I of its postsynaptic neuron,
+one synapse after the other. Floating point addition is not associative, so
+to get bit-identical I values, the synaptic input is added in the same
+order: the entries of each CSR row are in simsnn synapse order, and the
+k-th entries of all rows are added in the k-th vectorised addition.
+"""
+from typing import List
+
+import numpy as np
+
+from snncompare.typechecking import typechecked
+
+
+# pylint: disable=R0903
+class Csr_synapses:
+    """Stores the presynaptic neuron indices of the synapses per postsynaptic
+    neuron, in CSR format."""
+
+    @typechecked
+    def __init__(
+        self,
+        pre_indices: np.ndarray,
+        post_indices: np.ndarray,
+        nr_of_neurons: int,
+    ):
+        """Sorts the synapses on their postsynaptic neuron, keeping the
+        simsnn synapse order within each row."""
+        self.nr_of_neurons: int = nr_of_neurons
+        # The simsnn synapse index of each CSR entry.
+        self.synapse_order: np.ndarray = np.argsort(
+            post_indices, kind="stable"
+        )
+        self.indices: np.ndarray = pre_indices[self.synapse_order]
+        self.indptr: np.ndarray = np.zeros(nr_of_neurons + 1, dtype=int)
+        np.cumsum(
+            np.bincount(post_indices, minlength=nr_of_neurons),
+            out=self.indptr[1:],
+        )
+
+        # The k-th layer contains the k-th entry of each row that has more
+        # than k entries, as (row, CSR entry) index arrays.
+        row_lengths: np.ndarray = np.diff(self.indptr)
+        self.layers: List[tuple[np.ndarray, np.ndarray]] = []
+        for k in range(int(row_lengths.max(initial=0))):
+            rows: np.ndarray = np.flatnonzero(row_lengths > k)
+            self.layers.append((rows, self.indptr[rows] + k))
+
+    @typechecked
+    def get_csr_weights(self, *, weights: np.ndarray) -> np.ndarray:
+        """Returns the synapse weights, with a column per synapse in simsnn
+        order, as CSR data, with a column per CSR entry."""
+        return weights[:, self.synapse_order]
+
+    @typechecked
+    def add_synaptic_input(
+        self,
+        *,
+        i: np.ndarray,
+        out: np.ndarray,
+        csr_weights: np.ndarray,
+    ) -> None:
+        """Adds w*out of the presynaptic neurons to the I of the postsynaptic
+        neurons, with a row per snn in i, out and csr_weights."""
+        for rows, entries in self.layers:
+            i[:, rows] += (
+                csr_weights[:, entries] * out[:, self.indices[entries]]
+            )
@@ -1,13 +1,13 @@
 """Simulates the SNN graphs and returns a deep copy of the graph per
 timestep."""
-from typing import Dict, Tuple, Union
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
 
 import networkx as nx
 from simsnn.core.simulators import Simulator
 from snnbackends.networkx.run_on_networkx import run_snn_on_networkx
 from snnbackends.simsnn.run_on_simsnn import run_snn_on_simsnn
 from snnradiation.apply_rad_to_simsnn import apply_synapse_weight_increase_rad
-from typeguard import typechecked
 
 from snncompare.export_results.output_stage1_configs_and_input_graph import (
     Radiation_data,
@@ -16,9 +16,24 @@ from snncompare.export_results.output_stage1_configs_and_input_graph import (
 )
 from snncompare.helper import get_snn_graph_from_graphs_dict
 from snncompare.import_results.helper import simsnn_files_exists_and_get_path
-from snncompare.import_results.load_stage_1_and_2 import load_simsnn_graphs
-from snncompare.optional_config.Output_config import Output_config
+from snncompare.import_results.load_stage_1_and_2 import (
+    Stage_2_recording_mismatch,
+    load_simsnn_graphs,
+)
+from snncompare.optional_config.Output_config import (
+    Early_stop_policy,
+    Output_config,
+)
+from snncompare.progress_report.profiling import profile_section
 from snncompare.run_config.Run_config import Run_config
+from snncompare.simulation.batched_sim import run_snns_in_batch
+from snncompare.simulation.clone_snn import clone_snn
+from snncompare.simulation.early_stop import run_snn_on_simsnn_with_early_stop
+from snncompare.simulation.reuse_unradiated_sim import (
+    copy_sim_results,
+    is_unaffected_by_radiation,
+)
+from snncompare.typechecking import typechecked
 
 from ..helper import (
     add_stage_completion_to_graph,
@@ -35,9 +50,31 @@ def sim_graphs(
     output_config: Output_config,
     run_config: Run_config,
     stage_1_graphs: Dict,
+    unradiated_sim_cache: Optional[Dict] = None,
+    deferred_rad_snns: Optional[
+        Dict[str, List[Tuple[Run_config, Simulator]]]
+    ] = None,
 ) -> None:
     """Simulates the snn graphs and makes a deep copy for each timestep.
 
+    The unradiated snns do not depend on the radiation of the run_config.
+    If an unradiated_sim_cache is given, the simulated unradiated snns are
+    stored in it, and taken from it if they were already simulated (or
+    loaded) for a run_config that only differs in radiation. On disk, the
+    stage 2 files of the unradiated snns are that cache: their path is
+    determined by the algorithm, the input graph, its (seeded) random
+    numbers and the adaptation, so they are loaded instead of simulated for
+    any later run_config with those settings. With skip_stage_2_output, they
+    are not written, so only the in-memory cache remains.
+
+    If deferred_rad_snns is given, the radiated simsnn snns are only
+    radiated, and added to it per graph_name with their run_config, such
+    that they can be simulated in a batch with sim_deferred_rad_snns.
+
+    Radiated simsnn snns that are not changed by their radiation are not
+    simulated; they get a copy of the simulation results of their
+    unradiated snn.
+
     :param stage_1_graphs: Dict:
     """
 
@@ -46,6 +83,16 @@ def sim_graphs(
         # Derive the adaptation setting for this graph.
 
         if graph_name != "input_graph":
+            if (
+                unradiated_sim_cache is not None
+                and graph_name in unradiated_sim_cache
+            ):
+                print(f"graph_name={graph_name} - reusing simulation.")
+                stage_1_graphs[graph_name] = clone_snn(
+                    snn=unradiated_sim_cache[graph_name]
+                )
+                continue
+
             with_adaptation: bool = get_with_adaptation_bool(
                 graph_name=graph_name
             )
@@ -60,6 +107,34 @@ def sim_graphs(
                 with_adaptation=with_adaptation,
                 with_radiation=with_radiation,
             )
+            if next_action == "Load":
+                print(f"graph_name={graph_name} - loading.")
+                try:
+                    with profile_section(category="serialise"):
+                        loaded_snn = load_simsnn_graphs(
+                            run_config=run_config,
+                            input_graph=stage_1_graphs["input_graph"],
+                            with_adaptation=with_adaptation,
+                            with_radiation=with_radiation,
+                            stage_index=2,
+                            recording_policy=output_config.recording_policy,
+                        )
+                except Stage_2_recording_mismatch as mismatch:
+                    # The recording policy is not part of the stage 2 path,
+                    # so a resumed sweep with another policy simulates the
+                    # snn again, and outputs it in place of the stale file.
+                    print(f"graph_name={graph_name} - {mismatch} Simulating.")
+                    Path(mismatch.output_filepath).unlink()
+                    next_action = "Simulate"
+                else:
+                    stage_1_graphs[graph_name] = loaded_snn
+                    get_rand_synapse_weights(
+                        input_graph=stage_1_graphs["input_graph"],
+                        simsnn_synapses=stage_1_graphs[
+                            graph_name
+                        ].network.synapses,
+                    )
+
             if next_action == "Simulate":
                 print(f"graph_name={graph_name} - simulating.")
 
@@ -76,43 +151,105 @@ def sim_graphs(
                         seed=run_config.seed,
                         snn=snn,
                     )
-                sim_snn(
-                    input_graph=stage_1_graphs["input_graph"],
-                    snn=snn,
-                    run_config=run_config,
-                )
+                    # If no radiation event changed the snn, it behaves like
+                    # the already simulated unradiated snn.
+                    if isinstance(
+                        snn, Simulator
+                    ) and is_unaffected_by_radiation(
+                        rad_snn=snn, unradiated_snn=unradiated_graph
+                    ):
+                        print(
+                            f"graph_name={graph_name} - unaffected by "
+                            + "radiation, reusing unradiated simulation."
+                        )
+                        copy_sim_results(
+                            rad_snn=snn, unradiated_snn=unradiated_graph
+                        )
+                        add_stage_completion_to_graph(snn=snn, stage_index=2)
+                        continue
+                if (
+                    deferred_rad_snns is not None
+                    and with_radiation
+                    and run_config.simulator == "simsnn"
+                ):
+                    deferred_rad_snns.setdefault(graph_name, []).append(
+                        (run_config, snn)
+                    )
+                    continue
+                with profile_section(category="simulate"):
+                    sim_snn(
+                        input_graph=stage_1_graphs["input_graph"],
+                        snn=snn,
+                        run_config=run_config,
+                        early_stop_policy=output_config.early_stop_policy,
+                        simsnn_backend=output_config.simsnn_backend,
+                    )
                 add_stage_completion_to_graph(
                     snn=stage_1_graphs[graph_name], stage_index=2
                 )
 
-            elif next_action == "Load":
-                print(f"graph_name={graph_name} - loading.")
-                stage_1_graphs[graph_name] = load_simsnn_graphs(
-                    run_config=run_config,
-                    input_graph=stage_1_graphs["input_graph"],
-                    with_adaptation=with_adaptation,
-                    with_radiation=with_radiation,
-                    stage_index=2,
-                )
-
-                get_rand_synapse_weights(
-                    input_graph=stage_1_graphs["input_graph"],
-                    simsnn_synapses=stage_1_graphs[
-                        graph_name
-                    ].network.synapses,
-                )
             elif next_action == "Skip":
                 print("Skip.")
-            else:
+            elif next_action != "Load":
                 raise ValueError(
                     f"Error, next action unexpected:{next_action}"
                 )
+
+            if (
+                unradiated_sim_cache is not None
+                and not with_radiation
+                and next_action != "Skip"
+            ):
+                unradiated_sim_cache[graph_name] = clone_snn(
+                    snn=stage_1_graphs[graph_name]
+                )
         else:
             add_stage_completion_to_graph(
                 snn=stage_1_graphs[graph_name], stage_index=2
             )
 
 
+@typechecked
+def sim_deferred_rad_snns(
+    *,
+    input_graph: nx.Graph,
+    output_config: Output_config,
+    deferred_rad_snns: Dict[str, List[Tuple[Run_config, Simulator]]],
+) -> None:
+    """Simulates the deferred radiated snns of run_configs that only differ in
+    radiation, in a single batch per graph_name.
+
+    Each snn is simulated for the duration of its own run_config, and
+    stopped with the early stop policy of the output_config, such that its
+    recordings and actual_duration are those of sim_snn.
+    """
+    for graph_name, run_configs_and_snns in deferred_rad_snns.items():
+        print(
+            f"graph_name={graph_name} - simulating "
+            + f"{len(run_configs_and_snns)} radiated snns in batch."
+        )
+        sim_durations: List[int] = [
+            get_max_sim_duration(
+                input_graph=input_graph,
+                run_config=run_config,
+            )
+            for run_config, _ in run_configs_and_snns
+        ]
+        snns: List[Simulator] = [snn for _, snn in run_configs_and_snns]
+        with profile_section(category="simulate"):
+            run_snns_in_batch(
+                snns=snns,
+                sim_duration=max(sim_durations),
+                early_stop_policy=output_config.early_stop_policy,
+                # The run_configs only differ in radiation, so they have
+                # the same early stop predicate.
+                run_config=run_configs_and_snns[0][0],
+                sim_durations=sim_durations,
+            )
+        for snn in snns:
+            add_stage_completion_to_graph(snn=snn, stage_index=2)
+
+
 @typechecked
 def simulate_load_or_skip(
     *,
@@ -218,9 +355,17 @@ def sim_snn(
     input_graph: nx.Graph,
     snn: Union[nx.DiGraph, Simulator],
     run_config: Run_config,
+    early_stop_policy: Optional[Early_stop_policy] = None,
+    simsnn_backend: str = "simsnn",
 ) -> None:
     """Simulates the snn graphs and makes a deep copy for each timestep.
 
+    If an early_stop_policy is given, the simsnn simulation stops once its
+    predicate holds, and the actual_duration of the snn is the nr of
+    simulated timesteps. The simsnn_backend specifies whether the simsnn snn
+    is stepped by simsnn, or with the sparse weight matrix of the snn. Both
+    give the same results, so it is not part of the run_config.
+
     :param stage_1_graphs: Dict:
     """
     sim_duration: int
@@ -236,6 +381,10 @@ def sim_snn(
                 f"{type(snn)}"
             )
 
+        if early_stop_policy is not None:
+            raise NotImplementedError(
+                "Error, early stopping is not supported for the nx simulator."
+            )
         run_snn_on_networkx(
             run_config=run_config,
             snn_graph=snn,
@@ -251,11 +400,28 @@ def sim_snn(
                 "Error, snn should be of type Simulator, it was:"
                 + f"{type(snn)}"
             )
-        run_snn_on_simsnn(
-            run_config=run_config,
-            snn=snn,
-            sim_duration=sim_duration,
-        )
+        if simsnn_backend == "sparse":
+            # A batch of a single snn is simulated with the sparse weight
+            # matrix of that snn.
+            run_snns_in_batch(
+                snns=[snn],
+                sim_duration=sim_duration,
+                early_stop_policy=early_stop_policy,
+                run_config=run_config,
+            )
+        elif early_stop_policy is None:
+            run_snn_on_simsnn(
+                run_config=run_config,
+                snn=snn,
+                sim_duration=sim_duration,
+            )
+        else:
+            run_snn_on_simsnn_with_early_stop(
+                early_stop_policy=early_stop_policy,
+                run_config=run_config,
+                snn=snn,
+                sim_duration=sim_duration,
+            )
 
     else:
         # TODO: add lava neurons if run config demands lava.
@@ -0,0 +1,36 @@
+"""Provides the typechecked decorator of the package.
+
+By default this applies the typechecked decorator of typeguard, which checks
+the argument and return types of each call. In fast mode, which is enabled
+by setting the SNNCOMPARE_FAST environment variable to 1 (or with the --fast
+cli argument), the decorated function is returned unchanged, such that the
+calls have no type checking overhead. The mode is read when a function is
+decorated, i.e. when its module is imported, so it should be set before the
+package is imported. As the environment variable is inherited, the worker
+processes of parallel runs use the same mode.
+"""
+import os
+from typing import Any, Callable, TypeVar
+
+import typeguard
+
+FAST_MODE_ENV_VAR: str = "SNNCOMPARE_FAST"
+
+T = TypeVar("T", bound=Callable[..., Any])
+
+
+def is_fast_mode() -> bool:
+    """Returns True if the runtime type checks are disabled."""
+    return os.environ.get(FAST_MODE_ENV_VAR, "").lower() in [
+        "1",
+        "true",
+        "yes",
+    ]
+
+
+def typechecked(target: T) -> T:
+    """Returns the function with runtime type checks, or unchanged in fast
+    mode."""
+    if is_fast_mode():
+        return target
+    return typeguard.typechecked(target)
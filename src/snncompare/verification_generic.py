@@ -1,7 +1,7 @@
 """Performs generic verification tasks."""
 from typing import List
 
-from typeguard import typechecked
+from snncompare.typechecking import typechecked
 
 
 @typechecked
@@ -0,0 +1,479 @@
+"""Times the hot paths of the pipeline on a grid of graph sizes, m_vals and
+redundancy levels, and compares the timings against those of another commit.
+
+The benchmarked paths are:
+- stage_1_creation: get_graphs_stage_1 (networkx snns and conversion).
+- simsnn_conversion: nx_lif_graphs_to_simsnn_graphs.
+- stage_1_loading_<format>: rebuilding a stage 1 simsnn Simulator from
+  its json file, or from the columns of its npz file.
+- simulation: sim_snn on the (radiated) snns.
+- stage_2_output_<format> and stage_2_loading_<format>: the stage 2
+  serialisation and loading in the json and npz formats.
+- failure_modes: add_failure_modes_to_graph.
+- completion_checks: has_outputted_stage_1 and has_outputted_stage_2_or_4.
+
+The benchmark runs in a temporary working directory, such that it does not
+use or modify the results of earlier runs. Run it from the root of the repo
+with:
+python -m tests.benchmarks.benchmark_pipeline -o benchmarks/new.json
+and compare it against the timings of another commit with:
+python -m tests.benchmarks.benchmark_pipeline -o benchmarks/new.json \
+    -b benchmarks/old.json
+"""
+import os
+import shutil
+import tempfile
+from argparse import ArgumentParser, Namespace
+from typing import Dict, List, Optional, Union
+
+from simsnn.core.simulators import Simulator
+from snnalgorithms.get_input_graphs import (
+    create_mdsa_input_graphs_from_exp_config,
+)
+from typeguard import typechecked
+
+from snncompare.create_configs import generate_run_configs
+from snncompare.exp_config.Exp_config import (
+    Exp_config,
+    Supported_experiment_settings,
+)
+from snncompare.export_plots.Plot_config import get_default_plot_config
+from snncompare.export_results.output_stage1_configs_and_input_graph import (
+    output_stage_1_configs_and_input_graphs,
+)
+from snncompare.export_results.output_stage1_snn_graphs import (
+    output_snn_graph_stage_1,
+    output_stage_1_snns,
+)
+from snncompare.export_results.output_stage2_snns import (
+    output_snn_graph_stage_2,
+)
+from snncompare.graph_generation.stage_1_create_graphs import (
+    get_graphs_stage_1,
+    get_nx_lif_graphs,
+    nx_lif_graphs_to_simsnn_graphs,
+)
+from snncompare.import_results.load_stage_1_and_2 import (
+    has_outputted_stage_1,
+    load_binary_snn_graph_stage_1,
+    load_snn_graph_stage_2,
+    stage1_simsnn_arrays_to_simulator,
+    stage1_simsnn_graph_from_file_to_simulator,
+)
+from snncompare.import_results.read_json import load_json_file_into_dict
+from snncompare.process_results.get_failure_modes import (
+    add_failure_modes_to_graph,
+)
+from snncompare.progress_report.has_completed_stage2_or_4 import (
+    has_outputted_stage_2_or_4,
+)
+from snncompare.run_config.Run_config import Run_config
+from snncompare.simulation.add_radiation_graphs import (
+    ensure_empty_rad_snns_exist,
+)
+from snncompare.simulation.clone_snn import clone_graphs_dict, clone_snn
+from snncompare.simulation.stage2_sim import sim_snn
+from tests.benchmarks.benchmark_report import (
+    get_case_name,
+    get_case_timings,
+    get_regressions,
+    load_benchmark_results,
+    output_benchmark_results,
+    print_regressions,
+    time_case,
+)
+
+DEFAULT_GRAPH_SIZES: List[int] = [3, 5, 10, 20]
+DEFAULT_M_VALS: List[int] = [0, 1, 2]
+DEFAULT_REDUNDANCIES: List[int] = [2, 4]
+
+
+@typechecked
+def get_benchmark_exp_config(
+    *, graph_sizes: List[int], m_vals: List[int], redundancies: List[int]
+) -> Exp_config:
+    """Returns the experiment config that spans the benchmark grid, with a
+    single input graph per graph size and a single radiation setting."""
+    return Exp_config(
+        adaptations={"redundancy": redundancies},
+        algorithms={"MDSA": [{"m_val": m_val} for m_val in m_vals]},
+        max_graph_size=max(graph_sizes),
+        max_max_graphs=1,
+        min_graph_size=min(graph_sizes),
+        min_max_graphs=1,
+        neuron_models=["LIF"],
+        radiations={
+            "change_u": {
+                "amplitude": [1],
+                "excitatory": [True],
+                "inhibitory": [False],
+                "probability_per_t": [0.001],
+            }
+        },
+        seeds=[7],
+        simulators=["simsnn"],
+        size_and_max_graphs=[(graph_size, 1) for graph_size in graph_sizes],
+        synaptic_models=["LIF"],
+    )
+
+
+# pylint: disable=R0914
+@typechecked
+def benchmark_run_config(
+    *,
+    exp_config: Exp_config,
+    repeats: int,
+    run_config: Run_config,
+) -> Dict[str, Dict[str, Union[float, int]]]:
+    """Returns the timings of the benchmarked paths for a single run_config,
+    with the path names as keys."""
+    timings: Dict[str, Dict[str, Union[float, int]]] = {}
+    plot_config = get_default_plot_config()
+
+    timings["stage_1_creation"] = get_case_timings(
+        durations=time_case(
+            run=lambda: get_graphs_stage_1(
+                plot_config=plot_config, run_config=run_config
+            ),
+            repeats=repeats,
+        )
+    )
+
+    nx_lif_graphs: Dict = get_nx_lif_graphs(
+        plot_config=plot_config, run_config=run_config
+    )
+    timings["simsnn_conversion"] = get_case_timings(
+        durations=time_case(
+            run=lambda: nx_lif_graphs_to_simsnn_graphs(
+                stage_1_graphs=nx_lif_graphs,
+                reverse_conversion=False,
+                run_config=run_config,
+            ),
+            repeats=repeats,
+        )
+    )
+
+    stage_1_graphs: Dict = get_graphs_stage_1(
+        plot_config=plot_config, run_config=run_config
+    )
+    output_stage_1_configs_and_input_graphs(
+        exp_config=exp_config,
+        run_config=run_config,
+        graphs_dict=stage_1_graphs,
+    )
+    for with_adaptation in [False, True]:
+        output_stage_1_snns(
+            run_config=run_config,
+            graphs_dict=stage_1_graphs,
+            with_adaptation=with_adaptation,
+        )
+
+    for stage_1_format in ["json", "npz"]:
+        timings[
+            f"stage_1_loading_{stage_1_format}"
+        ] = benchmark_stage_1_format(
+            repeats=repeats,
+            stage_1_snn=stage_1_graphs["adapted_snn_graph"],
+            stage_1_format=stage_1_format,
+        )
+
+    # The snns are simulated from fresh copies of the stage 1 snns in each
+    # repetition, the last simulated snns are used by the next paths.
+    graphs_dict: Dict = {}
+
+    def setup_simulation() -> None:
+        """Creates the (radiated) snns that are simulated."""
+        graphs_dict.clear()
+        graphs_dict.update(clone_graphs_dict(graphs_dict=stage_1_graphs))
+        ensure_empty_rad_snns_exist(
+            run_config=run_config, stage_1_graphs=graphs_dict
+        )
+
+    def simulate() -> None:
+        """Simulates all snns of the run_config."""
+        for graph_name, snn in graphs_dict.items():
+            if graph_name != "input_graph":
+                sim_snn(
+                    input_graph=graphs_dict["input_graph"],
+                    snn=snn,
+                    run_config=run_config,
+                )
+
+    timings["simulation"] = get_case_timings(
+        durations=time_case(
+            run=simulate, setup=setup_simulation, repeats=repeats
+        )
+    )
+
+    for stage_2_format in ["json", "npz"]:
+        timings.update(
+            benchmark_stage_2_format(
+                repeats=repeats,
+                snn=graphs_dict["rad_adapted_snn_graph"],
+                stage_1_snn=stage_1_graphs["adapted_snn_graph"],
+                stage_2_format=stage_2_format,
+            )
+        )
+
+    timings["failure_modes"] = get_case_timings(
+        durations=time_case(
+            run=lambda: add_failure_modes_to_graph(
+                snn_graphs=graphs_dict, run_config=run_config
+            ),
+            repeats=repeats,
+        )
+    )
+
+    def check_completion() -> None:
+        """Checks whether stage 1 and stage 2 are completed."""
+        has_outputted_stage_1(
+            input_graph=graphs_dict["input_graph"], run_config=run_config
+        )
+        has_outputted_stage_2_or_4(
+            graphs_dict=graphs_dict, run_config=run_config, stage_index=2
+        )
+
+    timings["completion_checks"] = get_case_timings(
+        durations=time_case(run=check_completion, repeats=repeats)
+    )
+    return timings
+
+
+@typechecked
+def benchmark_stage_1_format(
+    *,
+    repeats: int,
+    stage_1_snn: Simulator,
+    stage_1_format: str,
+) -> Dict[str, Union[float, int]]:
+    """Returns the timings of rebuilding the simsnn Simulator of a stage 1
+    snn from its file in the stage 1 format."""
+    os.makedirs("stage_1", exist_ok=True)
+    filepath: str = output_snn_graph_stage_1(
+        output_filepath="stage_1/snn.json",
+        snn_graph=stage_1_snn,
+        stage_1_format=stage_1_format,
+    )
+
+    def load_stage_1() -> None:
+        """Rebuilds the stage 1 snn from its file."""
+        if stage_1_format == "npz":
+            stage1_simsnn_arrays_to_simulator(
+                add_to_raster=True,
+                add_to_multimeter=True,
+                stage_1_arrays=load_binary_snn_graph_stage_1(
+                    output_filepath=filepath
+                ),
+            )
+        else:
+            stage1_simsnn_graph_from_file_to_simulator(
+                add_to_raster=True,
+                add_to_multimeter=True,
+                simsnn_dict=load_json_file_into_dict(json_filepath=filepath),
+            )
+
+    timings: Dict[str, Union[float, int]] = get_case_timings(
+        durations=time_case(run=load_stage_1, repeats=repeats)
+    )
+    shutil.rmtree("stage_1")
+    return timings
+
+
+@typechecked
+def benchmark_stage_2_format(
+    *,
+    repeats: int,
+    snn: Simulator,
+    stage_1_snn: Simulator,
+    stage_2_format: str,
+) -> Dict[str, Dict[str, Union[float, int]]]:
+    """Returns the timings of outputting the behaviour of a simulated snn in
+    the stage 2 format, and of loading it into a copy of its stage 1 snn."""
+    filepaths: List[str] = []
+    os.makedirs("stage_2", exist_ok=True)
+
+    def output_stage_2() -> None:
+        """Outputs the snn behaviour to a new file."""
+        filepaths.append(
+            output_snn_graph_stage_2(
+                output_filepath=f"stage_2/{len(filepaths)}.json",
+                snn_graph=snn,
+                stage_2_format=stage_2_format,
+            )
+        )
+
+    timings: Dict[str, Dict[str, Union[float, int]]] = {
+        f"stage_2_output_{stage_2_format}": get_case_timings(
+            durations=time_case(run=output_stage_2, repeats=repeats)
+        )
+    }
+    loaded_snn: Simulator = clone_snn(snn=stage_1_snn)
+    timings[f"stage_2_loading_{stage_2_format}"] = get_case_timings(
+        durations=time_case(
+            run=lambda: load_snn_graph_stage_2(
+                output_filepath=filepaths[-1],
+                stage_1_simsnn_simulator=loaded_snn,
+            ),
+            repeats=repeats,
+        )
+    )
+    shutil.rmtree("stage_2")
+    return timings
+
+
+@typechecked
+def run_benchmarks(
+    *,
+    graph_sizes: List[int],
+    m_vals: List[int],
+    redundancies: List[int],
+    repeats: int,
+) -> Dict[str, Dict[str, Union[float, int]]]:
+    """Returns the timings per case of the benchmark grid.
+
+    The benchmark is performed in a temporary working directory.
+    """
+    supp_exp_config = Supported_experiment_settings()
+    for graph_size in graph_sizes:
+        if not (
+            supp_exp_config.min_graph_size
+            <= graph_size
+            <= supp_exp_config.max_graph_size
+        ):
+            raise ValueError(
+                f"Error, graph size:{graph_size} is not in the supported "
+                + f"range:[{supp_exp_config.min_graph_size},"
+                + f"{supp_exp_config.max_graph_size}]."
+            )
+    exp_config: Exp_config = get_benchmark_exp_config(
+        graph_sizes=graph_sizes, m_vals=m_vals, redundancies=redundancies
+    )
+
+    original_cwd: str = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.chdir(tmp_dir)
+        try:
+            create_mdsa_input_graphs_from_exp_config(exp_config=exp_config)
+            results: Dict[str, Dict[str, Union[float, int]]] = {}
+            for run_config in generate_run_configs(exp_config=exp_config):
+                # The failure modes are only computed with adaptation.
+                if run_config.adaptation is None:
+                    continue
+                for path_name, timings in benchmark_run_config(
+                    exp_config=exp_config,
+                    repeats=repeats,
+                    run_config=run_config,
+                ).items():
+                    case_name: str = get_case_name(
+                        path_name=path_name,
+                        graph_size=run_config.graph_size,
+                        m_val=run_config.algorithm["MDSA"]["m_val"],
+                        redundancy=run_config.adaptation.redundancy,
+                    )
+                    print(f"{case_name:<50} {timings['median_s']:>10.4f}")
+                    results[case_name] = timings
+        finally:
+            os.chdir(original_cwd)
+    return results
+
+
+@typechecked
+def parse_int_list(some_str: str) -> List[int]:
+    """Converts a comma separated string of integers into a list."""
+    return [int(value) for value in some_str.split(",")]
+
+
+@typechecked
+def parse_benchmark_args(args: Optional[List[str]] = None) -> Namespace:
+    """Returns the arguments of the benchmark."""
+    parser = ArgumentParser(description="Times the hot paths of the pipeline.")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default="benchmarks/benchmark_results.json",
+        help="The json file to which the timings are written.",
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        type=str,
+        default=None,
+        help="The timings of another commit, to find regressions.",
+    )
+    parser.add_argument(
+        "-l",
+        "--label",
+        type=str,
+        default="",
+        help="A label that identifies the timings, e.g. the commit hash.",
+    )
+    parser.add_argument(
+        "-n",
+        "--graph-sizes",
+        type=parse_int_list,
+        default=DEFAULT_GRAPH_SIZES,
+        help="Comma separated graph sizes.",
+    )
+    parser.add_argument(
+        "-m",
+        "--m-vals",
+        type=parse_int_list,
+        default=DEFAULT_M_VALS,
+        help="Comma separated m_vals of the MDSA algorithm.",
+    )
+    parser.add_argument(
+        "-r",
+        "--redundancies",
+        type=parse_int_list,
+        default=DEFAULT_REDUNDANCIES,
+        help="Comma separated redundancy levels.",
+    )
+    parser.add_argument(
+        "-rep",
+        "--repeats",
+        type=int,
+        default=3,
+        help="The nr of times each case is timed.",
+    )
+    parser.add_argument(
+        "-t",
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="The fraction a case may slow down before it is a regression.",
+    )
+    return parser.parse_args(args)
+
+
+@typechecked
+def main(args: Optional[List[str]] = None) -> None:
+    """Runs the benchmarks, stores the timings and reports the regressions
+    against the baseline, if a baseline is given."""
+    benchmark_args: Namespace = parse_benchmark_args(args)
+    results: Dict[str, Dict[str, Union[float, int]]] = run_benchmarks(
+        graph_sizes=benchmark_args.graph_sizes,
+        m_vals=benchmark_args.m_vals,
+        redundancies=benchmark_args.redundancies,
+        repeats=benchmark_args.repeats,
+    )
+    output_benchmark_results(
+        output_filepath=benchmark_args.output,
+        label=benchmark_args.label,
+        results=results,
+    )
+    if benchmark_args.baseline is not None:
+        regressions: List[Dict[str, Union[str, float]]] = get_regressions(
+            baseline=load_benchmark_results(
+                input_filepath=benchmark_args.baseline
+            ),
+            current=results,
+            tolerance=benchmark_args.tolerance,
+        )
+        print_regressions(regressions=regressions)
+        if regressions:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Stores the benchmark timings in a stable json format, and compares the
+timings of two commits to find performance regressions.
+
+The timings are stored per case, where a case is a benchmarked path on a
+single point of the benchmark grid, e.g.:
+simulation/size=10/m_val=1/redundancy=2
+The cases are sorted and the timings are rounded, such that the files of two
+commits can also be compared with a plain diff.
+"""
+import json
+import os
+import statistics
+import time
+from typing import Callable, Dict, List, Optional, Union
+
+from typeguard import typechecked
+
+BENCHMARK_FORMAT_VERSION: int = 1
+# Timings below this duration [s] are dominated by noise, so they are not
+# reported as regressions.
+MIN_COMPARED_DURATION: float = 1e-3
+
+
+@typechecked
+def get_case_name(
+    *, path_name: str, graph_size: int, m_val: int, redundancy: int
+) -> str:
+    """Returns the name of a benchmarked path on a point of the grid."""
+    return (
+        f"{path_name}/size={graph_size}/m_val={m_val}/redundancy={redundancy}"
+    )
+
+
+@typechecked
+def time_case(
+    *,
+    run: Callable[[], None],
+    repeats: int,
+    setup: Optional[Callable[[], None]] = None,
+) -> List[float]:
+    """Returns the durations [s] of repeatedly running a case.
+
+    The setup is performed before each repetition, and is not included
+    in the duration.
+    """
+    if repeats < 1:
+        raise ValueError(f"Error, repeats should be 1 or larger:{repeats}")
+    durations: List[float] = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start: float = time.perf_counter()
+        run()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+@typechecked
+def get_case_timings(
+    *, durations: List[float]
+) -> Dict[str, Union[float, int]]:
+    """Returns the rounded median and minimum duration of a case."""
+    return {
+        "median_s": round(statistics.median(durations), 6),
+        "min_s": round(min(durations), 6),
+        "repeats": len(durations),
+    }
+
+
+@typechecked
+def output_benchmark_results(
+    *,
+    output_filepath: str,
+    label: str,
+    results: Dict[str, Dict[str, Union[float, int]]],
+) -> None:
+    """Writes the timings per case to a json file with sorted keys."""
+    output_dir: str = os.path.dirname(output_filepath)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(output_filepath, "w", encoding="utf-8") as json_file:
+        json.dump(
+            {
+                "format_version": BENCHMARK_FORMAT_VERSION,
+                "label": label,
+                "results": results,
+            },
+            json_file,
+            indent=2,
+            sort_keys=True,
+        )
+        json_file.write("\n")
+
+
+@typechecked
+def load_benchmark_results(
+    *, input_filepath: str
+) -> Dict[str, Dict[str, Union[float, int]]]:
+    """Returns the timings per case of a benchmark results file."""
+    if not os.path.isfile(input_filepath):
+        raise FileNotFoundError(
+            f"Error, benchmark results not found at:{input_filepath}"
+        )
+    with open(input_filepath, encoding="utf-8") as json_file:
+        benchmark_results: Dict = json.load(json_file)
+    if benchmark_results["format_version"] != BENCHMARK_FORMAT_VERSION:
+        raise ValueError(
+            "Error, benchmark format version:"
+            + f"{benchmark_results['format_version']} is not supported."
+        )
+    return benchmark_results["results"]
+
+
+@typechecked
+def get_regressions(
+    *,
+    baseline: Dict[str, Dict[str, Union[float, int]]],
+    current: Dict[str, Dict[str, Union[float, int]]],
+    tolerance: float,
+) -> List[Dict[str, Union[str, float]]]:
+    """Returns the cases of which the median duration increased by more than
+    the tolerance fraction, sorted from the largest slowdown down.
+
+    Cases that are not in both results, or that are faster than the
+    minimum compared duration, are ignored.
+    """
+    regressions: List[Dict[str, Union[str, float]]] = []
+    for case_name in sorted(set(baseline).intersection(current)):
+        baseline_median: float = float(baseline[case_name]["median_s"])
+        current_median: float = float(current[case_name]["median_s"])
+        if max(baseline_median, current_median) < MIN_COMPARED_DURATION:
+            continue
+        if current_median > baseline_median * (1 + tolerance):
+            regressions.append(
+                {
+                    "case_name": case_name,
+                    "baseline_s": baseline_median,
+                    "current_s": current_median,
+                    "slowdown": current_median / max(baseline_median, 1e-9),
+                }
+            )
+    return sorted(
+        regressions,
+        key=lambda regression: regression["slowdown"],
+        reverse=True,
+    )
+
+
+@typechecked
+def print_regressions(
+    *, regressions: List[Dict[str, Union[str, float]]]
+) -> None:
+    """Prints the cases that became slower."""
+    if not regressions:
+        print("No performance regressions found.")
+        return
+    print(f"{'case':<50} {'baseline [s]':>12} {'current [s]':>12} {'x':>6}")
+    for regression in regressions:
+        print(
+            f"{regression['case_name']:<50} "
+            + f"{regression['baseline_s']:>12.4f} "
+            + f"{regression['current_s']:>12.4f} "
+            + f"{regression['slowdown']:>6.2f}"
+        )
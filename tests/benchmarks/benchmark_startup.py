@@ -0,0 +1,338 @@
+"""Times how long the snncompare cli takes to start, and lists the plotting
+and table packages that it imports, and compares the timings against those
+of another commit.
+
+The benchmarked commands are:
+- cli_help: python -m snncompare --help, which only imports the package.
+- minimal_run: python -m snncompare -e minimal_results -j1 -j2 -j4, a
+  headless run of stages 1, 2 and 4 that should not import the plotting and
+  table packages.
+
+It also runs the stage timings of benchmark_pipeline on a small grid, with
+and without the SNNCOMPARE_FAST environment variable, and reports the
+speedup of the fast mode per stage. These timings are stored under
+pipeline_checked/.. and pipeline_fast/.., and are skipped with
+--skip-pipeline.
+
+Each command runs in a temporary working directory with a copy of the json
+configurations, such that it does not use or modify the results of earlier
+runs. Run it from the root of the repo with:
+python -m tests.benchmarks.benchmark_startup -o benchmarks/startup.json
+and compare it against the timings of another commit with:
+python -m tests.benchmarks.benchmark_startup -o benchmarks/startup.json \
+    -b benchmarks/old_startup.json
+"""
+import os
+import shutil
+import subprocess  # nosec
+import sys
+import tempfile
+from argparse import ArgumentParser, Namespace
+from typing import Dict, List, Optional, Union
+
+from typeguard import typechecked
+
+from snncompare.typechecking import FAST_MODE_ENV_VAR
+from tests.benchmarks.benchmark_report import (
+    get_case_timings,
+    get_regressions,
+    load_benchmark_results,
+    output_benchmark_results,
+    print_regressions,
+    time_case,
+)
+
+STARTUP_COMMANDS: Dict[str, List[str]] = {
+    "cli_help": ["--help"],
+    "minimal_run": ["-e", "minimal_results", "-j1", "-j2", "-j4"],
+}
+# The packages that should only be imported for stage 3, 5, 6 or to show the
+# failure modes.
+PLOTTING_PACKAGES: List[str] = [
+    "dash",
+    "matplotlib",
+    "pandas",
+    "plotly",
+    "rich",
+    "seaborn",
+]
+JSON_CONFIGURATIONS_DIR: str = "src/snncompare/json_configurations"
+# The grid of the pipeline stage timings with and without type checks.
+PIPELINE_ARGS: List[str] = ["-n", "3,5", "-m", "0,1", "-r", "2"]
+
+
+@typechecked
+def get_imported_packages(*, importtime_output: str) -> List[str]:
+    """Returns the sorted top level packages in the output of python -X
+    importtime."""
+    packages = set()
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        module_name: str = line.split("|")[-1].strip()
+        if module_name != "imported package":
+            packages.add(module_name.split(".")[0])
+    return sorted(packages)
+
+
+@typechecked
+def run_snncompare(
+    *, cli_args: List[str], working_dir: str, importtime: bool = False
+) -> subprocess.CompletedProcess:
+    """Runs the snncompare cli in the working directory, with the src
+    directory of this repo on the python path."""
+    env: Dict[str, str] = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.abspath("src"), env.get("PYTHONPATH", "")]
+    ).rstrip(os.pathsep)
+    command: List[str] = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    return subprocess.run(  # nosec
+        command + ["-m", "snncompare"] + cli_args,
+        cwd=working_dir,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+@typechecked
+def prepare_working_dir(*, working_dir: str) -> None:
+    """Removes the results of a previous run, and copies the json
+    configurations into the working directory if they are not there yet."""
+    shutil.rmtree(os.path.join(working_dir, "results"), ignore_errors=True)
+    configurations_dir: str = os.path.join(
+        working_dir, JSON_CONFIGURATIONS_DIR
+    )
+    if not os.path.isdir(configurations_dir):
+        shutil.copytree(JSON_CONFIGURATIONS_DIR, configurations_dir)
+
+
+@typechecked
+def time_startup_command(
+    *, cli_args: List[str], working_dir: str, repeats: int
+) -> List[float]:
+    """Returns the durations [s] of running the snncompare cli, each time
+    without the results of the previous run."""
+    return time_case(
+        run=lambda: run_snncompare(cli_args=cli_args, working_dir=working_dir),
+        setup=lambda: prepare_working_dir(working_dir=working_dir),
+        repeats=repeats,
+    )
+
+
+@typechecked
+def run_startup_benchmarks(
+    *, repeats: int
+) -> Dict[str, Dict[str, Union[float, int]]]:
+    """Returns the timings per startup command, and prints the plotting and
+    table packages that each command imports."""
+    results: Dict[str, Dict[str, Union[float, int]]] = {}
+    with tempfile.TemporaryDirectory() as working_dir:
+        for command_name, cli_args in sorted(STARTUP_COMMANDS.items()):
+            results[f"startup/{command_name}"] = get_case_timings(
+                durations=time_startup_command(
+                    cli_args=cli_args, working_dir=working_dir, repeats=repeats
+                )
+            )
+
+            # The import times are measured in a separate run, because
+            # measuring them slows down the imports.
+            prepare_working_dir(working_dir=working_dir)
+            imported_plotting_packages: List[str] = [
+                package
+                for package in get_imported_packages(
+                    importtime_output=run_snncompare(
+                        cli_args=cli_args,
+                        working_dir=working_dir,
+                        importtime=True,
+                    ).stderr
+                )
+                if package in PLOTTING_PACKAGES
+            ]
+            print(
+                f"{command_name}: {results[f'startup/{command_name}']}, "
+                + f"plotting packages:{imported_plotting_packages}"
+            )
+    return results
+
+
+@typechecked
+def run_pipeline_benchmark(
+    *, fast_mode: bool, output_filepath: str, repeats: int
+) -> Dict[str, Dict[str, Union[float, int]]]:
+    """Returns the timings of benchmark_pipeline, which runs in a separate
+    process because the fast mode is read when snncompare is imported."""
+    env: Dict[str, str] = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [
+            os.path.abspath("src"),
+            os.path.abspath("."),
+            env.get("PYTHONPATH", ""),
+        ]
+    ).rstrip(os.pathsep)
+    env[FAST_MODE_ENV_VAR] = "1" if fast_mode else "0"
+    subprocess.run(  # nosec
+        [
+            sys.executable,
+            "-m",
+            "tests.benchmarks.benchmark_pipeline",
+            "-o",
+            output_filepath,
+            "-rep",
+            str(repeats),
+        ]
+        + PIPELINE_ARGS,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return load_benchmark_results(input_filepath=output_filepath)
+
+
+@typechecked
+def get_fast_mode_stage_speedups(
+    *,
+    checked_results: Dict[str, Dict[str, Union[float, int]]],
+    fast_results: Dict[str, Dict[str, Union[float, int]]],
+) -> Dict[str, Dict[str, float]]:
+    """Returns per pipeline stage the summed median duration of its cases
+    with and without type checks, and the speedup of the fast mode. Only the
+    cases that are timed in both modes are included."""
+    speedups: Dict[str, Dict[str, float]] = {}
+    for case_name in sorted(set(checked_results) & set(fast_results)):
+        stage_totals: Dict[str, float] = speedups.setdefault(
+            case_name.split("/")[0],
+            {"checked_s": 0.0, "fast_s": 0.0},
+        )
+        stage_totals["checked_s"] += checked_results[case_name]["median_s"]
+        stage_totals["fast_s"] += fast_results[case_name]["median_s"]
+    for stage_totals in speedups.values():
+        stage_totals["speedup"] = stage_totals["checked_s"] / max(
+            stage_totals["fast_s"], 1e-9
+        )
+    return speedups
+
+
+@typechecked
+def run_fast_mode_benchmarks(
+    *, repeats: int
+) -> Dict[str, Dict[str, Union[float, int]]]:
+    """Returns the pipeline timings with and without type checks, and prints
+    the speedup of the fast mode per stage."""
+    mode_results: Dict[str, Dict[str, Dict[str, Union[float, int]]]] = {}
+    with tempfile.TemporaryDirectory() as output_dir:
+        for mode_name, fast_mode in [("checked", False), ("fast", True)]:
+            mode_results[mode_name] = run_pipeline_benchmark(
+                fast_mode=fast_mode,
+                output_filepath=os.path.join(output_dir, f"{mode_name}.json"),
+                repeats=repeats,
+            )
+
+    print(f"{'stage':<25} {'checked [s]':>12} {'fast [s]':>10} {'x':>6}")
+    for stage_name, stage_totals in get_fast_mode_stage_speedups(
+        checked_results=mode_results["checked"],
+        fast_results=mode_results["fast"],
+    ).items():
+        print(
+            f"{stage_name:<25} {stage_totals['checked_s']:>12.4f} "
+            + f"{stage_totals['fast_s']:>10.4f} "
+            + f"{stage_totals['speedup']:>6.2f}"
+        )
+    return {
+        f"pipeline_{mode_name}/{case_name}": timings
+        for mode_name, results in mode_results.items()
+        for case_name, timings in results.items()
+    }
+
+
+@typechecked
+def parse_startup_benchmark_args(
+    args: Optional[List[str]] = None,
+) -> Namespace:
+    """Returns the arguments of the startup benchmark."""
+    parser = ArgumentParser(
+        description="Times the start of the snncompare cli."
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default="benchmarks/startup_results.json",
+        help="The json file to which the timings are written.",
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        type=str,
+        default=None,
+        help="The timings of another commit, to find regressions.",
+    )
+    parser.add_argument(
+        "-l",
+        "--label",
+        type=str,
+        default="",
+        help="A label that identifies the timings, e.g. the commit hash.",
+    )
+    parser.add_argument(
+        "-rep",
+        "--repeats",
+        type=int,
+        default=3,
+        help="The nr of times each command is timed.",
+    )
+    parser.add_argument(
+        "-t",
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="The fraction a command may slow down before it is a regression.",
+    )
+    parser.add_argument(
+        "--skip-pipeline",
+        action="store_true",
+        default=False,
+        help=(
+            "Do not time the pipeline stages with and without the "
+            + f"{FAST_MODE_ENV_VAR} environment variable."
+        ),
+    )
+    return parser.parse_args(args)
+
+
+@typechecked
+def main(args: Optional[List[str]] = None) -> None:
+    """Runs the startup benchmarks, stores the timings and reports the
+    regressions against the baseline, if a baseline is given."""
+    benchmark_args: Namespace = parse_startup_benchmark_args(args)
+    results: Dict[str, Dict[str, Union[float, int]]] = run_startup_benchmarks(
+        repeats=benchmark_args.repeats
+    )
+    if not benchmark_args.skip_pipeline:
+        results.update(
+            run_fast_mode_benchmarks(repeats=benchmark_args.repeats)
+        )
+    output_benchmark_results(
+        output_filepath=benchmark_args.output,
+        label=benchmark_args.label,
+        results=results,
+    )
+    if benchmark_args.baseline is not None:
+        regressions: List[Dict[str, Union[str, float]]] = get_regressions(
+            baseline=load_benchmark_results(
+                input_filepath=benchmark_args.baseline
+            ),
+            current=results,
+            tolerance=benchmark_args.tolerance,
+        )
+        print_regressions(regressions=regressions)
+        if regressions:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
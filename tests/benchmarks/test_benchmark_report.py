@@ -0,0 +1,96 @@
+"""Verifies the benchmark timings are stored in a stable format, and that
+slowed down cases are reported as regressions."""
+import os
+import tempfile
+import unittest
+from typing import Dict, List, Union
+
+from typeguard import typechecked
+
+from tests.benchmarks.benchmark_report import (
+    get_case_name,
+    get_case_timings,
+    get_regressions,
+    load_benchmark_results,
+    output_benchmark_results,
+    time_case,
+)
+
+
+class Test_benchmark_report(unittest.TestCase):
+    """Tests the benchmark report on synthetic timings."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.simulation_case: str = get_case_name(
+            path_name="simulation", graph_size=10, m_val=1, redundancy=2
+        )
+        self.loading_case: str = get_case_name(
+            path_name="stage_2_loading_npz",
+            graph_size=10,
+            m_val=1,
+            redundancy=2,
+        )
+        self.baseline: Dict[str, Dict[str, Union[float, int]]] = {
+            self.simulation_case: get_case_timings(durations=[0.5, 0.4, 0.6]),
+            self.loading_case: get_case_timings(durations=[0.0001]),
+        }
+
+    @typechecked
+    def test_results_are_stored_stably(self) -> None:
+        """Verifies the stored timings are loaded unchanged, and that storing
+        the same timings in another order yields the same file."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepaths: List[str] = []
+            for order in [1, -1]:
+                filepaths.append(os.path.join(tmp_dir, f"{order}.json"))
+                output_benchmark_results(
+                    output_filepath=filepaths[-1],
+                    label="abc",
+                    results=dict(list(self.baseline.items())[::order]),
+                )
+            self.assertEqual(
+                load_benchmark_results(input_filepath=filepaths[0]),
+                self.baseline,
+            )
+            with open(filepaths[0], encoding="utf-8") as first_file, open(
+                filepaths[1], encoding="utf-8"
+            ) as second_file:
+                self.assertEqual(first_file.read(), second_file.read())
+
+    @typechecked
+    def test_slowdowns_are_regressions(self) -> None:
+        """Verifies only the slowdowns beyond the tolerance, of cases that
+        are not dominated by noise, are regressions."""
+        current: Dict[str, Dict[str, Union[float, int]]] = {
+            self.simulation_case: get_case_timings(durations=[0.7]),
+            self.loading_case: get_case_timings(durations=[0.0005]),
+        }
+        regressions = get_regressions(
+            baseline=self.baseline, current=current, tolerance=0.2
+        )
+        self.assertEqual(
+            [regression["case_name"] for regression in regressions],
+            [self.simulation_case],
+        )
+        self.assertAlmostEqual(regressions[0]["slowdown"], 1.4)
+        self.assertEqual(
+            get_regressions(
+                baseline=self.baseline, current=current, tolerance=0.5
+            ),
+            [],
+        )
+
+    @typechecked
+    def test_setup_is_not_timed(self) -> None:
+        """Verifies the setup is performed before each repetition."""
+        calls: List[str] = []
+        durations: List[float] = time_case(
+            run=lambda: calls.append("run"),
+            setup=lambda: calls.append("setup"),
+            repeats=2,
+        )
+        self.assertEqual(len(durations), 2)
+        self.assertEqual(calls, ["setup", "run", "setup", "run"])
@@ -0,0 +1,62 @@
+"""Verifies the imported packages are read from the output of python -X
+importtime, and the speedup of the fast mode is computed per pipeline
+stage."""
+import unittest
+
+from typeguard import typechecked
+
+from tests.benchmarks.benchmark_startup import (
+    get_fast_mode_stage_speedups,
+    get_imported_packages,
+)
+
+
+class Test_benchmark_startup(unittest.TestCase):
+    """Tests the parsing of the import times."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.importtime_output: str = "\n".join(
+            [
+                "import time: self [us] | cumulative | imported package",
+                "import time:       120 |        120 |   _io",
+                "import time:        80 |        200 | snncompare",
+                "import time:       900 |       1500 |     matplotlib.pyplot",
+                "import time:       600 |        600 |   matplotlib",
+                "Performing run.",
+            ]
+        )
+
+    @typechecked
+    def test_top_level_packages_are_listed(self) -> None:
+        """Verifies each imported package is listed once, by its top level
+        package name."""
+        self.assertEqual(
+            get_imported_packages(importtime_output=self.importtime_output),
+            ["_io", "matplotlib", "snncompare"],
+        )
+
+    @typechecked
+    def test_fast_mode_speedups_per_stage(self) -> None:
+        """Verifies the durations of the cases of a stage are summed per mode,
+        and cases that are only timed in one mode are ignored."""
+        checked_results = {
+            "simulation/size=3/m_val=0/redundancy=2": {"median_s": 0.3},
+            "simulation/size=5/m_val=0/redundancy=2": {"median_s": 0.5},
+            "failure_modes/size=3/m_val=0/redundancy=2": {"median_s": 0.2},
+            "failure_modes/size=5/m_val=0/redundancy=2": {"median_s": 0.4},
+        }
+        fast_results = {
+            "simulation/size=3/m_val=0/redundancy=2": {"median_s": 0.1},
+            "simulation/size=5/m_val=0/redundancy=2": {"median_s": 0.1},
+            "failure_modes/size=3/m_val=0/redundancy=2": {"median_s": 0.1},
+        }
+        speedups = get_fast_mode_stage_speedups(
+            checked_results=checked_results, fast_results=fast_results
+        )
+        self.assertEqual(set(speedups), {"simulation", "failure_modes"})
+        self.assertAlmostEqual(speedups["simulation"]["checked_s"], 0.8)
+        self.assertAlmostEqual(speedups["simulation"]["speedup"], 4.0)
+        self.assertAlmostEqual(speedups["failure_modes"]["speedup"], 2.0)
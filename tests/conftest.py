@@ -2,11 +2,17 @@
 
 Thanks to Guilherme Salgado.
 """
+import os
 from typing import Any, Iterator
 
 import pytest
 from pyannotate_runtime import collect_types
 
+# The tests keep the runtime type checks, also if the fast mode is set. This
+# runs before any snncompare module is imported, because the typechecked
+# decorator reads the fast mode when it decorates a function.
+os.environ.pop("SNNCOMPARE_FAST", None)
+
 
 # pylint: disable=W0613
 def pytest_collection_finish(*, session: Any) -> None:  # type:ignore[misc]
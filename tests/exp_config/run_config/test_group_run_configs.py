@@ -0,0 +1,59 @@
+"""Verifies the run_configs are grouped on the settings that determine their
+stage 1 snns."""
+import unittest
+from typing import List
+
+from typeguard import typechecked
+
+from snncompare.create_configs import (
+    exp_config_to_run_configs,
+    get_stage_1_group_key,
+    group_run_configs_by_stage_1,
+)
+from snncompare.exp_config.Exp_config import Exp_config
+from snncompare.json_configurations.algo_test import load_exp_config_from_file
+from snncompare.run_config.Run_config import Run_config
+
+
+class Test_group_run_configs(unittest.TestCase):
+    """Tests whether the run_configs that only differ in radiation are put in
+    the same group."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        exp_config: Exp_config = load_exp_config_from_file(
+            custom_config_path="src/snncompare/json_configurations/",
+            filename="minimal_results",
+        )
+        self.nr_of_radiations: int = len(exp_config.radiations)
+        self.run_configs: List[Run_config] = exp_config_to_run_configs(
+            exp_config=exp_config
+        )
+
+    @typechecked
+    def test_groups_contain_all_radiations(self) -> None:
+        """Verifies each group contains one run_config per radiation, and that
+        no run_config is lost or duplicated."""
+        groups: List[List[Run_config]] = group_run_configs_by_stage_1(
+            run_configs=self.run_configs
+        )
+        self.assertEqual(
+            len(self.run_configs), sum(len(group) for group in groups)
+        )
+        for group in groups:
+            self.assertEqual(len(group), self.nr_of_radiations)
+            self.assertEqual(
+                len({run_config.radiation.get_hash() for run_config in group}),
+                self.nr_of_radiations,
+            )
+            self.assertEqual(
+                len(
+                    {
+                        get_stage_1_group_key(run_config=run_config)
+                        for run_config in group
+                    }
+                ),
+                1,
+            )
@@ -0,0 +1,85 @@
+"""Verifies the completed and missing run_configs are determined from the
+results index, and are summarised per experiment setting."""
+import copy
+import os
+import tempfile
+import unittest
+from typing import List
+
+from typeguard import typechecked
+
+from snncompare.create_configs import exp_config_to_run_configs
+from snncompare.exp_config.Exp_config import Exp_config
+from snncompare.import_results.results_index import index_completed_stage
+from snncompare.json_configurations.algo_test import load_exp_config_from_file
+from snncompare.progress_report.resume_manifest import (
+    get_completed_and_missing_run_configs_from_manifest,
+    get_run_config_summary_key,
+    print_resume_summary,
+)
+from snncompare.run_config.Run_config import Run_config
+
+
+class Test_resume_manifest(unittest.TestCase):
+    """Tests the resume manifest in a temporary working directory."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        exp_config: Exp_config = load_exp_config_from_file(
+            custom_config_path="src/snncompare/json_configurations/",
+            filename="minimal_results",
+        )
+        self.run_configs: List[Run_config] = exp_config_to_run_configs(
+            exp_config=exp_config
+        )
+
+    @typechecked
+    def setUp(self) -> None:
+        """Runs each test in an empty working directory."""
+        self.original_cwd: str = os.getcwd()
+        # pylint: disable=R1732
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+
+    @typechecked
+    def tearDown(self) -> None:
+        """Restores the original working directory."""
+        os.chdir(self.original_cwd)
+        self.tmp_dir.cleanup()
+
+    @typechecked
+    def test_completed_and_missing_run_configs(self) -> None:
+        """Verifies only the run_configs that completed stage 4 according to
+        the results index are completed."""
+        index_completed_stage(
+            unique_id=self.run_configs[0].unique_id, stage_index=4
+        )
+        index_completed_stage(
+            unique_id=self.run_configs[1].unique_id, stage_index=2
+        )
+        (
+            completed_run_configs,
+            missing_run_configs,
+        ) = get_completed_and_missing_run_configs_from_manifest(
+            run_configs=self.run_configs
+        )
+        self.assertEqual(completed_run_configs, self.run_configs[:1])
+        self.assertEqual(missing_run_configs, self.run_configs[1:])
+
+    @typechecked
+    def test_summarise_run_configs_without_adaptation(self) -> None:
+        """Verifies the run_configs without adaptation are summarised as
+        no_adaptation."""
+        run_config: Run_config = copy.copy(self.run_configs[0])
+        run_config.adaptation = None
+        self.assertTrue(
+            get_run_config_summary_key(run_config=run_config).endswith(
+                "adaptation=no_adaptation"
+            )
+        )
+        print_resume_summary(
+            completed_run_configs=self.run_configs,
+            missing_run_configs=[run_config],
+        )
@@ -0,0 +1,151 @@
+"""Verifies the lazy run space returns the run_configs of an experiment
+configuration by index, by unique_id and per shard."""
+import copy
+import unittest
+from typing import List
+
+from typeguard import typechecked
+
+from snncompare.create_configs import Run_config_space, generate_run_configs
+from snncompare.exp_config.Exp_config import Exp_config
+from snncompare.json_configurations.algo_test import load_exp_config_from_file
+from snncompare.run_config.Run_config import Run_config
+
+
+class Test_run_config_space(unittest.TestCase):
+    """Tests whether the run space is indexable and can be sharded."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        exp_config: Exp_config = load_exp_config_from_file(
+            custom_config_path="src/snncompare/json_configurations/",
+            filename="minimal_results",
+        )
+        self.exp_config: Exp_config = exp_config
+        self.run_config_space: Run_config_space = Run_config_space(
+            exp_config=exp_config
+        )
+        self.run_configs: List[Run_config] = list(self.run_config_space)
+
+    @typechecked
+    def test_index_and_unique_id_lookup(self) -> None:
+        """Verifies each run_config is found back by its settings, and that
+        the unique_ids are unique."""
+        self.assertEqual(len(self.run_configs), len(self.run_config_space))
+        self.assertEqual(
+            len({run_config.unique_id for run_config in self.run_configs}),
+            len(self.run_configs),
+        )
+        for index, run_config in enumerate(self.run_configs):
+            self.assertEqual(
+                self.run_config_space.get_index(run_config=run_config), index
+            )
+            self.assertEqual(
+                self.run_config_space.get_index_of_unique_id(
+                    unique_id=run_config.unique_id
+                ),
+                index,
+            )
+        self.assertIs(
+            self.run_config_space.get_unique_id_indices(),
+            self.run_config_space.get_unique_id_indices(),
+        )
+        with self.assertRaises(ValueError):
+            self.run_config_space.get_index_of_unique_id(
+                unique_id="some_other_id"
+            )
+        self.assertEqual(
+            self.run_config_space[-1].unique_id,
+            self.run_configs[-1].unique_id,
+        )
+        with self.assertRaises(IndexError):
+            # pylint: disable=W0104
+            self.run_config_space[len(self.run_config_space)]
+
+    @typechecked
+    def test_specific_run_config(self) -> None:
+        """Verifies a specific run_config is only returned if its settings
+        and unique_id are in the run space."""
+        run_config: Run_config = self.run_configs[1]
+        self.assertEqual(
+            generate_run_configs(
+                exp_config=self.exp_config, specific_run_config=run_config
+            ),
+            [run_config],
+        )
+        other_run_config: Run_config = copy.copy(run_config)
+        other_run_config.unique_id = "some_other_id"
+        with self.assertRaises(ValueError):
+            generate_run_configs(
+                exp_config=self.exp_config,
+                specific_run_config=other_run_config,
+            )
+
+    @typechecked
+    def test_shards_are_disjoint_and_complete(self) -> None:
+        """Verifies the shards together contain each run_config once."""
+        shard_count: int = 3
+        indices: List[int] = []
+        for shard_index in range(shard_count):
+            indices.extend(
+                self.run_config_space.get_shard_indices(
+                    shard_index=shard_index, shard_count=shard_count
+                )
+            )
+        self.assertEqual(sorted(indices), list(range(len(self.run_configs))))
+        with self.assertRaises(ValueError):
+            self.run_config_space.get_shard_indices(
+                shard_index=shard_count, shard_count=shard_count
+            )
+
+    @typechecked
+    def test_shards_are_balanced_on_cost(self) -> None:
+        """Verifies the total estimated cost of the shards differs by at most
+        the cost of the most expensive run_config."""
+        shard_count: int = 2
+        costs: List[int] = [
+            self.run_config_space.get_cost_estimate(index=index)
+            for index in range(len(self.run_config_space))
+        ]
+        shard_costs: List[int] = [
+            sum(
+                costs[index]
+                for index in self.run_config_space.get_shard_indices(
+                    shard_index=shard_index, shard_count=shard_count
+                )
+            )
+            for shard_index in range(shard_count)
+        ]
+        self.assertLessEqual(max(shard_costs) - min(shard_costs), max(costs))
+
+    @typechecked
+    def test_shard_assignment_is_cached(self) -> None:
+        """Verifies the run space reuses its shard assignment, that another
+        run space of the same exp_config computes the same assignment, and
+        that it matches the shards."""
+        shard_count: int = 3
+        other_run_config_space: Run_config_space = Run_config_space(
+            exp_config=self.exp_config
+        )
+        shard_assignment: List[
+            int
+        ] = self.run_config_space.get_shard_assignment(shard_count=shard_count)
+        self.assertIs(
+            self.run_config_space.get_shard_assignment(
+                shard_count=shard_count
+            ),
+            shard_assignment,
+        )
+        self.assertEqual(
+            other_run_config_space.get_shard_assignment(
+                shard_count=shard_count
+            ),
+            shard_assignment,
+        )
+        for shard_index in range(shard_count):
+            for index in self.run_config_space.get_shard_indices(
+                shard_index=shard_index, shard_count=shard_count
+            ):
+                self.assertEqual(shard_assignment[index], shard_index)
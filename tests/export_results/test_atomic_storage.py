@@ -0,0 +1,69 @@
+"""Verifies result files are replaced atomically, and that concurrent
+processes append each seed hash line only once."""
+import json
+import os
+import tempfile
+import unittest
+from multiprocessing import Pool
+
+from typeguard import typechecked
+
+from snncompare.export_results.atomic_storage import (
+    append_line_if_missing,
+    atomic_open,
+)
+
+
+@typechecked
+def append_hashes(filepath: str) -> None:
+    """Appends the same hash lines to the file."""
+    for hash_nr in range(20):
+        append_line_if_missing(filepath=filepath, line=f"hash_{hash_nr}")
+
+
+class Test_atomic_storage(unittest.TestCase):
+    """Tests the atomic writes and locked appends in a temporary
+    directory."""
+
+    @typechecked
+    def setUp(self) -> None:
+        """Creates an empty output directory."""
+        # pylint: disable=R1732
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.output_filepath: str = os.path.join(
+            self.tmp_dir.name, "results.json"
+        )
+
+    @typechecked
+    def tearDown(self) -> None:
+        """Removes the output directory."""
+        self.tmp_dir.cleanup()
+
+    @typechecked
+    def test_failed_write_keeps_original_file(self) -> None:
+        """Verifies a write that raises an error leaves the original file
+        and no temporary file behind."""
+        with atomic_open(output_filepath=self.output_filepath) as fp:
+            json.dump({"passed": True}, fp)
+
+        with self.assertRaises(RuntimeError):
+            with atomic_open(output_filepath=self.output_filepath) as fp:
+                fp.write('{"passed": ')
+                raise RuntimeError("Interrupted write.")
+
+        with open(self.output_filepath, encoding="utf-8") as json_file:
+            self.assertEqual(json.load(json_file), {"passed": True})
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["results.json"])
+
+    @typechecked
+    def test_concurrent_appends_do_not_duplicate_lines(self) -> None:
+        """Verifies each line is stored once when processes append the same
+        lines concurrently."""
+        filepath: str = os.path.join(self.tmp_dir.name, "seed_hashes.txt")
+        with Pool(4) as pool:
+            pool.map(append_hashes, [filepath] * 4)
+        with open(filepath, encoding="utf-8") as txt_file:
+            lines = txt_file.read().splitlines()
+        self.assertEqual(
+            sorted(lines), sorted(f"hash_{hash_nr}" for hash_nr in range(20))
+        )
@@ -0,0 +1,228 @@
+"""Verifies the binary stage 1 snn is loaded back as the same network as the
+json stage 1 snn."""
+import glob
+import os
+import tempfile
+import unittest
+from math import inf
+from typing import Dict
+
+from simsnn.core.networks import Network
+from simsnn.core.simulators import Simulator
+from typeguard import typechecked
+
+from snncompare.create_configs import Run_config_space
+from snncompare.Experiment_runner import Experiment_runner
+from snncompare.export_results.output_stage1_snn_graphs import (
+    output_snn_graph_stage_1,
+)
+from snncompare.import_results.helper import get_binary_filepath
+from snncompare.import_results.load_stage4 import load_stage4_results_only
+from snncompare.import_results.load_stage_1_and_2 import (
+    load_binary_snn_graph_stage_1,
+    stage1_simsnn_arrays_to_simulator,
+)
+from snncompare.import_results.read_json import load_json_file_into_dict
+from snncompare.import_results.results_index import get_indexed_stage_4_results
+from snncompare.json_configurations.algo_test import load_exp_config_from_file
+from snncompare.optional_config.Output_config import (
+    Extra_storing_config,
+    Output_config,
+    Zoom,
+)
+from snncompare.progress_report.reindex_results import reindex_results
+from snncompare.run_config.Run_config import Run_config
+
+
+@typechecked
+def get_simulator(*, nr_of_neurons: int) -> Simulator:
+    """Returns a simsnn Simulator with a chain of neurons, of which the
+    properties differ per neuron."""
+    net = Network()
+    neurons = []
+    for neuron_nr in range(nr_of_neurons):
+        neurons.append(
+            net.createLIF(
+                m=neuron_nr % 2,
+                bias=0.5 * neuron_nr,
+                V_init=0,
+                V_reset=0,
+                V_min=-inf,
+                thr=1 + neuron_nr,
+                amplitude=1,
+                I_e=0,
+                noise=0,
+                rng=0,
+                ID=neuron_nr,
+                name=f"n{neuron_nr}",
+                increment_count=False,
+                du=0,
+                pos=(0.5, neuron_nr),
+                spike_only_if_thr_exceeded=neuron_nr == 0,
+            )
+        )
+    for synapse_nr, (pre, post) in enumerate(zip(neurons[:-1], neurons[1:])):
+        net.createSynapse(
+            pre=pre,
+            post=post,
+            ID=(pre.name, post.name),
+            w=-2.5,
+            d=1 + synapse_nr % 2,
+        )
+    return Simulator(net, monitor_I=True)
+
+
+class Test_binary_stage_1_output(unittest.TestCase):
+    """Tests whether the neuron and synapse properties survive the binary
+    stage 1 output."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.nr_of_neurons: int = 5
+
+    @typechecked
+    def test_binary_output_round_trip(self) -> None:
+        """Outputs an snn in the npz format, rebuilds it from the columns,
+        and verifies its json output equals the json output of the original
+        snn."""
+        sim: Simulator = get_simulator(nr_of_neurons=self.nr_of_neurons)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_filepath: str = os.path.join(tmp_dir, "original.json")
+            self.assertEqual(
+                output_snn_graph_stage_1(
+                    output_filepath=json_filepath, snn_graph=sim
+                ),
+                json_filepath,
+            )
+            npz_filepath: str = output_snn_graph_stage_1(
+                output_filepath=os.path.join(tmp_dir, "some_hash.json"),
+                snn_graph=sim,
+                stage_1_format="npz",
+            )
+            self.assertEqual(
+                npz_filepath,
+                get_binary_filepath(
+                    json_filepath=os.path.join(tmp_dir, "some_hash.json"),
+                    stage_index=1,
+                ),
+            )
+            self.assertFalse(
+                os.path.isfile(os.path.join(tmp_dir, "some_hash.json"))
+            )
+
+            loaded_sim: Simulator = stage1_simsnn_arrays_to_simulator(
+                add_to_raster=True,
+                add_to_multimeter=True,
+                stage_1_arrays=load_binary_snn_graph_stage_1(
+                    output_filepath=npz_filepath
+                ),
+            )
+            self.assertEqual(
+                [neuron.name for neuron in loaded_sim.raster.targets],
+                [f"n{nr}" for nr in range(self.nr_of_neurons)],
+            )
+
+            # The simulation state, synapse delays and networkx graph equal
+            # those of the original snn.
+            self.assertEqual(
+                [
+                    (neuron.V, neuron.I, neuron.out)
+                    for neuron in loaded_sim.network.nodes
+                ],
+                [
+                    (neuron.V, neuron.I, neuron.out)
+                    for neuron in sim.network.nodes
+                ],
+            )
+            self.assertEqual(
+                [
+                    len(synapse.out_pre)
+                    for synapse in loaded_sim.network.synapses
+                ],
+                [len(synapse.out_pre) for synapse in sim.network.synapses],
+            )
+            self.assertEqual(
+                list(loaded_sim.network.graph.nodes),
+                list(sim.network.graph.nodes),
+            )
+            self.assertEqual(
+                list(loaded_sim.network.graph.edges),
+                list(sim.network.graph.edges),
+            )
+
+            loaded_json_filepath: str = os.path.join(tmp_dir, "loaded.json")
+            output_snn_graph_stage_1(
+                output_filepath=loaded_json_filepath, snn_graph=loaded_sim
+            )
+            self.assertEqual(
+                load_json_file_into_dict(json_filepath=loaded_json_filepath),
+                load_json_file_into_dict(json_filepath=json_filepath),
+            )
+
+    @typechecked
+    def test_stage_4_results_from_files_with_binary_stage_1(self) -> None:
+        """Performs a run with binary stage 1 snns, and verifies its stage 4
+        results are loaded from the files once the results index has been
+        rebuilt without them."""
+        exp_config = load_exp_config_from_file(
+            custom_config_path="src/snncompare/json_configurations/",
+            filename="minimal_results",
+        )
+        run_config: Run_config = Run_config_space(exp_config=exp_config)[0]
+        output_config: Output_config = Output_config(
+            recreate_stages=[],
+            export_types=[],
+            zoom=Zoom(
+                create_zoomed_image=False, left_right=None, bottom_top=None
+            ),
+            output_json_stages=[1, 2, 4],
+            extra_storing_config=Extra_storing_config(
+                count_spikes=False,
+                count_neurons=False,
+                count_synapses=False,
+                skip_stage_2_output=False,
+                show_images=False,
+                store_died_neurons=False,
+                export_failure_modes=False,
+                show_failure_modes=False,
+            ),
+            stage_1_format="npz",
+        )
+        original_cwd: str = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.chdir(tmp_dir)
+            try:
+                Experiment_runner(
+                    exp_config=exp_config,
+                    output_config=output_config,
+                    reverse=False,
+                    specific_run_config=run_config,
+                )
+                self.assertNotEqual(
+                    glob.glob("results/stage1/**/snns/*.npz", recursive=True),
+                    [],
+                )
+                expected_results: Dict[
+                    str, Dict[str, Dict]
+                ] = get_indexed_stage_4_results(
+                    unique_ids=[run_config.unique_id]
+                )
+                self.assertIn(run_config.unique_id, expected_results)
+
+                # The rebuilt results index has no stage 4 results, so they
+                # are read from the stage 4 files.
+                reindex_results()
+                self.assertEqual(
+                    get_indexed_stage_4_results(
+                        unique_ids=[run_config.unique_id]
+                    ),
+                    {},
+                )
+                self.assertEqual(
+                    load_stage4_results_only(run_configs=[run_config]),
+                    expected_results,
+                )
+            finally:
+                os.chdir(original_cwd)
@@ -0,0 +1,302 @@
+"""Verifies the binary stage 2 snn behaviour is loaded back as it was
+outputted."""
+import os
+import tempfile
+import unittest
+from math import inf
+
+import numpy as np
+from simsnn.core.networks import Network
+from simsnn.core.simulators import Simulator
+from typeguard import typechecked
+
+from snncompare.create_configs import Run_config_space
+from snncompare.export_results.output_stage2_snns import (
+    output_snn_graph_stage_2,
+    output_stage_2_snns,
+)
+from snncompare.graph_generation.stage_1_create_graphs import (
+    get_simulator_with_recorded_neurons,
+)
+from snncompare.import_results.helper import get_binary_filepath
+from snncompare.import_results.load_stage_1_and_2 import (
+    Stage_2_recording_mismatch,
+    load_snn_graph_stage_2,
+)
+from snncompare.json_configurations.algo_test import load_exp_config_from_file
+from snncompare.optional_config.Output_config import (
+    Extra_storing_config,
+    Output_config,
+    Recording_policy,
+    Zoom,
+)
+from snncompare.process_results.get_failure_modes import get_incorrect_spikes
+from snncompare.run_config.Run_config import Run_config
+
+
+@typechecked
+def get_simulator(*, nr_of_neurons: int) -> Simulator:
+    """Returns a simsnn Simulator with all neurons in its raster and
+    multimeter."""
+    net = Network()
+    sim = Simulator(net, monitor_I=True)
+    for neuron_nr in range(nr_of_neurons):
+        net.createLIF(
+            m=1,
+            bias=0,
+            V_init=0,
+            V_reset=0,
+            V_min=-inf,
+            thr=1,
+            amplitude=1,
+            I_e=0,
+            noise=0,
+            rng=0,
+            ID=0,
+            name=f"n{neuron_nr}",
+            increment_count=False,
+            du=0,
+            pos=(0, neuron_nr),
+            spike_only_if_thr_exceeded=True,
+        )
+    sim.raster.addTarget(net.nodes)
+    sim.multimeter.addTarget(net.nodes)
+    return sim
+
+
+@typechecked
+def get_recorded_simulator(
+    *, nr_of_neurons: int, recording_policy: Recording_policy
+) -> Simulator:
+    """Returns a simsnn Simulator with the neurons of the recording policy in
+    its raster and multimeter."""
+    return get_simulator_with_recorded_neurons(
+        net=get_simulator(nr_of_neurons=nr_of_neurons).network,
+        add_to_multimeter=True,
+        add_to_raster=True,
+        recording_policy=recording_policy,
+    )
+
+
+class Test_binary_stage_2_output(unittest.TestCase):
+    """Tests whether the spikes, V and I survive the binary stage 2 output."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        # Use a number of neurons that is not a multiple of 8 to verify the
+        # bit-packing padding is removed.
+        self.nr_of_neurons: int = 11
+        self.nr_of_timesteps: int = 7
+
+    @typechecked
+    def test_binary_output_round_trip(self) -> None:
+        """Outputs random snn behaviour in the npz format and verifies it is
+        loaded back identically, up to float32 precision."""
+        rng = np.random.default_rng(seed=42)
+        sim: Simulator = get_simulator(nr_of_neurons=self.nr_of_neurons)
+        shape = (self.nr_of_timesteps, self.nr_of_neurons)
+        sim.raster.spikes = rng.random(shape) > 0.5
+        sim.multimeter.V = rng.random(shape)
+        sim.multimeter.I = rng.random(shape)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_filepath: str = os.path.join(tmp_dir, "some_hash.json")
+            output_snn_graph_stage_2(
+                output_filepath=json_filepath,
+                snn_graph=sim,
+                stage_2_format="npz",
+            )
+            binary_filepath: str = get_binary_filepath(
+                json_filepath=json_filepath,
+                stage_index=2,
+            )
+            self.assertFalse(os.path.isfile(json_filepath))
+            self.assertTrue(os.path.isfile(binary_filepath))
+            with self.assertRaises(ValueError):
+                get_binary_filepath(json_filepath=json_filepath, stage_index=4)
+            # The file is a regular .npz file.
+            with np.load(binary_filepath) as npz_file:
+                self.assertEqual(
+                    sorted(npz_file.files),
+                    ["multimeter_neurons", "raster_neurons", "traces"],
+                )
+                self.assertEqual(
+                    npz_file["raster_neurons"].tolist(),
+                    [f"n{nr}" for nr in range(self.nr_of_neurons)],
+                )
+
+            loaded_sim: Simulator = get_simulator(
+                nr_of_neurons=self.nr_of_neurons
+            )
+            load_snn_graph_stage_2(
+                output_filepath=binary_filepath,
+                stage_1_simsnn_simulator=loaded_sim,
+            )
+            np.testing.assert_array_equal(
+                loaded_sim.raster.spikes, sim.raster.spikes
+            )
+            np.testing.assert_allclose(
+                loaded_sim.multimeter.V, sim.multimeter.V, rtol=1e-6
+            )
+            np.testing.assert_allclose(
+                loaded_sim.multimeter.I, sim.multimeter.I, rtol=1e-6
+            )
+            # Release the memory map before the directory is removed.
+            del loaded_sim
+
+    @typechecked
+    def test_spikes_only_output_round_trip(self) -> None:
+        """Outputs the spikes of the selected neurons only, and verifies they
+        are loaded back without V and I."""
+        recording_policy: Recording_policy = Recording_policy(
+            recording="spikes", neuron_name_patterns=["n1*"]
+        )
+        sims = []
+        for _ in range(2):
+            net: Network = get_simulator(
+                nr_of_neurons=self.nr_of_neurons
+            ).network
+            sims.append(
+                get_simulator_with_recorded_neurons(
+                    net=net,
+                    add_to_multimeter=True,
+                    add_to_raster=True,
+                    recording_policy=recording_policy,
+                )
+            )
+        sim, loaded_sim = sims
+        # Only n1 and n10 match the pattern.
+        self.assertEqual(
+            [neuron.name for neuron in sim.raster.targets], ["n1", "n10"]
+        )
+        self.assertEqual(sim.multimeter.targets, [])
+        sim.raster.spikes = (
+            np.random.default_rng(seed=42).random((self.nr_of_timesteps, 2))
+            > 0.5
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            binary_filepath: str = output_snn_graph_stage_2(
+                output_filepath=os.path.join(tmp_dir, "some_hash.json"),
+                snn_graph=sim,
+                stage_2_format="npz",
+            )
+            load_snn_graph_stage_2(
+                output_filepath=binary_filepath,
+                stage_1_simsnn_simulator=loaded_sim,
+            )
+            np.testing.assert_array_equal(
+                loaded_sim.raster.spikes, sim.raster.spikes
+            )
+            self.assertEqual(
+                loaded_sim.multimeter.V.shape, (self.nr_of_timesteps, 0)
+            )
+            # Release the memory map before the directory is removed.
+            del sims, loaded_sim
+
+    @typechecked
+    def test_neuron_name_patterns_failure_modes_and_reload(self) -> None:
+        """Outputs the behaviour of a subset of the neurons in both formats,
+        verifies the failure modes are named after the recorded neurons, and
+        that the behaviour is only loaded into simulators that record the
+        same neurons."""
+        recording_policy: Recording_policy = Recording_policy(
+            recording="full", neuron_name_patterns=["n1*", "n3"]
+        )
+        unradiated_sim: Simulator = get_recorded_simulator(
+            nr_of_neurons=self.nr_of_neurons, recording_policy=recording_policy
+        )
+        radiated_sim: Simulator = get_recorded_simulator(
+            nr_of_neurons=self.nr_of_neurons, recording_policy=recording_policy
+        )
+        # The recorded columns belong to n1, n3 and n10.
+        shape = (self.nr_of_timesteps, 3)
+        for sim in [unradiated_sim, radiated_sim]:
+            sim.raster.spikes = np.zeros(shape, dtype=bool)
+            sim.multimeter.V = np.zeros(shape)
+            sim.multimeter.I = np.zeros(shape)
+        radiated_sim.raster.spikes[2, 1] = True
+        radiated_sim.multimeter.I[4, 2] = -1.0
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for stage_2_format in ["json", "npz"]:
+                filepath: str = output_snn_graph_stage_2(
+                    output_filepath=os.path.join(
+                        tmp_dir, f"{stage_2_format}.json"
+                    ),
+                    snn_graph=radiated_sim,
+                    stage_2_format=stage_2_format,
+                )
+                loaded_sim: Simulator = get_recorded_simulator(
+                    nr_of_neurons=self.nr_of_neurons,
+                    recording_policy=recording_policy,
+                )
+                load_snn_graph_stage_2(
+                    output_filepath=filepath,
+                    stage_1_simsnn_simulator=loaded_sim,
+                )
+                self.assertEqual(
+                    get_incorrect_spikes(
+                        adapted_unradiated_snn=unradiated_sim,
+                        snn_graphs={"rad_adapted_snn_graph": loaded_sim},
+                        unradiated_I=unradiated_sim.multimeter.I,
+                        unradiated_spikes=unradiated_sim.raster.spikes,
+                    ),
+                    ({2: ["n3"]}, {}, {}, {4: ["n10"]}),
+                )
+
+                # A simulator that records all neurons can not load the
+                # behaviour of the subset, so it is simulated again.
+                with self.assertRaises(Stage_2_recording_mismatch):
+                    load_snn_graph_stage_2(
+                        output_filepath=filepath,
+                        stage_1_simsnn_simulator=get_simulator(
+                            nr_of_neurons=self.nr_of_neurons
+                        ),
+                    )
+                # Release the memory map before the directory is removed.
+                del loaded_sim
+
+    @typechecked
+    def test_skipped_stage_2_output(self) -> None:
+        """Verifies no stage 2 behaviour is outputted, nor looked up, if the
+        stage 2 output is skipped."""
+        output_config: Output_config = Output_config(
+            recreate_stages=[],
+            export_types=[],
+            zoom=Zoom(
+                create_zoomed_image=False, left_right=None, bottom_top=None
+            ),
+            output_json_stages=[1, 2, 4],
+            extra_storing_config=Extra_storing_config(
+                count_spikes=False,
+                count_neurons=False,
+                count_synapses=False,
+                skip_stage_2_output=True,
+                show_images=False,
+                store_died_neurons=False,
+                export_failure_modes=False,
+                show_failure_modes=False,
+            ),
+        )
+        run_config: Run_config = Run_config_space(
+            exp_config=load_exp_config_from_file(
+                custom_config_path="src/snncompare/json_configurations/",
+                filename="minimal_results",
+            )
+        )[0]
+        original_cwd: str = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.chdir(tmp_dir)
+            try:
+                # The graphs are not needed if nothing is outputted.
+                output_stage_2_snns(
+                    graphs_dict={},
+                    output_config=output_config,
+                    run_config=run_config,
+                )
+                self.assertEqual(os.listdir(tmp_dir), [])
+            finally:
+                os.chdir(original_cwd)
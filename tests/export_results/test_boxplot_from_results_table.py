@@ -0,0 +1,84 @@
+"""Verifies the boxplot scores are computed from the stage 4 results
+table."""
+import unittest
+from typing import Dict, List
+
+import pandas as pd
+from snnadaptation.Adaptation import Adaptation
+from typeguard import typechecked
+
+from snncompare.export_results.analysis.create_performance_plots import (
+    Boxplot_x_val,
+    boxplot_data_to_y_series,
+    get_boxplot_datapoints,
+)
+
+
+class Test_boxplot_from_results_table(unittest.TestCase):
+    """Tests whether the boxplot columns contain the pass ratio per seed."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.adaptation: Adaptation = Adaptation(
+            adaptation_type="redundancy", redundancy=2
+        )
+        self.other_adaptation: Adaptation = Adaptation(
+            adaptation_type="redundancy", redundancy=4
+        )
+
+    @typechecked
+    def get_rows(
+        self, *, adaptation: Adaptation, seed: int, rad_passed: bool
+    ) -> List[Dict]:
+        """Returns the results table rows of a single run_config."""
+        return [
+            {
+                "unique_id": f"{adaptation.get_name()}_{seed}_{rad_passed}",
+                "algorithm_name": "MDSA",
+                "adaptation_name": adaptation.get_name(),
+                "seed": seed,
+                "graph_name": graph_name,
+                "passed": passed,
+            }
+            for graph_name, passed in [
+                ("snn_algo_graph", True),
+                ("adapted_snn_graph", True),
+                ("rad_snn_algo_graph", False),
+                ("rad_adapted_snn_graph", rad_passed),
+            ]
+        ]
+
+    @typechecked
+    def test_scores_per_column_and_seed(self) -> None:
+        """Verifies the scores per column, and that the adaptations that are
+        not in the boxplot do not get a column."""
+        rows: List[Dict] = (
+            self.get_rows(adaptation=self.adaptation, seed=1, rad_passed=True)
+            + self.get_rows(
+                adaptation=self.adaptation, seed=1, rad_passed=False
+            )
+            + self.get_rows(
+                adaptation=self.adaptation, seed=2, rad_passed=True
+            )
+            + self.get_rows(
+                adaptation=self.other_adaptation, seed=2, rad_passed=False
+            )
+        )
+        boxplot_data: Dict[
+            str, Dict[int, Boxplot_x_val]
+        ] = get_boxplot_datapoints(
+            adaptations=[self.adaptation],
+            results_table=pd.DataFrame(rows),
+            seeds=[1, 2],
+        )
+        self.assertEqual(
+            boxplot_data_to_y_series(boxplot_data=boxplot_data),
+            {
+                "snn_algo_graph": [1.0, 1.0],
+                "adapted_snn_graph": [1.0, 1.0],
+                "rad_snn_algo_graph": [0.0, 0.0],
+                self.adaptation.get_name(): [0.5, 1.0],
+            },
+        )
@@ -0,0 +1,204 @@
+"""Verifies the profiler attributes the work of nested sections to their own
+category, and summarises the profile log from the slowest category down."""
+import os
+import tempfile
+import time
+import unittest
+from typing import Any, Dict, List
+
+from typeguard import typechecked
+
+from snncompare.progress_report.profiling import (
+    get_fast_mode_speedups,
+    get_peak_rss_kb,
+    load_profile_records,
+    profile_section,
+    profile_stage,
+    summarise_profile_records,
+)
+
+
+@typechecked
+def get_rss_kb() -> int:
+    """Returns the current resident memory of this process in kB, or 0 if
+    the operating system does not report it."""
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as statm_file:
+            resident_pages: int = int(statm_file.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        return 0
+
+
+class Test_profiling(unittest.TestCase):
+    """Tests the profiler in a temporary working directory."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.log_filepath: str = "results/profile_log.jsonl"
+
+    @typechecked
+    def setUp(self) -> None:
+        """Runs each test in an empty working directory."""
+        self.original_cwd: str = os.getcwd()
+        # pylint: disable=R1732
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+
+    @typechecked
+    def tearDown(self) -> None:
+        """Restores the original working directory."""
+        os.chdir(self.original_cwd)
+        self.tmp_dir.cleanup()
+
+    @typechecked
+    def test_nested_sections_are_exclusive(self) -> None:
+        """Verifies the time of a nested section is not attributed to the
+        section around it, and the touched files are counted."""
+        with profile_stage(
+            unique_id="abc",
+            stage_index=2,
+            enabled=True,
+            log_filepath=self.log_filepath,
+        ):
+            with profile_section(category="simulate"):
+                time.sleep(0.05)
+                with profile_section(category="serialise"):
+                    for filename in ["first.json", "second.json"]:
+                        with open(filename, "w", encoding="utf-8") as file:
+                            file.write("{}")
+                    time.sleep(0.2)
+
+        records: Dict[str, Dict[str, Any]] = {
+            record["category"]: record
+            for record in load_profile_records(log_filepath=self.log_filepath)
+        }
+        self.assertEqual(set(records), {"simulate", "serialise", "other"})
+        self.assertGreaterEqual(records["serialise"]["wall_time"], 0.2)
+        self.assertLess(records["simulate"]["wall_time"], 0.2)
+        self.assertGreaterEqual(records["simulate"]["wall_time"], 0.05)
+        self.assertEqual(records["serialise"]["files_touched"], 2)
+        self.assertEqual(records["simulate"]["files_touched"], 0)
+        for record in records.values():
+            self.assertEqual(record["unique_id"], "abc")
+            self.assertEqual(record["stage_index"], 2)
+
+    @typechecked
+    def test_peak_rss_growth_per_stage(self) -> None:
+        """Verifies the growth of the peak memory is attributed to the stage
+        that allocated it, and not to the later stages, even though the
+        lifetime peak of the process includes the earlier stage."""
+        with profile_stage(
+            unique_id="abc",
+            stage_index=1,
+            enabled=True,
+            log_filepath=self.log_filepath,
+        ):
+            with profile_section(category="generate"):
+                # Make 64 MB more resident than the peak of the earlier tests.
+                data = bytearray(
+                    (get_peak_rss_kb() - get_rss_kb() + 64 * 1024) * 1024
+                )
+                data[::4096] = b"x" * len(data[::4096])
+                del data
+        with profile_stage(
+            unique_id="abc",
+            stage_index=2,
+            enabled=True,
+            log_filepath=self.log_filepath,
+        ):
+            with profile_section(category="simulate"):
+                time.sleep(0.01)
+
+        records: Dict[int, Dict[str, Any]] = {
+            record["stage_index"]: record
+            for record in load_profile_records(log_filepath=self.log_filepath)
+            if record["category"] != "other"
+        }
+        if records[1]["peak_rss_kb"] == 0:
+            self.skipTest("The peak memory is not reported on this platform.")
+        self.assertGreaterEqual(records[1]["peak_rss_growth_kb"], 32 * 1024)
+        self.assertLess(records[2]["peak_rss_growth_kb"], 10 * 1024)
+        # The lifetime peak does not drop in the later stage.
+        self.assertGreaterEqual(
+            records[2]["peak_rss_kb"], records[1]["peak_rss_kb"]
+        )
+
+    @typechecked
+    def test_disabled_stage_is_not_logged(self) -> None:
+        """Verifies no log is created if profiling is disabled."""
+        with profile_stage(
+            unique_id="abc",
+            stage_index=1,
+            enabled=False,
+            log_filepath=self.log_filepath,
+        ):
+            with profile_section(category="generate"):
+                pass
+        self.assertFalse(os.path.isfile(self.log_filepath))
+
+    @typechecked
+    def test_summary_is_sorted_by_wall_time(self) -> None:
+        """Verifies the records are summed per stage and category, from the
+        most to the least wall time."""
+        records: List[Dict[str, Any]] = [
+            {
+                "unique_id": unique_id,
+                "stage_index": stage_index,
+                "category": category,
+                "wall_time": wall_time,
+                "cpu_time": wall_time,
+                "peak_rss_kb": 100,
+                "bytes_read": 0,
+                "bytes_written": 10,
+                "files_touched": 1,
+            }
+            for unique_id, stage_index, category, wall_time in [
+                ("a", 1, "generate", 1.0),
+                ("b", 1, "generate", 2.0),
+                ("a", 2, "simulate", 5.0),
+                ("a", 4, "verify", 0.5),
+            ]
+        ]
+        summary: List[Dict[str, Any]] = summarise_profile_records(
+            records=records
+        )
+        self.assertEqual(
+            [
+                (totals["stage_index"], totals["category"])
+                for totals in summary
+            ],
+            [(2, "simulate"), (1, "generate"), (4, "verify")],
+        )
+        self.assertEqual(summary[1]["wall_time"], 3.0)
+        self.assertEqual(summary[1]["bytes_written"], 20)
+        self.assertEqual(summary[1]["run_configs"], 2)
+
+    @typechecked
+    def test_fast_mode_speedup_per_stage(self) -> None:
+        """Verifies the speedup is computed from the mean wall time per
+        run_config, for the stages that are profiled in both modes."""
+        records: List[Dict[str, Any]] = [
+            {
+                "unique_id": unique_id,
+                "stage_index": stage_index,
+                "wall_time": wall_time,
+                "fast_mode": fast_mode,
+            }
+            for unique_id, stage_index, wall_time, fast_mode in [
+                ("a", 2, 3.0, False),
+                ("a", 2, 1.0, False),
+                ("b", 2, 4.0, False),
+                ("a", 2, 1.0, True),
+                ("a", 4, 1.0, False),
+            ]
+        ]
+        speedups: List[Dict[str, Any]] = get_fast_mode_speedups(
+            records=records
+        )
+        self.assertEqual(len(speedups), 1)
+        self.assertEqual(speedups[0]["stage_index"], 2)
+        self.assertEqual(speedups[0]["checked_wall_time"], 4.0)
+        self.assertEqual(speedups[0]["speedup"], 4.0)
@@ -0,0 +1,233 @@
+"""Verifies the results index stores the outputted files and completed stages,
+and can be rebuilt from an existing results directory."""
+import os
+import shutil
+import tempfile
+import unittest
+
+from typeguard import typechecked
+
+from snncompare.import_results.results_index import (
+    clear_results_index,
+    get_indexed_completed_unique_ids,
+    get_indexed_hash,
+    get_indexed_stage_4_results,
+    get_stage_index_and_hashes,
+    has_artifact,
+    has_confirmed_completed_stage,
+    has_indexed_completed_stage,
+    index_artifact,
+    index_artifacts_in_results_dir,
+    index_completed_stage,
+    index_hash,
+    index_stage_4_results,
+    is_indexed_artifact,
+    merge_results_index,
+    results_index_exists,
+)
+
+
+class Test_results_index(unittest.TestCase):
+    """Tests the sqlite results index in a temporary working directory."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.stage_2_filepath: str = (
+            "results/stage2/MDSA_0/no_adaptation/neuron_death/"
+            + "abc_rand_def_rad_123.json"
+        )
+
+    @typechecked
+    def setUp(self) -> None:
+        """Runs each test in an empty working directory."""
+        self.original_cwd: str = os.getcwd()
+        # pylint: disable=R1732
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+
+    @typechecked
+    def tearDown(self) -> None:
+        """Restores the original working directory."""
+        os.chdir(self.original_cwd)
+        self.tmp_dir.cleanup()
+
+    @typechecked
+    def test_stage_index_and_hashes_from_filepath(self) -> None:
+        """Verifies the stage and hashes are parsed from the filepath."""
+        self.assertEqual(
+            get_stage_index_and_hashes(filepath=self.stage_2_filepath),
+            (2, "abc", "def", "123"),
+        )
+        self.assertEqual(
+            get_stage_index_and_hashes(
+                filepath="results/stage1/input_graphs/3/abc.json"
+            ),
+            (1, "abc", None, None),
+        )
+
+    @typechecked
+    def test_index_artifacts_and_completed_stages(self) -> None:
+        """Verifies indexed files and completed stages are found, and that
+        other files and stages are not."""
+        self.assertFalse(is_indexed_artifact(filepath=self.stage_2_filepath))
+        index_artifact(filepath=self.stage_2_filepath, unique_id="some_id")
+        self.assertTrue(is_indexed_artifact(filepath=self.stage_2_filepath))
+        self.assertFalse(
+            is_indexed_artifact(filepath="results/stage4/other.json")
+        )
+
+        index_completed_stage(unique_id="some_id", stage_index=4)
+        self.assertTrue(
+            has_indexed_completed_stage(unique_id="some_id", stage_index=4)
+        )
+        self.assertFalse(
+            has_indexed_completed_stage(unique_id="some_id", stage_index=1)
+        )
+        self.assertEqual(
+            get_indexed_completed_unique_ids(stage_index=4), {"some_id"}
+        )
+
+    @typechecked
+    def test_has_artifact_answers_from_index(self) -> None:
+        """Verifies the filesystem decides if there is no results index, that
+        files that are not indexed have not been outputted otherwise, and
+        that deleted files are removed from the results index."""
+        os.makedirs(os.path.dirname(self.stage_2_filepath), exist_ok=True)
+        with open(self.stage_2_filepath, "w", encoding="utf-8") as some_file:
+            some_file.write("{}")
+        self.assertFalse(results_index_exists())
+        self.assertTrue(has_artifact(filepath=self.stage_2_filepath))
+
+        # A new results index contains the files that already exist.
+        index_completed_stage(unique_id="some_id", stage_index=4)
+        self.assertTrue(is_indexed_artifact(filepath=self.stage_2_filepath))
+
+        # Files that are copied afterwards are found once the index is
+        # rebuilt, deleted files are removed from the index when looked up.
+        stage_4_filepath: str = "results/stage4/some_hash.json"
+        os.makedirs(os.path.dirname(stage_4_filepath), exist_ok=True)
+        with open(stage_4_filepath, "w", encoding="utf-8") as some_file:
+            some_file.write("{}")
+        os.remove(self.stage_2_filepath)
+        self.assertFalse(has_artifact(filepath=self.stage_2_filepath))
+        self.assertFalse(is_indexed_artifact(filepath=self.stage_2_filepath))
+        self.assertFalse(has_artifact(filepath=stage_4_filepath))
+
+        clear_results_index()
+        index_artifacts_in_results_dir()
+        self.assertTrue(has_artifact(filepath=stage_4_filepath))
+
+    @typechecked
+    def test_completed_stage_with_deleted_file_is_run_again(self) -> None:
+        """Verifies a completed stage is only reported while the files its
+        run_config outputted in that stage exist, and that it is removed
+        from the results index once one of those files is deleted."""
+        run_config_filepath: str = "results/stage1/run_configs/some_id.json"
+        os.makedirs(os.path.dirname(run_config_filepath), exist_ok=True)
+        with open(run_config_filepath, "w", encoding="utf-8") as some_file:
+            some_file.write("{}")
+        index_artifact(filepath=run_config_filepath, unique_id="some_id")
+        index_completed_stage(unique_id="some_id", stage_index=1)
+        self.assertTrue(
+            has_confirmed_completed_stage(unique_id="some_id", stage_index=1)
+        )
+
+        os.remove(run_config_filepath)
+        self.assertFalse(
+            has_confirmed_completed_stage(unique_id="some_id", stage_index=1)
+        )
+        # Stage 1 is checked on its files, and thus run, again.
+        self.assertFalse(
+            has_indexed_completed_stage(unique_id="some_id", stage_index=1)
+        )
+        self.assertFalse(is_indexed_artifact(filepath=run_config_filepath))
+
+    @typechecked
+    def test_index_existing_results_dir(self) -> None:
+        """Verifies the files in an existing results directory are indexed."""
+        run_config_filepath: str = "results/stage1/run_configs/some_id.json"
+        for filepath in [self.stage_2_filepath, run_config_filepath]:
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            with open(filepath, "w", encoding="utf-8") as some_file:
+                some_file.write("{}")
+        clear_results_index()
+
+        # The results index itself is not in a stage directory.
+        self.assertEqual(index_artifacts_in_results_dir(), 2)
+        self.assertTrue(is_indexed_artifact(filepath=self.stage_2_filepath))
+        self.assertTrue(is_indexed_artifact(filepath=run_config_filepath))
+
+    @typechecked
+    def test_bulk_read_stage_4_results(self) -> None:
+        """Verifies the stage 4 results of multiple run_configs are returned
+        per unique_id and graph name, and unknown unique_ids are omitted."""
+        results_per_graph = {
+            "snn_algo_graph": {"passed": True},
+            "rad_snn_algo_graph": {"passed": False},
+        }
+        for unique_id in ["first_id", "second_id"]:
+            index_stage_4_results(
+                unique_id=unique_id, results_per_graph=results_per_graph
+            )
+        self.assertEqual(
+            get_indexed_stage_4_results(
+                unique_ids=["first_id", "second_id", "unknown_id"]
+            ),
+            {
+                "first_id": results_per_graph,
+                "second_id": results_per_graph,
+            },
+        )
+
+    @typechecked
+    def test_merge_results_index_of_shard(self) -> None:
+        """Verifies the completed stage 4 and files of the results index of
+        another shard are added to the results index, and that the merged
+        files are only found once they are copied."""
+        index_completed_stage(unique_id="first_id", stage_index=1)
+        index_completed_stage(unique_id="first_id", stage_index=4)
+        index_artifact(filepath=self.stage_2_filepath, unique_id="first_id")
+        shard_filepath: str = "shard_results_index.sqlite"
+        shutil.copyfile("results/results_index.sqlite", shard_filepath)
+        clear_results_index()
+        index_completed_stage(unique_id="second_id", stage_index=4)
+
+        merge_results_index(filepath=shard_filepath)
+        self.assertEqual(
+            get_indexed_completed_unique_ids(stage_index=4),
+            {"first_id", "second_id"},
+        )
+        self.assertFalse(
+            has_indexed_completed_stage(unique_id="first_id", stage_index=1)
+        )
+        self.assertTrue(is_indexed_artifact(filepath=self.stage_2_filepath))
+        self.assertFalse(has_artifact(filepath=self.stage_2_filepath))
+
+    @typechecked
+    def test_index_hashes(self) -> None:
+        """Verifies hashes are only stored if there is a results index, are
+        looked up per hash name and input digest, and are removed when the
+        index is cleared."""
+        index_hash(hash_name="some_hash", input_digest="abc", hash_value="1")
+        self.assertFalse(results_index_exists())
+        self.assertIsNone(
+            get_indexed_hash(hash_name="some_hash", input_digest="abc")
+        )
+
+        index_completed_stage(unique_id="first_id", stage_index=1)
+        index_hash(hash_name="some_hash", input_digest="abc", hash_value="1")
+        self.assertEqual(
+            get_indexed_hash(hash_name="some_hash", input_digest="abc"), "1"
+        )
+        self.assertIsNone(
+            get_indexed_hash(hash_name="other_hash", input_digest="abc")
+        )
+        self.assertIsNone(
+            get_indexed_hash(hash_name="some_hash", input_digest="def")
+        )
+        clear_results_index()
+        self.assertIsNone(
+            get_indexed_hash(hash_name="some_hash", input_digest="abc")
+        )
@@ -0,0 +1,62 @@
+"""Verifies the stage 4 results table is loaded back from its Parquet file
+as it was outputted."""
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+from typeguard import typechecked
+
+from snncompare.export_results.analysis import results_table
+from snncompare.export_results.analysis.results_table import (
+    load_stage_4_results_table,
+    output_stage_4_results_table,
+)
+
+
+class Test_results_table(unittest.TestCase):
+    """Tests whether the stage 4 results table survives the Parquet
+    output."""
+
+    @typechecked
+    def test_results_table_round_trip(self) -> None:
+        """Verifies the flat columns are loaded back as they were, and the
+        nested stage 4 results as json strings."""
+        table: pd.DataFrame = pd.DataFrame(
+            [
+                {
+                    "unique_id": "some_id",
+                    "seed": 7,
+                    "graph_name": graph_name,
+                    "passed": passed,
+                    "MDSA": {"counter_0": 1, "counter_1": 0},
+                }
+                for graph_name, passed in [
+                    ("snn_algo_graph", True),
+                    ("rad_snn_algo_graph", False),
+                ]
+            ]
+        )
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath: str = os.path.join(
+                tmp_dir, "results", "stage4_results_table.parquet"
+            )
+            with patch.object(
+                results_table,
+                "get_stage_4_results_table",
+                return_value=table,
+            ):
+                output_stage_4_results_table(run_configs=[], filepath=filepath)
+            loaded_table: pd.DataFrame = load_stage_4_results_table(
+                filepath=filepath
+            )
+
+        pd.testing.assert_frame_equal(
+            loaded_table.drop(columns="MDSA"), table.drop(columns="MDSA")
+        )
+        self.assertEqual(
+            [json.loads(value) for value in loaded_table["MDSA"]],
+            table["MDSA"].tolist(),
+        )
@@ -0,0 +1,179 @@
+"""Verifies the input graph catalogue numbers the input graphs stably, and
+only reads the input graph directory and files once."""
+import json
+import os
+import tempfile
+import threading
+import unittest
+from typing import List
+from unittest import mock
+
+import networkx as nx
+from networkx.readwrite import json_graph
+from typeguard import typechecked
+
+from snncompare.export_results.atomic_storage import exclusive_lock
+from snncompare.graph_generation import input_graph_catalogue
+from snncompare.graph_generation.input_graph_catalogue import (
+    clear_input_graph_catalogue,
+    get_input_graph_hashes,
+    get_input_graph_nr,
+    get_manifest_filepath,
+    has_input_graph,
+    load_input_graph,
+    output_manifest,
+    register_input_graph,
+)
+
+
+class Test_input_graph_catalogue(unittest.TestCase):
+    """Tests the catalogue in a temporary working directory."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.graph_size: int = 4
+        self.input_graph_dir: str = (
+            f"results/stage1/input_graphs/{self.graph_size}"
+        )
+
+    @typechecked
+    def setUp(self) -> None:
+        """Runs each test in an empty working directory."""
+        self.original_cwd: str = os.getcwd()
+        # pylint: disable=R1732
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+        clear_input_graph_catalogue()
+        for isomorphic_hash, some_graph in [
+            ("b", nx.path_graph(self.graph_size)),
+            ("a", nx.star_graph(self.graph_size - 1)),
+        ]:
+            self.output_input_graph(
+                isomorphic_hash=isomorphic_hash, some_graph=some_graph
+            )
+
+    @typechecked
+    def tearDown(self) -> None:
+        """Restores the original working directory."""
+        os.chdir(self.original_cwd)
+        self.tmp_dir.cleanup()
+        clear_input_graph_catalogue()
+
+    @typechecked
+    def output_input_graph(
+        self, *, isomorphic_hash: str, some_graph: nx.Graph
+    ) -> None:
+        """Writes an input graph like the input graph generation does."""
+        os.makedirs(self.input_graph_dir, exist_ok=True)
+        with open(
+            f"{self.input_graph_dir}/{isomorphic_hash}.json",
+            "w",
+            encoding="utf-8",
+        ) as json_file:
+            json.dump(json_graph.node_link_data(some_graph), json_file)
+
+    @typechecked
+    def test_graph_nrs_are_stable(self) -> None:
+        """Verifies the input graphs of an existing directory are numbered in
+        the order of os.listdir, like earlier versions did, and that an input
+        graph that is added later gets the next graph nr, also after the
+        manifest is reloaded."""
+        legacy_hashes: List[str] = [
+            filename[: -len(".json")]
+            for filename in os.listdir(self.input_graph_dir)
+        ]
+        for graph_nr, isomorphic_hash in enumerate(legacy_hashes):
+            self.assertEqual(
+                get_input_graph_nr(
+                    graph_size=self.graph_size, isomorphic_hash=isomorphic_hash
+                ),
+                graph_nr,
+            )
+        self.assertTrue(
+            nx.is_isomorphic(
+                load_input_graph(
+                    graph_size=self.graph_size,
+                    graph_nr=legacy_hashes.index("b"),
+                ),
+                nx.path_graph(self.graph_size),
+            )
+        )
+        self.assertFalse(
+            has_input_graph(graph_size=self.graph_size, graph_nr=2)
+        )
+
+        self.output_input_graph(
+            isomorphic_hash="0", some_graph=nx.cycle_graph(self.graph_size)
+        )
+        register_input_graph(graph_size=self.graph_size, isomorphic_hash="0")
+        clear_input_graph_catalogue()
+        for graph_nr, isomorphic_hash in enumerate(legacy_hashes + ["0"]):
+            self.assertEqual(
+                get_input_graph_nr(
+                    graph_size=self.graph_size, isomorphic_hash=isomorphic_hash
+                ),
+                graph_nr,
+            )
+
+    @typechecked
+    def test_waits_for_manifest_of_other_process(self) -> None:
+        """Verifies the manifest is updated after another process released
+        the manifest lock, and that the graph nrs that other process wrote
+        to the manifest are kept."""
+        legacy_hashes: List[str] = get_input_graph_hashes(
+            graph_size=self.graph_size
+        )
+        self.output_input_graph(
+            isomorphic_hash="0", some_graph=nx.cycle_graph(self.graph_size)
+        )
+        updated_hashes: List[List[str]] = []
+        with open(
+            f"{get_manifest_filepath(graph_size=self.graph_size)}.lock",
+            "a",
+            encoding="utf-8",
+        ) as lock_file, exclusive_lock(some_file=lock_file):
+            updater = threading.Thread(
+                target=lambda: updated_hashes.append(
+                    get_input_graph_hashes(
+                        graph_size=self.graph_size, refresh=True
+                    )
+                )
+            )
+            updater.start()
+            updater.join(timeout=0.2)
+            self.assertTrue(updater.is_alive())
+
+            # The other process adds an input graph to the manifest.
+            self.output_input_graph(
+                isomorphic_hash="c", some_graph=nx.star_graph(2)
+            )
+            output_manifest(
+                graph_size=self.graph_size, hashes=legacy_hashes + ["c"]
+            )
+        updater.join()
+        self.assertEqual(updated_hashes, [legacy_hashes + ["c", "0"]])
+
+    @typechecked
+    def test_warm_lookups_do_not_read_files(self) -> None:
+        """Verifies the directory is listed and the input graph is parsed
+        once, and that the returned input graphs are copies."""
+        input_graph: nx.Graph = load_input_graph(
+            graph_size=self.graph_size, graph_nr=0
+        )
+        input_graph.graph["alg_props"] = {}
+        with mock.patch.object(
+            input_graph_catalogue.os, "listdir"
+        ) as listdir, mock.patch("builtins.open", side_effect=AssertionError):
+            for _ in range(3):
+                self.assertTrue(
+                    has_input_graph(graph_size=self.graph_size, graph_nr=1)
+                )
+                self.assertNotIn(
+                    "alg_props",
+                    load_input_graph(
+                        graph_size=self.graph_size, graph_nr=0
+                    ).graph,
+                )
+            listdir.assert_not_called()
@@ -0,0 +1,118 @@
+"""Verifies the memoised isomorphic graph hash equals the Weisfeiler-Lehman
+hash, also after the graph is mutated, and when it is read from the results
+index."""
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import networkx as nx
+from typeguard import typechecked
+
+from snncompare.import_results.helper import (
+    get_cached_isomorphic_graph_hash,
+    get_isomorphic_graph_hash,
+)
+from snncompare.import_results.results_index import (
+    clear_results_index,
+    index_completed_stage,
+)
+
+
+class Test_isomorphic_graph_hash(unittest.TestCase):
+    """Tests whether the memoised get_isomorphic_graph_hash returns the hash
+    of the current shape of the graph."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+
+    @typechecked
+    def test_hash_equals_weisfeiler_lehman_hash(self) -> None:
+        """Verifies the memoised hash equals the uncached hash for directed
+        and undirected graphs, also on repeated calls."""
+        for directed in [False, True]:
+            for seed in range(10):
+                some_graph = nx.gnp_random_graph(
+                    8, 0.3, seed=seed, directed=directed
+                )
+                for _ in range(2):
+                    self.assertEqual(
+                        get_isomorphic_graph_hash(some_graph=some_graph),
+                        nx.weisfeiler_lehman_graph_hash(some_graph),
+                    )
+
+    @typechecked
+    def test_hash_changes_after_mutation(self) -> None:
+        """Verifies a graph is hashed again after an edge is added."""
+        some_graph = nx.path_graph(4)
+        path_hash: str = get_isomorphic_graph_hash(some_graph=some_graph)
+        some_graph.add_edge(0, 3)
+        self.assertNotEqual(
+            get_isomorphic_graph_hash(some_graph=some_graph), path_hash
+        )
+        self.assertEqual(
+            get_isomorphic_graph_hash(some_graph=some_graph),
+            nx.weisfeiler_lehman_graph_hash(some_graph),
+        )
+
+    @typechecked
+    def test_hash_is_read_from_results_index(self) -> None:
+        """Verifies a hash that is stored in the results index is not
+        recomputed by a process without the memoised hash, that another graph
+        is still hashed, and that clearing the index removes the hash."""
+        original_cwd: str = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.chdir(tmp_dir)
+            try:
+                index_completed_stage(unique_id="some_id", stage_index=1)
+                some_graph = nx.cycle_graph(5)
+                cycle_hash: str = get_isomorphic_graph_hash(
+                    some_graph=some_graph
+                )
+
+                # Forget the memoised hashes, as in a new process.
+                get_cached_isomorphic_graph_hash.cache_clear()
+                with patch(
+                    "networkx.algorithms.graph_hashing."
+                    + "weisfeiler_lehman_graph_hash",
+                    side_effect=AssertionError("Hash was recomputed."),
+                ):
+                    self.assertEqual(
+                        get_isomorphic_graph_hash(some_graph=some_graph),
+                        cycle_hash,
+                    )
+                    # The edge order of the undirected graph does not matter.
+                    self.assertEqual(
+                        get_isomorphic_graph_hash(
+                            some_graph=nx.Graph(
+                                [(1, 0), (2, 1), (3, 2), (4, 3), (0, 4)]
+                            )
+                        ),
+                        cycle_hash,
+                    )
+
+                # A mutated graph is not found in the index.
+                some_graph.add_edge(0, 2)
+                self.assertEqual(
+                    get_isomorphic_graph_hash(some_graph=some_graph),
+                    nx.weisfeiler_lehman_graph_hash(some_graph),
+                )
+
+                clear_results_index()
+                get_cached_isomorphic_graph_hash.cache_clear()
+                with patch(
+                    "networkx.algorithms.graph_hashing."
+                    + "weisfeiler_lehman_graph_hash",
+                    return_value="recomputed",
+                ):
+                    self.assertEqual(
+                        get_isomorphic_graph_hash(
+                            some_graph=nx.cycle_graph(5)
+                        ),
+                        "recomputed",
+                    )
+            finally:
+                get_cached_isomorphic_graph_hash.cache_clear()
+                os.chdir(original_cwd)
@@ -0,0 +1,157 @@
+"""Verifies the vectorised failure mode extraction returns the same neurons
+per timestep as comparing each neuron at each timestep."""
+import unittest
+from typing import Dict, List, Tuple
+
+import numpy as np
+from typeguard import typechecked
+
+from snncompare.process_results.get_failure_modes import (
+    get_failure_modes_from_arrays,
+)
+
+
+@typechecked
+def get_failure_modes_per_neuron_and_timestep(
+    *,
+    neuron_names: List[str],
+    unradiated_spikes: np.ndarray,
+    radiated_spikes: np.ndarray,
+    unradiated_I: np.ndarray,
+    radiated_I: np.ndarray,
+) -> Tuple[
+    Dict[int, List[str]],
+    Dict[int, List[str]],
+    Dict[int, List[str]],
+    Dict[int, List[str]],
+]:
+    """Returns the failure modes by looping over every neuron and timestep."""
+    failure_modes: Tuple[
+        Dict[int, List[str]],
+        Dict[int, List[str]],
+        Dict[int, List[str]],
+        Dict[int, List[str]],
+    ] = ({}, {}, {}, {})
+    for neuron_index, neuron_name in enumerate(neuron_names):
+        for t in range(min(len(unradiated_spikes), len(radiated_spikes))):
+            if (
+                unradiated_spikes[t][neuron_index]
+                != radiated_spikes[t][neuron_index]
+            ):
+                if unradiated_spikes[t][neuron_index]:
+                    failure_modes[1].setdefault(t, []).append(neuron_name)
+                else:
+                    failure_modes[0].setdefault(t, []).append(neuron_name)
+        for t in range(min(len(unradiated_I), len(radiated_I))):
+            if unradiated_I[t][neuron_index] < radiated_I[t][neuron_index]:
+                failure_modes[2].setdefault(t, []).append(neuron_name)
+            elif unradiated_I[t][neuron_index] > radiated_I[t][neuron_index]:
+                failure_modes[3].setdefault(t, []).append(neuron_name)
+    for failures in failure_modes:
+        for neuron_names_at_t in failures.values():
+            neuron_names_at_t.sort()
+    return failure_modes
+
+
+class Test_failure_modes(unittest.TestCase):
+    """Tests whether get_failure_modes_from_arrays matches a per neuron and
+    per timestep comparison."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.neuron_names: List[str] = [f"n_{i}" for i in range(9, -1, -1)]
+
+    @typechecked
+    def test_matches_per_neuron_comparison(self) -> None:
+        """Compares random spike and current arrays in which the radiated SNN
+        ran for fewer timesteps than the unradiated SNN."""
+        rng = np.random.default_rng(seed=7)
+        nr_of_neurons: int = len(self.neuron_names)
+        unradiated_spikes: np.ndarray = rng.random((12, nr_of_neurons)) > 0.5
+        radiated_spikes: np.ndarray = rng.random((10, nr_of_neurons)) > 0.5
+        # Use integer currents such that equal currents occur.
+        unradiated_I: np.ndarray = rng.integers(0, 3, (12, nr_of_neurons))
+        radiated_I: np.ndarray = rng.integers(0, 3, (10, nr_of_neurons))
+
+        kwargs = {
+            "neuron_names": self.neuron_names,
+            "unradiated_spikes": unradiated_spikes,
+            "radiated_spikes": radiated_spikes,
+            "unradiated_I": unradiated_I.astype(float),
+            "radiated_I": radiated_I.astype(float),
+        }
+        self.assertEqual(
+            get_failure_modes_from_arrays(**kwargs),
+            get_failure_modes_per_neuron_and_timestep(**kwargs),
+        )
+
+    @typechecked
+    def test_identical_behaviour_has_no_failures(self) -> None:
+        """Verifies no failures are found if both SNNs behave the same."""
+        spikes: np.ndarray = np.eye(len(self.neuron_names), dtype=bool)
+        currents: np.ndarray = np.ones((len(self.neuron_names),) * 2)
+        self.assertEqual(
+            get_failure_modes_from_arrays(
+                neuron_names=self.neuron_names,
+                unradiated_spikes=spikes,
+                radiated_spikes=spikes.copy(),
+                unradiated_I=currents,
+                radiated_I=currents.copy(),
+            ),
+            ({}, {}, {}, {}),
+        )
+
+    @typechecked
+    def test_rejects_arrays_of_other_neurons(self) -> None:
+        """Verifies the arrays must have a column per neuron name."""
+        spikes: np.ndarray = np.zeros((3, len(self.neuron_names) + 1), bool)
+        currents: np.ndarray = np.zeros(spikes.shape)
+        with self.assertRaises(ValueError):
+            get_failure_modes_from_arrays(
+                neuron_names=self.neuron_names,
+                unradiated_spikes=spikes,
+                radiated_spikes=spikes,
+                unradiated_I=currents,
+                radiated_I=currents,
+            )
+
+    @typechecked
+    def test_stored_currents_equal_simulated_currents(self) -> None:
+        """Verifies the currents of an SNN that are loaded from a binary stage
+        2 file, do not differ from the same currents that are simulated."""
+        spikes: np.ndarray = np.zeros((3, len(self.neuron_names)), bool)
+        simulated_I: np.ndarray = np.random.default_rng(seed=7).random(
+            spikes.shape
+        )
+        self.assertEqual(
+            get_failure_modes_from_arrays(
+                neuron_names=self.neuron_names,
+                unradiated_spikes=spikes,
+                radiated_spikes=spikes,
+                unradiated_I=simulated_I,
+                radiated_I=simulated_I.astype(np.float32),
+            ),
+            ({}, {}, {}, {}),
+        )
+
+    @typechecked
+    def test_simulated_currents_are_compared_in_their_dtype(self) -> None:
+        """Verifies a difference between two simulated currents that is
+        smaller than the precision of a binary stage 2 file, is a failure
+        mode."""
+        spikes: np.ndarray = np.zeros((1, len(self.neuron_names)), bool)
+        unradiated_I: np.ndarray = np.ones(spikes.shape)
+        radiated_I: np.ndarray = unradiated_I.copy()
+        radiated_I[0, 0] += 1e-12
+        self.assertEqual(
+            get_failure_modes_from_arrays(
+                neuron_names=self.neuron_names,
+                unradiated_spikes=spikes,
+                radiated_spikes=spikes,
+                unradiated_I=unradiated_I,
+                radiated_I=radiated_I,
+            ),
+            ({}, {}, {0: [self.neuron_names[0]]}, {}),
+        )
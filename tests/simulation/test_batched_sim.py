@@ -0,0 +1,227 @@
+"""Verifies simulating a batch of radiated snns gives the same recordings as
+simulating each snn separately."""
+import copy
+import unittest
+from typing import List, Optional
+
+import networkx as nx
+import numpy as np
+from simsnn.core.networks import Network
+from simsnn.core.simulators import Simulator
+from typeguard import typechecked
+
+from snncompare.create_configs import Run_config_space
+from snncompare.helper import add_stage_completion_to_graph
+from snncompare.json_configurations.algo_test import load_exp_config_from_file
+from snncompare.optional_config.Output_config import (
+    Early_stop_policy,
+    Extra_storing_config,
+    Output_config,
+    Zoom,
+)
+from snncompare.run_config.Run_config import Run_config
+from snncompare.simulation.batched_sim import run_snns_in_batch
+from snncompare.simulation.stage2_sim import sim_deferred_rad_snns, sim_snn
+
+
+class Test_batched_sim(unittest.TestCase):
+    """Tests the batched simulation on copies of a random network with
+    perturbed synapse weights and neuron thresholds."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.rng = np.random.default_rng(7)
+        self.nr_of_neurons: int = 12
+        self.sim_duration: int = 50
+
+    @typechecked
+    def get_snn(self) -> Simulator:
+        """Returns a random recurrent network, with all neurons in the raster
+        and the first 5 neurons in the multimeter."""
+        net = Network()
+        neurons = [
+            net.createLIF(
+                ID=neuron_nr,
+                m=float(self.rng.uniform(0.5, 1)),
+                V_init=float(self.rng.uniform(0, 1)),
+                V_min=-1,
+                thr=float(self.rng.uniform(0.5, 1.5)),
+                I_e=float(self.rng.uniform(0, 0.4)),
+            )
+            for neuron_nr in range(self.nr_of_neurons)
+        ]
+        for pre in range(self.nr_of_neurons):
+            for post in range(self.nr_of_neurons):
+                if self.rng.random() < 0.3:
+                    net.createSynapse(
+                        pre=neurons[pre],
+                        post=neurons[post],
+                        ID=(pre, post),
+                        w=float(self.rng.normal()),
+                        d=1,
+                    )
+        snn = Simulator(net)
+        snn.raster.addTarget(neurons)
+        snn.multimeter.addTarget(neurons[:5])
+        return snn
+
+    @typechecked
+    def test_batch_equals_separate_simulations(self) -> None:
+        """Verifies the spikes and V of each snn in the batch are identical to
+        those of the snn simulated on its own."""
+        snn: Simulator = self.get_snn()
+        batched_snns: List[Simulator] = []
+        for _ in range(5):
+            radiated_snn: Simulator = copy.deepcopy(snn)
+            for synapse in radiated_snn.network.synapses:
+                synapse.w *= float(self.rng.uniform(0.8, 1.5))
+            radiated_snn.network.nodes[0].thr = float(self.rng.uniform(0, 2))
+            batched_snns.append(radiated_snn)
+        separate_snns: List[Simulator] = copy.deepcopy(batched_snns)
+
+        run_snns_in_batch(snns=batched_snns, sim_duration=self.sim_duration)
+        for separate_snn, batched_snn in zip(separate_snns, batched_snns):
+            separate_snn.run(self.sim_duration)
+            self.assertTrue(separate_snn.raster.spikes.any())
+            np.testing.assert_array_equal(
+                batched_snn.raster.spikes, separate_snn.raster.spikes
+            )
+            np.testing.assert_array_equal(
+                batched_snn.multimeter.V, separate_snn.multimeter.V
+            )
+            self.assertEqual(
+                batched_snn.network.graph.graph["actual_duration"],
+                self.sim_duration,
+            )
+
+    @typechecked
+    def test_different_topologies_are_rejected(self) -> None:
+        """Verifies snns with different synapses can not be batched."""
+        snn: Simulator = self.get_snn()
+        other_snn: Simulator = copy.deepcopy(snn)
+        other_snn.network.synapses.pop()
+        with self.assertRaises(ValueError):
+            run_snns_in_batch(
+                snns=[snn, other_snn], sim_duration=self.sim_duration
+            )
+
+    @typechecked
+    def get_output_config(
+        self, *, early_stop_policy: Optional[Early_stop_policy]
+    ) -> Output_config:
+        """Returns the output config of a run of stages 1, 2 and 4 with the
+        early stop policy."""
+        return Output_config(
+            recreate_stages=[],
+            export_types=[],
+            zoom=Zoom(
+                create_zoomed_image=False, left_right=None, bottom_top=None
+            ),
+            output_json_stages=[1, 2, 4],
+            extra_storing_config=Extra_storing_config(
+                count_spikes=False,
+                count_neurons=False,
+                count_synapses=False,
+                skip_stage_2_output=False,
+                show_images=False,
+                store_died_neurons=False,
+                export_failure_modes=False,
+                show_failure_modes=False,
+            ),
+            early_stop_policy=early_stop_policy,
+            batch_radiation=True,
+        )
+
+    @typechecked
+    def get_radiated_chain_snns(self) -> List[Simulator]:
+        """Returns copies of a chain of neurons in which the first neuron
+        spikes once, with another synapse cut per copy, such that the copies
+        become quiescent at different timesteps."""
+        net = Network()
+        chain = [
+            net.createLIF(
+                ID=neuron_nr,
+                m=1,
+                V_init=int(neuron_nr == 0),
+                V_reset=0,
+                thr=0.5,
+                name=f"chain_{neuron_nr}",
+            )
+            for neuron_nr in range(6)
+        ]
+        for neuron_nr in range(5):
+            net.createSynapse(
+                pre=chain[neuron_nr],
+                post=chain[neuron_nr + 1],
+                ID=(neuron_nr, neuron_nr + 1),
+                w=1,
+                d=1,
+            )
+        snn = Simulator(net, monitor_I=True)
+        snn.raster.addTarget(chain)
+        snn.multimeter.addTarget(chain)
+        add_stage_completion_to_graph(snn=snn, stage_index=1)
+
+        radiated_snns: List[Simulator] = []
+        for synapse_nr in range(5):
+            radiated_snn: Simulator = copy.deepcopy(snn)
+            radiated_snn.network.synapses[synapse_nr].w = 0
+            radiated_snns.append(radiated_snn)
+        return radiated_snns
+
+    @typechecked
+    def test_batched_stage_2_equals_unbatched(self) -> None:
+        """Verifies the radiated snns that are simulated in a batch in stage 2
+        have the same spikes, V, I and actual_duration as the radiated snns
+        that are simulated one by one, with and without early stopping."""
+        run_config: Run_config = Run_config_space(
+            exp_config=load_exp_config_from_file(
+                custom_config_path="src/snncompare/json_configurations/",
+                filename="minimal_results",
+            )
+        )[0]
+        input_graph: nx.Graph = nx.path_graph(3)
+        for early_stop_policy in [
+            None,
+            Early_stop_policy(
+                predicate="quiescent", check_interval=1, quiescent_duration=2
+            ),
+        ]:
+            batched_snns: List[Simulator] = self.get_radiated_chain_snns()
+            separate_snns: List[Simulator] = copy.deepcopy(batched_snns)
+            sim_deferred_rad_snns(
+                input_graph=input_graph,
+                output_config=self.get_output_config(
+                    early_stop_policy=early_stop_policy
+                ),
+                deferred_rad_snns={
+                    "rad_snn_algo_graph": [
+                        (run_config, snn) for snn in batched_snns
+                    ]
+                },
+            )
+            actual_durations: List[int] = []
+            for separate_snn, batched_snn in zip(separate_snns, batched_snns):
+                sim_snn(
+                    input_graph=input_graph,
+                    snn=separate_snn,
+                    run_config=run_config,
+                    early_stop_policy=early_stop_policy,
+                )
+                actual_durations.append(len(separate_snn.raster.spikes))
+                self.assertEqual(
+                    batched_snn.network.graph.graph["actual_duration"],
+                    actual_durations[-1],
+                )
+                np.testing.assert_array_equal(
+                    batched_snn.raster.spikes, separate_snn.raster.spikes
+                )
+                for recording_name in ["V", "I"]:
+                    np.testing.assert_array_equal(
+                        getattr(batched_snn.multimeter, recording_name),
+                        getattr(separate_snn.multimeter, recording_name),
+                    )
+            if early_stop_policy is not None:
+                self.assertEqual(actual_durations, [3, 4, 5, 6, 7])
@@ -0,0 +1,75 @@
+"""Verifies a cloned simsnn snn can be radiated and simulated without
+modifying the original snn, and behaves like a deep copy."""
+import copy
+import unittest
+
+import numpy as np
+from simsnn.core.networks import Network
+from simsnn.core.simulators import Simulator
+from typeguard import typechecked
+
+from snncompare.simulation.clone_snn import clone_simsnn
+
+
+class Test_clone_snn(unittest.TestCase):
+    """Tests the clone of a small recurrent network."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.sim_duration: int = 20
+
+    @typechecked
+    def get_snn(self) -> Simulator:
+        """Returns a network of two neurons that excite each other."""
+        net = Network()
+        first = net.createLIF(ID=0, V_init=1, thr=0.5)
+        second = net.createLIF(ID=1, thr=0.5)
+        net.createSynapse(pre=first, post=second, ID=(0, 1), w=1, d=1)
+        net.createSynapse(pre=second, post=first, ID=(1, 0), w=1, d=1)
+        net.graph.graph["completed_stages"] = [1]
+        snn = Simulator(net)
+        snn.raster.addTarget(net.nodes)
+        snn.multimeter.addTarget(net.nodes)
+        return snn
+
+    @typechecked
+    def test_clone_does_not_modify_original(self) -> None:
+        """Verifies radiating and simulating the clone leaves the original
+        snn unchanged."""
+        snn: Simulator = self.get_snn()
+        snn_clone: Simulator = clone_simsnn(snn=snn)
+        snn_clone.network.synapses[0].w = 0.2
+        snn_clone.network.nodes[1].thr = 999
+        snn_clone.network.graph.graph["completed_stages"].append(2)
+        snn_clone.run(self.sim_duration)
+
+        self.assertEqual(snn.network.synapses[0].w, 1)
+        self.assertEqual(snn.network.nodes[1].thr, 0.5)
+        self.assertEqual(snn.network.nodes[1].V, 0)
+        self.assertEqual(snn.network.graph.graph["completed_stages"], [1])
+        self.assertFalse(hasattr(snn.raster, "spikes"))
+        self.assertIs(
+            snn_clone.network.synapses[0].post, snn_clone.network.nodes[1]
+        )
+        self.assertEqual(
+            list(snn_clone.network.graph.edges),
+            list(snn.network.graph.edges),
+        )
+
+    @typechecked
+    def test_clone_simulates_like_deep_copy(self) -> None:
+        """Verifies the clone and a deep copy record the same behaviour."""
+        snn: Simulator = self.get_snn()
+        snn_clone: Simulator = clone_simsnn(snn=snn)
+        snn_copy: Simulator = copy.deepcopy(snn)
+        snn_clone.run(self.sim_duration)
+        snn_copy.run(self.sim_duration)
+        self.assertTrue(snn_clone.raster.spikes.any())
+        np.testing.assert_array_equal(
+            snn_clone.raster.spikes, snn_copy.raster.spikes
+        )
+        np.testing.assert_array_equal(
+            snn_clone.multimeter.V, snn_copy.multimeter.V
+        )
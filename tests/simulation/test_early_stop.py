@@ -0,0 +1,180 @@
+"""Verifies the simsnn simulation stops once the early stop predicate holds,
+and that the recordings and actual_duration match the simulated
+timesteps."""
+import copy
+import unittest
+from typing import List
+
+import numpy as np
+from simsnn.core.networks import Network
+from simsnn.core.simulators import Simulator
+from typeguard import typechecked
+
+from snncompare.create_configs import Run_config_space
+from snncompare.json_configurations.algo_test import load_exp_config_from_file
+from snncompare.optional_config.Output_config import Early_stop_policy
+from snncompare.run_config.Run_config import Run_config
+from snncompare.simulation.batched_sim import run_snns_in_batch
+from snncompare.simulation.early_stop import run_snn_on_simsnn_with_early_stop
+
+
+class Test_early_stop(unittest.TestCase):
+    """Tests the early stop predicates on a network in which a spike once
+    neuron makes the terminator neuron spike at t=2."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.run_config: Run_config = Run_config_space(
+            exp_config=load_exp_config_from_file(
+                custom_config_path="src/snncompare/json_configurations/",
+                filename="minimal_results",
+            )
+        )[0]
+        self.sim_duration: int = 20
+
+    @typechecked
+    def get_snn(self) -> Simulator:
+        """Returns the simsnn Simulator of the network, with both neurons in
+        the raster."""
+        net = Network()
+        spike_once = net.createLIF(
+            ID=0, m=1, V_init=1, V_reset=0, thr=0.5, name="spike_once_0"
+        )
+        terminator = net.createLIF(
+            ID=1, m=1, V_reset=0, thr=0.5, name="terminator_node"
+        )
+        net.createSynapse(pre=spike_once, post=terminator, ID=(0, 1), w=1, d=1)
+        snn = Simulator(net, monitor_I=False)
+        snn.raster.addTarget([spike_once, terminator])
+        return snn
+
+    @typechecked
+    def test_terminator_stops_at_next_check(self) -> None:
+        """Verifies the simulation stops at the first check after the
+        terminator neuron spiked."""
+        snn: Simulator = self.get_snn()
+        actual_duration: int = run_snn_on_simsnn_with_early_stop(
+            early_stop_policy=Early_stop_policy(
+                predicate="terminator", check_interval=3
+            ),
+            run_config=self.run_config,
+            snn=snn,
+            sim_duration=self.sim_duration,
+        )
+        self.assertEqual(actual_duration, 3)
+        self.assertEqual(snn.network.graph.graph["actual_duration"], 3)
+        self.assertEqual(
+            snn.raster.spikes.tolist(),
+            [[True, False], [False, True], [False, False]],
+        )
+
+    @typechecked
+    def test_quiescent_stops_after_quiescent_duration(self) -> None:
+        """Verifies the simulation stops once no neuron spiked for the
+        quiescent duration, and otherwise runs the full duration."""
+        snn: Simulator = self.get_snn()
+        self.assertEqual(
+            run_snn_on_simsnn_with_early_stop(
+                early_stop_policy=Early_stop_policy(
+                    predicate="quiescent",
+                    check_interval=1,
+                    quiescent_duration=2,
+                ),
+                run_config=self.run_config,
+                snn=snn,
+                sim_duration=self.sim_duration,
+            ),
+            4,
+        )
+        self.assertEqual(len(snn.raster.spikes), 4)
+
+        snn = self.get_snn()
+        self.assertEqual(
+            run_snn_on_simsnn_with_early_stop(
+                early_stop_policy=Early_stop_policy(
+                    predicate="quiescent",
+                    quiescent_duration=self.sim_duration,
+                ),
+                run_config=self.run_config,
+                snn=snn,
+                sim_duration=self.sim_duration,
+            ),
+            self.sim_duration,
+        )
+
+    @typechecked
+    def test_batch_stops_each_snn_like_separate_simulation(self) -> None:
+        """Verifies each snn in a batch stops at its own timestep, with the
+        same recordings, neuron states and actual_duration as the snn that is
+        simulated on its own."""
+        net = Network()
+        chain = [
+            net.createLIF(
+                ID=neuron_nr,
+                m=1,
+                V_init=int(neuron_nr == 0),
+                V_reset=0,
+                thr=0.5,
+                name=f"chain_{neuron_nr}",
+            )
+            for neuron_nr in range(6)
+        ]
+        for neuron_nr in range(5):
+            net.createSynapse(
+                pre=chain[neuron_nr],
+                post=chain[neuron_nr + 1],
+                ID=(neuron_nr, neuron_nr + 1),
+                w=1,
+                d=1,
+            )
+        snn = Simulator(net, monitor_I=True)
+        snn.raster.addTarget(chain)
+        snn.multimeter.addTarget(chain)
+
+        # Cutting the chain at another synapse per snn makes the snns become
+        # quiescent at different timesteps.
+        batched_snns: List[Simulator] = []
+        for synapse_nr in range(5):
+            cut_snn: Simulator = copy.deepcopy(snn)
+            cut_snn.network.synapses[synapse_nr].w = 0
+            batched_snns.append(cut_snn)
+        separate_snns: List[Simulator] = copy.deepcopy(batched_snns)
+
+        early_stop_policy = Early_stop_policy(
+            predicate="quiescent", check_interval=1, quiescent_duration=2
+        )
+        run_snns_in_batch(
+            snns=batched_snns,
+            sim_duration=self.sim_duration,
+            early_stop_policy=early_stop_policy,
+            run_config=self.run_config,
+        )
+        actual_durations: List[int] = []
+        for separate_snn, batched_snn in zip(separate_snns, batched_snns):
+            actual_durations.append(
+                run_snn_on_simsnn_with_early_stop(
+                    early_stop_policy=early_stop_policy,
+                    run_config=self.run_config,
+                    snn=separate_snn,
+                    sim_duration=self.sim_duration,
+                )
+            )
+            self.assertEqual(
+                batched_snn.network.graph.graph["actual_duration"],
+                actual_durations[-1],
+            )
+            for recording_name in ["V", "I"]:
+                np.testing.assert_array_equal(
+                    getattr(batched_snn.multimeter, recording_name),
+                    getattr(separate_snn.multimeter, recording_name),
+                )
+            np.testing.assert_array_equal(
+                batched_snn.raster.spikes, separate_snn.raster.spikes
+            )
+            self.assertEqual(
+                [neuron.V for neuron in batched_snn.network.nodes],
+                [neuron.V for neuron in separate_snn.network.nodes],
+            )
+        self.assertEqual(actual_durations, [3, 4, 5, 6, 7])
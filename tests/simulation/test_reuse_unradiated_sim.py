@@ -0,0 +1,87 @@
+"""Verifies a radiated snn that is not changed by its radiation gets the
+simulation results of its unradiated snn, and that a changed radiated snn
+does not."""
+import unittest
+
+import numpy as np
+from simsnn.core.networks import Network
+from simsnn.core.simulators import Simulator
+from typeguard import typechecked
+
+from snncompare.simulation.clone_snn import clone_simsnn
+from snncompare.simulation.reuse_unradiated_sim import (
+    copy_sim_results,
+    is_unaffected_by_radiation,
+)
+
+
+class Test_reuse_unradiated_sim(unittest.TestCase):
+    """Tests the reuse on a small recurrent network."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.sim_duration: int = 20
+
+    @typechecked
+    def get_snn(self) -> Simulator:
+        """Returns a network of two neurons that excite each other."""
+        net = Network()
+        first = net.createLIF(ID=0, V_init=1, thr=0.5)
+        second = net.createLIF(ID=1, thr=0.5)
+        net.createSynapse(pre=first, post=second, ID=(0, 1), w=1, d=1)
+        net.createSynapse(pre=second, post=first, ID=(1, 0), w=1, d=1)
+        snn = Simulator(net)
+        snn.raster.addTarget(net.nodes)
+        snn.multimeter.addTarget(net.nodes)
+        return snn
+
+    @typechecked
+    def test_unaffected_snn_gets_unradiated_results(self) -> None:
+        """Verifies the copied results equal those of simulating the radiated
+        snn."""
+        unradiated_snn: Simulator = self.get_snn()
+        rad_snn: Simulator = clone_simsnn(snn=unradiated_snn)
+        simulated_rad_snn: Simulator = clone_simsnn(snn=unradiated_snn)
+        unradiated_snn.run(self.sim_duration)
+        unradiated_snn.network.graph.graph[
+            "actual_duration"
+        ] = self.sim_duration
+        simulated_rad_snn.run(self.sim_duration)
+
+        self.assertTrue(
+            is_unaffected_by_radiation(
+                rad_snn=rad_snn, unradiated_snn=unradiated_snn
+            )
+        )
+        copy_sim_results(rad_snn=rad_snn, unradiated_snn=unradiated_snn)
+        self.assertTrue(rad_snn.raster.spikes.any())
+        np.testing.assert_array_equal(
+            rad_snn.raster.spikes, simulated_rad_snn.raster.spikes
+        )
+        np.testing.assert_array_equal(
+            rad_snn.multimeter.V, simulated_rad_snn.multimeter.V
+        )
+        self.assertEqual(
+            rad_snn.network.graph.graph["actual_duration"], self.sim_duration
+        )
+        # The results are copies, so they can be modified separately.
+        self.assertIsNot(rad_snn.raster.spikes, unradiated_snn.raster.spikes)
+
+    @typechecked
+    def test_radiated_snn_is_affected(self) -> None:
+        """Verifies a changed neuron or synapse is detected."""
+        unradiated_snn: Simulator = self.get_snn()
+        dead_neuron_snn: Simulator = clone_simsnn(snn=unradiated_snn)
+        dead_neuron_snn.network.nodes[1].thr = 999
+        weight_increase_snn: Simulator = clone_simsnn(snn=unradiated_snn)
+        weight_increase_snn.network.synapses[0].w = 2
+        unradiated_snn.run(self.sim_duration)
+
+        for rad_snn in [dead_neuron_snn, weight_increase_snn]:
+            self.assertFalse(
+                is_unaffected_by_radiation(
+                    rad_snn=rad_snn, unradiated_snn=unradiated_snn
+                )
+            )
@@ -0,0 +1,122 @@
+"""Verifies the CSR synapses add the synaptic input in the same order as
+simsnn, such that the I values are bit-identical, and that the sparse
+simsnn backend records the same behaviour as simsnn."""
+import unittest
+from typing import Dict
+
+import numpy as np
+from simsnn.core.simulators import Simulator
+from typeguard import typechecked
+
+from snncompare.create_configs import Run_config_space
+from snncompare.export_plots.Plot_config import get_default_plot_config
+from snncompare.graph_generation.stage_1_create_graphs import (
+    get_graphs_stage_1,
+)
+from snncompare.helper import get_snn_graph_names
+from snncompare.json_configurations.algo_test import load_exp_config_from_file
+from snncompare.run_config.Run_config import Run_config
+from snncompare.simulation.clone_snn import clone_simsnn
+from snncompare.simulation.sparse_sim import Csr_synapses
+from snncompare.simulation.stage2_sim import sim_snn
+
+
+class Test_sparse_sim(unittest.TestCase):
+    """Tests the CSR synapses on random synapses with float weights."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        rng = np.random.default_rng(3)
+        self.nr_of_neurons: int = 8
+        self.pre_indices: np.ndarray = rng.integers(0, 8, size=40)
+        self.post_indices: np.ndarray = rng.integers(0, 8, size=40)
+        self.weights: np.ndarray = rng.normal(size=(2, 40))
+        self.out: np.ndarray = rng.integers(0, 2, size=(2, 8)).astype(float)
+        self.i: np.ndarray = rng.normal(size=(2, 8))
+
+    @typechecked
+    def test_csr_rows(self) -> None:
+        """Verifies each CSR row contains the presynaptic neurons of its
+        postsynaptic neuron, in synapse order."""
+        synapses: Csr_synapses = Csr_synapses(
+            pre_indices=self.pre_indices,
+            post_indices=self.post_indices,
+            nr_of_neurons=self.nr_of_neurons,
+        )
+        row_starts, row_ends = synapses.indptr[:-1], synapses.indptr[1:]
+        for post, (row_start, row_end) in enumerate(zip(row_starts, row_ends)):
+            self.assertEqual(
+                synapses.indices[row_start:row_end].tolist(),
+                self.pre_indices[self.post_indices == post].tolist(),
+            )
+
+    @typechecked
+    def test_synaptic_input_is_added_in_synapse_order(self) -> None:
+        """Verifies the I values equal those of adding the input of one
+        synapse after the other."""
+        expected_i: np.ndarray = self.i.copy()
+        for snn_index in range(len(self.weights)):
+            for synapse_index, (pre, post) in enumerate(
+                zip(self.pre_indices, self.post_indices)
+            ):
+                expected_i[snn_index, post] += (
+                    self.weights[snn_index, synapse_index]
+                    * self.out[snn_index, pre]
+                )
+
+        synapses: Csr_synapses = Csr_synapses(
+            pre_indices=self.pre_indices,
+            post_indices=self.post_indices,
+            nr_of_neurons=self.nr_of_neurons,
+        )
+        i: np.ndarray = self.i.copy()
+        synapses.add_synaptic_input(
+            i=i,
+            out=self.out,
+            csr_weights=synapses.get_csr_weights(weights=self.weights),
+        )
+        np.testing.assert_array_equal(i, expected_i)
+
+    @typechecked
+    def test_sparse_backend_equals_simsnn_on_mdsa_snns(self) -> None:
+        """Verifies the sparse backend records the same spikes, V and I as
+        simsnn for the stage 1 MDSA snns, with and without adaptation."""
+        run_config: Run_config = Run_config_space(
+            exp_config=load_exp_config_from_file(
+                custom_config_path="src/snncompare/json_configurations/",
+                filename="minimal_results",
+            )
+        )[0]
+        stage_1_graphs: Dict = get_graphs_stage_1(
+            plot_config=get_default_plot_config(), run_config=run_config
+        )
+        for graph_name in get_snn_graph_names():
+            if graph_name not in stage_1_graphs:
+                continue
+            simsnn_snn: Simulator = clone_simsnn(
+                snn=stage_1_graphs[graph_name]
+            )
+            sparse_snn: Simulator = clone_simsnn(
+                snn=stage_1_graphs[graph_name]
+            )
+            for snn, simsnn_backend in [
+                (simsnn_snn, "simsnn"),
+                (sparse_snn, "sparse"),
+            ]:
+                sim_snn(
+                    input_graph=stage_1_graphs["input_graph"],
+                    snn=snn,
+                    run_config=run_config,
+                    simsnn_backend=simsnn_backend,
+                )
+            self.assertTrue(simsnn_snn.raster.spikes.any())
+            np.testing.assert_array_equal(
+                sparse_snn.raster.spikes, simsnn_snn.raster.spikes
+            )
+            for recording_name in ["V", "I"]:
+                np.testing.assert_array_equal(
+                    getattr(sparse_snn.multimeter, recording_name),
+                    getattr(simsnn_snn.multimeter, recording_name),
+                )
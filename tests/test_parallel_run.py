@@ -0,0 +1,139 @@
+"""Verifies the run_configs are performed on multiple workers, and that the
+failed run_configs are reported with an error once the other run_configs are
+completed."""
+import os
+import tempfile
+import unittest
+from typing import Dict, List, Set
+from unittest.mock import patch
+
+from typeguard import typechecked
+
+from snncompare.create_configs import exp_config_to_run_configs
+from snncompare.exp_config.Exp_config import Exp_config
+from snncompare.Experiment_runner import Experiment_runner
+from snncompare.export_plots.Plot_config import Plot_config
+from snncompare.json_configurations.algo_test import load_exp_config_from_file
+from snncompare.optional_config.Output_config import (
+    Extra_storing_config,
+    Output_config,
+    Zoom,
+)
+from snncompare.run_config.Run_config import Run_config
+
+# The unique_ids of the run_configs that fail. The worker processes are forked
+# after this set is filled, so they see the same unique_ids.
+FAILING_UNIQUE_IDS: Set[str] = set()
+
+
+# pylint: disable=W0613
+# pylint: disable=R0913
+def perform_single_run_or_fail(
+    self: Experiment_runner,
+    exp_config: Exp_config,
+    output_config: Output_config,
+    plot_config: Plot_config,
+    run_config: Run_config,
+    visualise: bool,
+) -> Dict:
+    """Replaces stages 1 to 4 of a run_config, and fails for the run_configs
+    in FAILING_UNIQUE_IDS."""
+    if run_config.unique_id in FAILING_UNIQUE_IDS:
+        raise ValueError(f"Error, failing run_config:{run_config.unique_id}")
+    return {}
+
+
+class Test_parallel_run(unittest.TestCase):
+    """Tests the parallel run with 2 workers, in a temporary working
+    directory."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.exp_config: Exp_config = load_exp_config_from_file(
+            custom_config_path="src/snncompare/json_configurations/",
+            filename="minimal_results",
+        )
+        self.run_configs: List[Run_config] = exp_config_to_run_configs(
+            exp_config=self.exp_config
+        )
+
+    @typechecked
+    def setUp(self) -> None:
+        """Runs each test in an empty working directory."""
+        self.original_cwd: str = os.getcwd()
+        # pylint: disable=R1732
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+        FAILING_UNIQUE_IDS.clear()
+
+    @typechecked
+    def tearDown(self) -> None:
+        """Restores the original working directory."""
+        os.chdir(self.original_cwd)
+        self.tmp_dir.cleanup()
+        FAILING_UNIQUE_IDS.clear()
+
+    @typechecked
+    def get_output_config(self) -> Output_config:
+        """Returns the output config of a run of stages 1, 2 and 4."""
+        return Output_config(
+            recreate_stages=[],
+            export_types=[],
+            zoom=Zoom(
+                create_zoomed_image=False, left_right=None, bottom_top=None
+            ),
+            output_json_stages=[1, 2, 4],
+            extra_storing_config=Extra_storing_config(
+                count_spikes=False,
+                count_neurons=False,
+                count_synapses=False,
+                skip_stage_2_output=False,
+                show_images=False,
+                store_died_neurons=False,
+                export_failure_modes=False,
+                show_failure_modes=False,
+            ),
+        )
+
+    @typechecked
+    def test_all_run_configs_completed(self) -> None:
+        """Verifies no run_config is reported as failed if all run_configs
+        complete."""
+        with patch.object(
+            Experiment_runner,
+            "perform_single_run",
+            perform_single_run_or_fail,
+        ):
+            exp_runner: Experiment_runner = Experiment_runner(
+                exp_config=self.exp_config,
+                output_config=self.get_output_config(),
+                reverse=False,
+                workers=2,
+            )
+        self.assertEqual(exp_runner.failed_run_configs, {})
+        self.assertEqual(exp_runner.results_nx_graphs, {})
+
+    @typechecked
+    def test_failed_run_config_raises_error(self) -> None:
+        """Verifies a failing run_config raises an error that names only that
+        run_config, after the other run_configs are performed."""
+        failing_unique_id: str = self.run_configs[0].unique_id
+        FAILING_UNIQUE_IDS.add(failing_unique_id)
+        with patch.object(
+            Experiment_runner,
+            "perform_single_run",
+            perform_single_run_or_fail,
+        ), self.assertRaises(SystemError) as context:
+            Experiment_runner(
+                exp_config=self.exp_config,
+                output_config=self.get_output_config(),
+                reverse=False,
+                workers=2,
+            )
+        self.assertIn(
+            f"1 of {len(self.run_configs)} run_configs failed",
+            str(context.exception),
+        )
+        self.assertIn(failing_unique_id, str(context.exception))
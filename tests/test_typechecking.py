@@ -0,0 +1,73 @@
+"""Verifies the runtime type checks are only disabled in fast mode."""
+import os
+import subprocess  # nosec
+import sys
+import unittest
+from unittest import mock
+
+from typeguard import TypeCheckError, typechecked
+
+from snncompare.helper import file_exists
+from snncompare.typechecking import FAST_MODE_ENV_VAR
+from snncompare.typechecking import typechecked as snncompare_typechecked
+
+
+def get_double(*, some_nr: int) -> int:
+    """Returns the number times two."""
+    return 2 * some_nr
+
+
+class Test_typechecking(unittest.TestCase):
+    """Tests the typechecked decorator of the package."""
+
+    # Initialize test object
+    @typechecked
+    def __init__(self, *args, **kwargs) -> None:  # type:ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+
+    @typechecked
+    def test_types_are_checked_by_default(self) -> None:
+        """Verifies a wrong argument type raises an error."""
+        with mock.patch.dict(os.environ, {FAST_MODE_ENV_VAR: ""}):
+            checked_get_double = snncompare_typechecked(get_double)
+        self.assertEqual(checked_get_double(some_nr=2), 4)
+        with self.assertRaises(TypeCheckError):
+            checked_get_double(some_nr="2")
+
+    @typechecked
+    def test_fast_mode_returns_the_function(self) -> None:
+        """Verifies the function is not wrapped in fast mode."""
+        with mock.patch.dict(os.environ, {FAST_MODE_ENV_VAR: "1"}):
+            self.assertIs(snncompare_typechecked(get_double), get_double)
+
+    @typechecked
+    def test_package_types_are_checked(self) -> None:
+        """Verifies a function of the package raises an error on a wrong
+        argument type."""
+        with self.assertRaises(TypeCheckError):
+            file_exists(filepath=2)  # type: ignore[arg-type]
+
+    @typechecked
+    def test_tests_ignore_exported_fast_mode(self) -> None:
+        """Verifies the conftest keeps the type checks of the package, also if
+        the fast mode is exported before the tests start."""
+        result = subprocess.run(  # nosec
+            [
+                sys.executable,
+                "-c",
+                "import tests.conftest\n"
+                + "from typeguard import TypeCheckError\n"
+                + "from snncompare.helper import file_exists\n"
+                + "try:\n"
+                + "    file_exists(filepath=2)\n"
+                + "except TypeCheckError:\n"
+                + "    raise SystemExit(0)\n"
+                + "raise SystemExit(1)\n",
+            ],
+            capture_output=True,
+            check=False,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            env={**os.environ, FAST_MODE_ENV_VAR: "1"},
+            text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)